@@ -0,0 +1,32 @@
+"""
+Performance benchmarks for applying binary DLL deltas.
+Patches a DLL-sized file whose new build moved code around (scattered byte
+changes plus an insertion), the case deltas exist for.
+"""
+import random
+
+import pytest
+
+binary_delta = pytest.importorskip("dlss_updater.binary_delta")
+
+FILE_SIZE = 16 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def builds():
+    """Old and new builds of a ~16 MB DLL, and the delta between them"""
+    rng = random.Random(3)
+    old = rng.randbytes(FILE_SIZE)
+    new = bytearray(old)
+    new[4096:4096] = rng.randbytes(8192)
+    for _ in range(20000):
+        new[rng.randrange(len(new))] = rng.randrange(256)
+    new = bytes(new)
+    return old, new, binary_delta.make_delta(old, new)
+
+
+def test_apply_delta(benchmark, builds):
+    """Benchmark rebuilding the new build from the cached one"""
+    old, new, patch = builds
+    result = benchmark(binary_delta.apply_delta, old, patch)
+    assert result == new
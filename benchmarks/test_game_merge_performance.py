@@ -0,0 +1,69 @@
+"""
+Performance benchmarks for the nested game-folder merge in ``find_all_dlls``.
+Compares ``_merge_nested_game_dirs`` (sorted sweep, O(n log n)) against the
+previous pairwise ``startswith`` pass (O(n^2)) on synthetic game roots: a
+custom folder with thousands of DLL-bearing subfolders, a fifth of which are
+nested inside another game. The baseline runs on 2k roots only - at 10k it
+takes seconds per round.
+"""
+import os
+
+import pytest
+
+scanner = pytest.importorskip("dlss_updater.scanner")
+
+GAME_ROOTS = 10_000
+GAME_ROOTS_BASELINE = 2_000
+NESTED_EVERY = 5
+
+
+def _games_dict(count: int) -> dict[str, list[str]]:
+    base = os.path.join(os.sep, "mnt", "Games")
+    games = {}
+    for n in range(count):
+        if n % NESTED_EVERY:
+            root = os.path.join(base, f"Game{n:05d}")
+        else:
+            root = os.path.join(base, f"Game{n - 1:05d}", "Plugins", f"Sub{n}")
+        games[root] = [os.path.join(root, "nvngx_dlss.dll")]
+    return games
+
+
+def _pairwise_merge(games_dict: dict[str, list]) -> int:
+    """The previous merge: compare every pair of paths sorted by length"""
+    sorted_paths = sorted(games_dict.keys(), key=len)
+    paths_to_remove = set()
+    for i, path1 in enumerate(sorted_paths):
+        if path1 in paths_to_remove:
+            continue
+        path1_lower = path1.lower()
+        for path2 in sorted_paths[i + 1:]:
+            if path2 in paths_to_remove:
+                continue
+            if path2.lower().startswith(path1_lower + os.sep):
+                games_dict[path1].extend(games_dict[path2])
+                paths_to_remove.add(path2)
+    for path in paths_to_remove:
+        del games_dict[path]
+    return len(paths_to_remove)
+
+
+def test_sorted_sweep_merge(benchmark):
+    """Benchmark the sorted-sweep merge on 10k game roots"""
+    # Every fifth root is nested, except the first (it has no parent game)
+    expected = GAME_ROOTS // NESTED_EVERY - 1
+
+    def run():
+        return scanner._merge_nested_game_dirs(_games_dict(GAME_ROOTS))
+
+    assert benchmark(run) == expected
+
+
+def test_pairwise_merge_baseline(benchmark):
+    """Benchmark the previous pairwise merge on 2k game roots"""
+    expected = GAME_ROOTS_BASELINE // NESTED_EVERY - 1
+
+    def run():
+        return _pairwise_merge(_games_dict(GAME_ROOTS_BASELINE))
+
+    assert benchmark(run) == expected
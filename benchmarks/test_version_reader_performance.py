@@ -0,0 +1,33 @@
+"""
+Performance benchmarks for DLL version extraction.
+Compares the lightweight VS_VERSIONINFO reader against the pefile path it
+replaced, on a DLL padded to a realistic upscaler size.
+"""
+import pytest
+
+pe_version = pytest.importorskip("dlss_updater.pe_version")
+updater = pytest.importorskip("dlss_updater.updater")
+
+from tests.pe_builder import build_pe  # noqa: E402
+
+DLL_SIZE_PADDING = 32 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def large_dll(tmp_path_factory):
+    """A ~32 MB DLL, the size class of nvngx_dlss.dll"""
+    path = tmp_path_factory.mktemp("dlls") / "nvngx_dlss.dll"
+    path.write_bytes(build_pe("310.4.0.0", fixed=(310, 4, 0, 0), padding=DLL_SIZE_PADDING))
+    return str(path)
+
+
+def test_version_reader(benchmark, large_dll):
+    """Benchmark the lightweight reader"""
+    info = benchmark(pe_version.read_version_info, large_dll)
+    assert info.file_version == "310.4.0.0"
+
+
+def test_version_pefile(benchmark, large_dll):
+    """Benchmark the pefile fallback path"""
+    result = benchmark(updater._read_file_version_pefile, large_dll)
+    assert result == "310.4.0.0"
@@ -0,0 +1,101 @@
+"""
+Performance benchmarks for the parallel directory walk.
+Compares the shared work-queue scheduler of ``_parallel_scandir_walk`` against
+the previous strategy (one worker per top-level directory, serial below it) on
+a skewed tree: one huge game folder next to a few small ones, the shape of a
+custom library holding a single 150 GB title.
+
+The temp tree sits in the page cache, where a listing costs microseconds of
+CPU. The ``cold`` variants add a fixed GIL-releasing delay per listing, as a
+directory read from disk would, which is where idle workers matter.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+scanner = pytest.importorskip("dlss_updater.scanner")
+
+DLL_NAMES = frozenset({"nvngx_dlss.dll"})
+WORKERS = 8
+
+# HugeGame: 20 x 20 directories with a handful of files each; eight tiny games
+HUGE_FANOUT = (20, 20)
+SMALL_GAMES = 8
+FILES_PER_DIR = 6
+
+# Simulated cost of reading one directory from disk
+COLD_LISTING_DELAY = 0.0002
+
+
+@pytest.fixture(scope="module")
+def skewed_tree(tmp_path_factory):
+    """A library whose directories are almost all under one game"""
+    root = tmp_path_factory.mktemp("library")
+    outer, inner = HUGE_FANOUT
+    for i in range(outer):
+        for j in range(inner):
+            leaf = root / "HugeGame" / f"pak{i:02d}" / f"chunk{j:02d}"
+            leaf.mkdir(parents=True)
+            for k in range(FILES_PER_DIR):
+                (leaf / f"asset{k}.bin").touch()
+    (root / "HugeGame" / "pak00" / "chunk00" / "nvngx_dlss.dll").touch()
+    for n in range(SMALL_GAMES):
+        game = root / f"SmallGame{n}" / "bin"
+        game.mkdir(parents=True)
+        (game / "nvngx_dlss.dll").touch()
+    return str(root)
+
+
+def _top_level_walk(root_path: str) -> list[str]:
+    """The previous scheduler: parallel per top-level directory only"""
+    def recurse(directory: str) -> list[str]:
+        try:
+            found, subdirs = scanner._list_directory(directory, DLL_NAMES)
+        except OSError:
+            return []
+        for subdir in subdirs:
+            found.extend(recurse(subdir))
+        return found
+
+    results, top_level_dirs = scanner._list_directory(root_path, DLL_NAMES)
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        for found in executor.map(recurse, top_level_dirs):
+            results.extend(found)
+    return results
+
+
+def test_walk_work_queue(benchmark, skewed_tree):
+    """Benchmark the shared work-queue walk on a skewed tree"""
+    found = benchmark(scanner._parallel_scandir_walk, skewed_tree, DLL_NAMES, WORKERS)
+    assert len(found) == SMALL_GAMES + 1
+
+
+def test_walk_top_level_only(benchmark, skewed_tree):
+    """Benchmark the top-level-only walk on the same tree"""
+    found = benchmark(_top_level_walk, skewed_tree)
+    assert len(found) == SMALL_GAMES + 1
+
+
+@pytest.fixture
+def cold_listings(monkeypatch):
+    """Make every directory listing wait as if it missed the page cache"""
+    list_directory = scanner._list_directory
+
+    def _slow_list_directory(*args, **kwargs):
+        time.sleep(COLD_LISTING_DELAY)
+        return list_directory(*args, **kwargs)
+
+    monkeypatch.setattr(scanner, "_list_directory", _slow_list_directory)
+
+
+def test_walk_work_queue_cold(benchmark, skewed_tree, cold_listings):
+    """Benchmark the shared work-queue walk with disk-like listing latency"""
+    found = benchmark(scanner._parallel_scandir_walk, skewed_tree, DLL_NAMES, WORKERS)
+    assert len(found) == SMALL_GAMES + 1
+
+
+def test_walk_top_level_only_cold(benchmark, skewed_tree, cold_listings):
+    """Benchmark the top-level-only walk with disk-like listing latency"""
+    found = benchmark(_top_level_walk, skewed_tree)
+    assert len(found) == SMALL_GAMES + 1
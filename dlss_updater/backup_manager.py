@@ -12,7 +12,7 @@ from pathlib import Path
 
 from dlss_updater.logger import setup_logger
 from dlss_updater.database import db_manager
-from dlss_updater.concurrency_limiters import io_heavy, thread_io
+from dlss_updater.concurrency_limiters import device_slot, io_heavy, thread_io
 
 logger = setup_logger()
 
@@ -23,7 +23,8 @@ async def async_copy2(src: Path, dst: Path, chunk_size: int = 65536) -> None:
     ``shutil.copy2`` — file data plus permission/stat metadata).
 
     Delegates to :func:`shutil.copy2` on a worker thread via the shared
-    ``thread_io`` limiter. ``shutil.copy2`` uses the platform fast-copy path
+    ``thread_io`` limiter, gated by the destination device's limiter so
+    parallel restores cannot pile onto one spinning disk. ``shutil.copy2`` uses the platform fast-copy path
     (``sendfile``/``copy_file_range`` on Linux, ``CopyFile2`` on Windows)
     instead of streaming 64KB chunks through Python, which is dramatically
     faster for large DLLs while keeping the event loop non-blocking.
@@ -33,7 +34,8 @@ async def async_copy2(src: Path, dst: Path, chunk_size: int = 65536) -> None:
         dst: Destination file path
         chunk_size: Unused; retained for signature/backwards compatibility.
     """
-    await anyio.to_thread.run_sync(shutil.copy2, src, dst, limiter=thread_io)
+    async with device_slot(dst):
+        await anyio.to_thread.run_sync(shutil.copy2, src, dst, limiter=thread_io)
 
 
 def record_backup_metadata_sync(dll_path: Path, backup_path: Path) -> int | None:
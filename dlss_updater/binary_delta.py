@@ -0,0 +1,186 @@
+"""
+bsdiff-style binary deltas between two builds of a DLL.
+
+Consecutive builds of a 60-70 MB upscaler DLL share most of their bytes, but
+code moves around, so even "unchanged" regions differ in the addresses they
+embed. Like bsdiff, a delta therefore stores approximate matches as a byte
+*difference* against the old file (mostly zeros, which compress very well)
+plus the new bytes that match nothing:
+
+    header   b"DLSSBSD1", new size, compressed control size, compressed diff
+             size (little-endian u64 each)
+    control  bz2 of (diff_len, extra_len, seek) triples (signed i64 each)
+    diff     bz2 of the bytewise (new - old) mod 256 of every matched run
+    extra    bz2 of the unmatched new bytes
+
+Applying walks the controls: take ``diff_len`` bytes of the old file at the
+current position and add the next diff bytes to them, append ``extra_len``
+extra bytes, then move the old position by ``diff_len + seek``.
+
+The bytewise addition runs on Python ints a megabyte at a time (SWAR, see
+_add_bytes), so applying a patch to a 70 MB DLL takes well under a second
+without numpy or a compiled bsdiff. make_delta is for publishing deltas
+(see tools/make_dll_delta.py): it matches on aligned blocks of the old file
+instead of bsdiff's suffix sort, which is slower to converge on tiny
+edits but needs no native code.
+
+Pure stdlib (``bz2``, ``struct``), no module state: safe to call from any
+thread. Malformed patches raise ``DeltaError``.
+"""
+
+import bz2
+import struct
+
+MAGIC = b"DLSSBSD1"
+
+_HEADER = struct.Struct("<8sQQQ")
+_CONTROL = struct.Struct("<qqq")
+
+# Old-file block size matches are seeded from (and extended by)
+_BLOCK = 64
+
+# Bytes per SWAR addition step, and the per-byte masks for that many bytes
+_ADD_CHUNK = 1 << 20
+_LOW7 = int.from_bytes(b"\x7f" * _ADD_CHUNK, "little")
+_HIGH = int.from_bytes(b"\x80" * _ADD_CHUNK, "little")
+
+# Bytewise negation mod 256, for turning a subtraction into an addition
+_NEGATE = bytes((-x) & 0xFF for x in range(256))
+
+
+class DeltaError(ValueError):
+    """The patch is malformed or does not belong to the given old file."""
+
+
+def _add_bytes(a, b) -> bytes:
+    """
+    Bytewise (a + b) mod 256 of two equal-length buffers.
+
+    Adds the low 7 bits of every byte at once as one big int - their sum
+    never carries out of its byte - then fixes the top bit of each byte with
+    an XOR (top bits of a, b and the carry into them).
+    """
+    out = bytearray(len(a))
+    a, b = memoryview(a), memoryview(b)
+    for i in range(0, len(a), _ADD_CHUNK):
+        x = int.from_bytes(a[i:i + _ADD_CHUNK], "little")
+        y = int.from_bytes(b[i:i + _ADD_CHUNK], "little")
+        n = min(_ADD_CHUNK, len(a) - i)
+        total = ((x & _LOW7) + (y & _LOW7)) ^ ((x ^ y) & _HIGH)
+        out[i:i + n] = total.to_bytes(n, "little")
+    return bytes(out)
+
+
+def apply_delta(old: bytes, patch: bytes) -> bytes:
+    """
+    Rebuild the new file from ``old`` and a patch made by make_delta.
+
+    Raises:
+        DeltaError: if the patch is malformed or reads outside ``old``
+    """
+    if len(patch) < _HEADER.size:
+        raise DeltaError("Patch too short")
+    magic, new_size, ctrl_size, diff_size = _HEADER.unpack_from(patch)
+    if magic != MAGIC:
+        raise DeltaError("Not a DLL delta")
+
+    offset = _HEADER.size
+    try:
+        ctrl = bz2.decompress(patch[offset:offset + ctrl_size])
+        offset += ctrl_size
+        diff = bz2.decompress(patch[offset:offset + diff_size])
+        offset += diff_size
+        extra = bz2.decompress(patch[offset:])
+    except (OSError, ValueError) as e:
+        raise DeltaError(f"Corrupt patch data: {e}") from e
+    if len(ctrl) % _CONTROL.size:
+        raise DeltaError("Truncated control block")
+
+    # Gather the old bytes every diff run applies to, so the addition is one
+    # pass over the whole diff block instead of one per run
+    old_runs = []
+    layout = []
+    old_pos = 0
+    for diff_len, extra_len, seek in _CONTROL.iter_unpack(ctrl):
+        if diff_len < 0 or extra_len < 0:
+            raise DeltaError("Negative run length")
+        if diff_len and (old_pos < 0 or old_pos + diff_len > len(old)):
+            raise DeltaError("Diff run outside the old file")
+        old_runs.append(old[old_pos:old_pos + diff_len])
+        layout.append((diff_len, extra_len))
+        old_pos += diff_len + seek
+
+    base = b"".join(old_runs)
+    if len(base) != len(diff) or sum(n for _d, n in layout) != len(extra):
+        raise DeltaError("Control block does not match the data blocks")
+    added = _add_bytes(base, diff)
+
+    out = bytearray()
+    diff_pos = extra_pos = 0
+    for diff_len, extra_len in layout:
+        out += added[diff_pos:diff_pos + diff_len]
+        out += extra[extra_pos:extra_pos + extra_len]
+        diff_pos += diff_len
+        extra_pos += extra_len
+    if len(out) != new_size:
+        raise DeltaError(f"Patched size {len(out)} != {new_size}")
+    return bytes(out)
+
+
+def make_delta(old: bytes, new: bytes) -> bytes:
+    """
+    Make a patch that turns ``old`` into ``new`` (see apply_delta).
+
+    Matches are seeded by looking up each position of ``new`` among the
+    aligned blocks of ``old``, extended backwards while bytes are equal and
+    forwards a block at a time while at least half of each block is, so
+    runs with scattered changes (moved code) become cheap diff runs.
+    """
+    index: dict[bytes, int] = {}
+    for pos in range(0, len(old) - _BLOCK + 1, _BLOCK):
+        index.setdefault(old[pos:pos + _BLOCK], pos)
+
+    controls = [[0, 0, 0]]  # leading control: no diff, just the extra before the first match
+    diff = bytearray()
+    extra = bytearray()
+    old_pos = 0  # where the applier's old position is after the last control's diff
+    pending = 0  # start of the new bytes not covered yet
+
+    i = 0
+    while i <= len(new) - _BLOCK:
+        j = index.get(new[i:i + _BLOCK])
+        if j is None:
+            i += 1
+            continue
+
+        while i > pending and j > 0 and new[i - 1] == old[j - 1]:
+            i -= 1
+            j -= 1
+        end, old_end = i, j
+        while end < len(new) and old_end < len(old):
+            n = min(_BLOCK, len(new) - end, len(old) - old_end)
+            a, b = new[end:end + n], old[old_end:old_end + n]
+            if a != b and 2 * sum(x == y for x, y in zip(a, b)) < n:
+                break
+            end += n
+            old_end += n
+
+        controls[-1][1] = i - pending
+        controls[-1][2] = j - old_pos
+        extra += new[pending:i]
+        diff += _add_bytes(new[i:end], old[j:old_end].translate(_NEGATE))
+        controls.append([end - i, 0, 0])
+        old_pos = old_end
+        i = pending = end
+
+    controls[-1][1] = len(new) - pending
+    extra += new[pending:]
+
+    ctrl = bz2.compress(b"".join(_CONTROL.pack(*c) for c in controls))
+    diff_block = bz2.compress(bytes(diff))
+    return (
+        _HEADER.pack(MAGIC, len(new), len(ctrl), len(diff_block))
+        + ctrl
+        + diff_block
+        + bz2.compress(bytes(extra))
+    )
@@ -18,11 +18,28 @@ sites were actually bounding:
   aiohttp requests or PE-parsing tasks run at once), replacing
   ``asyncio.Semaphore(Concurrency.IO_HEAVY / IO_EXTREME)``. These are not
   threads at all, so they can be sized much higher (CPU_THREADS * 32/64).
+
+On top of the global limits, disk work is also bounded per device:
+``device_limiter(path)`` returns the limiter shared by everything on the same
+filesystem (``st_dev``), so a spinning disk gets DEVICE_IO_ROTATIONAL workers
+however many are free globally, while an NVMe library next to it keeps
+DEVICE_IO_SSD. From async code, hold ``device_slot(path)`` around the thread
+dispatch of one unit of disk work (``async with device_slot(path): await
+anyio.to_thread.run_sync(...)``) - it resolves the device on a worker thread,
+as that takes a stat() and, on Linux, a sysfs read. A multi-threaded walk
+asks for several slots and sizes its pool to what it got. Never hold a slot
+across another acquisition of the same device's limiter.
 """
 
+import os
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 import anyio
 
 from .config import Concurrency
+from .platform_utils import IS_LINUX
 
 # Real OS thread pools (anyio.to_thread.run_sync(..., limiter=...))
 thread_cpu = anyio.CapacityLimiter(Concurrency.THREADPOOL_CPU)
@@ -31,3 +48,108 @@ thread_io = anyio.CapacityLimiter(Concurrency.THREADPOOL_IO)
 # Async-task concurrency gates (async with io_heavy: / io_extreme:)
 io_heavy = anyio.CapacityLimiter(Concurrency.IO_HEAVY)
 io_extreme = anyio.CapacityLimiter(Concurrency.IO_EXTREME)
+
+# Per-device limiters, created on first use (st_dev -> limiter). None keys
+# paths whose device could not be determined.
+_device_limiters: dict[int | None, anyio.CapacityLimiter] = {}
+_device_capacities: dict[int | None, int] = {}
+_device_lock = threading.Lock()
+
+
+def _device_of(path) -> int | None:
+    """st_dev of ``path``, or of its nearest existing ancestor (None if none)."""
+    path = Path(path)
+    for candidate in (path, *path.parents):
+        try:
+            return os.stat(candidate).st_dev
+        except OSError:
+            continue
+    return None
+
+
+def _is_rotational(dev: int) -> bool:
+    """
+    True if ``dev`` is a spinning disk (Linux sysfs; False when unknown).
+
+    ``/sys/dev/block/MAJ:MIN`` links to the block device, or to a partition
+    whose parent directory is the disk that carries ``queue/rotational``.
+    Virtual filesystems (btrfs subvolumes, overlayfs, network mounts) have no
+    block device entry and count as non-rotational.
+    """
+    if not IS_LINUX:
+        return False
+    try:
+        device_dir = os.path.realpath(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}")
+    except (OSError, ValueError):
+        return False
+    for block_dir in (device_dir, os.path.dirname(device_dir)):
+        try:
+            with open(os.path.join(block_dir, "queue", "rotational")) as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return False
+
+
+def _device_key(path) -> int | None:
+    dev = _device_of(path)
+    with _device_lock:
+        if dev in _device_capacities:
+            return dev
+    rotational = dev is not None and _is_rotational(dev)
+    capacity = Concurrency.DEVICE_IO_ROTATIONAL if rotational else Concurrency.DEVICE_IO_SSD
+    with _device_lock:
+        _device_capacities.setdefault(dev, capacity)
+    return dev
+
+
+def device_capacity(path) -> int:
+    """Number of concurrent I/O workers the device holding ``path`` should get."""
+    dev = _device_key(path)
+    with _device_lock:
+        return _device_capacities[dev]
+
+
+def device_limiter(path) -> anyio.CapacityLimiter:
+    """The limiter shared by all disk work on the device holding ``path``."""
+    dev = _device_key(path)
+    with _device_lock:
+        limiter = _device_limiters.get(dev)
+        if limiter is None:
+            limiter = anyio.CapacityLimiter(_device_capacities[dev])
+            _device_limiters[dev] = limiter
+        return limiter
+
+
+def group_by_device(paths: list[str]) -> list[list[str]]:
+    """Split ``paths`` by the device holding them, keeping their order."""
+    groups: dict[int | None, list[str]] = {}
+    for path in paths:
+        groups.setdefault(_device_key(path), []).append(path)
+    return list(groups.values())
+
+
+@asynccontextmanager
+async def device_slot(path, workers: int = 1):
+    """
+    Hold slots of the device holding ``path`` for a unit of disk work.
+
+    Waits for one slot, then takes up to ``workers`` in total of those free
+    right now, and yields how many it holds: a walk running that many
+    threads keeps the device within its limit however many walks share it.
+    """
+    limiter = await anyio.to_thread.run_sync(device_limiter, path, limiter=thread_io)
+    borrowers = [object()]
+    await limiter.acquire_on_behalf_of(borrowers[0])
+    try:
+        while len(borrowers) < workers:
+            borrower = object()
+            try:
+                limiter.acquire_on_behalf_of_nowait(borrower)
+            except anyio.WouldBlock:
+                break
+            borrowers.append(borrower)
+        yield len(borrowers)
+    finally:
+        for borrower in borrowers:
+            limiter.release_on_behalf_of(borrower)
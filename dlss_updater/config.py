@@ -13,6 +13,7 @@ from .models import (
     MAX_PATHS_PER_LAUNCHER,
     AppUpdatesConfig,
     DiscordBannerConfig,
+    DLLStoreConfig,
     ImageCacheConfig,
     LauncherPathsConfig,
     LinuxDLSSConfig,
@@ -120,6 +121,13 @@ class Concurrency:
     THREADPOOL_CPU: int = max(8, min(_THREADPOOL_CPU_CAP, int(CPU_THREADS * 0.9)))  # Cap for CPU work
     THREADPOOL_IO: int = min(32, CPU_THREADS * 2)  # Cap at 32 for I/O (was 128, too much memory)
 
+    # Per-device I/O limits (concurrency_limiters.device_limiter). A spinning
+    # disk seeks between every concurrent reader, so more than a couple of
+    # workers only slows it down; SSD/NVMe queues are deep enough to take the
+    # full I/O thread pool. Devices of unknown type get the SSD limit.
+    DEVICE_IO_ROTATIONAL: int = 2
+    DEVICE_IO_SSD: int = THREADPOOL_IO
+
     @classmethod
     def log_config(cls):
         """Log the concurrency configuration."""
@@ -128,6 +136,7 @@ class Concurrency:
         logger.info(f"  IO_LIGHT={cls.IO_LIGHT}, IO_MEDIUM={cls.IO_MEDIUM}")
         logger.info(f"  IO_HEAVY={cls.IO_HEAVY}, IO_EXTREME={cls.IO_EXTREME}")
         logger.info(f"  THREADPOOL_CPU={cls.THREADPOOL_CPU}, THREADPOOL_IO={cls.THREADPOOL_IO}")
+        logger.info(f"  DEVICE_IO_ROTATIONAL={cls.DEVICE_IO_ROTATIONAL}, DEVICE_IO_SSD={cls.DEVICE_IO_SSD}")
 
 # Thread-safety locks for free-threading (Python 3.14+)
 #
@@ -217,6 +226,10 @@ def update_latest_dll_versions_from_cache() -> None:
 # IMPORTANT: We'll initialize this later to avoid circular imports
 LATEST_DLL_PATHS = {}
 
+# Per-game pinned DLLs: game folder -> DLL name -> stored file (see
+# get_source_dll_path); filled alongside LATEST_DLL_PATHS
+GAME_DLL_PATHS: dict[str, dict[str, str]] = {}
+
 
 class LauncherPathName(StrEnum):
     STEAM = "SteamPath"
@@ -294,6 +307,7 @@ class AppConfig(msgspec.Struct):
     steam_api: SteamAPIConfig = msgspec.field(default_factory=SteamAPIConfig)
     performance: PerformanceConfig = msgspec.field(default_factory=_default_performance)
     blacklist_skips: dict[str, bool] = msgspec.field(default_factory=dict)
+    dll_store: DLLStoreConfig = msgspec.field(default_factory=DLLStoreConfig)
     window_state: WindowStateConfig = msgspec.field(default_factory=WindowStateConfig)
     appearance: dict[str, str] = msgspec.field(default_factory=dict)
     extra: dict[str, dict[str, str]] = msgspec.field(default_factory=dict)
@@ -1073,12 +1087,14 @@ class ConfigManager:
     def get_performance_config_struct(self) -> PerformanceConfig:
         """Get performance config as validated msgspec struct"""
         return PerformanceConfig(
-            max_worker_threads=self.get_max_worker_threads()
+            max_worker_threads=self.get_max_worker_threads(),
+            watch_libraries=self.get_watch_libraries(),
         )
 
     def save_performance_config_struct(self, perf: PerformanceConfig):
         """Save performance config from msgspec struct"""
         self.set_max_worker_threads(perf.max_worker_threads)
+        self.set_watch_libraries(perf.watch_libraries)
 
     # =========================================================================
     # Performance
@@ -1097,6 +1113,65 @@ class ConfigManager:
             self._config.performance.max_worker_threads = int(count)
             self._save_unlocked()
 
+    def get_watch_libraries(self) -> bool:
+        """Get whether the background library watcher runs (default: disabled)"""
+        with _config_lock:
+            return self._config.performance.watch_libraries
+
+    def set_watch_libraries(self, enabled: bool):
+        """Set whether the background library watcher runs"""
+        with _config_lock:
+            self._config.performance.watch_libraries = bool(enabled)
+            self._save_unlocked()
+
+    # =========================================================================
+    # DLL Store (multi-version cache and pinning)
+    # =========================================================================
+
+    def get_dll_store_keep_versions(self) -> int:
+        """Get how many recent versions of each DLL the store keeps"""
+        with _config_lock:
+            return self._config.dll_store.keep_versions
+
+    def set_dll_store_keep_versions(self, count: int):
+        """Set how many recent versions of each DLL the store keeps (at least 1)"""
+        with _config_lock:
+            self._config.dll_store.keep_versions = max(1, int(count))
+            self._save_unlocked()
+
+    def get_dll_pins(self) -> dict[str, str]:
+        """Get the global version pins (DLL name -> version)"""
+        with _config_lock:
+            return dict(self._config.dll_store.pins)
+
+    def get_game_dll_pins(self) -> dict[str, dict[str, str]]:
+        """Get the per-game version pins (game folder -> DLL name -> version)"""
+        with _config_lock:
+            return {game: dict(pins) for game, pins in self._config.dll_store.game_pins.items()}
+
+    def set_dll_pin(self, dll_name: str, version: str | None, game_path: str | None = None):
+        """
+        Pin a DLL to a stored version, for every game or for one game folder.
+
+        A None/empty version removes the pin. Call config.refresh_dll_paths()
+        afterwards to switch the DLL paths over.
+        """
+        dll_name = dll_name.lower()
+        with _config_lock:
+            store = self._config.dll_store
+            if game_path is None:
+                pins = store.pins
+            else:
+                game_path = normalize_user_path(game_path)
+                pins = store.game_pins.setdefault(game_path, {})
+            if version:
+                pins[dll_name] = version
+            else:
+                pins.pop(dll_name, None)
+                if game_path is not None and not pins:
+                    del store.game_pins[game_path]
+            self._save_unlocked()
+
     # =========================================================================
     # Linux DLSS SR Presets Configuration
     # =========================================================================
@@ -1303,11 +1378,32 @@ def get_all_dll_paths() -> dict[str, str]:
         return dict(LATEST_DLL_PATHS)
 
 
+def _apply_dll_paths(cached: dict[str, str | None]) -> dict[str, str | None]:
+    """Resolve the cached DLLs through the store and publish the paths.
+
+    The dicts are updated in place so modules that imported them by name
+    see the new paths too.
+    """
+    from .dll_store import resolve_dll_paths
+
+    # Resolve outside the lock to minimize lock time
+    latest, per_game = resolve_dll_paths(cached)
+
+    with _dll_paths_lock:
+        LATEST_DLL_PATHS.clear()
+        LATEST_DLL_PATHS.update(latest)
+        GAME_DLL_PATHS.clear()
+        GAME_DLL_PATHS.update(per_game)
+
+    return LATEST_DLL_PATHS
+
+
 def initialize_dll_paths():
-    """Initialize the DLL paths after all modules are loaded (thread-safe)"""
-    from .dll_repository import get_local_dll_path
+    """Initialize the DLL paths after all modules are loaded (thread-safe).
 
-    global LATEST_DLL_PATHS
+    Reads the DLL store; from async code run it in a worker thread.
+    """
+    from .dll_repository import get_local_dll_path
 
     # Derived from DLL_TYPE_MAP rather than hand-listed. These two used to be
     # maintained separately, and drifted: DLLs added to DLL_TYPE_MAP/DLL_GROUPS
@@ -1317,13 +1413,40 @@ def initialize_dll_paths():
     # platform-conditional entries (DirectStorage is Windows-only) for free.
     from .constants import DLL_TYPE_MAP
 
-    # Build the dict outside the lock to minimize lock time
-    new_paths = {
+    return _apply_dll_paths({
         dll_name: get_local_dll_path(dll_name)
         for dll_name in DLL_TYPE_MAP
-    }
+    })
 
-    with _dll_paths_lock:
-        LATEST_DLL_PATHS = new_paths
 
-    return LATEST_DLL_PATHS
+def refresh_dll_paths():
+    """Re-resolve the DLL paths after a pin changed (thread-safe).
+
+    Works from the DLLs already cached and stored - no downloads - so
+    switching versions is immediate.
+    """
+    from .constants import DLL_TYPE_MAP
+    from .dll_repository import LOCAL_DLL_CACHE_DIR
+
+    cached = {}
+    for dll_name in DLL_TYPE_MAP:
+        path = Path(LOCAL_DLL_CACHE_DIR) / dll_name
+        cached[dll_name] = str(path) if path.exists() else None
+    _apply_dll_paths(cached)
+    update_latest_dll_versions_from_cache()
+
+
+def get_source_dll_path(dll_name: str, target_path: str | None = None) -> str | None:
+    """
+    Cached DLL to install as ``dll_name`` (thread-safe).
+
+    Honours a per-game pin when ``target_path`` lies in a pinned game folder,
+    otherwise returns LATEST_DLL_PATHS (which carries the global pins).
+    """
+    with _dll_paths_lock:
+        if target_path is not None and GAME_DLL_PATHS:
+            target = Path(target_path)
+            for game_path, paths in GAME_DLL_PATHS.items():
+                if dll_name in paths and target.is_relative_to(game_path):
+                    return paths[dll_name]
+        return LATEST_DLL_PATHS.get(dll_name)
@@ -8,6 +8,7 @@ Performance optimizations:
 - Thread-local connection reuse for sync operations
 """
 
+import os
 import sqlite3
 import logging
 import threading
@@ -32,7 +33,8 @@ from dlss_updater.platform_utils import APP_CONFIG_DIR
 from dlss_updater.models import (
     Game, GameDLL, DLLBackup, UpdateHistory, SteamImage,
     GameDLLBackup, GameBackupSummary, GameWithBackupCount, MergedGame,
-    GameDLSSPresets
+    GameDLSSPresets, ScanDirIndexEntry, SteamManifestState, CompatdataPrefixes,
+    GameRootProbe, ScanCheckpoint, StoreSearchResult, encode_json, decode_json
 )
 
 logger = setup_logger()
@@ -40,6 +42,37 @@ logger = setup_logger()
 # Thread-safety lock for singleton pattern (free-threading Python 3.14+)
 _db_manager_lock = threading.Lock()
 
+# Triggers keeping the steam_apps_fts index in sync with steam_apps, shared by
+# schema setup, the FTS migration and the app-list swap
+_STEAM_APPS_FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS steam_apps_ai AFTER INSERT ON steam_apps BEGIN
+        INSERT INTO steam_apps_fts(rowid, name, name_search)
+        VALUES (new.appid, new.name, new.name_search);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS steam_apps_ad AFTER DELETE ON steam_apps BEGIN
+        INSERT INTO steam_apps_fts(steam_apps_fts, rowid, name, name_search)
+        VALUES ('delete', old.appid, old.name, old.name_search);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS steam_apps_au AFTER UPDATE ON steam_apps BEGIN
+        INSERT INTO steam_apps_fts(steam_apps_fts, rowid, name, name_search)
+        VALUES ('delete', old.appid, old.name, old.name_search);
+        INSERT INTO steam_apps_fts(rowid, name, name_search)
+        VALUES (new.appid, new.name, new.name_search);
+    END
+    """,
+)
+
+# Exact-match index on normalized names; DROP TABLE in the app-list swap takes
+# it with the old table, so the swap recreates it like the triggers above
+_STEAM_APPS_NORMALIZED_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_steam_apps_normalized ON steam_apps(name_normalized)"
+)
+
 # Rollback detection thresholds
 # A (dll_filename, version) is flagged when >= THRESHOLD distinct games rolled back
 # to it within WINDOW_DAYS after updating to a version newer than it.
@@ -605,28 +638,8 @@ class DatabaseManager:
             """)
 
             # Triggers to keep FTS5 index in sync with steam_apps table
-            cursor.execute("""
-                CREATE TRIGGER IF NOT EXISTS steam_apps_ai AFTER INSERT ON steam_apps BEGIN
-                    INSERT INTO steam_apps_fts(rowid, name, name_search)
-                    VALUES (new.appid, new.name, new.name_search);
-                END
-            """)
-
-            cursor.execute("""
-                CREATE TRIGGER IF NOT EXISTS steam_apps_ad AFTER DELETE ON steam_apps BEGIN
-                    INSERT INTO steam_apps_fts(steam_apps_fts, rowid, name, name_search)
-                    VALUES ('delete', old.appid, old.name, old.name_search);
-                END
-            """)
-
-            cursor.execute("""
-                CREATE TRIGGER IF NOT EXISTS steam_apps_au AFTER UPDATE ON steam_apps BEGIN
-                    INSERT INTO steam_apps_fts(steam_apps_fts, rowid, name, name_search)
-                    VALUES ('delete', old.appid, old.name, old.name_search);
-                    INSERT INTO steam_apps_fts(rowid, name, name_search)
-                    VALUES (new.appid, new.name, new.name_search);
-                END
-            """)
+            for statement in _STEAM_APPS_FTS_TRIGGERS:
+                cursor.execute(statement)
 
             # Search history table
             cursor.execute("""
@@ -665,6 +678,155 @@ class DatabaseManager:
                 )
             """)
 
+            # Persistent directory index for incremental rescans. One row per
+            # directory the scanner has listed: its identity at listing time
+            # (mtime_ns + inode) plus the known DLLs and walkable child dirs it
+            # held. '/' separates names since it cannot appear in a filename on
+            # either Windows or Linux. WITHOUT ROWID: always looked up by path.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scan_dir_index (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    dll_names TEXT NOT NULL DEFAULT '',
+                    subdirs TEXT NOT NULL DEFAULT '',
+                    exe_names TEXT NOT NULL DEFAULT '',
+                    exe_sizes TEXT NOT NULL DEFAULT ''
+                ) WITHOUT ROWID
+            """)
+
+            # Persistent PE version cache: FileVersion of each DLL keyed by the
+            # file's identity, so a DLL is parsed at most once per revision
+            # across runs. version is NULL for DLLs without a FileVersion.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS dll_version_cache (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    version TEXT
+                ) WITHOUT ROWID
+            """)
+
+            # Migration: content fingerprint of each cached DLL revision
+            try:
+                cursor.execute("ALTER TABLE dll_version_cache ADD COLUMN fingerprint TEXT")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
+            # SHA-256 of DLLs keyed by the file's identity, recorded as downloads
+            # are verified (and on first hash otherwise), so known-bad and
+            # integrity checks cost a stat plus a lookup instead of a re-hash
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS dll_digests (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+            # Versions kept in the content-addressable DLL store (dll_store.py):
+            # each (DLL, version) points at the digest its file is stored under
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS dll_store (
+                    dll_name TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    stored_at INTEGER NOT NULL,
+                    PRIMARY KEY (dll_name, version)
+                ) WITHOUT ROWID
+            """)
+
+            # Fingerprint -> FileVersion, shared by every byte-identical copy of
+            # a DLL (dozens of games ship the same nvngx_dlss.dll build).
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS dll_fingerprints (
+                    fingerprint TEXT PRIMARY KEY,
+                    version TEXT
+                ) WITHOUT ROWID
+            """)
+
+            # Ranked executable candidates per game, collected by the scan walk
+            # so exe_resolver does not have to walk the game tree again.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS game_exe_candidates (
+                    game_id INTEGER NOT NULL,
+                    exe_path TEXT NOT NULL,
+                    size INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (game_id, exe_path),
+                    FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE
+                ) WITHOUT ROWID
+            """)
+
+            # Steam appmanifest state per install dir at its last DLL walk, so
+            # games Steam has not touched since can skip the walk and reuse
+            # their game_dlls rows (see models.SteamManifestState).
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS steam_app_manifests (
+                    install_path TEXT PRIMARY KEY,
+                    app_id INTEGER,
+                    build_id INTEGER NOT NULL DEFAULT 0,
+                    last_updated INTEGER NOT NULL DEFAULT 0,
+                    size_on_disk INTEGER NOT NULL DEFAULT 0,
+                    state_flags INTEGER NOT NULL DEFAULT 0,
+                    dll_names_key TEXT NOT NULL DEFAULT '',
+                    dll_count INTEGER NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+            """)
+
+            # Proton prefixes per compatdata directory at its last listing, so
+            # repeat scans skip probing hundreds of prefixes while the
+            # directory is unchanged (see models.CompatdataPrefixes).
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS compatdata_prefixes (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    app_dirs TEXT NOT NULL DEFAULT ''
+                ) WITHOUT ROWID
+            """)
+
+            # find_game_root indicator counts per directory, so resolving a
+            # game root across runs costs one stat per level instead of a glob
+            # plus eight exists() probes (see models.GameRootProbe).
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS game_root_probes (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    indicators INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+            # Progress of an interrupted full scan (see scan_session): one row
+            # per finished launcher (kind 'launcher', data = its DLL paths) and
+            # per recorded game (kind 'game', data = its prepared record), as
+            # JSON. dll_names_key ties rows to the DLL selection they were
+            # scanned with; created_at (unix seconds) lets stale rows be ignored.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scan_checkpoints (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    dll_names_key TEXT NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (kind, key)
+                ) WITHOUT ROWID
+            """)
+
+            # Top Steam Store search hit per normalised game name, so scans and
+            # re-resolution skip the rate-limited request for names already
+            # searched. steam_app_id is NULL when the search found nothing.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS store_search_cache (
+                    name TEXT PRIMARY KEY,
+                    steam_app_id INTEGER,
+                    fetched_at INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+
             # Migration: Add resolution_source column if missing
             try:
                 cursor.execute("ALTER TABLE games ADD COLUMN resolution_source TEXT")
@@ -758,7 +920,7 @@ class DatabaseManager:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_steam_name ON steam_app_list(name COLLATE NOCASE)")
 
             # Index for fast exact match lookups on normalized names (spaceless)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_steam_apps_normalized ON steam_apps(name_normalized)")
+            cursor.execute(_STEAM_APPS_NORMALIZED_INDEX)
 
             # Search-related indexes for fast game name lookups
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_name ON games(name COLLATE NOCASE)")
@@ -858,26 +1020,8 @@ class DatabaseManager:
                 content_rowid='appid'
             )
         """)
-        cursor.execute("""
-            CREATE TRIGGER steam_apps_ai AFTER INSERT ON steam_apps BEGIN
-                INSERT INTO steam_apps_fts(rowid, name, name_search)
-                VALUES (new.appid, new.name, new.name_search);
-            END
-        """)
-        cursor.execute("""
-            CREATE TRIGGER steam_apps_ad AFTER DELETE ON steam_apps BEGIN
-                INSERT INTO steam_apps_fts(steam_apps_fts, rowid, name, name_search)
-                VALUES ('delete', old.appid, old.name, old.name_search);
-            END
-        """)
-        cursor.execute("""
-            CREATE TRIGGER steam_apps_au AFTER UPDATE ON steam_apps BEGIN
-                INSERT INTO steam_apps_fts(steam_apps_fts, rowid, name, name_search)
-                VALUES ('delete', old.appid, old.name, old.name_search);
-                INSERT INTO steam_apps_fts(rowid, name, name_search)
-                VALUES (new.appid, new.name, new.name_search);
-            END
-        """)
+        for statement in _STEAM_APPS_FTS_TRIGGERS:
+            cursor.execute(statement)
 
         # 5. Rebuild the FTS index from the content table in one shot.
         cursor.execute("INSERT INTO steam_apps_fts(steam_apps_fts) VALUES('rebuild')")
@@ -1383,6 +1527,92 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    async def delete_games_without_dlls(self, game_paths: list[str]) -> int:
+        """
+        Delete the given games if no game_dlls row points at them any more.
+
+        The streaming scan records a game before all of its DLLs are settled;
+        when a higher-priority launcher later claims every one of them, the
+        game is left empty and must not survive the scan.
+
+        Args:
+            game_paths: Paths of the candidate games
+
+        Returns:
+            Number of games removed from database
+        """
+        if not game_paths:
+            return 0
+        return await anyio.to_thread.run_sync(self._delete_games_without_dlls, game_paths, limiter=thread_io)
+
+    def _delete_games_without_dlls(self, game_paths: list[str]) -> int:
+        """Delete DLL-less games among game_paths (runs in thread)"""
+        conn = self._new_connection()
+        cursor = conn.cursor()
+
+        try:
+            placeholders = ','.join('?' * len(game_paths))
+            cursor.execute(f"""
+                DELETE FROM games
+                WHERE path IN ({placeholders})
+                AND NOT EXISTS (SELECT 1 FROM game_dlls WHERE game_dlls.game_id = games.id)
+            """, list(game_paths))
+            conn.commit()
+            if cursor.rowcount:
+                logger.info(f"Removed {cursor.rowcount} game(s) left without DLLs")
+            return cursor.rowcount
+
+        except Exception as e:
+            logger.error(f"Error deleting games without DLLs: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+
+    async def delete_dlls_by_paths(self, dll_paths: list[str]) -> int:
+        """
+        Delete the game_dlls rows at the given paths.
+
+        The streaming scan can write a DLL's row under one spelling of its path
+        before a higher-priority launcher claims the same file under another
+        (a symlinked library, say); the first row is then a duplicate. Rows
+        holding a restorable backup are kept, as in cleanup_orphan_dlls.
+
+        Args:
+            dll_paths: DLL paths whose rows are stale
+
+        Returns:
+            Number of DLL records removed
+        """
+        if not dll_paths:
+            return 0
+        return await anyio.to_thread.run_sync(self._delete_dlls_by_paths, dll_paths, limiter=thread_io)
+
+    def _delete_dlls_by_paths(self, dll_paths: list[str]) -> int:
+        """Delete unbacked DLL rows at dll_paths (runs in thread)"""
+        conn = self._new_connection()
+        cursor = conn.cursor()
+
+        try:
+            placeholders = ','.join('?' * len(dll_paths))
+            cursor.execute(f"""
+                DELETE FROM game_dlls
+                WHERE dll_path IN ({placeholders})
+                AND NOT EXISTS (
+                    SELECT 1 FROM dll_backups b
+                    WHERE b.game_dll_id = game_dlls.id AND b.is_active = 1
+                )
+            """, list(dll_paths))
+            conn.commit()
+            return cursor.rowcount
+
+        except Exception as e:
+            logger.error(f"Error deleting DLLs by path: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+
     async def cleanup_orphan_dlls(self, valid_dll_paths: set[str]) -> int:
         """
         Retire DLL records whose files no longer exist on the filesystem.
@@ -1684,6 +1914,74 @@ class DatabaseManager:
             logger.error(f"Error getting cached game exe: {e}", exc_info=True)
             return None
 
+    def get_exe_candidates_sync(self, game_id: int) -> list[str]:
+        """Return the game's recorded exe candidates, largest first.
+
+        SYNC method used as the heuristic step of exe_resolver, like
+        get_game_exe_sync. Empty if the scan has not recorded any.
+        """
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                SELECT exe_path FROM game_exe_candidates
+                WHERE game_id = ?
+                ORDER BY size DESC, exe_path COLLATE NOCASE
+                """,
+                (game_id,),
+            )
+            return [row[0] for row in cursor]
+        except Exception as e:
+            logger.error(f"Error getting exe candidates: {e}", exc_info=True)
+            return []
+
+    async def replace_exe_candidates(self, candidates: dict[int, list[tuple[str, int]]]) -> int:
+        """
+        Replace the recorded exe candidates of each given game.
+
+        Args:
+            candidates: Dict mapping game_id to its (exe_path, size) candidates;
+                games not in the dict keep their rows
+
+        Returns:
+            Number of candidate rows written
+        """
+        if not candidates:
+            return 0
+        return await anyio.to_thread.run_sync(
+            self._replace_exe_candidates, candidates, limiter=thread_io
+        )
+
+    def _replace_exe_candidates(self, candidates: dict[int, list[tuple[str, int]]]) -> int:
+        """Replace exe candidates (runs in thread) - dedicated connection for bulk write"""
+        conn = self._new_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany(
+                "DELETE FROM game_exe_candidates WHERE game_id = ?",
+                [(game_id,) for game_id in candidates],
+            )
+            rows = [
+                (game_id, exe_path, size)
+                for game_id, exes in candidates.items()
+                for exe_path, size in exes
+            ]
+            cursor.executemany(
+                "INSERT OR REPLACE INTO game_exe_candidates (game_id, exe_path, size) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Error saving exe candidates: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+
     async def save_game_dlss_presets(
         self,
         game_id: int,
@@ -2164,109 +2462,889 @@ class DatabaseManager:
             conn.rollback()
             return 0
 
-    # ===== High-Performance Batch Operations for UI Loading =====
-    # These sync methods are designed for use with ThreadPoolExecutor
-    # to achieve true parallelism (not just asyncio.to_thread serialization)
+    # ===== Scan Directory Index (incremental rescans) =====
 
-    def batch_get_dlls_for_games_sync(self, game_ids: list[int]) -> dict[int, list[GameDLL]]:
+    async def load_scan_dir_index(self) -> dict[str, ScanDirIndexEntry]:
         """
-        Get DLLs for multiple games in a single query - O(1) vs O(n).
-
-        SYNC method designed for ThreadPoolExecutor parallelism.
-        Uses thread-local connection for connection reuse.
-
-        Args:
-            game_ids: List of game IDs to fetch DLLs for
+        Load the whole persistent directory index.
 
         Returns:
-            Dict mapping game_id to list of GameDLL objects
+            Dict mapping directory path to its ScanDirIndexEntry (empty on error)
         """
-        if not game_ids:
-            return {}
+        return await anyio.to_thread.run_sync(self._load_scan_dir_index, limiter=thread_io)
 
+    def _load_scan_dir_index(self) -> dict[str, ScanDirIndexEntry]:
+        """Load directory index (runs in thread) - uses thread-local connection"""
         conn = self._get_thread_connection()
         cursor = conn.cursor()
 
         try:
-            placeholders = ','.join('?' * len(game_ids))
-            # missing_at IS NULL — see _get_dlls_for_game (issue #281).
-            cursor.execute(f"""
-                SELECT id, game_id, dll_type, dll_filename, dll_path, current_version, detected_at
-                FROM game_dlls
-                WHERE game_id IN ({placeholders}) AND missing_at IS NULL
-                ORDER BY game_id, dll_type
-            """, game_ids)
-
-            # Group results by game_id
-            result: dict[int, list[GameDLL]] = {gid: [] for gid in game_ids}
-            for row in cursor:
-                dll = GameDLL(
-                    id=row[0],
-                    game_id=row[1],
-                    dll_type=row[2],
-                    dll_filename=row[3],
-                    dll_path=row[4],
-                    current_version=row[5],
-                    detected_at=datetime.fromisoformat(row[6])
+            cursor.execute(
+                "SELECT path, mtime_ns, inode, dll_names, subdirs, exe_names, exe_sizes FROM scan_dir_index"
+            )
+            return {
+                row[0]: ScanDirIndexEntry(
+                    path=row[0],
+                    mtime_ns=row[1],
+                    inode=row[2],
+                    dll_names=row[3].split('/') if row[3] else [],
+                    subdirs=row[4].split('/') if row[4] else [],
+                    exe_names=row[5].split('/') if row[5] else [],
+                    exe_sizes=[int(n) for n in row[6].split('/')] if row[6] else [],
                 )
-                result[dll.game_id].append(dll)
-
-            return result
+                for row in cursor
+            }
 
         except Exception as e:
-            logger.error(f"Error batch getting DLLs for games: {e}", exc_info=True)
-            return {gid: [] for gid in game_ids}
+            logger.error(f"Error loading scan directory index: {e}", exc_info=True)
+            return {}
 
-    def batch_get_backups_grouped_sync(self, game_ids: list[int]) -> dict[int, dict[str, list[DLLBackup]]]:
+    async def save_scan_dir_index(
+        self,
+        upserts: list[ScanDirIndexEntry],
+        deletes: list[str],
+    ) -> int:
         """
-        Get backups grouped by DLL type for multiple games in a single query.
+        Apply one scan's changes to the persistent directory index.
 
-        SYNC method designed for ThreadPoolExecutor parallelism.
-        Uses thread-local connection for connection reuse.
+        Only directories that were (re)listed are written and only directories
+        that disappeared are deleted, so a no-change rescan writes nothing.
 
         Args:
-            game_ids: List of game IDs to fetch backups for
+            upserts: Entries for directories listed during this scan
+            deletes: Paths of directories no longer present
 
         Returns:
-            Dict mapping game_id to dict of dll_type -> list of DLLBackup
+            Number of rows written plus deleted
         """
-        if not game_ids:
-            return {}
+        if not upserts and not deletes:
+            return 0
 
-        conn = self._get_thread_connection()
+        return await anyio.to_thread.run_sync(
+            self._save_scan_dir_index, upserts, deletes, limiter=thread_io
+        )
+
+    def _save_scan_dir_index(self, upserts: list[ScanDirIndexEntry], deletes: list[str]) -> int:
+        """Save directory index changes (runs in thread).
+
+        Keeps a DEDICATED connection: a first scan writes one row per directory
+        of every library, which is a bulk write like _upsert_steam_apps.
+        """
+        conn = self._new_connection()
         cursor = conn.cursor()
 
         try:
-            placeholders = ','.join('?' * len(game_ids))
-            cursor.execute(f"""
-                SELECT
-                    gd.game_id,
-                    b.id, b.game_dll_id, g.name, gd.dll_filename,
-                    b.backup_path, b.original_version, b.backup_created_at,
-                    b.backup_size, b.is_active, gd.dll_type
-                FROM dll_backups b
-                INNER JOIN game_dlls gd ON b.game_dll_id = gd.id
-                INNER JOIN games g ON gd.game_id = g.id
-                WHERE gd.game_id IN ({placeholders}) AND b.is_active = 1
-                ORDER BY gd.game_id, gd.dll_type, b.backup_created_at DESC
-            """, game_ids)
+            cursor.executemany(
+                """
+                INSERT INTO scan_dir_index
+                    (path, mtime_ns, inode, dll_names, subdirs, exe_names, exe_sizes)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    mtime_ns = excluded.mtime_ns,
+                    inode = excluded.inode,
+                    dll_names = excluded.dll_names,
+                    subdirs = excluded.subdirs,
+                    exe_names = excluded.exe_names,
+                    exe_sizes = excluded.exe_sizes
+                """,
+                [
+                    (e.path, e.mtime_ns, e.inode, '/'.join(e.dll_names), '/'.join(e.subdirs),
+                     '/'.join(e.exe_names), '/'.join(str(n) for n in e.exe_sizes))
+                    for e in upserts
+                ],
+            )
+            cursor.executemany(
+                "DELETE FROM scan_dir_index WHERE path = ?",
+                [(path,) for path in deletes],
+            )
+            conn.commit()
+            logger.debug(
+                f"Scan directory index saved: {len(upserts)} written, {len(deletes)} removed"
+            )
+            return len(upserts) + len(deletes)
 
-            # Group results by game_id -> dll_type
-            result: dict[int, dict[str, list[DLLBackup]]] = {gid: {} for gid in game_ids}
-            for row in cursor:
-                game_id = row[0]
-                dll_type = row[10]
-                backup = DLLBackup(
-                    id=row[1],
-                    game_dll_id=row[2],
-                    game_name=row[3],
-                    dll_filename=row[4],
-                    backup_path=row[5],
-                    original_version=row[6],
-                    backup_created_at=datetime.fromisoformat(row[7]),
-                    backup_size=row[8],
-                    is_active=bool(row[9])
-                )
+        except Exception as e:
+            logger.error(f"Error saving scan directory index: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+
+    # ===== Persistent DLL Version Cache =====
+    # SYNC methods called from updater.get_dll_version, which always runs on a
+    # worker thread. Errors are logged at debug level and treated as a cache
+    # miss: a missing cache must never stop a version from being read.
+
+    def get_cached_dll_version_sync(
+        self, path: str, size: int, mtime_ns: int, inode: int
+    ) -> tuple[bool, str | None, str | None]:
+        """
+        Look up the cached FileVersion and fingerprint of a DLL revision.
+
+        Returns:
+            Tuple of (hit, version, fingerprint); version may be None on a hit
+            for a DLL that has no FileVersion, fingerprint None for rows cached
+            before fingerprints were recorded
+        """
+        conn = self._get_thread_connection()
+
+        try:
+            row = conn.execute(
+                "SELECT size, mtime_ns, inode, version, fingerprint FROM dll_version_cache WHERE path = ?",
+                (path,),
+            ).fetchone()
+            if row is None or (row[0], row[1], row[2]) != (size, mtime_ns, inode):
+                return False, None, None
+            return True, row[3], row[4]
+        except Exception as e:
+            logger.debug(f"DLL version cache lookup failed for {path}: {e}")
+            return False, None, None
+
+    def get_fingerprint_version_sync(self, fingerprint: str) -> tuple[bool, str | None]:
+        """
+        Look up the FileVersion recorded for a content fingerprint.
+
+        Returns:
+            Tuple of (hit, version)
+        """
+        conn = self._get_thread_connection()
+
+        try:
+            row = conn.execute(
+                "SELECT version FROM dll_fingerprints WHERE fingerprint = ?",
+                (fingerprint,),
+            ).fetchone()
+            if row is None:
+                return False, None
+            return True, row[0]
+        except Exception as e:
+            logger.debug(f"DLL fingerprint lookup failed for {fingerprint}: {e}")
+            return False, None
+
+    def store_dll_version_sync(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        inode: int,
+        version: str | None,
+        fingerprint: str | None = None,
+    ) -> None:
+        """Record the FileVersion (and fingerprint) of a DLL revision."""
+        conn = self._get_thread_connection()
+
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO dll_version_cache
+                    (path, size, mtime_ns, inode, version, fingerprint)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (path, size, mtime_ns, inode, version, fingerprint),
+            )
+            if fingerprint is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO dll_fingerprints (fingerprint, version) VALUES (?, ?)",
+                    (fingerprint, version),
+                )
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"DLL version cache store failed for {path}: {e}")
+            conn.rollback()
+
+    # ===== DLL Integrity Index =====
+    # SYNC methods called from dll_repository.get_dll_sha256 on worker
+    # threads. Same contract as the version cache: errors are a cache miss.
+
+    def get_cached_dll_digest_sync(
+        self, path: str, size: int, mtime_ns: int, inode: int
+    ) -> str | None:
+        """Look up the recorded SHA-256 of a DLL revision (None on a miss)."""
+        conn = self._get_thread_connection()
+
+        try:
+            row = conn.execute(
+                "SELECT size, mtime_ns, inode, sha256 FROM dll_digests WHERE path = ?",
+                (path,),
+            ).fetchone()
+            if row is None or (row[0], row[1], row[2]) != (size, mtime_ns, inode):
+                return None
+            return row[3]
+        except Exception as e:
+            logger.debug(f"DLL digest lookup failed for {path}: {e}")
+            return None
+
+    def store_dll_digest_sync(
+        self, path: str, size: int, mtime_ns: int, inode: int, sha256: str
+    ) -> None:
+        """Record the SHA-256 of a DLL revision."""
+        conn = self._get_thread_connection()
+
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO dll_digests (path, size, mtime_ns, inode, sha256)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (path, size, mtime_ns, inode, sha256),
+            )
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"DLL digest store failed for {path}: {e}")
+            conn.rollback()
+
+    # ===== DLL Store Index =====
+    # SYNC methods called from dll_store on worker threads. Errors are logged
+    # and treated as an empty index - the top-level cache still works.
+
+    def get_stored_dll_versions_sync(self, dll_name: str) -> list[tuple[str, str]]:
+        """List (version, sha256) stored for a DLL, most recently stored first."""
+        conn = self._get_thread_connection()
+
+        try:
+            return [
+                (row[0], row[1])
+                for row in conn.execute(
+                    "SELECT version, sha256 FROM dll_store WHERE dll_name = ? ORDER BY stored_at DESC",
+                    (dll_name,),
+                )
+            ]
+        except Exception as e:
+            logger.debug(f"DLL store lookup failed for {dll_name}: {e}")
+            return []
+
+    def add_stored_dll_version_sync(
+        self, dll_name: str, version: str, sha256: str, stored_at: int
+    ) -> None:
+        """Record that a DLL version is stored under a digest.
+
+        stored_at is bumped past the DLL's newest entry if needed, so the
+        order stays strict on platforms with a coarse clock.
+        """
+        conn = self._get_thread_connection()
+
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO dll_store (dll_name, version, sha256, stored_at)
+                VALUES (?, ?, ?, MAX(?, (
+                    SELECT COALESCE(MAX(stored_at), 0) + 1 FROM dll_store WHERE dll_name = ?
+                )))
+                """,
+                (dll_name, version, sha256, stored_at, dll_name),
+            )
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"DLL store update failed for {dll_name} {version}: {e}")
+            conn.rollback()
+
+    def remove_stored_dll_versions_sync(self, dll_name: str, versions: list[str]) -> None:
+        """Drop versions of a DLL from the store index."""
+        conn = self._get_thread_connection()
+
+        try:
+            conn.executemany(
+                "DELETE FROM dll_store WHERE dll_name = ? AND version = ?",
+                [(dll_name, version) for version in versions],
+            )
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"DLL store prune failed for {dll_name}: {e}")
+            conn.rollback()
+
+    # ===== Steam Manifest State (skip unchanged Steam games) =====
+
+    async def get_steam_manifest_states(self) -> dict[str, SteamManifestState]:
+        """
+        Load the appmanifest state recorded at each Steam game's last walk.
+
+        Returns:
+            Dict mapping install path to SteamManifestState (empty on error)
+        """
+        return await anyio.to_thread.run_sync(self._get_steam_manifest_states, limiter=thread_io)
+
+    def _get_steam_manifest_states(self) -> dict[str, SteamManifestState]:
+        """Load Steam manifest states (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT install_path, app_id, build_id, last_updated, size_on_disk,
+                       state_flags, dll_names_key, dll_count
+                FROM steam_app_manifests
+            """)
+            return {
+                row[0]: SteamManifestState(
+                    install_path=row[0],
+                    app_id=row[1],
+                    build_id=row[2],
+                    last_updated=row[3],
+                    size_on_disk=row[4],
+                    state_flags=row[5],
+                    dll_names_key=row[6],
+                    dll_count=row[7],
+                )
+                for row in cursor
+            }
+
+        except Exception as e:
+            logger.error(f"Error loading Steam manifest states: {e}", exc_info=True)
+            return {}
+
+    async def save_steam_manifest_states(self, states: list[SteamManifestState]) -> int:
+        """
+        Replace the recorded Steam manifest states with this scan's.
+
+        Games no longer installed drop out because the table is rewritten as a
+        whole; it holds one row per installed Steam game, so this is cheap.
+
+        Args:
+            states: State of every Steam game whose DLLs this scan recorded
+
+        Returns:
+            Number of rows written
+        """
+        return await anyio.to_thread.run_sync(
+            self._save_steam_manifest_states, states, limiter=thread_io
+        )
+
+    def _save_steam_manifest_states(self, states: list[SteamManifestState]) -> int:
+        """Replace Steam manifest states (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("DELETE FROM steam_app_manifests")
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO steam_app_manifests
+                    (install_path, app_id, build_id, last_updated, size_on_disk,
+                     state_flags, dll_names_key, dll_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (st.install_path, st.app_id, st.build_id, st.last_updated,
+                     st.size_on_disk, st.state_flags, st.dll_names_key, st.dll_count)
+                    for st in states
+                ],
+            )
+            conn.commit()
+            return len(states)
+
+        except Exception as e:
+            logger.error(f"Error saving Steam manifest states: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+
+    # ===== Game Root Probe Cache =====
+
+    async def load_game_root_probes(self) -> dict[str, GameRootProbe]:
+        """
+        Load every recorded find_game_root directory probe.
+
+        Returns:
+            Dict mapping directory path to its GameRootProbe (empty on error)
+        """
+        return await anyio.to_thread.run_sync(self._load_game_root_probes, limiter=thread_io)
+
+    def _load_game_root_probes(self) -> dict[str, GameRootProbe]:
+        """Load game root probes (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("SELECT path, mtime_ns, inode, indicators FROM game_root_probes")
+            return {
+                row[0]: GameRootProbe(path=row[0], mtime_ns=row[1], inode=row[2], indicators=row[3])
+                for row in cursor
+            }
+
+        except Exception as e:
+            logger.error(f"Error loading game root probes: {e}", exc_info=True)
+            return {}
+
+    async def save_game_root_probes(self, upserts: list[GameRootProbe], deletes: list[str]) -> int:
+        """
+        Apply new and dropped find_game_root directory probes.
+
+        Args:
+            upserts: Probes taken since the last save
+            deletes: Paths no longer worth keeping (evicted or stale)
+
+        Returns:
+            Number of rows written plus deleted
+        """
+        if not upserts and not deletes:
+            return 0
+
+        return await anyio.to_thread.run_sync(
+            self._save_game_root_probes, upserts, deletes, limiter=thread_io
+        )
+
+    def _save_game_root_probes(self, upserts: list[GameRootProbe], deletes: list[str]) -> int:
+        """Save game root probe changes (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany(
+                "DELETE FROM game_root_probes WHERE path = ?",
+                [(path,) for path in deletes],
+            )
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO game_root_probes (path, mtime_ns, inode, indicators)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(p.path, p.mtime_ns, p.inode, p.indicators) for p in upserts],
+            )
+            conn.commit()
+            return len(upserts) + len(deletes)
+
+        except Exception as e:
+            logger.error(f"Error saving game root probes: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+
+    # ===== Scan Checkpoints (resumable scans) =====
+
+    async def load_scan_checkpoint(self, dll_names_key: str, max_age_s: float) -> ScanCheckpoint:
+        """
+        Load the checkpoint of an interrupted scan.
+
+        Args:
+            dll_names_key: '/'-joined sorted DLL names the scan looks for; rows
+                           written for a different selection are ignored
+            max_age_s: Ignore rows older than this many seconds
+
+        Returns:
+            ScanCheckpoint (empty if there is none, or on error)
+        """
+        return await anyio.to_thread.run_sync(
+            self._load_scan_checkpoint, dll_names_key, max_age_s, limiter=thread_io
+        )
+
+    def _load_scan_checkpoint(self, dll_names_key: str, max_age_s: float) -> ScanCheckpoint:
+        """Load scan checkpoint (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+        checkpoint = ScanCheckpoint()
+
+        try:
+            cursor.execute(
+                """
+                SELECT kind, key, data FROM scan_checkpoints
+                WHERE dll_names_key = ? AND created_at >= ?
+                """,
+                (dll_names_key, int(datetime.now().timestamp() - max_age_s)),
+            )
+            for kind, key, data in cursor:
+                if kind == 'launcher':
+                    checkpoint.launchers[key] = decode_json(data.encode(), list[str])
+                elif kind == 'game':
+                    checkpoint.games[key] = decode_json(data.encode(), dict)
+            return checkpoint
+
+        except Exception as e:
+            logger.error(f"Error loading scan checkpoint: {e}", exc_info=True)
+            return ScanCheckpoint()
+
+    async def save_scan_checkpoint(self, kind: str, key: str, dll_names_key: str, data: Any) -> bool:
+        """
+        Record one finished launcher or recorded game of the running scan.
+
+        Args:
+            kind: 'launcher' or 'game'
+            key: Launcher name or game folder path
+            dll_names_key: DLL selection of the running scan
+            data: JSON-serialisable payload (DLL paths or game record)
+
+        Returns:
+            True if saved successfully
+        """
+        return await anyio.to_thread.run_sync(
+            self._save_scan_checkpoint, kind, key, dll_names_key, data, limiter=thread_io
+        )
+
+    def _save_scan_checkpoint(self, kind: str, key: str, dll_names_key: str, data: Any) -> bool:
+        """Save scan checkpoint row (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO scan_checkpoints (kind, key, dll_names_key, created_at, data)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (kind, key, dll_names_key, int(datetime.now().timestamp()), encode_json(data).decode()),
+            )
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving scan checkpoint: {e}", exc_info=True)
+            conn.rollback()
+            return False
+
+    async def clear_scan_checkpoint(self) -> bool:
+        """
+        Delete the scan checkpoint (after a scan completed).
+
+        Returns:
+            True if cleared successfully
+        """
+        return await anyio.to_thread.run_sync(self._clear_scan_checkpoint, limiter=thread_io)
+
+    def _clear_scan_checkpoint(self) -> bool:
+        """Clear scan checkpoint (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("DELETE FROM scan_checkpoints")
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error clearing scan checkpoint: {e}", exc_info=True)
+            conn.rollback()
+            return False
+
+    # ===== Store Search Cache =====
+
+    async def get_store_search_result(
+        self, name: str, hit_max_age_s: float, miss_max_age_s: float
+    ) -> StoreSearchResult | None:
+        """
+        Get the cached Store search result for a normalised game name.
+
+        Args:
+            name: Normalised game name
+            hit_max_age_s: Ignore cached app IDs older than this many seconds
+            miss_max_age_s: Ignore cached "no match" results older than this
+
+        Returns:
+            StoreSearchResult, or None if not cached, expired or on error
+        """
+        return await anyio.to_thread.run_sync(
+            self._get_store_search_result, name, hit_max_age_s, miss_max_age_s, limiter=thread_io
+        )
+
+    def _get_store_search_result(
+        self, name: str, hit_max_age_s: float, miss_max_age_s: float
+    ) -> StoreSearchResult | None:
+        """Get Store search result (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                "SELECT steam_app_id, fetched_at FROM store_search_cache WHERE name = ?",
+                (name,),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            steam_app_id, fetched_at = row
+            max_age_s = hit_max_age_s if steam_app_id is not None else miss_max_age_s
+            if fetched_at < datetime.now().timestamp() - max_age_s:
+                return None
+            return StoreSearchResult(steam_app_id=steam_app_id, fetched_at=fetched_at)
+
+        except Exception as e:
+            logger.error(f"Error reading store search cache: {e}", exc_info=True)
+            return None
+
+    async def save_store_search_result(self, name: str, steam_app_id: int | None) -> bool:
+        """
+        Cache a Store search result for a normalised game name.
+
+        Args:
+            name: Normalised game name
+            steam_app_id: Top hit, or None if the search found nothing
+
+        Returns:
+            True if saved successfully
+        """
+        return await anyio.to_thread.run_sync(
+            self._save_store_search_result, name, steam_app_id, limiter=thread_io
+        )
+
+    def _save_store_search_result(self, name: str, steam_app_id: int | None) -> bool:
+        """Save Store search result (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO store_search_cache (name, steam_app_id, fetched_at)
+                VALUES (?, ?, ?)
+                """,
+                (name, steam_app_id, int(datetime.now().timestamp())),
+            )
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving store search cache: {e}", exc_info=True)
+            conn.rollback()
+            return False
+
+    # ===== Proton Prefix Cache =====
+
+    async def get_compatdata_prefixes(self, path: str) -> CompatdataPrefixes | None:
+        """
+        Get the Proton prefixes recorded for a compatdata directory.
+
+        Args:
+            path: The ``steamapps/compatdata`` directory
+
+        Returns:
+            CompatdataPrefixes or None if not recorded (or on error)
+        """
+        return await anyio.to_thread.run_sync(self._get_compatdata_prefixes, path, limiter=thread_io)
+
+    def _get_compatdata_prefixes(self, path: str) -> CompatdataPrefixes | None:
+        """Get recorded compatdata prefixes (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                "SELECT path, mtime_ns, inode, app_dirs FROM compatdata_prefixes WHERE path = ?",
+                (path,),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return CompatdataPrefixes(
+                path=row[0],
+                mtime_ns=row[1],
+                inode=row[2],
+                app_dirs=row[3].split('/') if row[3] else [],
+            )
+
+        except Exception as e:
+            logger.error(f"Error loading compatdata prefixes: {e}", exc_info=True)
+            return None
+
+    async def save_compatdata_prefixes(self, entry: CompatdataPrefixes) -> bool:
+        """
+        Record the Proton prefixes of a compatdata directory.
+
+        Args:
+            entry: Prefixes found at the directory's current mtime/inode
+
+        Returns:
+            True if saved successfully
+        """
+        return await anyio.to_thread.run_sync(self._save_compatdata_prefixes, entry, limiter=thread_io)
+
+    def _save_compatdata_prefixes(self, entry: CompatdataPrefixes) -> bool:
+        """Save compatdata prefixes (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO compatdata_prefixes (path, mtime_ns, inode, app_dirs)
+                VALUES (?, ?, ?, ?)
+                """,
+                (entry.path, entry.mtime_ns, entry.inode, '/'.join(entry.app_dirs)),
+            )
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving compatdata prefixes: {e}", exc_info=True)
+            conn.rollback()
+            return False
+
+    async def get_dll_paths_under(self, roots: list[str]) -> dict[str, list[str]]:
+        """
+        Get the live (not marked missing) game_dlls paths below each root.
+
+        Args:
+            roots: Directory paths, e.g. Steam install dirs
+
+        Returns:
+            Dict mapping each root (as given) to the DLL paths recorded under
+            it; roots without any rows map to an empty list
+        """
+        if not roots:
+            return {}
+        return await anyio.to_thread.run_sync(self._get_dll_paths_under, roots, limiter=thread_io)
+
+    def _get_dll_paths_under(self, roots: list[str]) -> dict[str, list[str]]:
+        """Get DLL paths grouped by root (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+        result: dict[str, list[str]] = {root: [] for root in roots}
+        by_lower = {os.path.normcase(root).lower(): root for root in roots}
+
+        try:
+            cursor.execute("SELECT dll_path FROM game_dlls WHERE missing_at IS NULL")
+            for (dll_path,) in cursor:
+                # Walk up the parents instead of prefix-testing every root.
+                parent = os.path.dirname(dll_path)
+                while parent:
+                    root = by_lower.get(os.path.normcase(parent).lower())
+                    if root is not None:
+                        result[root].append(dll_path)
+                        break
+                    next_parent = os.path.dirname(parent)
+                    if next_parent == parent:
+                        break
+                    parent = next_parent
+            return result
+
+        except Exception as e:
+            logger.error(f"Error loading DLL paths by root: {e}", exc_info=True)
+            return {root: [] for root in roots}
+
+    async def get_game_dll_paths(self) -> dict[str, tuple[str, list[str]]]:
+        """
+        Get every game with its launcher and live (not marked missing) DLL paths.
+
+        Used by the library watcher to decide which directories to watch.
+
+        Returns:
+            Dict mapping game path to (launcher, DLL paths); games without
+            live DLL rows are left out
+        """
+        return await anyio.to_thread.run_sync(self._get_game_dll_paths, limiter=thread_io)
+
+    def _get_game_dll_paths(self) -> dict[str, tuple[str, list[str]]]:
+        """Get DLL paths grouped by game (runs in thread) - uses thread-local connection"""
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+        result: dict[str, tuple[str, list[str]]] = {}
+
+        try:
+            cursor.execute("""
+                SELECT g.path, g.launcher, d.dll_path
+                FROM game_dlls d
+                JOIN games g ON g.id = d.game_id
+                WHERE d.missing_at IS NULL
+            """)
+            for game_path, launcher, dll_path in cursor:
+                entry = result.get(game_path)
+                if entry is None:
+                    entry = result[game_path] = (launcher, [])
+                entry[1].append(dll_path)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error loading DLL paths by game: {e}", exc_info=True)
+            return {}
+
+    # ===== High-Performance Batch Operations for UI Loading =====
+    # These sync methods are designed for use with ThreadPoolExecutor
+    # to achieve true parallelism (not just asyncio.to_thread serialization)
+
+    def batch_get_dlls_for_games_sync(self, game_ids: list[int]) -> dict[int, list[GameDLL]]:
+        """
+        Get DLLs for multiple games in a single query - O(1) vs O(n).
+
+        SYNC method designed for ThreadPoolExecutor parallelism.
+        Uses thread-local connection for connection reuse.
+
+        Args:
+            game_ids: List of game IDs to fetch DLLs for
+
+        Returns:
+            Dict mapping game_id to list of GameDLL objects
+        """
+        if not game_ids:
+            return {}
+
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            placeholders = ','.join('?' * len(game_ids))
+            # missing_at IS NULL — see _get_dlls_for_game (issue #281).
+            cursor.execute(f"""
+                SELECT id, game_id, dll_type, dll_filename, dll_path, current_version, detected_at
+                FROM game_dlls
+                WHERE game_id IN ({placeholders}) AND missing_at IS NULL
+                ORDER BY game_id, dll_type
+            """, game_ids)
+
+            # Group results by game_id
+            result: dict[int, list[GameDLL]] = {gid: [] for gid in game_ids}
+            for row in cursor:
+                dll = GameDLL(
+                    id=row[0],
+                    game_id=row[1],
+                    dll_type=row[2],
+                    dll_filename=row[3],
+                    dll_path=row[4],
+                    current_version=row[5],
+                    detected_at=datetime.fromisoformat(row[6])
+                )
+                result[dll.game_id].append(dll)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error batch getting DLLs for games: {e}", exc_info=True)
+            return {gid: [] for gid in game_ids}
+
+    def batch_get_backups_grouped_sync(self, game_ids: list[int]) -> dict[int, dict[str, list[DLLBackup]]]:
+        """
+        Get backups grouped by DLL type for multiple games in a single query.
+
+        SYNC method designed for ThreadPoolExecutor parallelism.
+        Uses thread-local connection for connection reuse.
+
+        Args:
+            game_ids: List of game IDs to fetch backups for
+
+        Returns:
+            Dict mapping game_id to dict of dll_type -> list of DLLBackup
+        """
+        if not game_ids:
+            return {}
+
+        conn = self._get_thread_connection()
+        cursor = conn.cursor()
+
+        try:
+            placeholders = ','.join('?' * len(game_ids))
+            cursor.execute(f"""
+                SELECT
+                    gd.game_id,
+                    b.id, b.game_dll_id, g.name, gd.dll_filename,
+                    b.backup_path, b.original_version, b.backup_created_at,
+                    b.backup_size, b.is_active, gd.dll_type
+                FROM dll_backups b
+                INNER JOIN game_dlls gd ON b.game_dll_id = gd.id
+                INNER JOIN games g ON gd.game_id = g.id
+                WHERE gd.game_id IN ({placeholders}) AND b.is_active = 1
+                ORDER BY gd.game_id, gd.dll_type, b.backup_created_at DESC
+            """, game_ids)
+
+            # Group results by game_id -> dll_type
+            result: dict[int, dict[str, list[DLLBackup]]] = {gid: {} for gid in game_ids}
+            for row in cursor:
+                game_id = row[0]
+                dll_type = row[10]
+                backup = DLLBackup(
+                    id=row[1],
+                    game_dll_id=row[2],
+                    game_name=row[3],
+                    dll_filename=row[4],
+                    backup_path=row[5],
+                    original_version=row[6],
+                    backup_created_at=datetime.fromisoformat(row[7]),
+                    backup_size=row[8],
+                    is_active=bool(row[9])
+                )
 
                 if dll_type not in result[game_id]:
                     result[game_id][dll_type] = []
@@ -3682,6 +4760,133 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    # A fresh app list is loaded into steam_apps_staging (no FTS triggers, so
+    # no per-row index maintenance), then swapped in by
+    # swap_in_staged_steam_apps with a single FTS rebuild.
+
+    async def begin_steam_apps_staging(self) -> bool:
+        """
+        (Re)create the empty steam_apps_staging table.
+
+        Returns:
+            True if the staging table is ready
+        """
+        return await anyio.to_thread.run_sync(self._begin_steam_apps_staging, limiter=thread_io)
+
+    def _begin_steam_apps_staging(self) -> bool:
+        """Create staging table (runs in thread) - dedicated connection"""
+        conn = self._new_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("DROP TABLE IF EXISTS steam_apps_staging")
+            cursor.execute("""
+                CREATE TABLE steam_apps_staging (
+                    appid INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    name_normalized TEXT NOT NULL,
+                    name_search TEXT NOT NULL DEFAULT ''
+                )
+            """)
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error creating Steam apps staging table: {e}", exc_info=True)
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    async def stage_steam_apps(self, apps: list[tuple[int, str, str, str]]) -> int:
+        """
+        Add one chunk of the app list to steam_apps_staging.
+
+        Args:
+            apps: Tuples (appid, name, name_normalized, name_search), as for
+                  upsert_steam_apps
+
+        Returns:
+            Number of rows staged (0 on error)
+        """
+        if not apps:
+            return 0
+        return await anyio.to_thread.run_sync(self._stage_steam_apps, apps, limiter=thread_io)
+
+    def _stage_steam_apps(self, apps: list[tuple[int, str, str, str]]) -> int:
+        """Stage Steam apps chunk (runs in thread) - dedicated connection"""
+        conn = self._new_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany("""
+                INSERT OR REPLACE INTO steam_apps_staging (appid, name, name_normalized, name_search)
+                VALUES (?, ?, ?, ?)
+            """, apps)
+            conn.commit()
+            return len(apps)
+
+        except Exception as e:
+            logger.error(f"Error staging Steam apps: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+
+    async def swap_in_staged_steam_apps(self) -> int:
+        """
+        Atomically replace steam_apps with steam_apps_staging.
+
+        One transaction drops the old table, renames the staging table into
+        its place, recreates the FTS triggers and rebuilds the FTS index once
+        from the new content. Readers see the old list until it commits.
+
+        Returns:
+            Number of apps now in steam_apps (0 on error, old list kept)
+        """
+        return await anyio.to_thread.run_sync(self._swap_in_staged_steam_apps, limiter=thread_io)
+
+    def _swap_in_staged_steam_apps(self) -> int:
+        """Swap in staged Steam apps (runs in thread) - dedicated connection"""
+        conn = self._new_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            for trigger in ("steam_apps_ai", "steam_apps_ad", "steam_apps_au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            cursor.execute("DROP TABLE steam_apps")
+            cursor.execute("ALTER TABLE steam_apps_staging RENAME TO steam_apps")
+            cursor.execute(_STEAM_APPS_NORMALIZED_INDEX)
+            for statement in _STEAM_APPS_FTS_TRIGGERS:
+                cursor.execute(statement)
+            cursor.execute("INSERT INTO steam_apps_fts(steam_apps_fts) VALUES('rebuild')")
+            count = cursor.execute("SELECT COUNT(*) FROM steam_apps").fetchone()[0]
+            conn.commit()
+            return count
+
+        except Exception as e:
+            logger.error(f"Error swapping in Steam app list: {e}", exc_info=True)
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+
+    async def drop_steam_apps_staging(self) -> None:
+        """Discard steam_apps_staging (an ingestion that is not swapped in)."""
+        await anyio.to_thread.run_sync(self._drop_steam_apps_staging, limiter=thread_io)
+
+    def _drop_steam_apps_staging(self) -> None:
+        """Drop staging table (runs in thread) - dedicated connection"""
+        conn = self._new_connection()
+        try:
+            conn.execute("DROP TABLE IF EXISTS steam_apps_staging")
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Error dropping Steam apps staging table: {e}", exc_info=True)
+        finally:
+            conn.close()
+
     # ===== Per-Game Backup Operations =====
 
     async def get_backups_for_game(self, game_id: int) -> list[GameDLLBackup]:
@@ -10,7 +10,15 @@ import aiofiles
 import concurrent.futures
 from .logger import setup_logger
 from .config import initialize_dll_paths, update_latest_dll_versions_from_cache, Concurrency
-from .concurrency_limiters import io_heavy, io_extreme, thread_cpu
+from .concurrency_limiters import io_heavy, io_extreme, thread_cpu, thread_io
+from .http_cache import (
+    clear_validators,
+    fetch_cached,
+    load_validators,
+    save_validators,
+    validators_from_headers,
+)
+from .models import HttpValidators
 
 logger = setup_logger()
 
@@ -53,6 +61,45 @@ KNOWN_BAD_DLL_BUILDS = {
 }
 
 
+def get_dll_sha256(path: Path) -> str:
+    """
+    SHA-256 (hex) of a DLL, from the integrity index when possible.
+
+    The index in games.db is keyed by file identity (path, size, mtime_ns,
+    inode): downloads record the digest they verified while streaming, and a
+    file not in it yet is hashed once and recorded. Runs on worker threads.
+
+    Raises OSError if the file cannot be read.
+    """
+    from .database import db_manager
+
+    path_str = str(path)
+    st = os.stat(path_str)
+    identity = (path_str, st.st_size, st.st_mtime_ns, st.st_ino)
+    digest = db_manager.get_cached_dll_digest_sync(*identity)
+    if digest is None:
+        with open(path_str, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        db_manager.store_dll_digest_sync(*identity, digest)
+    return digest
+
+
+def _record_dll_digest(path: Path, digest: str) -> None:
+    """Record the digest of a file just written (see get_dll_sha256)."""
+    from .database import db_manager
+
+    st = os.stat(path)
+    db_manager.store_dll_digest_sync(str(path), st.st_size, st.st_mtime_ns, st.st_ino, digest)
+
+
+def manifest_sha256(dll_info: dict) -> str | None:
+    """Published SHA-256 (hex) of a manifest entry, None if it has none."""
+    digest = dll_info.get("sha256")
+    if not digest:
+        return None
+    return digest.split(":", 1)[1].strip().lower() if ":" in digest else digest.strip().lower()
+
+
 def is_known_bad_dll(dll_name: str, local_path: Path) -> bool:
     """Check whether a cached DLL is a known-bad build (see KNOWN_BAD_DLL_BUILDS)."""
     bad_build = KNOWN_BAD_DLL_BUILDS.get(dll_name.lower())
@@ -61,9 +108,7 @@ def is_known_bad_dll(dll_name: str, local_path: Path) -> bool:
     try:
         if local_path.stat().st_size != bad_build["size"]:
             return False
-        with open(local_path, "rb") as f:
-            digest = hashlib.file_digest(f, "sha256").hexdigest()
-        return digest == bad_build["sha256"]
+        return get_dll_sha256(local_path) == bad_build["sha256"]
     except OSError as e:
         logger.warning(f"Could not check {local_path} against known-bad builds: {e}")
         return False
@@ -145,18 +190,23 @@ def get_local_dll_path(dll_name, skip_update_check=False):
 
 
 async def get_remote_manifest_async() -> dict | None:
-    """Fetch the remote DLL manifest (async version)"""
+    """Fetch the remote DLL manifest (async version)
+
+    Conditional on the cached manifest.json: when the manifest is unchanged
+    (HTTP 304) the cached copy is returned, and a fresh download replaces it.
+    """
+    manifest_path = Path(LOCAL_DLL_CACHE_DIR) / "manifest.json"
     try:
         session = await get_http_session()
-        async with session.get(
-            DLL_MANIFEST_URL,
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as response:
-            if response.status != 200:
-                logger.error(f"Failed to fetch DLL manifest: HTTP {response.status}")
-                return None
-            content = await response.read()
+        content = await fetch_cached(session, DLL_MANIFEST_URL, manifest_path, timeout=10)
+        if content is None:
+            return None
+        try:
             return _json_decoder.decode(content)
+        except msgspec.DecodeError:
+            # Don't let a 304 keep serving an unreadable copy
+            await anyio.to_thread.run_sync(clear_validators, manifest_path, limiter=thread_io)
+            raise
     except TimeoutError:
         logger.error("Timeout fetching DLL manifest")
         return None
@@ -217,19 +267,6 @@ def update_cached_manifest(manifest):
         return False
 
 
-async def update_cached_manifest_async(manifest):
-    """Update the cached manifest (async version)"""
-    manifest_path = Path(LOCAL_DLL_CACHE_DIR) / "manifest.json"
-    try:
-        encoded = msgspec.json.format(msgspec.json.encode(manifest), indent=2)
-        async with aiofiles.open(manifest_path, "wb") as f:
-            await f.write(encoded)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to update cached manifest: {e}")
-        return False
-
-
 async def check_for_dll_update_async(dll_name: str, manifest: dict | None = None) -> bool:
     """Check if a newer version of the DLL is available (async version)"""
     from .updater import get_dll_version, parse_version
@@ -266,6 +303,22 @@ async def check_for_dll_update_async(dll_name: str, manifest: dict | None = None
         logger.warning(f"{dll_name} not found in manifest")
         return False
 
+    # A published digest settles it: the cached copy either is that exact
+    # build or must be replaced (the digest comes from the integrity index,
+    # so this is normally a stat plus a lookup)
+    expected = manifest_sha256(manifest[dll_name])
+    if expected is not None:
+        try:
+            actual = await anyio.to_thread.run_sync(get_dll_sha256, local_path, limiter=thread_cpu)
+        except OSError as e:
+            logger.warning(f"Could not hash cached {dll_name}: {e}")
+        else:
+            if actual == expected:
+                logger.info(f"{dll_name} matches the published digest, up to date")
+                return False
+            logger.info(f"Cached {dll_name} does not match the published digest, update needed")
+            return True
+
     remote_version = manifest[dll_name]["version"]
 
     try:
@@ -317,6 +370,22 @@ def check_for_dll_update(dll_name):
         logger.warning(f"{dll_name} not found in manifest")
         return False
 
+    # A published digest settles it: the cached copy either is that exact
+    # build or must be replaced (the digest comes from the integrity index,
+    # so this is normally a stat plus a lookup)
+    expected = manifest_sha256(manifest[dll_name])
+    if expected is not None:
+        try:
+            actual = get_dll_sha256(local_path)
+        except OSError as e:
+            logger.warning(f"Could not hash cached {dll_name}: {e}")
+        else:
+            if actual == expected:
+                logger.info(f"{dll_name} matches the published digest, up to date")
+                return False
+            logger.info(f"Cached {dll_name} does not match the published digest, update needed")
+            return True
+
     remote_version = manifest[dll_name]["version"]
 
     try:
@@ -339,10 +408,163 @@ def check_for_dll_update(dll_name):
         return True
 
 
+def _verify_download(dll_name: str, dll_info: dict, actual_hex: str, temp_path: Path) -> bool:
+    """
+    Compare a streamed download's hash against the manifest digest.
+
+    A mismatch deletes the temp file - a corrupt or tampered DLL must never
+    reach the cache. Entries without a published digest are accepted (HTTPS
+    to GitHub still authenticated them), with a warning.
+    """
+    expected = manifest_sha256(dll_info)
+    if expected is None:
+        logger.warning(f"No sha256 in manifest for {dll_name} - skipping hash verification")
+        return True
+    if actual_hex != expected:
+        logger.error(f"Digest mismatch for {dll_name}: expected {expected}, got {actual_hex}")
+        _discard_partial(temp_path)
+        return False
+    logger.info(f"Verified sha256 for {dll_name}")
+    return True
+
+
+def _install_download(temp_path: Path, local_path: Path, digest: str) -> None:
+    """Move a finished download into the cache, record its digest and store it."""
+    os.replace(temp_path, local_path)  # atomic, also over an existing copy
+    clear_validators(temp_path)
+    _record_dll_digest(local_path, digest)
+
+    # Keep the build in the multi-version store so it can be pinned later
+    from .dll_store import add_dll
+    add_dll(local_path.name, local_path, digest)
+
+
+def _patch_cached_dll(local_path: Path, patch: bytes, expected: str) -> bool:
+    """
+    Apply a delta to the cached DLL, installing the result if it verifies.
+
+    Runs on a worker thread. Returns False (cache untouched) if the patch
+    does not apply or its result is not the published build.
+    """
+    from .binary_delta import DeltaError, apply_delta
+
+    try:
+        patched = apply_delta(local_path.read_bytes(), patch)
+    except DeltaError as e:
+        logger.warning(f"Delta for {local_path.name} does not apply: {e}")
+        return False
+    digest = hashlib.sha256(patched).hexdigest()
+    if digest != expected:
+        logger.warning(f"Patched {local_path.name} does not match the published digest")
+        return False
+
+    patched_path = local_path.with_suffix(local_path.suffix + ".patched")
+    patched_path.write_bytes(patched)
+    _install_download(patched_path, local_path, digest)
+    return True
+
+
+async def _try_delta_update(dll_name: str, dll_info: dict, local_path: Path) -> bool:
+    """
+    Update the cached DLL with a binary delta instead of the full file.
+
+    Manifest entries may list deltas keyed by the SHA-256 of the build they
+    apply to, as paths under the DLL repository::
+
+        "deltas": {"<source sha256>": "deltas/nvngx_dlss.dll/<source>-<target>.bsd"}
+
+    Used only when the entry publishes its own sha256 (to verify the
+    result) and the cached copy's digest has a delta.
+
+    Returns:
+        True if the cached copy was patched to the published build; False
+        to fall back to the full download
+    """
+    deltas = dll_info.get("deltas")
+    expected = manifest_sha256(dll_info)
+    if not deltas or expected is None or not local_path.exists():
+        return False
+
+    try:
+        source = await anyio.to_thread.run_sync(get_dll_sha256, local_path, limiter=thread_cpu)
+        delta_path = deltas.get(source)
+        if delta_path is None:
+            return False
+
+        session = await get_http_session()
+        async with session.get(
+            f"{GITHUB_RAW_BASE}/{delta_path}",
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60),
+        ) as response:
+            if response.status != 200:
+                logger.warning(f"Failed to fetch delta for {dll_name}: HTTP {response.status}")
+                return False
+            patch = await response.read()
+
+        if not await anyio.to_thread.run_sync(
+            _patch_cached_dll, local_path, patch, expected, limiter=thread_cpu
+        ):
+            return False
+    except (TimeoutError, aiohttp.ClientError, OSError) as e:
+        logger.warning(f"Delta update of {dll_name} failed: {e}")
+        return False
+
+    logger.info(f"Patched {dll_name} to v{dll_info['version']} with a {len(patch)} byte delta")
+    return True
+
+
+def _resumable_partial(temp_path: Path) -> tuple[int, str | None]:
+    """
+    Byte count and ETag of a partial download that can be resumed.
+
+    A partial file is kept after a dropped connection together with the ETag
+    of the download it belongs to; anything else left behind is deleted.
+
+    Returns:
+        (bytes already downloaded, ETag), or (0, None) to start from scratch
+    """
+    validators = load_validators(temp_path)
+    if validators is not None and validators.etag:
+        size = temp_path.stat().st_size
+        if size:
+            return size, validators.etag
+    temp_path.unlink(missing_ok=True)
+    clear_validators(temp_path)
+    return 0, None
+
+
+def _discard_partial(temp_path: Path) -> None:
+    temp_path.unlink(missing_ok=True)
+    clear_validators(temp_path)
+
+
+def _hash_partial(temp_path: Path):
+    """SHA-256 state after the bytes already downloaded (to continue hashing)."""
+    with open(temp_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256")
+
+
+def _content_range_start(value: str | None) -> int | None:
+    """First byte of a ``Content-Range: bytes <start>-<end>/<size>`` header."""
+    try:
+        return int(value.split()[1].split("-", 1)[0])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
 async def download_latest_dll_async(dll_name: str, manifest: dict | None = None, progress_callback=None) -> bool:
     """
     Download the latest version of a DLL (async version with streaming)
 
+    When the manifest has a delta for the cached build, the cached copy is
+    patched instead (see _try_delta_update), falling back to a full download.
+
+    A download cut off by a network error leaves its partial ``.tmp`` file
+    behind with the response's ETag. The next attempt resumes it with a
+    ``Range`` request guarded by ``If-Range``: the server sends the rest
+    (206) only while the file is unchanged and answers with the whole file
+    (200) otherwise, including when it does not support ranges.
+
     Args:
         dll_name: Name of the DLL to download
         manifest: Optional manifest to use (avoids refetching)
@@ -364,10 +586,21 @@ async def download_latest_dll_async(dll_name: str, manifest: dict | None = None,
     local_path = Path(LOCAL_DLL_CACHE_DIR) / dll_name
     temp_path = local_path.with_suffix(local_path.suffix + ".tmp")
 
+    if await _try_delta_update(dll_name, dll_info, local_path):
+        # A partial full download is of no use any more
+        await anyio.to_thread.run_sync(_discard_partial, temp_path, limiter=thread_io)
+        return True
+
     try:
+        resume_from, etag = await anyio.to_thread.run_sync(
+            _resumable_partial, temp_path, limiter=thread_io
+        )
+        headers = {"Range": f"bytes={resume_from}-", "If-Range": etag} if resume_from else {}
+
         session = await get_http_session()
         async with session.get(
             download_url,
+            headers=headers,
             # Per-read, not per-download. A wall-clock `total` penalises large
             # files rather than stalled ones: libxess.dll is already ~78 MB and the
             # FidelityFX SDK 2.x frame-generation DLL is ~40 MB, so total=120 meant
@@ -378,18 +611,49 @@ async def download_latest_dll_async(dll_name: str, manifest: dict | None = None,
                 total=None, sock_connect=30, sock_read=60
             )
         ) as response:
-            if response.status != 200:
+            content_length = int(response.headers.get('content-length', 0))
+
+            if resume_from and (
+                response.status == 416
+                or (response.status == 206
+                    and _content_range_start(response.headers.get("Content-Range")) != resume_from)
+            ):
+                # The partial doesn't fit the file on the server: start over
+                logger.info(f"Cannot resume {dll_name} (HTTP {response.status}), downloading it again")
+                await anyio.to_thread.run_sync(_discard_partial, temp_path, limiter=thread_io)
+                return await download_latest_dll_async(dll_name, manifest, progress_callback)
+
+            if resume_from and response.status == 206:
+                logger.info(f"Resuming {dll_name} at {resume_from} bytes")
+                digest = await anyio.to_thread.run_sync(_hash_partial, temp_path, limiter=thread_cpu)
+                downloaded = resume_from
+                total_size = resume_from + content_length if content_length else 0
+                mode = 'ab'
+            elif response.status == 200:
+                # Fresh download; remember its ETag (strong ones only - If-Range
+                # can't use weak validators) so a dropped connection can resume
+                fresh = validators_from_headers(response.headers)
+                if fresh is not None and fresh.etag and not fresh.etag.startswith("W/"):
+                    await anyio.to_thread.run_sync(
+                        save_validators, temp_path, HttpValidators(etag=fresh.etag), limiter=thread_io
+                    )
+                else:
+                    await anyio.to_thread.run_sync(clear_validators, temp_path, limiter=thread_io)
+                digest = hashlib.sha256()
+                downloaded = 0
+                total_size = content_length
+                mode = 'wb'
+            else:
                 logger.error(f"Failed to download {dll_name}: HTTP {response.status}")
                 return False
 
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-
-            async with aiofiles.open(temp_path, 'wb') as f:
+            async with aiofiles.open(temp_path, mode) as f:
                 # 256 KB chunks - DLLs are multi-MB, so 8 KB meant thousands of
-                # tiny awaits/writes per download for no benefit.
+                # tiny awaits/writes per download for no benefit. Hashed as it
+                # arrives, so verification costs no extra pass over the file.
                 async for chunk in response.content.iter_chunked(262144):
                     await f.write(chunk)
+                    digest.update(chunk)
                     downloaded += len(chunk)
 
                     if progress_callback and total_size > 0:
@@ -398,14 +662,16 @@ async def download_latest_dll_async(dll_name: str, manifest: dict | None = None,
                         else:
                             progress_callback(downloaded, total_size, dll_name)
 
-        # Replace existing file using Python 3.14 Path.move()
-        if local_path.exists():
-            local_path.unlink()
-        temp_path.move(local_path)
+        if not _verify_download(dll_name, dll_info, digest.hexdigest(), temp_path):
+            return False
+        await anyio.to_thread.run_sync(
+            _install_download, temp_path, local_path, digest.hexdigest(), limiter=thread_io
+        )
 
         logger.info(f"Successfully downloaded {dll_name} v{dll_info['version']}")
         return True
 
+    # Network failures keep the partial file for the next attempt to resume
     except TimeoutError:
         logger.error(f"Timeout downloading {dll_name}")
         return False
@@ -414,11 +680,10 @@ async def download_latest_dll_async(dll_name: str, manifest: dict | None = None,
         return False
     except Exception as e:
         logger.error(f"Failed to download {dll_name}: {e}")
-        if temp_path.exists():
-            try:
-                temp_path.unlink()
-            except:
-                pass
+        try:
+            _discard_partial(temp_path)
+        except OSError:
+            pass
         return False
 
 
@@ -451,20 +716,23 @@ def download_latest_dll(dll_name, progress_callback=None):
 
         total_size = int(response.headers.get('content-length', 0))
         temp_path = local_path.with_suffix(local_path.suffix + ".tmp")
+        clear_validators(temp_path)  # not resumable: overwritten from the start
         downloaded = 0
+        digest = hashlib.sha256()
 
         with open(temp_path, "wb") as f:
             # 256 KB chunks - see download_latest_dll_async; DLLs are multi-MB.
             for chunk in response.iter_content(chunk_size=262144):
                 f.write(chunk)
+                digest.update(chunk)
                 downloaded += len(chunk)
 
                 if progress_callback and total_size > 0:
                     progress_callback(downloaded, total_size, dll_name)
 
-        if local_path.exists():
-            local_path.unlink()
-        temp_path.move(local_path)
+        if not _verify_download(dll_name, dll_info, digest.hexdigest(), temp_path):
+            return False
+        _install_download(temp_path, local_path, digest.hexdigest())
 
         logger.info(f"Successfully downloaded {dll_name} v{dll_info['version']}")
         return True
@@ -506,10 +774,9 @@ async def initialize_dll_cache_async(progress_callback=None):
     await report_progress(0, 100, "Fetching DLL manifest...")
 
     # Fetch latest manifest
+    # (get_remote_manifest_async keeps the cached copy current itself)
     manifest = await get_remote_manifest_async()
     if manifest:
-        await update_cached_manifest_async(manifest)
-
         await report_progress(10, 100, "Checking for DLL updates...")
 
         # Check all DLLs for updates concurrently
@@ -580,7 +847,8 @@ async def initialize_dll_cache_async(progress_callback=None):
     # Set initialized flag with lock for thread safety
     with _cache_init_lock:
         _cache_initialized = True
-    initialize_dll_paths()
+    # Resolving the paths queries the DLL store, keep it off the event loop
+    await anyio.to_thread.run_sync(initialize_dll_paths, limiter=thread_io)
     update_latest_dll_versions_from_cache()
 
     await report_progress(100, 100, "DLL cache initialized")
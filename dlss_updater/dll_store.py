@@ -0,0 +1,193 @@
+"""
+Multi-version, content-addressable store of cached DLLs.
+
+The top level of the DLL cache holds one file per DLL name - the latest
+download - and every download replaces it. The store keeps the builds it
+replaced, so switching a DLL (or one game) back to an earlier build is a
+config change instead of a download:
+
+    <dll_cache>/store/<sha256>/<dll name>   one file per distinct build
+    games.db dll_store table                 DLL name -> version -> sha256
+
+Downloads are added as they are installed (hard-linked to the cache file
+where the filesystem allows, copied otherwise). The ``keep_versions`` most
+recently stored versions of each DLL are kept, plus any version pinned in
+the ``[dll_store]`` config section; older ones are pruned.
+
+resolve_dll_paths() turns the cached files into the DLL paths the updaters
+install from, applying the pins; it only reads the store. All functions
+here are sync and run on worker threads.
+"""
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+from .config import config_manager
+from .logger import setup_logger
+
+logger = setup_logger()
+
+STORE_DIR_NAME = "store"
+
+
+def _store_dir() -> Path:
+    from . import dll_repository
+
+    return Path(dll_repository.LOCAL_DLL_CACHE_DIR) / STORE_DIR_NAME
+
+
+def _object_path(dll_name: str, digest: str) -> Path:
+    return _store_dir() / digest / dll_name
+
+
+def is_pinned_source(path: str | os.PathLike) -> bool:
+    """Whether a source DLL path is a stored build (i.e. came from a pin)."""
+    return Path(path).resolve().parent.parent == _store_dir().resolve()
+
+
+def stored_versions(dll_name: str) -> list[tuple[str, str]]:
+    """(version, sha256) of the stored builds of a DLL, newest first."""
+    from .database import db_manager
+
+    return db_manager.get_stored_dll_versions_sync(dll_name.lower())
+
+
+def stored_dll_path(dll_name: str, version: str) -> str | None:
+    """Path of a stored DLL version, None if it is not in the store."""
+    dll_name = dll_name.lower()
+    for stored_version, digest in stored_versions(dll_name):
+        if stored_version == version:
+            path = _object_path(dll_name, digest)
+            return str(path) if path.exists() else None
+    return None
+
+
+def add_dll(dll_name: str, path: Path, digest: str | None = None) -> str | None:
+    """
+    Add a cached DLL to the store and prune old versions.
+
+    Args:
+        dll_name: Name of the DLL
+        path: The cached file
+        digest: Its SHA-256 if already known (hashed otherwise)
+
+    Returns:
+        The version it is stored as, or None if it could not be stored
+    """
+    from .database import db_manager
+    from .dll_repository import get_dll_sha256
+    from .updater import get_dll_version
+
+    dll_name = dll_name.lower()
+    try:
+        if digest is None:
+            digest = get_dll_sha256(path)
+        obj = _object_path(dll_name, digest)
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            tmp = obj.with_name(obj.name + ".tmp")
+            try:
+                os.link(path, tmp)
+            except OSError:
+                shutil.copyfile(path, tmp)
+            os.replace(tmp, obj)
+    except OSError as e:
+        logger.warning(f"Could not add {dll_name} to the DLL store: {e}")
+        return None
+
+    # Builds without a readable FileVersion are told apart by digest
+    version = get_dll_version(str(path)) or digest[:12]
+    if dict(stored_versions(dll_name)).get(version) != digest:
+        db_manager.add_stored_dll_version_sync(dll_name, version, digest, time.time_ns())
+        logger.info(f"Stored {dll_name} {version} ({digest[:12]})")
+        prune(dll_name)
+    return version
+
+
+def _pinned_versions(dll_name: str) -> set[str]:
+    pinned = set()
+    version = config_manager.get_dll_pins().get(dll_name)
+    if version:
+        pinned.add(version)
+    for pins in config_manager.get_game_dll_pins().values():
+        if pins.get(dll_name):
+            pinned.add(pins[dll_name])
+    return pinned
+
+
+def prune(dll_name: str) -> list[str]:
+    """
+    Drop the versions of a DLL beyond ``keep_versions`` that are not pinned.
+
+    Returns:
+        The versions removed
+    """
+    from .database import db_manager
+
+    dll_name = dll_name.lower()
+    versions = stored_versions(dll_name)
+    keep = config_manager.get_dll_store_keep_versions()
+    pinned = _pinned_versions(dll_name)
+
+    kept = versions[:keep] + [(v, d) for v, d in versions[keep:] if v in pinned]
+    removed = [(v, d) for v, d in versions[keep:] if v not in pinned]
+    if not removed:
+        return []
+
+    db_manager.remove_stored_dll_versions_sync(dll_name, [v for v, _d in removed])
+    kept_digests = {d for _v, d in kept}
+    for _version, digest in removed:
+        if digest in kept_digests:
+            continue
+        obj = _object_path(dll_name, digest)
+        try:
+            obj.unlink(missing_ok=True)
+            obj.parent.rmdir()  # only succeeds once no other DLL uses the digest
+        except OSError:
+            pass
+    logger.info(f"Pruned {dll_name} from the DLL store: {', '.join(v for v, _d in removed)}")
+    return [v for v, _d in removed]
+
+
+def resolve_dll_paths(
+    cached: dict[str, str | None],
+) -> tuple[dict[str, str | None], dict[str, dict[str, str]]]:
+    """
+    Resolve the DLL paths to install from, applying the configured pins.
+
+    Reads the store only; builds get into it as their downloads are
+    installed.
+
+    Args:
+        cached: DLL name -> top-level cached file (None if not cached)
+
+    Returns:
+        (DLL name -> path with the global pins applied,
+         game folder -> DLL name -> path for the per-game pins)
+    """
+    pins = config_manager.get_dll_pins()
+    latest: dict[str, str | None] = {}
+    for dll_name, path in cached.items():
+        latest[dll_name] = path
+
+        version = pins.get(dll_name)
+        if version:
+            pinned_path = stored_dll_path(dll_name, version)
+            if pinned_path:
+                latest[dll_name] = pinned_path
+            else:
+                logger.warning(f"{dll_name} is pinned to {version}, which is not in the DLL store")
+
+    per_game: dict[str, dict[str, str]] = {}
+    for game_path, game_pins in config_manager.get_game_dll_pins().items():
+        for dll_name, version in game_pins.items():
+            pinned_path = stored_dll_path(dll_name, version)
+            if pinned_path:
+                per_game.setdefault(game_path, {})[dll_name] = pinned_path
+            else:
+                logger.warning(
+                    f"{dll_name} is pinned to {version} for {game_path}, which is not in the DLL store"
+                )
+    return latest, per_game
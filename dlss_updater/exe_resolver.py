@@ -11,10 +11,12 @@ Resolution order (short-circuits on the first success):
     1. cache          - the exe previously resolved and saved for this game
                         (``db_manager.get_game_exe_sync``). High confidence if the
                         file still exists on disk.
-    2. heuristic      - recursively scan the game folder for ``.exe`` files,
-                        skipping junk dirs (``scanner._SKIP_DIRECTORIES``) and a
-                        denylist of non-game executables (``_NON_GAME_EXE``),
-                        ranked by file size (largest = most likely the game).
+    2. heuristic      - the game's ``.exe`` files ranked by file size (largest =
+                        most likely the game), minus a denylist of non-game
+                        executables (``_NON_GAME_EXE``). The scan walk records
+                        these per game (``db_manager.get_exe_candidates_sync``);
+                        only games without recorded candidates get their folder
+                        walked here, skipping ``scanner._SKIP_DIRECTORIES``.
     3. driver-validate- for the top heuristic candidates, ask the NVIDIA driver
                         whether it already knows the exe
                         (``nvapi_drs.get_presets_for_app`` -> ``meta["found"]``).
@@ -157,8 +159,7 @@ def _scan_candidate_exes(root_path: str) -> list[str]:
         except (OSError, PermissionError):
             return
 
-        # Recurse after the scandir handle is closed (resource-leak safety,
-        # mirroring scanner._parallel_scandir_walk).
+        # Recurse after the scandir handle is closed (resource-leak safety).
         for sub in subdirs:
             _walk(sub)
 
@@ -172,6 +173,24 @@ def _scan_candidate_exes(root_path: str) -> list[str]:
     return [path for _size, path in found]
 
 
+def _candidate_exes(game_path: str | None, gid: int | None, db_manager) -> list[str]:
+    """Ranked exe candidates: recorded by the scan if available, else walked.
+
+    Recorded candidates whose file has since disappeared are dropped; if none
+    are left the folder is walked with ``_scan_candidate_exes``.
+    """
+    get_candidates = getattr(db_manager, "get_exe_candidates_sync", None)
+    if gid is not None and callable(get_candidates):
+        try:
+            recorded = [path for path in get_candidates(gid) if os.path.isfile(path)]
+        except Exception as e:
+            logger.debug(f"Candidate lookup failed for game {gid}: {e}")
+            recorded = []
+        if recorded:
+            return recorded
+    return _scan_candidate_exes(game_path)
+
+
 def _resolve_steam_manifest_exe(game, candidates: list[str]) -> str | None:
     """Best-effort Steam-manifest assist.
 
@@ -262,7 +281,7 @@ async def resolve_game_exe(game, db_manager) -> "object":
     ``ExeResolution``. Never raises for not-found / I/O errors - those downgrade
     to ``source="none"`` so the UI can offer a file picker.
 
-    All blocking work (filesystem walks) runs via ``asyncio.to_thread``; driver
+    All blocking work (DB lookups, filesystem walks) runs via ``asyncio.to_thread``; driver
     validation uses the existing async ``nvapi_drs.get_presets_for_app`` call.
     """
     game_path = _primary_path(game)
@@ -286,7 +305,9 @@ async def resolve_game_exe(game, db_manager) -> "object":
 
     # --- 2. heuristic (ranked candidates) --------------------------------
     try:
-        candidates = await anyio.to_thread.run_sync(_scan_candidate_exes, game_path, limiter=thread_io)
+        candidates = await anyio.to_thread.run_sync(
+            _candidate_exes, game_path, gid, db_manager, limiter=thread_io
+        )
     except Exception as e:
         logger.debug(f"Heuristic exe scan failed for {game_path}: {e}")
         candidates = []
@@ -331,7 +352,8 @@ def _resolve_game_exe_sync(game, db_path_or_manager) -> "object":
     """Fully synchronous resolver for use inside ThreadPoolExecutor / batch loads.
 
     ``db_path_or_manager`` may be a DatabaseManager (we call
-    ``get_game_exe_sync``) or anything falsy/None to skip the cache step. The
+    ``get_game_exe_sync`` and ``get_exe_candidates_sync``) or anything
+    falsy/None to skip the cache and recorded-candidate steps. The
     driver-validate step reuses the existing NvAPI blocking implementation
     (``nvapi_drs._read_app_blocking``) so true parallel batch loads still get the
     driver-first behaviour without spinning the event loop.
@@ -359,7 +381,7 @@ def _resolve_game_exe_sync(game, db_path_or_manager) -> "object":
 
     # --- 2. heuristic -----------------------------------------------------
     try:
-        candidates = _scan_candidate_exes(game_path)
+        candidates = _candidate_exes(game_path, gid, db_path_or_manager)
     except Exception as e:
         logger.debug(f"Sync heuristic scan failed for {game_path}: {e}")
         candidates = []
@@ -42,8 +42,8 @@ from typing import Callable, Any
 import anyio
 import psutil
 
-from .config import LATEST_DLL_PATHS, config_manager
-from .concurrency_limiters import thread_cpu, thread_io
+from .config import config_manager, get_source_dll_path
+from .concurrency_limiters import device_slot, thread_cpu, thread_io
 from .constants import DLL_TYPE_MAP
 from .logger import setup_logger
 from .models import (
@@ -56,9 +56,10 @@ from .models import (
 from .dll_repository import is_known_bad_dll
 from .updater import (
     create_backup,
+    get_dll_fingerprint,
     get_dll_version,
+    is_already_current,
     is_file_in_use,
-    parse_version,
     remove_read_only,
     restore_permissions,
 )
@@ -1269,10 +1270,11 @@ class HighPerformanceUpdateManager:
         unique_sources: dict[str, str] = {}
 
         for task in dll_tasks:
-            if task.source_dll_name not in unique_sources:
-                source_path = LATEST_DLL_PATHS.get(task.source_dll_name)
-                if source_path:
-                    unique_sources[task.source_dll_name] = source_path
+            # Keyed by path: a per-game pin installs a different build
+            # under the same DLL name
+            source_path = get_source_dll_path(task.source_dll_name, task.target_path)
+            if source_path:
+                unique_sources[source_path] = source_path
 
         logger.info(f"[PHASE 0] Loading {len(unique_sources)} unique source DLLs")
 
@@ -1306,7 +1308,7 @@ class HighPerformanceUpdateManager:
         if not target_path.exists():
             return False, "Target not found"
 
-        source_path = LATEST_DLL_PATHS.get(task.source_dll_name)
+        source_path = get_source_dll_path(task.source_dll_name, task.target_path)
         if not source_path:
             return False, "No source DLL"
 
@@ -1318,14 +1320,25 @@ class HighPerformanceUpdateManager:
         task.existing_version = existing_version
         task.latest_version = latest_version
 
+        # Known-bad builds (e.g. watermarked dev variants) report the same
+        # version as the clean replacement and can share its headers and
+        # resources, so nothing below may call them current
+        known_bad = is_known_bad_dll(target_path.name, target_path)
+
+        # Same build as the latest DLL by fingerprint: size, headers and
+        # resource section, not every byte (fingerprints are cached along
+        # with the versions above, so this costs no extra read)
+        if not known_bad:
+            target_fingerprint = get_dll_fingerprint(target_path)
+            if target_fingerprint is not None and target_fingerprint == get_dll_fingerprint(source_path):
+                return False, f"Up-to-date (same build as latest {latest_version})"
+
         if not existing_version or not latest_version:
             # Can't determine versions - include for update
             return True, "Version unknown"
 
-        if parse_version(existing_version) >= parse_version(latest_version):
-            # Known-bad builds (e.g. watermarked dev variants) report the
-            # same version as the clean replacement, so replace them anyway
-            if is_known_bad_dll(target_path.name, target_path):
+        if is_already_current(existing_version, latest_version, source_path):
+            if known_bad:
                 return True, f"Known-bad build ({existing_version}), replacing"
             return False, f"Up-to-date ({existing_version})"
 
@@ -1424,16 +1437,18 @@ class HighPerformanceUpdateManager:
                 continue
             targets.append(task)
 
-        # Run all backup copies in parallel via bounded I/O worker threads.
+        # Run all backup copies in parallel via bounded I/O worker threads,
+        # at most the target device's limit at a time on any one disk.
         # _create_single_backup never raises (it captures errors into its result
         # dict); wrap defensively so an unexpected raise still becomes a failure.
         results: list[dict[str, Any] | None] = [None] * len(targets)
 
         async def _run_backup(i: int, task: DLLTask) -> None:
             try:
-                results[i] = await anyio.to_thread.run_sync(
-                    self._create_single_backup, str(Path(task.target_path)), limiter=thread_io
-                )
+                async with device_slot(task.target_path):
+                    results[i] = await anyio.to_thread.run_sync(
+                        self._create_single_backup, str(Path(task.target_path)), limiter=thread_io
+                    )
             except Exception as e:
                 results[i] = {
                     "success": False,
@@ -1547,16 +1562,18 @@ class HighPerformanceUpdateManager:
         """
         logger.info(f"[PHASE 2] Applying {len(dll_tasks)} updates from cache")
 
-        # Apply all updates in parallel via bounded I/O worker threads, storing
+        # Apply all updates in parallel via bounded I/O worker threads (at most
+        # the target device's limit at a time on any one disk), storing
         # results by index to preserve ordering. Continues past individual
         # failures (each is captured into its own result dict).
         results: list[dict[str, Any] | None] = [None] * len(dll_tasks)
 
         async def _run_update(i: int, task: DLLTask) -> None:
             try:
-                result = await anyio.to_thread.run_sync(
-                    self._apply_single_update, task, limiter=thread_io
-                )
+                async with device_slot(task.target_path):
+                    result = await anyio.to_thread.run_sync(
+                        self._apply_single_update, task, limiter=thread_io
+                    )
                 results[i] = result
 
                 if progress_callback:
@@ -1621,12 +1638,12 @@ class HighPerformanceUpdateManager:
             if not target_path.exists():
                 return make_result(False, "Target file not found", skipped=True)
 
-            # Get source data from cache
-            source_data = self._source_cache.get_source_data(task.source_dll_name)
+            # Get source data from cache (keyed by source path, see Phase 0)
+            source_path = get_source_dll_path(task.source_dll_name, task.target_path)
+            source_data = self._source_cache.get_source_data(source_path) if source_path else None
 
             if source_data is None:
                 # Source not in cache - try direct file copy
-                source_path = LATEST_DLL_PATHS.get(task.source_dll_name)
                 if not source_path or not Path(source_path).exists():
                     return make_result(False, f"Source DLL not found: {task.source_dll_name}", skipped=True)
 
@@ -1645,7 +1662,7 @@ class HighPerformanceUpdateManager:
                 if existing_version and latest_version:
                     # Known-bad builds report the same version as the clean
                     # replacement - never skip those
-                    if parse_version(existing_version) >= parse_version(latest_version) \
+                    if is_already_current(existing_version, latest_version, source_path) \
                             and not is_known_bad_dll(target_path.name, target_path):
                         return make_result(
                             False, f"Already up-to-date ({existing_version})",
@@ -1672,7 +1689,6 @@ class HighPerformanceUpdateManager:
                 )
 
             # Use cached source data
-            source_path = LATEST_DLL_PATHS.get(task.source_dll_name)
 
             # Reuse versions computed in the pre-filter phase; only re-parse on a
             # cache miss (task included without a prior version check).
@@ -1686,7 +1702,7 @@ class HighPerformanceUpdateManager:
             if existing_version and latest_version:
                 # Known-bad builds report the same version as the clean
                 # replacement - never skip those
-                if parse_version(existing_version) >= parse_version(latest_version) \
+                if is_already_current(existing_version, latest_version, source_path) \
                         and not is_known_bad_dll(target_path.name, target_path):
                     return make_result(
                         False, f"Already up-to-date ({existing_version})",
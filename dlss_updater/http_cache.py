@@ -0,0 +1,127 @@
+"""
+Conditional downloads of remote files that are kept as a local copy.
+
+The ETag / Last-Modified validators of a download are saved in a sidecar
+``<file>.validators.json`` next to the copy. The next fetch sends them back
+(If-None-Match / If-Modified-Since) and a ``304 Not Modified`` answer is
+served from the copy, so an unchanged manifest or whitelist costs one small
+round-trip instead of a full download.
+"""
+
+import os
+from pathlib import Path
+
+import aiohttp
+import anyio
+import msgspec
+
+from dlss_updater.concurrency_limiters import thread_io
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import HttpValidators
+
+logger = setup_logger()
+
+_validators_decoder = msgspec.json.Decoder(HttpValidators)
+
+
+def validators_from_headers(headers) -> HttpValidators | None:
+    """Validators of a response, or None if it has neither ETag nor Last-Modified."""
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return None
+    return HttpValidators(etag=etag, last_modified=last_modified)
+
+
+def conditional_headers(validators: HttpValidators | None) -> dict[str, str]:
+    """Request headers that make a GET conditional on ``validators``."""
+    headers = {}
+    if validators is not None:
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+    return headers
+
+
+def _validators_path(cache_path: Path) -> Path:
+    return cache_path.with_name(cache_path.name + ".validators.json")
+
+
+def load_validators(cache_path: Path) -> HttpValidators | None:
+    """Saved validators of ``cache_path``; None when there is no usable copy."""
+    try:
+        if not cache_path.is_file():
+            return None
+        return _validators_decoder.decode(_validators_path(cache_path).read_bytes())
+    except (OSError, msgspec.DecodeError):
+        return None
+
+
+def clear_validators(cache_path: Path) -> None:
+    """Forget the validators of ``cache_path`` (the next fetch is unconditional)."""
+    _validators_path(cache_path).unlink(missing_ok=True)
+
+
+def save_validators(cache_path: Path, validators: HttpValidators) -> None:
+    """Save the validators of ``cache_path``."""
+    _validators_path(cache_path).write_bytes(msgspec.json.encode(validators))
+
+
+def store_cached(cache_path: Path, body: bytes, validators: HttpValidators | None) -> None:
+    """
+    Replace the local copy with ``body`` and save its validators.
+
+    The old validators are removed first and the new ones written last, so a
+    crash in between leaves a copy without validators (refetched in full)
+    rather than validators vouching for the wrong copy.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    clear_validators(cache_path)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_bytes(body)
+    os.replace(tmp_path, cache_path)
+    if validators is not None:
+        save_validators(cache_path, validators)
+
+
+async def fetch_cached(
+    session: aiohttp.ClientSession, url: str, cache_path: Path, timeout: float
+) -> bytes | None:
+    """
+    Download ``url``, revalidating the local copy at ``cache_path``.
+
+    A 200 answer replaces the copy (and its validators); a 304 answer returns
+    the copy unchanged. Network errors propagate to the caller.
+
+    Returns:
+        The current body, or None if the server answered with an error
+    """
+    validators = await anyio.to_thread.run_sync(load_validators, cache_path, limiter=thread_io)
+    async with session.get(
+        url,
+        headers=conditional_headers(validators),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as response:
+        if response.status == 304 and validators is not None:
+            try:
+                body = await anyio.to_thread.run_sync(cache_path.read_bytes, limiter=thread_io)
+            except OSError as e:
+                # The copy vanished since the validators were read: start over
+                logger.warning(f"Local copy of {url} unreadable ({e}), downloading it again")
+                await anyio.to_thread.run_sync(clear_validators, cache_path, limiter=thread_io)
+                return await fetch_cached(session, url, cache_path, timeout)
+            logger.info(f"{url} not modified, using local copy")
+            return body
+
+        if response.status != 200:
+            logger.error(f"Failed to fetch {url}: HTTP {response.status}")
+            return None
+        body = await response.read()
+        fresh = validators_from_headers(response.headers)
+
+    try:
+        await anyio.to_thread.run_sync(store_cached, cache_path, body, fresh, limiter=thread_io)
+    except OSError as e:
+        logger.warning(f"Could not save local copy of {url}: {e}")
+    return body
@@ -0,0 +1,612 @@
+"""
+Near-real-time DLL inventory between full scans.
+
+The inventory (games and game_dlls) used to change only when the user ran a
+full scan, so a game installed, patched or removed since then was invisible
+until the next one. ``LibraryWatcher`` keeps it current in the background:
+
+  * library roots (Steam ``steamapps/common`` folders, configured launcher
+    folders, custom folders) are watched for game folders appearing or
+    disappearing
+  * every recorded game is watched in the directories holding its DLLs, for
+    DLLs being created, replaced, renamed or deleted
+
+Events are debounced per game folder (``debounce`` seconds after the last
+event) and then applied with a targeted rescan of that one folder
+(``scan_game_for_dlls``) and an upsert of its game and DLL rows - the same
+rows a full scan writes, minus app ID resolution beyond the Steam manifest,
+which the next full scan fills in. Nothing is applied while a full scan runs;
+events queue up until it finishes.
+
+On Linux the watches are inotify watches, set up through ctypes (no extra
+dependency). The number of watches is bounded by a budget well below the
+kernel's ``fs.inotify.max_user_watches`` (other programs need watches too);
+library roots get them first, and games that do not fit in the budget - or
+every game, when inotify is unavailable (other platforms, inotify_init
+failing, the kernel limit reached) - are polled instead: every
+``poll_interval`` seconds they are rescanned through the persistent directory
+index, which costs one stat() per unchanged directory, and refreshed when
+their DLL set or any DLL's size/mtime changed. The index is loaded once and
+kept between ticks, and each sync only adds or removes the watches of
+directories that changed, so an idle tick costs neither a full index read
+nor a syscall per watch.
+
+A folder created under a library root usually fills up over minutes (Steam
+pre-allocates, installers extract), and its DLLs can land in subdirectories
+that are not watched yet, so a new folder without DLLs is re-checked on
+every poll tick for ``_NEW_DIR_TTL_S`` before it is given up on.
+"""
+
+import ctypes
+import inspect
+import os
+import struct
+import time
+from pathlib import Path
+
+import anyio
+
+from dlss_updater.concurrency_limiters import thread_cpu, thread_io
+from dlss_updater.logger import setup_logger
+from dlss_updater.platform_utils import IS_LINUX
+from dlss_updater.scan_index import DirectoryIndex
+from dlss_updater.scan_session import get_active_scan_session
+
+logger = setup_logger()
+
+# inotify event masks (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+# Library roots: game folders appearing or disappearing
+_ROOT_MASK = _IN_CREATE | _IN_MOVED_TO | _IN_DELETE | _IN_MOVED_FROM | _IN_ONLYDIR
+# Directories holding a game's DLLs: DLLs added, replaced or removed
+_DLL_DIR_MASK = (
+    _IN_CREATE | _IN_MOVED_TO | _IN_DELETE | _IN_MOVED_FROM | _IN_CLOSE_WRITE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+# Never use more than this many watches, nor more than a quarter of the
+# kernel's per-user limit
+_MAX_WATCHES = 8192
+_KERNEL_WATCH_SHARE = 4
+
+# A new folder under a library root without DLLs is re-checked this long
+_NEW_DIR_TTL_S = 60 * 60
+
+_DEFAULT_DEBOUNCE_S = 2.0
+_DEFAULT_POLL_INTERVAL_S = 120.0
+
+
+def _kernel_watch_limit() -> int | None:
+    """fs.inotify.max_user_watches, or None if it cannot be read."""
+    try:
+        with open("/proc/sys/fs/inotify/max_user_watches") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def default_watch_budget() -> int:
+    """Watches the watcher may use on this system."""
+    limit = _kernel_watch_limit()
+    if limit is None:
+        return _MAX_WATCHES
+    return max(0, min(_MAX_WATCHES, limit // _KERNEL_WATCH_SHARE))
+
+
+class _Inotify:
+    """Minimal non-blocking inotify instance via ctypes (Linux only)."""
+
+    def __init__(self, libc, fd: int):
+        self._libc = libc
+        self.fd = fd
+
+    @classmethod
+    def open(cls) -> "_Inotify | None":
+        """A new inotify instance, or None where inotify is unavailable."""
+        if not IS_LINUX:
+            return None
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        except (OSError, AttributeError) as e:
+            logger.info(f"inotify unavailable, polling libraries instead: {e}")
+            return None
+
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            logger.info(f"inotify_init1 failed, polling libraries instead: {os.strerror(err)}")
+            return None
+        return cls(libc, fd)
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """Watch ``path``; raises OSError (e.g. ENOSPC at the kernel limit)."""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self) -> list[tuple[int, int, str]]:
+        """Drain pending events as (wd, mask, name) tuples."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                events.append((wd, mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+async def _library_roots() -> dict[str, str]:
+    """Library root folder -> launcher, for every configured launcher."""
+    from dlss_updater import scanner
+
+    roots: dict[str, str] = {}
+
+    def _add(paths, launcher: str) -> None:
+        for path in paths or ():
+            roots.setdefault(str(path), launcher)
+
+    steam_path = scanner.get_steam_install_path()
+    if steam_path:
+        _add(await anyio.to_thread.run_sync(scanner.get_steam_libraries, steam_path, limiter=thread_io), "Steam")
+    _add(scanner.get_steam_manual_paths(), "Steam")
+    _add(await scanner.get_ea_games(), "EA Launcher")
+    _add(await scanner.get_ubisoft_games(), "Ubisoft Launcher")
+    _add(await scanner.get_epic_games(), "Epic Games Launcher")
+    _add(await scanner.get_gog_games(), "GOG Launcher")
+    _add(await scanner.get_battlenet_games(), "Battle.net Launcher")
+    _add(await scanner.get_xbox_games(), "Xbox Launcher")
+    for folder_num in range(1, 5):
+        _add(await scanner.get_custom_folder(folder_num), f"Custom Folder {folder_num}")
+
+    return {root: launcher for root, launcher in roots.items() if os.path.isdir(root)}
+
+
+def _list_subdirs(path: str) -> set[str]:
+    try:
+        with os.scandir(path) as entries:
+            return {entry.path for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def _signature(dll_paths) -> frozenset:
+    """(path, size, mtime_ns) of each existing DLL: changes when any DLL does."""
+    signature = []
+    for path in dll_paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        signature.append((path, st.st_size, st.st_mtime_ns))
+    return frozenset(signature)
+
+
+class LibraryWatcher:
+    """
+    Keeps the recorded DLL inventory current between full scans.
+
+    ``run()`` watches until cancelled (it is registered with task_registry by
+    main.py, so shutdown cancels it). ``on_change`` (sync or async, no
+    arguments) is called after a batch of changes has been recorded.
+    """
+
+    def __init__(
+        self,
+        on_change=None,
+        *,
+        debounce: float = _DEFAULT_DEBOUNCE_S,
+        poll_interval: float = _DEFAULT_POLL_INTERVAL_S,
+        watch_budget: int | None = None,
+        use_inotify: bool = True,
+    ):
+        self._on_change = on_change
+        self._debounce = debounce
+        self._poll_interval = poll_interval
+        self._watch_budget = default_watch_budget() if watch_budget is None else watch_budget
+        self._use_inotify = use_inotify
+        self._inotify: _Inotify | None = None
+        self._dll_names_lower: frozenset = frozenset()
+
+        # Recorded state, refreshed from the database on every poll tick
+        self._games: dict[str, tuple[str, set[str]]] = {}  # game path -> (launcher, DLL paths)
+        self._roots: dict[str, str] = {}                   # library root -> launcher
+
+        # inotify watches
+        self._watches: dict[str, int] = {}            # directory -> wd
+        self._watch_masks: dict[str, int] = {}        # directory -> mask it is watched with
+        self._wd_dirs: dict[int, set[str]] = {}       # wd -> directories (hard links, symlinks)
+        self._dir_games: dict[str, set[str]] = {}     # watched DLL directory -> game paths
+
+        # Polling fallback
+        self._polled_games: set[str] = set()
+        self._polled_roots: set[str] = set()
+        self._signatures: dict[str, frozenset] = {}   # polled game -> DLL signature
+        self._root_children: dict[str, set[str]] = {}  # polled root -> subdirectories
+        self._dir_index: DirectoryIndex | None = None  # loaded on the first poll, then kept
+        self._new_dirs: dict[str, tuple[str, float]] = {}  # new folder -> (launcher, first seen)
+
+        # Debounce queue: folder -> (due time, kind, launcher); kind is
+        # 'game' (a recorded game) or 'new' (a new folder under a root)
+        self._pending: dict[str, tuple[float, str, str]] = {}
+        self._wakeup = anyio.Event()
+
+    @property
+    def watch_count(self) -> int:
+        return len(self._watches)
+
+    @property
+    def polled_games(self) -> set[str]:
+        return set(self._polled_games)
+
+    async def run(self) -> None:
+        """Watch until cancelled."""
+        from dlss_updater.scanner import get_selected_dll_names
+
+        self._dll_names_lower = frozenset(name.lower() for name in get_selected_dll_names())
+        if not self._dll_names_lower:
+            logger.info("Library watcher: no technologies selected, nothing to watch")
+            return
+
+        if self._use_inotify:
+            self._inotify = _Inotify.open()
+        try:
+            await self.sync()
+            async with anyio.create_task_group() as tg:
+                if self._inotify is not None:
+                    tg.start_soon(self._read_events)
+                tg.start_soon(self._poll_loop)
+                tg.start_soon(self._process_loop)
+        finally:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+            self._watches.clear()
+            self._watch_masks.clear()
+            self._wd_dirs.clear()
+
+    # ===== Targets =====
+
+    async def sync(self) -> None:
+        """Re-read recorded games and library roots; place and drop watches to match."""
+        from dlss_updater.database import db_manager
+
+        games = await db_manager.get_game_dll_paths()
+        self._games = {path: (launcher, set(dlls)) for path, (launcher, dlls) in games.items()}
+        self._roots = await _library_roots()
+
+        # Directory -> mask wanted; roots first, so they get watches before games
+        wanted: dict[str, int] = {root: _ROOT_MASK for root in self._roots}
+        game_dirs: dict[str, set[str]] = {}
+        for game_path, (_launcher, dlls) in self._games.items():
+            game_dirs[game_path] = {os.path.dirname(dll) for dll in dlls}
+
+        self._dir_games = {}
+        self._polled_games = set()
+        self._polled_roots = set()
+        if self._inotify is None:
+            self._polled_roots = set(self._roots)
+            self._polled_games = set(self._games)
+            return
+
+        placed: dict[str, int] = {}
+        for root, mask in wanted.items():
+            if not self._place_watch(root, mask, placed):
+                self._polled_roots.add(root)
+        for game_path, dirs in game_dirs.items():
+            if all(self._place_watch(d, wanted.get(d, 0) | _DLL_DIR_MASK, placed) for d in sorted(dirs)):
+                for d in dirs:
+                    self._dir_games.setdefault(d, set()).add(game_path)
+            else:
+                self._polled_games.add(game_path)
+
+        for directory in [d for d in self._watches if d not in placed]:
+            self._drop_watch(directory, remove=True)
+        # Polled games and roots need a fresh baseline
+        self._signatures = {p: s for p, s in self._signatures.items() if p in self._polled_games}
+        self._root_children = {r: c for r, c in self._root_children.items() if r in self._polled_roots}
+
+        if self._polled_games:
+            logger.info(
+                f"Library watcher: {len(self._watches)} watches, "
+                f"{len(self._polled_games)} games polled (watch budget {self._watch_budget})"
+            )
+
+    def _place_watch(self, directory: str, mask: int, placed: dict[str, int]) -> bool:
+        """Watch ``directory`` within the budget; False if it cannot be watched."""
+        if placed.get(directory) == mask:
+            return True
+        if directory not in placed and len(placed) >= self._watch_budget:
+            return False
+        if directory in self._watches and self._watch_masks.get(directory) == mask:
+            # Still in place from an earlier sync
+            placed[directory] = mask
+            return True
+        try:
+            wd = self._inotify.add_watch(directory, mask)
+        except OSError as e:
+            if e.errno == 28:  # ENOSPC: the kernel-wide limit, lower our budget
+                self._watch_budget = len(placed)
+                logger.warning(f"Library watcher: inotify watch limit reached at {len(placed)} watches")
+            else:
+                logger.debug(f"Library watcher: cannot watch {directory}: {e}")
+            return False
+        placed[directory] = mask
+        self._watches[directory] = wd
+        self._watch_masks[directory] = mask
+        self._wd_dirs.setdefault(wd, set()).add(directory)
+        return True
+
+    def _drop_watch(self, directory: str, remove: bool) -> None:
+        wd = self._watches.pop(directory, None)
+        self._watch_masks.pop(directory, None)
+        if wd is None:
+            return
+        dirs = self._wd_dirs.get(wd)
+        if dirs is not None:
+            dirs.discard(directory)
+            if not dirs:
+                del self._wd_dirs[wd]
+                if remove and self._inotify is not None:
+                    self._inotify.rm_watch(wd)
+
+    # ===== Events =====
+
+    def _enqueue(self, path: str, kind: str, launcher: str) -> None:
+        self._pending[path] = (time.monotonic() + self._debounce, kind, launcher)
+        self._wakeup.set()
+
+    def _enqueue_game(self, game_path: str) -> None:
+        entry = self._games.get(game_path)
+        if entry is not None:
+            self._enqueue(game_path, 'game', entry[0])
+
+    def handle_event(self, wd: int, mask: int, name: str) -> None:
+        """Queue the folders an inotify event affects."""
+        if mask & _IN_Q_OVERFLOW:
+            # Events were lost: refresh everything watched
+            for game_path in self._games:
+                if game_path not in self._polled_games:
+                    self._enqueue_game(game_path)
+            return
+
+        dirs = self._wd_dirs.get(wd)
+        if not dirs:
+            return
+        is_dll = name.lower() in self._dll_names_lower
+        for directory in list(dirs):
+            launcher = self._roots.get(directory)
+            if launcher is not None and name and mask & _IN_ISDIR:
+                child = os.path.join(directory, name)
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self._enqueue(child, 'new', launcher)
+                elif child in self._games:
+                    self._enqueue_game(child)
+
+            games = self._dir_games.get(directory, ())
+            if games and (is_dll or mask & (_IN_ISDIR | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED)):
+                for game_path in games:
+                    self._enqueue_game(game_path)
+
+            if mask & _IN_IGNORED:
+                # The kernel dropped the watch (directory deleted or unmounted)
+                self._drop_watch(directory, remove=False)
+
+    async def _read_events(self) -> None:
+        while True:
+            await anyio.wait_readable(self._inotify.fd)
+            for wd, mask, name in self._inotify.read_events():
+                self.handle_event(wd, mask, name)
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await anyio.sleep(self._poll_interval)
+            if get_active_scan_session() is not None:
+                continue
+            try:
+                await self.sync()
+                await self.poll()
+            except anyio.get_cancelled_exc_class():
+                raise
+            except Exception as e:
+                logger.error(f"Library watcher poll failed: {e}", exc_info=True)
+
+    async def poll(self) -> None:
+        """Check polled roots, polled games and unsettled new folders once."""
+        from dlss_updater.scanner import scan_game_for_dlls
+
+        now = time.monotonic()
+        for root in self._polled_roots:
+            children = await anyio.to_thread.run_sync(_list_subdirs, root, limiter=thread_io)
+            previous = self._root_children.get(root)
+            self._root_children[root] = children
+            if previous is None:
+                continue
+            for child in children - previous:
+                self._enqueue(child, 'new', self._roots[root])
+            for child in previous - children:
+                self._enqueue_game(child)
+
+        for path, (launcher, first_seen) in list(self._new_dirs.items()):
+            if now - first_seen > _NEW_DIR_TTL_S or not os.path.isdir(path):
+                del self._new_dirs[path]
+            else:
+                self._enqueue(path, 'new', launcher)
+
+        if not self._polled_games:
+            return
+        if self._dir_index is None:
+            self._dir_index = await DirectoryIndex.load()
+        dir_index = self._dir_index
+        for game_path in sorted(self._polled_games):
+            recorded = self._signatures.get(game_path)
+            if recorded is None:
+                recorded = await anyio.to_thread.run_sync(
+                    _signature, sorted(self._games[game_path][1]), limiter=thread_io
+                )
+            found = await scan_game_for_dlls(Path(game_path), self._dll_names_lower, dir_index)
+            signature = await anyio.to_thread.run_sync(_signature, found, limiter=thread_io)
+            self._signatures[game_path] = signature
+            if signature != recorded:
+                self._enqueue_game(game_path)
+        await dir_index.save(prune=False)
+        dir_index.next_pass()
+
+    # ===== Applying changes =====
+
+    async def _process_loop(self) -> None:
+        while True:
+            if not self._pending:
+                self._wakeup = anyio.Event()
+                await self._wakeup.wait()
+                continue
+            wait = min(due for due, _kind, _launcher in self._pending.values()) - time.monotonic()
+            if wait > 0:
+                await anyio.sleep(wait)
+                continue
+            if get_active_scan_session() is not None:
+                # The full scan records everything anyway; retry after it
+                await anyio.sleep(self._debounce)
+                continue
+
+            now = time.monotonic()
+            due = [(path, kind, launcher) for path, (at, kind, launcher) in self._pending.items() if at <= now]
+            for path, _kind, _launcher in due:
+                del self._pending[path]
+            try:
+                changed = await self.apply(due)
+            except anyio.get_cancelled_exc_class():
+                raise
+            except Exception as e:
+                logger.error(f"Library watcher refresh failed: {e}", exc_info=True)
+                continue
+            if changed:
+                await self._notify()
+
+    async def _notify(self) -> None:
+        if self._on_change is None:
+            return
+        try:
+            result = self._on_change()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Library watcher change callback failed: {e}", exc_info=True)
+
+    async def apply(self, items: list[tuple[str, str, str]]) -> bool:
+        """
+        Rescan and record each (folder, kind, launcher); True if anything changed.
+        """
+        from dlss_updater.scanner import _filter_whitelisted, _merge_nested_game_dirs, scan_game_for_dlls
+        from dlss_updater.utils import find_game_root
+
+        changed = False
+        for path, kind, launcher in items:
+            found = []
+            if os.path.isdir(path):
+                found = await scan_game_for_dlls(Path(path), self._dll_names_lower)
+                found = await _filter_whitelisted(found, launcher)
+
+            if kind == 'game':
+                changed |= await self._record_game(path, launcher, found)
+                continue
+
+            if not found:
+                if os.path.isdir(path):
+                    self._new_dirs.setdefault(path, (launcher, time.monotonic()))
+                continue
+            self._new_dirs.pop(path, None)
+
+            def _group() -> dict[str, list[str]]:
+                games: dict[str, list[str]] = {}
+                for dll_path in found:
+                    games.setdefault(str(find_game_root(Path(dll_path), launcher)), []).append(dll_path)
+                _merge_nested_game_dirs(games)
+                return games
+
+            games = await anyio.to_thread.run_sync(_group, limiter=thread_io)
+            for game_path, dlls in games.items():
+                changed |= await self._record_game(game_path, launcher, dlls)
+        return changed
+
+    async def _record_game(self, game_path: str, launcher: str, found: list[str]) -> bool:
+        """Write ``game_path``'s rows so its DLLs are exactly ``found``."""
+        from dlss_updater.constants import DLL_TYPE_MAP
+        from dlss_updater.database import db_manager
+        from dlss_updater.steam_integration import detect_steam_app_id_from_manifest
+        from dlss_updater.updater import get_dll_version
+
+        launcher, recorded = self._games.get(game_path, (launcher, set()))
+        removed = sorted(recorded - set(found))
+        if removed:
+            await db_manager.delete_dlls_by_paths(removed)
+
+        if not found:
+            self._games.pop(game_path, None)
+            if recorded:
+                await db_manager.delete_games_without_dlls([game_path])
+                logger.info(f"Library watcher: {game_path} no longer has DLLs")
+            return bool(recorded)
+
+        app_id = None
+        if launcher == "Steam":
+            app_id = await detect_steam_app_id_from_manifest(Path(game_path))
+        game = (await db_manager.batch_upsert_games([{
+            'name': Path(game_path).name,
+            'path': game_path,
+            'launcher': launcher,
+            'steam_app_id': app_id,
+            'resolution_source': 'manifest' if app_id else None,
+        }])).get(game_path)
+        if game is None:
+            return bool(removed)
+
+        rows = []
+        for dll_path in found:
+            dll_filename = os.path.basename(dll_path)
+            rows.append({
+                'game_id': game.id,
+                'dll_type': DLL_TYPE_MAP.get(dll_filename.lower(), "Unknown"),
+                'dll_filename': dll_filename,
+                'dll_path': dll_path,
+                'current_version': await anyio.to_thread.run_sync(
+                    get_dll_version, dll_path, limiter=thread_cpu
+                ),
+            })
+        await db_manager.batch_upsert_dlls(rows)
+
+        self._games[game_path] = (launcher, set(found))
+        logger.info(f"Library watcher: recorded {len(found)} DLLs for {game_path}")
+        return True
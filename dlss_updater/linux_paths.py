@@ -6,12 +6,14 @@ Also provides Flatpak sandbox detection for permission handling.
 
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Any
 
 import anyio
 
 from dlss_updater.concurrency_limiters import thread_io
+from dlss_updater.scan_index import _RACY_WINDOW_NS
 
 logger = logging.getLogger("DLSSUpdater")
 
@@ -252,19 +254,34 @@ async def get_proton_prefixes(steam_path: Path) -> list[Path]:
 
     Each prefix contains a full Windows-like directory structure with DLLs.
 
+    The result is cached in the database keyed on the compatdata directory's
+    mtime and inode: creating or removing an app's prefix changes both, so
+    while they match the recorded list is reused without probing every app
+    directory again.
+
     Args:
-        steam_path: Path to Steam installation.
+        steam_path: Path to Steam installation (or any library root).
 
     Returns:
         List of paths to Proton prefix drive_c directories.
     """
-    prefixes = []
+    from dlss_updater.database import db_manager
+    from dlss_updater.models import CompatdataPrefixes
+
     compatdata_base = steam_path / "steamapps" / "compatdata"
 
-    if not compatdata_base.exists():
+    try:
+        st = await anyio.to_thread.run_sync(os.stat, compatdata_base, limiter=thread_io)
+    except OSError:
+        return []
+
+    cached = await db_manager.get_compatdata_prefixes(str(compatdata_base))
+    if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.inode == st.st_ino:
+        prefixes = [compatdata_base / name / "pfx" / "drive_c" for name in cached.app_dirs]
+        logger.info(f"Found {len(prefixes)} Proton prefixes (unchanged since last scan)")
         return prefixes
 
-    def _find_prefixes() -> list[Path]:
+    def _find_prefixes() -> list[Path] | None:
         result = []
         try:
             for app_dir in compatdata_base.iterdir():
@@ -277,11 +294,26 @@ async def get_proton_prefixes(steam_path: Path) -> list[Path]:
                             result.append(drive_c)
         except PermissionError as e:
             logger.warning(f"Permission denied accessing {compatdata_base}: {e}")
+            return None
         except Exception as e:
             logger.warning(f"Error scanning Proton prefixes: {e}")
+            return None
         return result
 
     prefixes = await anyio.to_thread.run_sync(_find_prefixes, limiter=thread_io)
+    if prefixes is None:
+        return []
+
+    # A listing taken within the mtime granularity of the last change may have
+    # missed an entry created in the same tick; only cache settled listings.
+    if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+        await db_manager.save_compatdata_prefixes(CompatdataPrefixes(
+            path=str(compatdata_base),
+            mtime_ns=st.st_mtime_ns,
+            inode=st.st_ino,
+            app_dirs=[drive_c.parent.parent.name for drive_c in prefixes],
+        ))
+
     logger.info(f"Found {len(prefixes)} Proton prefixes")
     return prefixes
 
@@ -258,6 +258,108 @@ class GameDLL(msgspec.Struct):
     detected_at: datetime = msgspec.field(default_factory=datetime.now)
 
 
+class ScanDirIndexEntry(msgspec.Struct):
+    """
+    One directory of the persistent scan index (``scan_dir_index`` table).
+
+    Records what a directory contained the last time it was listed, keyed on
+    the directory's identity (``mtime_ns`` + ``inode``). A directory's mtime
+    changes whenever an entry is added, removed or renamed inside it, so while
+    both still match the recorded listing can be reused instead of re-listed.
+
+    ``dll_names`` holds the known DLL filenames (DLL_TYPE_MAP, original case)
+    found directly in this directory; ``subdirs`` the child directory names the
+    walk descends into (skip-listed names already removed); ``exe_names`` and
+    ``exe_sizes`` the ``.exe`` files and their sizes, for exe_resolver.
+    """
+    path: str
+    mtime_ns: int
+    inode: int
+    dll_names: list[str] = []
+    subdirs: list[str] = []
+    exe_names: list[str] = []
+    exe_sizes: list[int] = []
+
+
+class CompatdataPrefixes(msgspec.Struct):
+    """
+    Proton prefixes of one ``steamapps/compatdata`` directory at its last
+    listing (``compatdata_prefixes`` table).
+
+    Keyed like ScanDirIndexEntry on the directory's ``mtime_ns`` + ``inode``:
+    while both match, no app directory was added or removed and the recorded
+    ``app_dirs`` (names of the app directories holding a ``pfx/drive_c``) can
+    be reused instead of probing every prefix again.
+    """
+    path: str
+    mtime_ns: int
+    inode: int
+    app_dirs: list[str] = []
+
+
+class GameRootProbe(msgspec.Struct):
+    """
+    Game-root indicators of one directory (``game_root_probes`` table).
+
+    ``indicators`` is the number of "this looks like a game root" signals
+    utils.find_game_root found directly in the directory (an ``.exe``, a
+    bin/engine/data/Content folder). Keyed like ScanDirIndexEntry on the
+    directory's ``mtime_ns`` + ``inode``: every signal is an entry of the
+    directory itself, so while both match the count is still accurate.
+    """
+    path: str
+    mtime_ns: int
+    inode: int
+    indicators: int
+
+
+class StoreSearchResult(msgspec.Struct):
+    """
+    Cached top hit of a Steam Store search (``store_search_cache`` table).
+
+    ``steam_app_id`` is None for a search that returned nothing (negative
+    entry); ``fetched_at`` is when the search ran (unix seconds).
+    """
+    steam_app_id: int | None
+    fetched_at: int
+
+
+class ScanCheckpoint(msgspec.Struct):
+    """
+    Progress of an interrupted full scan (``scan_checkpoints`` table).
+
+    ``launchers`` maps each launcher that finished to the DLL paths it
+    reported; ``games`` maps each recorded game folder to the record prepared
+    for it (the batch_upsert_games input, app ID resolution included).
+    """
+    launchers: dict[str, list[str]] = {}
+    games: dict[str, dict] = {}
+
+
+class SteamManifestState(msgspec.Struct):
+    """
+    Steam appmanifest state of one installed game at its last DLL walk
+    (``steam_app_manifests`` table).
+
+    Steam bumps ``build_id``/``last_updated`` whenever it patches a game, so
+    while they match the current manifest and the game is fully installed
+    (``state_flags`` == 4) the install dir has not been touched by Steam and
+    its DLLs can be taken from ``game_dlls`` instead of walking it again.
+
+    ``dll_names_key`` is the '/'-joined sorted set of DLL names that walk
+    looked for and ``dll_count`` how many it found; reuse requires the same
+    name set and that exactly that many live rows are still in ``game_dlls``.
+    """
+    install_path: str
+    app_id: int | None = None
+    build_id: int = 0
+    last_updated: int = 0
+    size_on_disk: int = 0
+    state_flags: int = 0
+    dll_names_key: str = ""
+    dll_count: int = 0
+
+
 class DLLBackup(msgspec.Struct):
     """
     DLL backup database model.
@@ -354,6 +456,40 @@ class SteamImage(msgspec.Struct):
     fetch_failed: bool = False
 
 
+class SteamAppListEntry(msgspec.Struct):
+    """
+    One app of the downloaded Steam app list (steamappidlist format).
+
+    Other fields of the entries (last_modified, price_change_number) are
+    ignored when decoding.
+    """
+    appid: int
+    name: str = ""
+
+
+class HttpValidators(msgspec.Struct, omit_defaults=True):
+    """
+    HTTP cache validators of a downloaded file (see http_cache).
+
+    Saved next to the local copy; sent back as If-None-Match /
+    If-Modified-Since so an unchanged file costs a 304 instead of a download.
+    """
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class SteamAppListCache(msgspec.Struct):
+    """
+    Contents of the Steam app list cache file (``steam_app_list.json``).
+
+    The list itself lives in the ``steam_apps`` table; the file records its
+    size and the validators of each category file it was built from (by URL).
+    Its mtime is when the list was last checked.
+    """
+    app_count: int = 0
+    validators: dict[str, HttpValidators] = {}
+
+
 # =============================================================================
 # Configuration Structures (Phase 4)
 # =============================================================================
@@ -401,8 +537,11 @@ class PerformanceConfig(msgspec.Struct):
     Performance settings configuration.
 
     Controls thread pool sizes and other performance tuning.
+    ``watch_libraries`` enables the background library watcher
+    (library_watcher.LibraryWatcher).
     """
     max_worker_threads: int = 8
+    watch_libraries: bool = False
 
     def __post_init__(self):
         """Validate worker thread count"""
@@ -410,6 +549,25 @@ class PerformanceConfig(msgspec.Struct):
             raise ValueError(f"max_worker_threads must be between 1 and 32, got {self.max_worker_threads}")
 
 
+class DLLStoreConfig(msgspec.Struct):
+    """
+    Multi-version DLL store settings ([dll_store], see dll_store).
+
+    ``keep_versions`` is how many of the most recent versions of each DLL
+    stay in the store; pinned versions are always kept. ``pins`` maps a DLL
+    name to the version every game gets, ``game_pins`` a game folder to
+    per-DLL pins that override it. Absence means "latest" - TOML has no null.
+    """
+    keep_versions: int = 3
+    pins: dict[str, str] = {}
+    game_pins: dict[str, dict[str, str]] = {}
+
+    def __post_init__(self):
+        """Validate the number of kept versions"""
+        if self.keep_versions < 1:
+            raise ValueError(f"keep_versions must be at least 1, got {self.keep_versions}")
+
+
 class UIPreferencesConfig(msgspec.Struct):
     """
     UI/UX preference configuration (persisted to config.toml [ui_preferences]).
@@ -0,0 +1,275 @@
+"""
+Lightweight VS_VERSIONINFO reader for PE files.
+
+``get_dll_version`` only needs one string out of a DLL: the ``FileVersion``
+entry of the version resource. pefile gets there by parsing the full headers
+and then the entire resource directory of a 20-80 MB file. This reader does
+the minimum instead:
+
+    1. read the DOS/PE/optional headers and the section table (one small read)
+    2. map the resource directory RVA to a file offset via the section table
+    3. walk only RT_VERSION -> name/ID -> language in the resource directory
+    4. read the VS_VERSIONINFO blob (a few KB) and decode VS_FIXEDFILEINFO and
+       the StringFileInfo ``FileVersion`` strings
+
+``content_fingerprint`` reuses the same header walk to identify a build
+cheaply: file size plus a hash of the headers and the raw section holding
+the resources. Different builds differ in header timestamp/checksum, so equal
+fingerprints mean the same build and can share one version lookup.
+
+Anything that does not look like a well-formed PE raises ``PEVersionError``
+so the caller can fall back to pefile, which copes with far more damage. A
+well-formed PE without a version resource is not an error and yields an
+empty ``PEVersionInfo``.
+
+Pure stdlib (``struct``, ``hashlib``), no module state: safe to call from any
+thread.
+"""
+
+import hashlib
+import os
+import struct
+
+import msgspec
+
+# Resource type ID of version resources (winuser.h RT_VERSION)
+_RT_VERSION = 16
+
+# VS_FIXEDFILEINFO.dwSignature
+_FIXED_FILE_INFO_SIGNATURE = 0xFEEF04BD
+
+# Optional header magic -> offset of the data directory array within it
+_DATA_DIRECTORY_OFFSET = {0x10B: 96, 0x20B: 112}
+
+# Bounds that no real DLL comes near; exceeding them means a corrupt file.
+_HEADER_READ = 4096
+_MAX_SECTIONS = 96
+_MAX_DIRECTORY_ENTRIES = 4096
+_MAX_VERSION_BLOB = 64 * 1024
+_MAX_FINGERPRINT_SECTION = 16 * 1024 * 1024
+
+
+class PEVersionError(ValueError):
+    """The file is not a PE this reader can walk (caller should fall back)."""
+
+
+class PEVersionInfo(msgspec.Struct):
+    """
+    Version data read from a PE's RT_VERSION resource.
+
+    ``file_version`` is the raw StringFileInfo ``FileVersion`` string (the
+    last one if there are several tables, as pefile-based callers saw it);
+    ``fixed_file_version`` the numeric VS_FIXEDFILEINFO version as a 4-tuple.
+    Both are None when the PE carries no such data.
+    """
+    file_version: str | None = None
+    fixed_file_version: tuple[int, int, int, int] | None = None
+
+
+def _unpack_from(fmt: str, data: bytes, offset: int) -> tuple:
+    try:
+        return struct.unpack_from(fmt, data, offset)
+    except struct.error as e:
+        raise PEVersionError(f"truncated structure at offset {offset}") from e
+
+
+def _read_at(f, offset: int, size: int) -> bytes:
+    f.seek(offset)
+    data = f.read(size)
+    if len(data) != size:
+        raise PEVersionError(f"unexpected end of file at offset {offset}")
+    return data
+
+
+def _read_sections(f, header: bytes) -> tuple[int, int, list[tuple[int, int, int, int]], bytes]:
+    """Parse the headers; return (resource RVA, resource size, sections, header bytes).
+
+    The returned header bytes run up to the end of the section table.
+    """
+    if header[:2] != b"MZ":
+        raise PEVersionError("missing MZ signature")
+    (pe_offset,) = _unpack_from("<I", header, 0x3C)
+    if pe_offset + 24 > len(header):
+        header = header + _read_at(f, len(header), pe_offset + 24 - len(header))
+    if header[pe_offset:pe_offset + 4] != b"PE\0\0":
+        raise PEVersionError("missing PE signature")
+
+    num_sections, = _unpack_from("<H", header, pe_offset + 6)
+    optional_size, = _unpack_from("<H", header, pe_offset + 20)
+    optional_offset = pe_offset + 24
+    section_offset = optional_offset + optional_size
+    if num_sections == 0 or num_sections > _MAX_SECTIONS:
+        raise PEVersionError(f"implausible section count {num_sections}")
+
+    end = section_offset + num_sections * 40
+    if end > len(header):
+        header = header + _read_at(f, len(header), end - len(header))
+
+    magic, = _unpack_from("<H", header, optional_offset)
+    dir_offset = _DATA_DIRECTORY_OFFSET.get(magic)
+    if dir_offset is None:
+        raise PEVersionError(f"unknown optional header magic {magic:#x}")
+    num_dirs, = _unpack_from("<I", header, optional_offset + dir_offset - 4)
+    if num_dirs <= 2 or dir_offset + 3 * 8 > optional_size:
+        return 0, 0, [], header[:end]  # no resource directory entry at all
+    rsrc_rva, rsrc_size = _unpack_from("<II", header, optional_offset + dir_offset + 2 * 8)
+
+    sections = []
+    for i in range(num_sections):
+        virtual_size, virtual_address, raw_size, raw_pointer = _unpack_from(
+            "<IIII", header, section_offset + i * 40 + 8
+        )
+        sections.append((virtual_address, max(virtual_size, raw_size), raw_pointer, raw_size))
+    return rsrc_rva, rsrc_size, sections, header[:end]
+
+
+def _rva_to_offset(rva: int, sections: list[tuple[int, int, int, int]]) -> int:
+    for virtual_address, span, raw_pointer, raw_size in sections:
+        if virtual_address <= rva < virtual_address + span:
+            delta = rva - virtual_address
+            if delta >= raw_size:
+                raise PEVersionError(f"RVA {rva:#x} lies in uninitialised data")
+            return raw_pointer + delta
+    raise PEVersionError(f"RVA {rva:#x} is outside every section")
+
+
+def _directory_entries(f, rsrc_offset: int, dir_rva: int) -> list[tuple[int, int]]:
+    """(name-or-ID, OffsetToData) pairs of the resource directory at ``dir_rva``."""
+    header = _read_at(f, rsrc_offset + dir_rva, 16)
+    named, ids = _unpack_from("<HH", header, 12)
+    count = named + ids
+    if count > _MAX_DIRECTORY_ENTRIES:
+        raise PEVersionError(f"implausible resource directory size {count}")
+    data = _read_at(f, rsrc_offset + dir_rva + 16, count * 8)
+    return [_unpack_from("<II", data, i * 8) for i in range(count)]
+
+
+def _version_blobs(f, rsrc_rva: int, sections) -> list[bytes]:
+    """Raw VS_VERSIONINFO blobs of every RT_VERSION resource, in directory order."""
+    rsrc_offset = _rva_to_offset(rsrc_rva, sections)
+    blobs = []
+
+    for type_id, type_target in _directory_entries(f, rsrc_offset, 0):
+        if type_id != _RT_VERSION:
+            continue
+        if not type_target & 0x80000000:
+            raise PEVersionError("RT_VERSION entry is not a directory")
+        for _name, name_target in _directory_entries(f, rsrc_offset, type_target & 0x7FFFFFFF):
+            if not name_target & 0x80000000:
+                raise PEVersionError("version name entry is not a directory")
+            for _lang, lang_target in _directory_entries(f, rsrc_offset, name_target & 0x7FFFFFFF):
+                if lang_target & 0x80000000:
+                    raise PEVersionError("version language entry is a directory")
+                data_rva, data_size = _unpack_from("<II", _read_at(f, rsrc_offset + lang_target, 8), 0)
+                if data_size > _MAX_VERSION_BLOB:
+                    raise PEVersionError(f"implausible version resource size {data_size}")
+                blobs.append(_read_at(f, _rva_to_offset(data_rva, sections), data_size))
+    return blobs
+
+
+def _align4(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+def _node(blob: bytes, offset: int, end: int) -> tuple[int, int, int, str, int]:
+    """Parse a version node header: (length, value length, type, key, value offset)."""
+    length, value_length, value_type = _unpack_from("<HHH", blob, offset)
+    if length < 6 or offset + length > end:
+        raise PEVersionError(f"version node at {offset} overruns its parent")
+    key_start = offset + 6
+    key_end = key_start
+    while key_end + 1 < offset + length and blob[key_end:key_end + 2] != b"\0\0":
+        key_end += 2
+    key = blob[key_start:key_end].decode("utf-16-le", errors="replace")
+    return length, value_length, value_type, key, _align4(key_end + 2)
+
+
+def _children(blob: bytes, start: int, end: int):
+    """Yield (offset, end) of each child node between ``start`` and ``end``."""
+    offset = _align4(start)
+    while offset + 6 <= end:
+        length, = _unpack_from("<H", blob, offset)
+        if length == 0:
+            break
+        if offset + length > end:
+            raise PEVersionError(f"version node at {offset} overruns its parent")
+        yield offset, offset + length
+        offset = _align4(offset + length)
+
+
+def _parse_version_blob(blob: bytes, info: PEVersionInfo) -> None:
+    length, value_length, _type, key, value_offset = _node(blob, 0, len(blob))
+    if key != "VS_VERSION_INFO":
+        raise PEVersionError(f"unexpected version root key {key!r}")
+
+    if value_length >= 52:
+        signature, = _unpack_from("<I", blob, value_offset)
+        if signature == _FIXED_FILE_INFO_SIGNATURE:
+            ms, ls = _unpack_from("<II", blob, value_offset + 8)
+            info.fixed_file_version = (ms >> 16, ms & 0xFFFF, ls >> 16, ls & 0xFFFF)
+
+    for child, child_end in _children(blob, value_offset + value_length, length):
+        _, _, _, child_key, child_value = _node(blob, child, child_end)
+        if child_key != "StringFileInfo":
+            continue
+        for table, table_end in _children(blob, child_value, child_end):
+            _, _, _, _lang, table_value = _node(blob, table, table_end)
+            for string, string_end in _children(blob, table_value, table_end):
+                _, _, _, string_key, string_value = _node(blob, string, string_end)
+                if string_key != "FileVersion":
+                    continue
+                raw = blob[string_value:string_end]
+                text = raw.decode("utf-16-le", errors="replace")
+                info.file_version = text.split("\0", 1)[0]
+
+
+def read_version_info(path) -> PEVersionInfo:
+    """
+    Read the version resource of the PE at ``path``.
+
+    Args:
+        path: Path to a DLL/EXE
+
+    Returns:
+        PEVersionInfo (fields None when the PE has no version resource)
+
+    Raises:
+        OSError: The file cannot be read
+        PEVersionError: The file is not a PE this reader understands
+    """
+    info = PEVersionInfo()
+    with open(path, "rb") as f:
+        header = f.read(_HEADER_READ)
+        rsrc_rva, rsrc_size, sections, _ = _read_sections(f, header)
+        if not rsrc_rva or not rsrc_size:
+            return info
+        for blob in _version_blobs(f, rsrc_rva, sections):
+            _parse_version_blob(blob, info)
+    return info
+
+
+def content_fingerprint(path) -> str:
+    """
+    Cheap build fingerprint of the PE at ``path``.
+
+    ``"<size>:<hash>"`` where the hash (BLAKE2b-128) covers the headers up to
+    the end of the section table and the raw bytes of the section holding the
+    resource directory - a few KB for an upscaler DLL, however big the file.
+
+    Raises:
+        OSError: The file cannot be read
+        PEVersionError: The file is not a PE this reader understands
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        rsrc_rva, _rsrc_size, sections, header = _read_sections(f, f.read(_HEADER_READ))
+        digest.update(header)
+        if rsrc_rva:
+            for virtual_address, span, raw_pointer, raw_size in sections:
+                if virtual_address <= rsrc_rva < virtual_address + span:
+                    if raw_size > _MAX_FINGERPRINT_SECTION:
+                        raise PEVersionError(f"implausible resource section size {raw_size}")
+                    digest.update(_read_at(f, raw_pointer, raw_size))
+                    break
+    return f"{size}:{digest.hexdigest()}"
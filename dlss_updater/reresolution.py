@@ -9,10 +9,17 @@ The re-resolution process:
 1. Fetches owned games via Steam API (single call)
 2. For each game needing re-resolution:
    - Try API lookup (instant, dict lookup)
-   - Try store search (rate-limited, 1.5s delay)
+   - Try store search (rate-limited, answers cached in store_search_cache)
+   Games are looked up concurrently at the rate steam_rate_limiter allows.
 3. Batch updates DB, clears old images, resets fetch_failed flags
+
+``app_id_resolver`` applies the same store-search tier in the background for
+games a scan just recorded: the scan writes each game with whatever the local
+tiers found (manifest, owned games, FTS5) and queues it here, so network round
+trips no longer hold up recording the library.
 """
 
+import asyncio
 import anyio
 import inspect
 from typing import Any
@@ -21,6 +28,10 @@ from dlss_updater.logger import setup_logger
 
 logger = setup_logger()
 
+# Games looked up at once by run_reresolution; the request rate itself is
+# bounded by steam_integration.steam_rate_limiter
+_RERESOLUTION_CONCURRENCY = 8
+
 
 async def reresolution_needed() -> int:
     """Count how many games would benefit from re-resolution.
@@ -37,6 +48,7 @@ async def reresolution_needed() -> int:
 async def run_reresolution(
     progress_callback: Any | None = None,
     force: bool = False,
+    refresh_store_search: bool = False,
 ) -> dict[str, int]:
     """Re-resolve app IDs for games that used FTS5 or had no app ID.
 
@@ -47,7 +59,7 @@ async def run_reresolution(
     1. Fetch owned games from Steam API (single call)
     2. For each game needing re-resolution:
        a. Try Steam API lookup (instant dict lookup)
-       b. Try Store Search (rate-limited, ~1.5s delay)
+       b. Try Store Search (cached; rate-limited when it hits the network)
        c. Skip if neither works (keep existing resolution)
     3. For games where app_id changed:
        a. Delete old cached image files
@@ -57,6 +69,9 @@ async def run_reresolution(
     Args:
         progress_callback: Optional async callable(current, total, message)
             for UI progress updates.
+        force: Re-resolve every game, not only the ones needing it.
+        refresh_store_search: Ask Steam again instead of answering from
+            store_search_cache (one rate-limited request per game).
 
     Returns:
         Dict with counts: resolved, unchanged, failed, total
@@ -113,23 +128,41 @@ async def run_reresolution(
     resolved = 0
     unchanged = 0
 
-    for i, game in enumerate(games):
-        new_app_id = None
-        new_source = None
-
-        # Tier 2: Steam API lookup (instant, dict lookup)
-        new_app_id = await find_app_id_via_api(game.name)
-        if new_app_id:
-            new_source = "api"
+    # Look games up concurrently: store searches are paced by the shared
+    # steam_rate_limiter, so this runs at the rate Steam allows instead of
+    # one request (plus a fixed sleep) at a time.
+    lookups: list[tuple[int | None, str | None]] = [(None, None)] * total
+    limiter = anyio.CapacityLimiter(_RERESOLUTION_CONCURRENCY)
+    completed = 0
+
+    async def _lookup(i: int, game) -> None:
+        nonlocal completed
+        async with limiter:
+            # Tier 2: Steam API lookup (instant, dict lookup)
+            new_app_id = await find_app_id_via_api(game.name)
+            new_source = "api" if new_app_id else None
+
+            # Tier 3: Store search (cached answers cost nothing)
+            if new_app_id is None:
+                new_app_id = await find_app_id_via_store_search(
+                    game.name, use_cache=not refresh_store_search
+                )
+                if new_app_id:
+                    new_source = "store_search"
+            lookups[i] = (new_app_id, new_source)
+
+        completed += 1
+        # Progress update every 5 games
+        if progress_callback and completed % 5 == 0:
+            await _safe_callback(
+                progress_callback, completed, total, f"Re-resolved {completed}/{total} games..."
+            )
 
-        # Tier 3: Store search (rate-limited)
-        if new_app_id is None:
-            new_app_id = await find_app_id_via_store_search(game.name)
-            if new_app_id:
-                new_source = "store_search"
-            # Rate limit every store search request (hit or miss)
-            await anyio.sleep(1.5)
+    async with anyio.create_task_group() as tg:
+        for i, game in enumerate(games):
+            tg.start_soon(_lookup, i, game)
 
+    for game, (new_app_id, new_source) in zip(games, lookups):
         if new_app_id and new_app_id != game.steam_app_id:
             # App ID changed or newly resolved
             updates.append(
@@ -159,12 +192,6 @@ async def run_reresolution(
         else:
             unchanged += 1
 
-        # Progress update every 5 games
-        if progress_callback and (i + 1) % 5 == 0:
-            await _safe_callback(
-                progress_callback, i + 1, total, f"Re-resolved {i + 1}/{total} games..."
-            )
-
     # Step 4: Batch database updates
     if updates:
         await db_manager.batch_update_game_app_ids(updates)
@@ -195,6 +222,115 @@ async def run_reresolution(
     return result
 
 
+def needs_network_resolution(steam_app_id: int | None, resolution_source: str | None) -> bool:
+    """True for games the store search may improve (same rule as get_games_needing_reresolution)."""
+    return steam_app_id is None or resolution_source is None or resolution_source == 'fts5'
+
+
+class AppIdResolver:
+    """
+    Background queue resolving app IDs through the Steam Store search.
+
+    Games are queued with their locally resolved app ID; a worker task (one
+    at a time, registered with task_registry) runs at most ``concurrency``
+    store searches at once (paced by steam_rate_limiter) and writes
+    improvements with batch_update_game_app_ids every ``batch_size``
+    results. A store hit replaces an FTS5 guess; a miss keeps it.
+    """
+
+    def __init__(self, concurrency: int = 3, batch_size: int = 20):
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        # game_id -> (name, steam_app_id); re-queuing a game replaces its entry
+        self._queue: dict[int, tuple[str, int | None]] = {}
+        self._updates: list[dict] = []
+        self._old_app_ids: list[int] = []
+        self._task: asyncio.Task | None = None
+        self._idle: anyio.Event | None = None
+        self._listeners: list = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def add_listener(self, callback) -> None:
+        """Call ``callback()`` (sync or async) after each batch of updates is written."""
+        self._listeners.append(callback)
+
+    def enqueue(self, game_id: int, name: str, steam_app_id: int | None) -> None:
+        """Queue a game for store-search resolution (must run on the event loop)."""
+        from dlss_updater.task_registry import register_task
+
+        self._queue[game_id] = (name, steam_app_id)
+        if self._task is None or self._task.done():
+            self._idle = anyio.Event()
+            self._task = register_task(asyncio.create_task(self._run()), "app_id_resolver")
+
+    async def drain(self) -> None:
+        """Wait until every queued game has been resolved and written."""
+        while self._task is not None and not self._task.done():
+            await self._idle.wait()
+
+    async def _run(self) -> None:
+        try:
+            while self._queue:
+                async with anyio.create_task_group() as tg:
+                    for _ in range(self._concurrency):
+                        tg.start_soon(self._worker)
+                await self._flush()
+        except anyio.get_cancelled_exc_class():
+            logger.info(f"App ID resolver stopped with {len(self._queue)} games queued")
+            raise
+        finally:
+            self._task = None
+            self._idle.set()
+
+    async def _worker(self) -> None:
+        from dlss_updater.steam_integration import find_app_id_via_store_search
+
+        while self._queue:
+            game_id = next(iter(self._queue))
+            name, current_app_id = self._queue.pop(game_id)
+            try:
+                app_id = await find_app_id_via_store_search(name)
+            except Exception as e:
+                logger.debug(f"Background store search failed for '{name}': {e}")
+                continue
+            if not app_id:
+                continue
+
+            self._updates.append({
+                'game_id': game_id,
+                'steam_app_id': app_id,
+                'resolution_source': 'store_search',
+            })
+            if current_app_id and current_app_id != app_id:
+                self._old_app_ids.append(current_app_id)
+            logger.debug(f"Resolved '{name}': {current_app_id} -> {app_id} (store_search)")
+            if len(self._updates) >= self._batch_size:
+                await self._flush()
+
+    async def _flush(self) -> None:
+        from dlss_updater.database import db_manager
+
+        if not self._updates:
+            return
+        updates, self._updates = self._updates, []
+        old_app_ids, self._old_app_ids = self._old_app_ids, []
+
+        await db_manager.batch_update_game_app_ids(updates)
+        if old_app_ids:
+            await db_manager.delete_cached_images_for_app_ids(old_app_ids)
+        await db_manager.clear_fetch_failed_for_app_ids([u['steam_app_id'] for u in updates])
+
+        for callback in self._listeners:
+            await _safe_callback(callback)
+
+
+# Shared by every scan
+app_id_resolver = AppIdResolver()
+
+
 async def _safe_callback(callback: Any, *args: Any) -> None:
     """Safely invoke a progress callback, handling both sync and async."""
     try:
@@ -0,0 +1,183 @@
+"""
+Persistent directory index for incremental rescans.
+
+Every scan used to re-list every directory of every game tree, even when
+nothing had been installed or patched since the previous scan. A directory's
+own mtime changes whenever an entry is created, removed or renamed inside it,
+so while its (mtime_ns, inode) still match what was recorded the last time it
+was listed, the recorded listing is still accurate: the directory then costs
+one stat() instead of a scandir(), and the walk continues into the recorded
+child directories (each of which is checked the same way).
+
+Racy listings: a directory changed within the same mtime tick as our listing
+keeps its recorded mtime, so the change would go unnoticed on the next scan.
+Listings of directories modified less than ``_RACY_WINDOW_NS`` before they were
+listed are therefore not recorded at all and simply get re-listed next time.
+
+The index is loaded once per scan by ``find_all_dlls`` and shared by every
+walker thread; ``save()`` writes back only the directories that were listed
+this time and drops the ones that no longer exist.
+
+The walk also notes every ``.exe`` it passes (recorded or freshly listed) in
+``exe_files``, so the scan can hand exe_resolver its candidates without a
+second walk of each game tree.
+"""
+
+import os
+import threading
+import time
+
+from dlss_updater.constants import DLL_TYPE_MAP
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import ScanDirIndexEntry
+
+logger = setup_logger()
+
+# Every DLL name the index records, whichever technologies the current scan
+# asks for, so toggling a technology in preferences does not invalidate the
+# index - callers filter recorded names against their own set at read time.
+INDEXED_DLL_NAMES: frozenset = frozenset(name.lower() for name in DLL_TYPE_MAP)
+
+# Listings of directories modified this recently are not trusted (see module
+# docstring). 2s covers the coarsest mtime granularity in use (FAT).
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class DirectoryIndex:
+    """
+    Per-scan view of the persistent directory index.
+
+    Thread-safe for Python 3.14 free-threading: lookups read an immutable
+    snapshot of the previous index, and all bookkeeping for the current scan
+    is guarded by a lock since many walker threads share one instance.
+    """
+
+    def __init__(self, previous: dict[str, ScanDirIndexEntry] | None = None):
+        self._previous = previous or {}
+        self._visited: set[str] = set()
+        self._changed: list[ScanDirIndexEntry] = []
+        self._lock = threading.Lock()
+        self.exe_files: list[tuple[str, int]] = []
+        self.reused = 0
+        self.listed = 0
+
+    @classmethod
+    async def load(cls) -> "DirectoryIndex":
+        """Load the index persisted by the previous scan (empty on error)."""
+        from dlss_updater.database import db_manager
+
+        try:
+            previous = await db_manager.load_scan_dir_index()
+        except Exception as e:
+            logger.warning(f"Could not load scan directory index, doing a full walk: {e}")
+            previous = {}
+        logger.debug(f"Loaded scan directory index with {len(previous)} directories")
+        return cls(previous)
+
+    def can_serve(self, dll_names_lower: frozenset) -> bool:
+        """True if recorded listings cover every DLL name in ``dll_names_lower``."""
+        return dll_names_lower <= INDEXED_DLL_NAMES
+
+    def lookup(self, path: str, st: os.stat_result) -> ScanDirIndexEntry | None:
+        """Return the recorded listing for ``path`` if the directory is unchanged."""
+        entry = self._previous.get(path)
+        if entry is None or entry.mtime_ns != st.st_mtime_ns or entry.inode != st.st_ino:
+            return None
+        with self._lock:
+            self._visited.add(path)
+            self.reused += 1
+        return entry
+
+    def add_exes(self, path: str, exe_names: list[str], exe_sizes: list[int]) -> None:
+        """Note the ``.exe`` files the walk saw directly in ``path``."""
+        if not exe_names:
+            return
+        with self._lock:
+            self.exe_files.extend(
+                (os.path.join(path, name), size) for name, size in zip(exe_names, exe_sizes)
+            )
+
+    def record(
+        self,
+        path: str,
+        st: os.stat_result,
+        dll_names: list[str],
+        subdirs: list[str],
+        exe_names: list[str] | None = None,
+        exe_sizes: list[int] | None = None,
+    ) -> None:
+        """Record a fresh listing of ``path`` taken after ``st`` was read."""
+        racy = time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+        with self._lock:
+            self.listed += 1
+            if racy:
+                return
+            self._visited.add(path)
+            self._changed.append(ScanDirIndexEntry(
+                path=path,
+                mtime_ns=st.st_mtime_ns,
+                inode=st.st_ino,
+                dll_names=dll_names,
+                subdirs=subdirs,
+                exe_names=exe_names or [],
+                exe_sizes=exe_sizes or [],
+            ))
+
+    def retain(self, root: str) -> None:
+        """
+        Keep the recorded subtree under ``root`` although this scan skipped it.
+
+        Used when a whole tree is known unchanged by other means (e.g. a Steam
+        game whose appmanifest build is unchanged) so saving with prune=True
+        does not drop its listings.
+        """
+        with self._lock:
+            stack = [root]
+            while stack:
+                path = stack.pop()
+                entry = self._previous.get(path)
+                if entry is None or path in self._visited:
+                    continue
+                self._visited.add(path)
+                stack.extend(os.path.join(path, name) for name in entry.subdirs)
+
+    def next_pass(self) -> None:
+        """
+        Start another pass over a long-lived index (see library_watcher).
+
+        Folds the listings recorded since the last pass into the snapshot
+        lookups read, so they are reused from now on, and resets the per-pass
+        bookkeeping. Call after save(prune=False) has persisted them.
+        """
+        with self._lock:
+            if self._changed:
+                previous = dict(self._previous)
+                previous.update((entry.path, entry) for entry in self._changed)
+                self._previous = previous  # readers keep the snapshot they hold
+            self._changed = []
+            self._visited = set()
+            self.exe_files = []
+            self.reused = 0
+            self.listed = 0
+
+    async def save(self, prune: bool = True) -> None:
+        """
+        Persist this scan's changes.
+
+        Args:
+            prune: Also delete recorded directories this scan did not reach.
+                   Only safe after a complete scan of every configured root; a
+                   partial scan (errors, targeted rescans) must pass False.
+        """
+        from dlss_updater.database import db_manager
+
+        with self._lock:
+            changed = list(self._changed)
+            deletes = [p for p in self._previous if p not in self._visited] if prune else []
+            reused, listed = self.reused, self.listed
+
+        logger.info(f"Directory index: {reused} directories unchanged, {listed} listed")
+        try:
+            await db_manager.save_scan_dir_index(changed, deletes)
+        except Exception as e:
+            logger.warning(f"Could not save scan directory index: {e}")
@@ -0,0 +1,145 @@
+"""
+Cancellable, resumable full scans.
+
+A full scan (``find_all_dlls``) walks every launcher's libraries and resolves
+a Steam app ID per game, which on slow network shares can take many minutes.
+Each run gets a ``ScanSession``:
+
+  * a cancel handle: ``cancel()`` (or ``cancel_active_scan()`` from the UI)
+    stops the record pipeline at its next await, and sets ``cancel_event``,
+    which the directory walks running on worker threads check before listing
+    each directory; the scanning task is registered with task_registry, so
+    application shutdown cancels it the same way
+  * checkpoints: each launcher's DLL list as soon as the launcher finishes,
+    and each game's prepared record (app ID resolution included) as soon as
+    it is written, persisted in the ``scan_checkpoints`` table
+
+A scan that is cancelled or killed leaves its checkpoint behind, and the next
+scan looking for the same DLLs resumes from it: finished launchers are not
+walked again and recorded games skip app ID resolution. The checkpoint is
+cleared once a scan completes. Checkpoints older than
+``CHECKPOINT_MAX_AGE_S`` are ignored, as installs may have changed since.
+"""
+
+import asyncio
+import threading
+
+import anyio
+
+from dlss_updater.logger import setup_logger
+from dlss_updater.models import ScanCheckpoint
+from dlss_updater.task_registry import register_task
+
+logger = setup_logger()
+
+# Resume only from checkpoints younger than this
+CHECKPOINT_MAX_AGE_S = 24 * 60 * 60
+
+# The session of the scan currently running (one at a time)
+_active_session: "ScanSession | None" = None
+
+
+class ScanCancelledError(Exception):
+    """The scan was cancelled through its ScanSession."""
+
+
+class ScanSession:
+    """
+    One run of ``find_all_dlls``: cancel scope plus checkpoint bookkeeping.
+
+    Only ever used from the event loop running the scan, so no locking
+    (``cancel_event`` is the one part worker threads read).
+    """
+
+    def __init__(self, dll_names_key: str, checkpoint: ScanCheckpoint | None = None):
+        checkpoint = checkpoint or ScanCheckpoint()
+        self.dll_names_key = dll_names_key
+        self.cancel_scope = anyio.CancelScope()
+        # Seen by the walks on worker threads, which the cancel scope can't reach
+        self.cancel_event = threading.Event()
+        self.resumed_launchers = checkpoint.launchers
+        self.resumed_games = checkpoint.games
+
+    @classmethod
+    async def start(cls, dll_names: list[str]) -> "ScanSession":
+        """Create the session for a new scan, resuming an earlier checkpoint."""
+        from dlss_updater.database import db_manager
+
+        global _active_session
+
+        dll_names_key = '/'.join(sorted(name.lower() for name in dll_names))
+        try:
+            checkpoint = await db_manager.load_scan_checkpoint(dll_names_key, CHECKPOINT_MAX_AGE_S)
+        except Exception as e:
+            logger.warning(f"Could not load scan checkpoint, scanning from scratch: {e}")
+            checkpoint = None
+
+        session = cls(dll_names_key, checkpoint)
+        if session.resumed_launchers or session.resumed_games:
+            logger.info(
+                f"Resuming interrupted scan: {len(session.resumed_launchers)} launchers, "
+                f"{len(session.resumed_games)} games from checkpoint"
+            )
+
+        task = asyncio.current_task()
+        if task is not None:
+            register_task(task, "find_all_dlls")
+        _active_session = session
+        return session
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_scope.cancel_called
+
+    def cancel(self) -> None:
+        """Cancel the scan; finished launchers and games stay checkpointed."""
+        logger.info("Scan cancellation requested")
+        self.cancel_event.set()
+        self.cancel_scope.cancel()
+
+    async def checkpoint_launcher(self, launcher: str, dlls: list[str]) -> None:
+        """Checkpoint a launcher that finished with ``dlls``."""
+        if launcher not in self.resumed_launchers:
+            await self._save('launcher', launcher, [str(dll) for dll in dlls])
+
+    async def checkpoint_game(self, game_data: dict) -> None:
+        """Checkpoint a game whose record was written."""
+        if game_data['path'] not in self.resumed_games:
+            await self._save('game', game_data['path'], game_data)
+
+    async def _save(self, kind: str, key: str, data) -> None:
+        from dlss_updater.database import db_manager
+
+        try:
+            await db_manager.save_scan_checkpoint(kind, key, self.dll_names_key, data)
+        except Exception as e:
+            logger.warning(f"Could not checkpoint scan progress ({kind} {key}): {e}")
+
+    async def complete(self) -> None:
+        """The scan finished: its checkpoint is no longer needed."""
+        from dlss_updater.database import db_manager
+
+        try:
+            await db_manager.clear_scan_checkpoint()
+        except Exception as e:
+            logger.warning(f"Could not clear scan checkpoint: {e}")
+
+    def close(self) -> None:
+        """Stop being the active session (whether the scan finished or not)."""
+        global _active_session
+        if _active_session is self:
+            _active_session = None
+
+
+def get_active_scan_session() -> ScanSession | None:
+    """The session of the scan currently running, if any."""
+    return _active_session
+
+
+def cancel_active_scan() -> bool:
+    """Cancel the running scan. Returns False if no scan is running."""
+    session = _active_session
+    if session is None:
+        return False
+    session.cancel()
+    return True
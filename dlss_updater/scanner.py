@@ -5,13 +5,18 @@ from typing import Any
 from .config import LauncherPathName, config_manager, Concurrency
 from .whitelist import is_whitelisted
 from .constants import DLL_GROUPS
-from .utils import find_game_root
+from .utils import find_game_root, load_game_root_probes, save_game_root_probes
 from .vdf_parser import VDFParser
 from .platform_utils import IS_WINDOWS, IS_LINUX
 import asyncio
 import anyio
-from dlss_updater.concurrency_limiters import thread_cpu, thread_io, io_heavy
+from dlss_updater.concurrency_limiters import (
+    device_capacity, device_slot, group_by_device, thread_cpu, thread_io, io_heavy,
+)
 from dlss_updater.logger import setup_logger
+from dlss_updater.models import SteamManifestState
+from dlss_updater.scan_index import DirectoryIndex, INDEXED_DLL_NAMES
+from dlss_updater.scan_session import ScanCancelledError, ScanSession
 from dlss_updater.task_registry import register_task
 import sys
 
@@ -39,7 +44,85 @@ else:
     logger.info("Scanner: Using parallel os.scandir() with GIL enabled (I/O parallelism)")
 
 
-def _parallel_scandir_walk(root_path: str, dll_names_lower: frozenset, max_workers: int = None) -> list[str]:
+def _list_directory(
+    directory: str,
+    dll_names_lower: frozenset,
+    dir_index: DirectoryIndex | None = None,
+) -> tuple[list[str], list[str]]:
+    """
+    List one directory for the scan walk.
+
+    With a ``dir_index``, an unchanged directory (same mtime_ns and inode as
+    when it was last listed) is answered from the recorded listing for the
+    cost of a single stat(); otherwise it is listed with os.scandir() and the
+    fresh listing is recorded for the next scan. Either way the directory's
+    ``.exe`` files are passed to ``dir_index.add_exes`` for exe_resolver.
+
+    Args:
+        directory: Directory to list
+        dll_names_lower: Frozenset of lowercase DLL names to find
+        dir_index: Optional persistent directory index for this scan
+
+    Returns:
+        Tuple of (DLL paths found directly in ``directory``, subdirectory
+        paths to descend into). Raises OSError if the directory cannot be
+        read, so each caller keeps its own error reporting.
+    """
+    st = None
+    if dir_index is not None:
+        st = os.stat(directory)
+        recorded = dir_index.lookup(directory, st)
+        if recorded is not None:
+            dir_index.add_exes(directory, recorded.exe_names, recorded.exe_sizes)
+            return (
+                [os.path.join(directory, n) for n in recorded.dll_names if n.lower() in dll_names_lower],
+                [os.path.join(directory, n) for n in recorded.subdirs],
+            )
+
+    found = []
+    subdirs = []
+    indexed_dlls = []
+    subdir_names = []
+    exe_names = []
+    exe_sizes = []
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                name_lower = entry.name.lower()
+                if entry.is_file(follow_symlinks=False):
+                    if name_lower in dll_names_lower:
+                        found.append(entry.path)
+                    if name_lower in INDEXED_DLL_NAMES:
+                        indexed_dlls.append(entry.name)
+                    elif dir_index is not None and name_lower.endswith(".exe"):
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            size = 0
+                        exe_names.append(entry.name)
+                        exe_sizes.append(size)
+                elif entry.is_dir(follow_symlinks=False):
+                    if name_lower not in _SKIP_DIRECTORIES:
+                        subdirs.append(entry.path)
+                        subdir_names.append(entry.name)
+            except (OSError, PermissionError):
+                continue
+
+    if dir_index is not None:
+        dir_index.record(directory, st, indexed_dlls, subdir_names, exe_names, exe_sizes)
+        dir_index.add_exes(directory, exe_names, exe_sizes)
+
+    return found, subdirs
+
+
+def _parallel_scandir_walk(
+    root_path: str,
+    dll_names_lower: frozenset,
+    max_workers: int = None,
+    dir_index: DirectoryIndex | None = None,
+    cancel_event: threading.Event | None = None,
+) -> list[str]:
     """
     High-performance parallel directory scanner using os.scandir().
 
@@ -49,93 +132,184 @@ def _parallel_scandir_walk(root_path: str, dll_names_lower: frozenset, max_worke
 
     Strategy:
     - Use os.scandir() which is faster than os.listdir() + os.stat()
-    - Parallelize across top-level directories for better load distribution
-    - Use thread pool sized to CPU count (more beneficial with no GIL)
+    - Schedule every directory, not just the top level: listed subdirectories
+      go onto one shared work queue that idle workers take from, so a single
+      huge game folder is spread across all workers instead of pinning one
+    - Pop the most recently queued directory first (depth-first), which keeps
+      the queue small on wide trees
+    - Use thread pool sized to CPU count (more beneficial with no GIL),
+      capped at the root device's limit so a spinning disk is not thrashed
+    - Reuse recorded listings of unchanged directories (``dir_index``)
 
     Args:
         root_path: Root directory to scan
         dll_names_lower: Frozenset of lowercase DLL names to find
-        max_workers: Number of worker threads (default: CPU count * 2 for I/O)
+        max_workers: Number of worker threads (default: the root device's
+                     I/O limit, see concurrency_limiters.device_capacity)
+        dir_index: Optional persistent directory index for this scan
+        cancel_event: Optional event of the scan (ScanSession.cancel_event);
+                      once set, no further directory is listed
 
     Returns:
-        List of found DLL paths
+        List of found DLL paths (those found before a cancel)
     """
-    import os
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+    if cancel_event is not None and cancel_event.is_set():
+        return []
+    if dir_index is not None and not dir_index.can_serve(dll_names_lower):
+        dir_index = None
 
-    if max_workers is None:
-        # Use thread pool sized for I/O operations - scale aggressively
-        max_workers = Concurrency.THREADPOOL_IO
+    # List the root inline: a root without subdirectories needs no pool
+    try:
+        results, top_level_dirs = _list_directory(root_path, dll_names_lower, dir_index)
+    except (OSError, PermissionError) as e:
+        logger.debug(f"Cannot access {root_path}: {e}")
+        if isinstance(e, PermissionError):
+            _note_skipped_path(root_path)
+        return []
 
-    results = []
+    if top_level_dirs:
+        results.extend(_walk_directories(
+            top_level_dirs, dll_names_lower, max_workers, dir_index, cancel_event
+        ))
+    return results
 
-    def scan_directory_recursive(directory: str) -> list[str]:
-        """Recursively scan a directory for DLLs using os.scandir()
 
-        Note: Subdirectories are collected first, then the scandir handle is
-        closed BEFORE recursion to prevent resource leaks during deep traversal.
-        """
-        found = []
-        subdirs = []
+def _walk_directories(
+    directories: list[str],
+    dll_names_lower: frozenset,
+    max_workers: int = None,
+    dir_index: DirectoryIndex | None = None,
+    cancel_event: threading.Event | None = None,
+) -> list[str]:
+    """
+    Walk several directory trees on one shared worker pool.
 
-        try:
-            with os.scandir(directory) as entries:
-                for entry in entries:
-                    try:
-                        name_lower = entry.name.lower()
-                        if entry.is_file(follow_symlinks=False):
-                            if name_lower in dll_names_lower:
-                                found.append(entry.path)
-                        elif entry.is_dir(follow_symlinks=False):
-                            if name_lower not in _SKIP_DIRECTORIES:
-                                subdirs.append(entry.path)
-                    except (OSError, PermissionError):
-                        continue
-        except (OSError, PermissionError):
-            pass
+    The scheduler behind ``_parallel_scandir_walk``; also used directly to
+    walk many unrelated roots (e.g. every game in every Wine prefix) as one
+    job, so work is shared across all of them.
 
-        # Recurse AFTER closing scandir handle to prevent resource leak
-        for subdir in subdirs:
-            found.extend(scan_directory_recursive(subdir))
+    Args:
+        directories: Directories to walk (each including its subtree)
+        dll_names_lower: Frozenset of lowercase DLL names to find
+        max_workers: Number of worker threads (default: the first
+                     directory's device I/O limit)
+        dir_index: Optional persistent directory index for this scan
+        cancel_event: Optional event of the scan; once set, workers drop
+                      their queued directories and stop after the one
+                      they are listing
 
-        return found
+    Returns:
+        List of found DLL paths (those found before a cancel)
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Get top-level directories for parallel processing
-    try:
-        with os.scandir(root_path) as entries:
-            top_level_dirs = []
-            for entry in entries:
-                try:
-                    if entry.is_dir(follow_symlinks=False):
-                        if entry.name.lower() not in _SKIP_DIRECTORIES:
-                            top_level_dirs.append(entry.path)
-                    elif entry.is_file(follow_symlinks=False):
-                        if entry.name.lower() in dll_names_lower:
-                            results.append(entry.path)
-                except (OSError, PermissionError):
-                    continue
-    except (OSError, PermissionError) as e:
-        logger.debug(f"Cannot access {root_path}: {e}")
-        return results
+    if not directories:
+        return []
 
-    if not top_level_dirs:
-        return results
+    if max_workers is None:
+        # Use thread pool sized for I/O operations - scale aggressively on
+        # SSDs, stay at a couple of workers on a spinning disk
+        max_workers = min(Concurrency.THREADPOOL_IO, device_capacity(directories[0]))
+
+    if dir_index is not None and not dir_index.can_serve(dll_names_lower):
+        dir_index = None
+
+    # Work distribution: every worker walks its own LIFO stack of directories
+    # without locking. Workers that run dry wait on the shared queue; a busy
+    # worker that sees one waiting hands over the shallower half of its stack
+    # (the bigger subtrees), so one huge folder ends up spread over the pool.
+    shared = deque(directories)
+    idle = 0
+    cond = threading.Condition()
+    results = []
 
-    # Parallel scan of top-level directories
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(scan_directory_recursive, d): d for d in top_level_dirs}
-        for future in as_completed(futures):
+    def worker() -> list[str]:
+        """Walk directories until every worker is out of work"""
+        nonlocal idle
+        found_here = []
+        stack = []
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                # Wind down through the idle path below like a worker out of
+                # work, so workers waiting for a hand-over are released too
+                stack.clear()
+                with cond:
+                    shared.clear()
+            if not stack:
+                with cond:
+                    idle += 1
+                    # An empty queue only means "done" once every worker is
+                    # idle, as a busy one may still hand work over
+                    while not shared and idle < max_workers:
+                        cond.wait()
+                    if not shared:
+                        cond.notify_all()
+                        return found_here
+                    idle -= 1
+                    stack.append(shared.popleft())
+
+            directory = stack.pop()
             try:
-                results.extend(future.result())
+                found, subdirs = _list_directory(directory, dll_names_lower, dir_index)
+                found_here.extend(found)
+                stack.extend(subdirs)
             except (OSError, PermissionError) as e:
                 # Expected errors during filesystem traversal - log at debug level
-                logger.debug(f"Error scanning {futures[future]}: {e}")
+                logger.debug(f"Error scanning {directory}: {e}")
+                if isinstance(e, PermissionError):
+                    _note_skipped_path(directory)
             except Exception as e:
                 # Unexpected errors - log at warning level with traceback
-                logger.warning(f"Unexpected error scanning {futures[future]}: {e}", exc_info=True)
+                logger.warning(f"Unexpected error scanning {directory}: {e}", exc_info=True)
+
+            # Unlocked read: a stale value only delays the hand-over by one directory
+            if idle and len(stack) > 1:
+                with cond:
+                    half = len(stack) // 2
+                    shared.extend(stack[:half])
+                    del stack[:half]
+                    cond.notify(half)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(worker) for _ in range(max_workers)]
+        for future in futures:
+            results.extend(future.result())
 
     return results
 
+
+def _file_identity(path) -> tuple[int, int] | str:
+    """
+    Identity of the file or directory at ``path``: its (st_dev, st_ino).
+
+    One file reached through a symlinked library, a bind mount or a
+    Flatpak-exposed path has a single identity however the path is spelled,
+    so scan hits and game directories are deduplicated on it. Falls back to
+    the path string when the file cannot be stat'ed or its filesystem has no
+    inode numbers (st_ino 0, e.g. some FAT and network drives).
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return str(path)
+    if not st.st_ino:
+        return str(path)
+    return (st.st_dev, st.st_ino)
+
+
+def _dedup_by_identity(paths: list[str]) -> list[str]:
+    """Keep the first path of each distinct file (see ``_file_identity``)."""
+    seen = set()
+    unique = []
+    for path in paths:
+        identity = _file_identity(path)
+        if identity not in seen:
+            seen.add(identity)
+            unique.append(path)
+    return unique
+
+
 # Thread-safe lock for scanner globals (Python 3.14 free-threading)
 _scanner_lock = threading.Lock()
 
@@ -178,6 +352,40 @@ def _get_dll_names_lower() -> frozenset:
         return _dll_names_lower
 
 
+# Paths this scan could not read, or found games in but cannot write to, as
+# path -> {'path', 'reason'}. Noted by the walk as it goes and handed back by
+# find_all_dlls as '_skipped_paths' on Linux, so reporting them needs no
+# second enumeration of every library and prefix. Guarded by _scanner_lock.
+_skipped_paths: dict[str, dict[str, str]] = {}
+
+
+def _note_skipped_path(path: str) -> None:
+    """Record a path the scan had to skip for lack of permission (thread-safe)."""
+    from dlss_updater.linux_paths import is_system_path
+
+    reason = "System path (requires root)" if is_system_path(Path(path)) else "Permission denied"
+    with _scanner_lock:
+        _skipped_paths.setdefault(path, {'path': path, 'reason': reason})
+    logger.debug(f"Skipping inaccessible path: {path} ({reason})")
+
+
+def _take_skipped_paths() -> list[dict[str, str]]:
+    """Return and clear the skipped paths noted so far (thread-safe)."""
+    with _scanner_lock:
+        skipped = list(_skipped_paths.values())
+        _skipped_paths.clear()
+    return skipped
+
+
+def _note_unwritable_games(game_paths: list[str]) -> None:
+    """Note game directories the scan could read but an update could not write."""
+    from dlss_updater.linux_paths import can_write_path
+
+    for game_path in game_paths:
+        if not can_write_path(Path(game_path)):
+            _note_skipped_path(game_path)
+
+
 async def _safe_progress_callback(progress_callback, current: int, total: int, message: str) -> None:
     """Thread-safe progress callback wrapper.
 
@@ -297,9 +505,20 @@ def get_steam_libraries(steam_path):
     return libraries
 
 
-async def find_dlls(library_paths, launcher_name, dll_names):
-    """Find DLLs from a filtered list of DLL names using batch whitelist checking"""
-    dll_paths = []
+async def find_dlls(
+    library_paths,
+    launcher_name,
+    dll_names,
+    dir_index: DirectoryIndex | None = None,
+    cancel_event: threading.Event | None = None,
+):
+    """Find DLLs from a filtered list of DLL names using batch whitelist checking
+
+    ``dir_index`` (optional) lets unchanged directories be answered from the
+    persistent directory index instead of being re-listed. Once
+    ``cancel_event`` (optional, ScanSession.cancel_event) is set, the library
+    walks stop listing directories.
+    """
     logger.debug(f"Searching for DLLs in {launcher_name}")
 
     # Pre-compute lowercase DLL names for O(1) lookup
@@ -308,20 +527,24 @@ async def find_dlls(library_paths, launcher_name, dll_names):
     # Collect all potential DLL paths, scanning every library path in PARALLEL.
     # Each library's synchronous scan is dispatched to a worker thread via the
     # shared thread_io limiter and awaited concurrently from a single anyio task
-    # group (same pattern as scan_steam_libraries_parallel). Results are stored
-    # index-keyed so ordering across library paths is preserved regardless of
-    # completion order; per-library errors are logged and skipped as before.
+    # group (same pattern as scan_steam_libraries_parallel), holding slots of
+    # the library's device so libraries sharing a disk share its limit.
+    # Results are stored index-keyed so ordering across library paths is
+    # preserved regardless of completion order; per-library errors are logged
+    # and skipped as before.
     library_paths = list(library_paths)
     potential_dlls = []
     lib_results: list[list[str] | None] = [None] * len(library_paths)
 
-    def _scan_library(library_path) -> list[str]:
+    def _scan_library(library_path, max_workers: int) -> list[str]:
         results = []
 
         # Use scandir-rs for 6-70x faster scanning on Windows if available
         if HAVE_SCANDIR_RS:
             try:
                 for entry in FastWalk(str(library_path)):
+                    if cancel_event is not None and cancel_event.is_set():
+                        break
                     # Skip directories in skip list
                     if entry.is_dir:
                         if entry.name.lower() in _SKIP_DIRECTORIES:
@@ -334,14 +557,17 @@ async def find_dlls(library_paths, launcher_name, dll_names):
                 logger.warning(f"scandir-rs failed, falling back to os.walk: {e}")
 
         # Fallback to parallel scandir (faster than os.walk, especially with GIL disabled)
-        return _parallel_scandir_walk(str(library_path), dll_names_lower)
+        return _parallel_scandir_walk(
+            str(library_path), dll_names_lower, max_workers, dir_index, cancel_event
+        )
 
     async def _scan_worker(i: int, library_path) -> None:
         logger.debug(f"Scanning directory: {library_path}")
         try:
-            lib_results[i] = await anyio.to_thread.run_sync(
-                _scan_library, library_path, limiter=thread_io
-            )
+            async with device_slot(library_path, Concurrency.THREADPOOL_IO) as workers:
+                lib_results[i] = await anyio.to_thread.run_sync(
+                    _scan_library, library_path, workers, limiter=thread_io
+                )
         except Exception as e:
             logger.error(f"Error scanning {library_path}: {e}")
 
@@ -353,7 +579,15 @@ async def find_dlls(library_paths, launcher_name, dll_names):
         if lib_dlls:
             potential_dlls.extend(lib_dlls)
 
-    # Batch check whitelist status
+    dll_paths = await _filter_whitelisted(potential_dlls, launcher_name)
+
+    logger.debug(f"Found {len(dll_paths)} DLLs in {launcher_name}")
+    return dll_paths
+
+
+async def _filter_whitelisted(potential_dlls: list[str], launcher_name: str) -> list[str]:
+    """Drop DLLs of whitelisted games, using one batch whitelist check."""
+    dll_paths = []
     if potential_dlls:
         from .whitelist import check_whitelist_batch
 
@@ -365,8 +599,6 @@ async def find_dlls(library_paths, launcher_name, dll_names):
                 dll_paths.append(dll_path)
             else:
                 logger.info(f"Skipped whitelisted game in {launcher_name}: {dll_path}")
-
-    logger.debug(f"Found {len(dll_paths)} DLLs in {launcher_name}")
     return dll_paths
 
 
@@ -754,7 +986,133 @@ async def get_custom_folder(folder_num):
     return [Path(p) for p in custom_paths if Path(p).exists()]
 
 
-async def scan_game_for_dlls(game_path: Path, dll_names_lower: frozenset) -> list[str]:
+async def get_prefix_game_dirs() -> list[str]:
+    """
+    Game directories inside every Proton and Wine prefix (Linux only).
+
+    Proton prefixes are collected from the compatdata directory of every Steam
+    library (cached per compatdata mtime, see linux_paths.get_proton_prefixes)
+    and Wine/Lutris prefixes from their usual locations. Directories that
+    resolve into a native Steam library - e.g. a Windows Steam inside a Wine
+    prefix pointed at the Linux library - are left to the Steam launcher, and
+    the same directory reached twice through symlinks is returned once.
+
+    Returns:
+        Game directory paths, in prefix order
+    """
+    if not IS_LINUX:
+        return []
+
+    from dlss_updater.linux_paths import (
+        get_linux_steam_libraries,
+        get_linux_steam_path,
+        get_proton_prefixes,
+        get_wine_prefixes,
+        scan_proton_games,
+    )
+
+    steam_libraries: list[Path] = []
+    prefixes: list[Path] = []
+    steam_path = await get_linux_steam_path()
+    if steam_path:
+        steam_libraries = await get_linux_steam_libraries(steam_path)
+        # Each library keeps its own compatdata next to steamapps/common
+        library_roots = [steam_path] + [lib.parent.parent for lib in steam_libraries]
+        seen_roots = set()
+        for root in library_roots:
+            root_key = os.path.realpath(root)
+            if root_key in seen_roots:
+                continue
+            seen_roots.add(root_key)
+            prefixes.extend(await get_proton_prefixes(root))
+    prefixes.extend(await get_wine_prefixes())
+
+    prefix_games: list[list[Path] | None] = [None] * len(prefixes)
+
+    async def _scan_prefix(i: int, prefix: Path) -> None:
+        try:
+            prefix_games[i] = await scan_proton_games(prefix)
+        except Exception as e:
+            logger.warning(f"Error scanning prefix {prefix}: {e}")
+
+    async with anyio.create_task_group() as tg:
+        for i, prefix in enumerate(prefixes):
+            tg.start_soon(_scan_prefix, i, prefix)
+
+    def _dedup(candidates: list[Path]) -> list[str]:
+        library_roots = tuple(
+            os.path.join(os.path.realpath(lib), "") for lib in steam_libraries
+        )
+        resolved = [(str(game_dir), os.path.realpath(game_dir)) for game_dir in candidates]
+        # Real directories first, so a symlinked duplicate is the one dropped
+        resolved.sort(key=lambda pair: pair[0] != pair[1])
+        seen = set()
+        result = []
+        for game_dir, real in resolved:
+            if real in seen or os.path.join(real, "").startswith(library_roots):
+                continue
+            seen.add(real)
+            result.append(game_dir)
+        return result
+
+    candidates = [game_dir for games in prefix_games if games for game_dir in games]
+    game_dirs = await anyio.to_thread.run_sync(_dedup, candidates, limiter=thread_io)
+    logger.info(
+        f"Found {len(game_dirs)} game directories in {len(prefixes)} Proton/Wine prefixes"
+        f" ({len(candidates) - len(game_dirs)} duplicates of Steam libraries or each other)"
+    )
+    return game_dirs
+
+
+async def scan_prefix_games(
+    dll_names,
+    dir_index: DirectoryIndex | None = None,
+    cancel_event: threading.Event | None = None,
+) -> list[str]:
+    """
+    Scan the game directories of every Proton and Wine prefix for DLLs.
+
+    The prefix game directories of each device are walked as one job on the
+    shared work-distributing walker, so a few big games and hundreds of empty
+    prefixes keep every worker busy alike, sized to the device slots held.
+
+    Args:
+        dll_names: DLL filenames to look for
+        dir_index: Optional persistent directory index for this scan
+        cancel_event: Optional event of the scan; stops the walk once set
+
+    Returns:
+        Non-whitelisted DLL paths
+    """
+    game_dirs = await get_prefix_game_dirs()
+    if not game_dirs:
+        return []
+
+    dll_names_lower = frozenset(d.lower() for d in dll_names)
+    groups = await anyio.to_thread.run_sync(group_by_device, game_dirs, limiter=thread_io)
+    group_results: list[list[str]] = [[] for _ in groups]
+
+    async def _walk_group(i: int, dirs: list[str]) -> None:
+        async with device_slot(dirs[0], Concurrency.THREADPOOL_IO) as workers:
+            group_results[i] = await anyio.to_thread.run_sync(
+                _walk_directories, dirs, dll_names_lower, workers, dir_index, cancel_event,
+                limiter=thread_io,
+            )
+
+    async with anyio.create_task_group() as tg:
+        for i, dirs in enumerate(groups):
+            tg.start_soon(_walk_group, i, dirs)
+
+    found = [dll for dlls in group_results for dll in dlls]
+    return await _filter_whitelisted(found, PREFIX_LAUNCHER)
+
+
+async def scan_game_for_dlls(
+    game_path: Path,
+    dll_names_lower: frozenset,
+    dir_index: DirectoryIndex | None = None,
+    cancel_event: threading.Event | None = None,
+) -> list[str]:
     """
     Scan a single game directory for DLLs using optimized os.scandir().
 
@@ -762,49 +1120,53 @@ async def scan_game_for_dlls(game_path: Path, dll_names_lower: frozenset) -> lis
     - Uses os.scandir() which avoids extra stat() calls
     - Uses frozenset for O(1) membership testing
     - Skips known non-game directories
-    - Runs in thread pool to avoid blocking event loop
+    - Runs in thread pool to avoid blocking event loop, gated by the game
+      device's limiter so parallel game scans do not thrash a spinning disk
+    - Reuses recorded listings of unchanged directories (``dir_index``)
 
     Args:
         game_path: Path to the game directory
         dll_names_lower: Frozenset of lowercase DLL names to search for
+        dir_index: Optional persistent directory index for this scan
+        cancel_event: Optional event of the scan; stops the walk once set
 
     Returns:
         List of found DLL paths
     """
+    if dir_index is not None and not dir_index.can_serve(dll_names_lower):
+        dir_index = None
+
     def _scan_sync() -> list[str]:
         """Synchronous scanning using os.scandir() (runs in thread pool)"""
         results = []
         dirs_to_scan = [str(game_path)]
 
         while dirs_to_scan:
+            if cancel_event is not None and cancel_event.is_set():
+                break
             current_dir = dirs_to_scan.pop()
             try:
-                with os.scandir(current_dir) as entries:
-                    for entry in entries:
-                        try:
-                            name_lower = entry.name.lower()
-                            if entry.is_file(follow_symlinks=False):
-                                if name_lower in dll_names_lower:
-                                    results.append(entry.path)
-                            elif entry.is_dir(follow_symlinks=False):
-                                if name_lower not in _SKIP_DIRECTORIES:
-                                    dirs_to_scan.append(entry.path)
-                        except (OSError, PermissionError):
-                            continue
+                found, subdirs = _list_directory(current_dir, dll_names_lower, dir_index)
+                results.extend(found)
+                dirs_to_scan.extend(subdirs)
             except PermissionError:
                 logger.debug(f"Permission denied accessing {current_dir}")
+                _note_skipped_path(current_dir)
             except Exception as e:
                 logger.debug(f"Error scanning {current_dir}: {e}")
 
         return results
 
-    return await anyio.to_thread.run_sync(_scan_sync, limiter=thread_io)
+    async with device_slot(game_path):
+        return await anyio.to_thread.run_sync(_scan_sync, limiter=thread_io)
 
 
 async def scan_games_for_dlls_parallel(
     games: list[dict[str, Any]],
     dll_names_lower: frozenset,
-    max_concurrent: int = None
+    max_concurrent: int = None,
+    dir_index: DirectoryIndex | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> dict[str, list[str]]:
     """
     Scan multiple game directories for DLLs in parallel with maximum concurrency.
@@ -813,6 +1175,8 @@ async def scan_games_for_dlls_parallel(
         games: List of game dicts with 'path' key
         dll_names_lower: Frozenset of lowercase DLL names
         max_concurrent: Maximum concurrent scans (default: IO_HEAVY from Concurrency)
+        dir_index: Optional persistent directory index for this scan
+        cancel_event: Optional event of the scan; stops the walks once set
 
     Returns:
         Dict mapping game path string to list of found DLLs
@@ -828,7 +1192,7 @@ async def scan_games_for_dlls_parallel(
         async with io_heavy:
             try:
                 game_path = game['path']
-                dlls = await scan_game_for_dlls(game_path, dll_names_lower)
+                dlls = await scan_game_for_dlls(game_path, dll_names_lower, dir_index, cancel_event)
                 scan_results[i] = (str(game_path), dlls, game)
             except Exception as e:
                 scan_errors[i] = e
@@ -877,7 +1241,181 @@ async def enumerate_steam_games_fast(steam_path: str) -> list[dict[str, Any]]:
         return []
 
 
-async def scan_steam_fast(steam_path: str, dll_names: list[str]) -> list[str]:
+def _merge_nested_game_dirs(games_dict: dict[str, list]) -> int:
+    """
+    Merge games nested inside another game's folder into that outer game.
+
+    Catches DLLs in subdirectories that find_game_root's pattern matching did
+    not attribute to their real game root (common in custom folders). Paths
+    are sorted by their lower-cased components, which places every folder
+    directly before its descendants, so one sweep that remembers the current
+    outermost folder finds all nesting in O(n log n).
+
+    Args:
+        games_dict: Game folder path -> its DLLs; modified in place (nested
+                    entries are removed, their DLLs appended to the outer game)
+
+    Returns:
+        Number of entries merged away
+    """
+    keyed = sorted((path.lower().split(os.sep), path) for path in games_dict)
+    merged = 0
+    root_parts: list[str] | None = None
+    root = None
+
+    for parts, path in keyed:
+        if root_parts is not None and len(parts) > len(root_parts) and parts[:len(root_parts)] == root_parts:
+            games_dict[root].extend(games_dict.pop(path))
+            merged += 1
+            logger.debug(f"Merged subdir {path} into {root}")
+        else:
+            root_parts, root = parts, path
+
+    return merged
+
+
+def _group_exe_candidates(
+    exe_files: list[tuple[str, int]],
+    games_by_path: dict[str, Any],
+) -> dict[int, list[tuple[str, int]]]:
+    """
+    Assign the ``.exe`` files seen by the scan walk to the games they live in.
+
+    Each exe goes to the game whose folder is its nearest ancestor; helpers
+    matched by exe_resolver's ``_NON_GAME_EXE`` denylist are dropped.
+
+    Args:
+        exe_files: (exe path, size) pairs from ``DirectoryIndex.exe_files``
+        games_by_path: Game folder path -> Game (from batch_upsert_games)
+
+    Returns:
+        Dict mapping game id to its (exe path, size) candidates
+    """
+    from dlss_updater.exe_resolver import _is_non_game_exe
+
+    game_ids = {os.path.normcase(path): game.id for path, game in games_by_path.items()}
+    grouped: dict[int, list[tuple[str, int]]] = {}
+    seen = set()
+
+    for exe_path, size in exe_files:
+        if exe_path in seen or _is_non_game_exe(os.path.basename(exe_path)):
+            continue
+        seen.add(exe_path)
+        parent = os.path.dirname(exe_path)
+        while parent:
+            game_id = game_ids.get(os.path.normcase(parent))
+            if game_id is not None:
+                grouped.setdefault(game_id, []).append((exe_path, size))
+                break
+            next_parent = os.path.dirname(parent)
+            if next_parent == parent:
+                break
+            parent = next_parent
+
+    return grouped
+
+
+# appmanifest StateFlags value for a fully installed game with no update
+# queued or running. Any other state means Steam may be writing to the dir.
+_STEAM_STATE_FULLY_INSTALLED = 4
+
+
+def _steam_manifest_state(game: dict[str, Any], dll_names_key: str, dll_count: int = 0) -> SteamManifestState:
+    """Build the SteamManifestState for a game dict from enumerate_steam_games_fast."""
+    return SteamManifestState(
+        install_path=str(game['path']),
+        app_id=game.get('app_id'),
+        build_id=game.get('build_id', 0),
+        last_updated=game.get('last_updated', 0),
+        size_on_disk=game.get('size_on_disk', 0),
+        state_flags=game.get('state_flags', 0),
+        dll_names_key=dll_names_key,
+        dll_count=dll_count,
+    )
+
+
+async def _reuse_unchanged_steam_games(
+    games: list[dict[str, Any]],
+    dll_names_lower: frozenset,
+    dll_names_key: str,
+    dir_index: DirectoryIndex | None = None,
+) -> tuple[list[str], list[SteamManifestState], list[dict[str, Any]]]:
+    """
+    Split Steam games into ones Steam has not touched since their last walk
+    and ones that must be walked.
+
+    A game is reused when its appmanifest buildid, LastUpdated and SizeOnDisk
+    match the state recorded at its last walk, it is fully installed, the walk
+    looked for the same DLL names, and every DLL that walk found is still in
+    game_dlls and on disk. Anything less and the game is walked as usual.
+
+    Returns:
+        Tuple of (reused DLL paths, states of reused games, games to walk)
+    """
+    from dlss_updater.database import db_manager
+
+    previous = await db_manager.get_steam_manifest_states()
+    if not previous:
+        return [], [], games
+
+    candidates = []
+    to_walk = []
+    for game in games:
+        recorded = previous.get(str(game['path']))
+        if (
+            recorded is not None
+            and recorded.dll_names_key == dll_names_key
+            and game.get('state_flags') == _STEAM_STATE_FULLY_INSTALLED
+            and recorded.state_flags == _STEAM_STATE_FULLY_INSTALLED
+            and recorded.build_id == game.get('build_id')
+            and recorded.last_updated == game.get('last_updated')
+            and recorded.size_on_disk == game.get('size_on_disk')
+        ):
+            candidates.append((game, recorded))
+        else:
+            to_walk.append(game)
+
+    if not candidates:
+        return [], [], to_walk
+
+    rows = await db_manager.get_dll_paths_under([st.install_path for _, st in candidates])
+
+    def _verify() -> list[bool]:
+        ok = []
+        for _, recorded in candidates:
+            paths = [
+                p for p in rows.get(recorded.install_path, [])
+                if os.path.basename(p).lower() in dll_names_lower
+            ]
+            ok.append(len(paths) == recorded.dll_count and all(os.path.isfile(p) for p in paths))
+        return ok
+
+    verified = await anyio.to_thread.run_sync(_verify, limiter=thread_io)
+
+    reused_dlls = []
+    reused_states = []
+    for (game, recorded), ok in zip(candidates, verified):
+        if not ok:
+            to_walk.append(game)
+            continue
+        reused_dlls.extend(
+            p for p in rows.get(recorded.install_path, [])
+            if os.path.basename(p).lower() in dll_names_lower
+        )
+        reused_states.append(recorded)
+        if dir_index is not None:
+            dir_index.retain(recorded.install_path)
+
+    return reused_dlls, reused_states, to_walk
+
+
+async def scan_steam_fast(
+    steam_path: str,
+    dll_names: list[str],
+    dir_index: DirectoryIndex | None = None,
+    manifest_states: list[SteamManifestState] | None = None,
+    cancel_event: threading.Event | None = None,
+) -> list[str]:
     """
     Optimized Steam scanning using appmanifest enumeration + targeted scanning.
 
@@ -890,6 +1428,12 @@ async def scan_steam_fast(steam_path: str, dll_names: list[str]) -> list[str]:
     Args:
         steam_path: Steam installation path
         dll_names: List of DLL names to search for
+        dir_index: Optional persistent directory index for this scan
+        manifest_states: If given, games whose appmanifest is unchanged since
+            their last walk reuse their game_dlls rows instead of being walked,
+            and the state of every auto-detected game is appended here for the
+            caller to persist once the DLLs are recorded
+        cancel_event: Optional event of the scan; stops the walks once set
 
     Returns:
         List of found DLL paths
@@ -901,100 +1445,119 @@ async def scan_steam_fast(steam_path: str, dll_names: list[str]) -> list[str]:
     games = await enumerate_steam_games_fast(steam_path)
 
     if games:
+        dll_names_key = '/'.join(sorted(dll_names_lower))
+        games_to_walk = games
+        if manifest_states is not None:
+            reused_dlls, reused_states, games_to_walk = await _reuse_unchanged_steam_games(
+                games, dll_names_lower, dll_names_key, dir_index
+            )
+            all_dlls.extend(reused_dlls)
+            manifest_states.extend(reused_states)
+            if reused_states:
+                logger.info(
+                    f"Skipped {len(reused_states)} unchanged Steam games "
+                    f"(appmanifest build unchanged), reusing {len(reused_dlls)} DLLs"
+                )
+
         # Step 2: Scan game directories in parallel
-        logger.info(f"Scanning {len(games)} Steam game directories for DLLs...")
-        scan_results = await scan_games_for_dlls_parallel(games, dll_names_lower)
+        logger.info(f"Scanning {len(games_to_walk)} Steam game directories for DLLs...")
+        scan_results = await scan_games_for_dlls_parallel(
+            games_to_walk, dll_names_lower, dir_index=dir_index, cancel_event=cancel_event
+        )
 
         # Collect all DLLs
         for path_str, data in scan_results.items():
             all_dlls.extend(data['dlls'])
 
-        logger.info(f"Found {len(all_dlls)} DLLs in {len(scan_results)} Steam games (auto-detected)")
+        if manifest_states is not None:
+            for game in games_to_walk:
+                found = scan_results.get(str(game['path']))
+                manifest_states.append(_steam_manifest_state(
+                    game, dll_names_key, len(found['dlls']) if found else 0
+                ))
+
+        logger.info(f"Found {len(all_dlls)} DLLs in {len(games)} Steam games (auto-detected)")
     else:
         logger.warning("No Steam games found via appmanifest, using library scan")
         # Fallback to legacy scanning
         steam_libraries = get_steam_libraries(steam_path)
-        all_dlls = await scan_steam_libraries_parallel(steam_libraries, dll_names)
+        all_dlls = await scan_steam_libraries_parallel(
+            steam_libraries, dll_names, dir_index=dir_index, cancel_event=cancel_event
+        )
 
     # Step 3: Also scan manually configured Steam paths (sub-folders)
     # This handles cases where users have additional game directories
     manual_paths = get_steam_manual_paths()
 
-    # De-duplicate: remove paths that are already covered by auto-detected libraries.
-    # Resolve symlinks/case before comparing - on Linux, Steam's default install
-    # (~/.steam/steam) is commonly a symlink to ~/.local/share/Steam, and comparing
-    # the raw literal strings would treat them as two different libraries even
-    # though they point at the same physical directory (Issue #240).
-    def _resolved_lower(path: Path) -> str:
-        try:
-            return str(path.resolve()).lower()
-        except OSError:
-            return str(path).lower()
+    # De-duplicate: remove paths that are already covered by auto-detected libraries
+    # (inside one, or containing one). Compare directory identities rather than
+    # path strings - on Linux, Steam's default install (~/.steam/steam) is
+    # commonly a symlink to ~/.local/share/Steam, and comparing the raw literal
+    # strings would treat them as two different libraries even though they
+    # point at the same physical directory (Issue #240).
+    def _lineage(path) -> list:
+        """Identities of ``path`` and each of its ancestors"""
+        identities = []
+        path = os.path.abspath(path)
+        while True:
+            identities.append(_file_identity(path))
+            parent = os.path.dirname(path)
+            if parent == path:
+                return identities
+            path = parent
 
     auto_detected_libs = set()
+    auto_lib_lineage = set()
     if steam_path:
         for lib in get_steam_libraries(steam_path):
-            auto_detected_libs.add(_resolved_lower(lib))
+            lineage = _lineage(lib)
+            auto_detected_libs.add(lineage[0])
+            auto_lib_lineage.update(lineage)
 
     unique_manual_paths = []
     for manual_path in manual_paths:
-        manual_str = _resolved_lower(manual_path)
-        # Check if this path is not already covered
-        is_duplicate = False
-        for auto_lib in auto_detected_libs:
-            if manual_str.startswith(auto_lib) or auto_lib.startswith(manual_str):
-                is_duplicate = True
-                break
+        lineage = _lineage(manual_path)
+        # Duplicate if it contains an auto-detected library, or lies in one
+        is_duplicate = lineage[0] in auto_lib_lineage or not auto_detected_libs.isdisjoint(lineage)
         if not is_duplicate:
             unique_manual_paths.append(manual_path)
 
     if unique_manual_paths:
         logger.info(f"Scanning {len(unique_manual_paths)} additional manual Steam paths...")
-        manual_dlls = await find_dlls(unique_manual_paths, "Steam (Manual)", dll_names)
+        manual_dlls = await find_dlls(
+            unique_manual_paths, "Steam (Manual)", dll_names, dir_index, cancel_event
+        )
         all_dlls.extend(manual_dlls)
         logger.info(f"Found {len(manual_dlls)} DLLs in manual Steam paths")
 
-    # Remove duplicates from all_dlls
-    seen = set()
-    unique_dlls = []
-    for dll in all_dlls:
-        dll_lower = str(dll).lower()
-        if dll_lower not in seen:
-            seen.add(dll_lower)
-            unique_dlls.append(dll)
+    # Remove duplicates from all_dlls: the same file found through two
+    # spellings of its path (symlink, bind mount, case) is kept once
+    unique_dlls = await anyio.to_thread.run_sync(_dedup_by_identity, all_dlls, limiter=thread_io)
 
     logger.info(f"Total Steam DLLs found: {len(unique_dlls)}")
     return unique_dlls
 
 
-async def find_all_dlls(progress_callback=None):
-    """
-    Find all DLLs across configured launchers
+# Scan source for games inside Proton/Wine prefixes (Linux). Also the launcher
+# name their games are recorded under; utils.find_game_root keys on it.
+PREFIX_LAUNCHER = "Proton/Wine Prefixes"
 
-    Args:
-        progress_callback: Optional callback(current, total, message) for progress updates
-    """
-    logger.info("Starting find_all_dlls function")
+# Streaming record pipeline in find_all_dlls: games being resolved/versioned at
+# once, and how many queued games / DLL rows may wait between stages.
+_GAME_WORKERS = 8
+_GAME_QUEUE_SIZE = 32
+_DLL_QUEUE_SIZE = 512
+# DLL rows per batch_upsert_dlls transaction
+_DLL_UPSERT_CHUNK = 256
 
-    # Report initialization (using thread-safe wrapper for free-threaded Python)
-    await _safe_progress_callback(progress_callback, 0, 100, "Initializing scan...")
 
-    all_dll_paths = {
-        "Steam": [],
-        "EA Launcher": [],
-        "Ubisoft Launcher": [],
-        "Epic Games Launcher": [],
-        "GOG Launcher": [],
-        "Battle.net Launcher": [],
-        "Xbox Launcher": [],
-        "Custom Folder 1": [],
-        "Custom Folder 2": [],
-        "Custom Folder 3": [],
-        "Custom Folder 4": [],
-        "_skipped_paths": [],  # Paths skipped due to permissions (Linux)
-    }
+def get_selected_dll_names() -> list[str]:
+    """
+    DLL filenames to look for, per the user's technology preferences.
 
-    # Get user preferences
+    Returns:
+        DLL names of every selected technology (empty if none is selected)
+    """
     update_dlss = config_manager.get_update_preference("DLSS")
     update_ds = config_manager.get_update_preference("DirectStorage")
     update_streamline = config_manager.get_update_preference("Streamline")
@@ -1024,6 +1587,39 @@ async def find_all_dlls(progress_callback=None):
                 continue
             dll_names.append(dll)
 
+    return dll_names
+
+
+async def find_all_dlls(progress_callback=None):
+    """
+    Find all DLLs across configured launchers
+
+    Args:
+        progress_callback: Optional callback(current, total, message) for progress updates
+    """
+    logger.info("Starting find_all_dlls function")
+
+    # Report initialization (using thread-safe wrapper for free-threaded Python)
+    await _safe_progress_callback(progress_callback, 0, 100, "Initializing scan...")
+
+    all_dll_paths = {
+        "Steam": [],
+        "EA Launcher": [],
+        "Ubisoft Launcher": [],
+        "Epic Games Launcher": [],
+        "GOG Launcher": [],
+        "Battle.net Launcher": [],
+        "Xbox Launcher": [],
+        "Custom Folder 1": [],
+        "Custom Folder 2": [],
+        "Custom Folder 3": [],
+        "Custom Folder 4": [],
+        PREFIX_LAUNCHER: [],
+        "_skipped_paths": [],  # Paths skipped due to permissions (Linux)
+    }
+
+    dll_names = get_selected_dll_names()
+
     # Skip if no technologies selected
     if not dll_names:
         logger.info("No technologies selected for update, skipping scan")
@@ -1033,12 +1629,32 @@ async def find_all_dlls(progress_callback=None):
     # Report preparation complete
     await _safe_progress_callback(progress_callback, 5, 100, "Preparing to scan launchers...")
 
+    # Persistent directory index: unchanged directories are answered from the
+    # previous scan's listing for the cost of one stat() each.
+    dir_index = await DirectoryIndex.load()
+    # Game-root probes of earlier runs: find_game_root then costs one stat()
+    # per unchanged directory while grouping DLLs into games
+    await load_game_root_probes()
+
+    # Drop skips noted by targeted scans since the last full scan
+    _take_skipped_paths()
+
+    # Filled by scan_steam_fast; saved only once this scan's DLLs are recorded,
+    # so a skipped game never points at game_dlls rows that were not written.
+    steam_manifest_states: list[SteamManifestState] = []
+
+    # dll path -> file identity, filled while grouping; reused by the final
+    # de-duplication of the returned lists
+    dll_identities: dict[str, tuple[int, int] | str] = {}
+
     # Define async functions for each launcher
     async def scan_steam():
         steam_path = get_steam_install_path()
         if steam_path:
             # Use optimized appmanifest-based scanning (FAST)
-            all_steam_dlls = await scan_steam_fast(steam_path, dll_names)
+            all_steam_dlls = await scan_steam_fast(
+                steam_path, dll_names, dir_index, steam_manifest_states, session.cancel_event
+            )
 
             # Now filter by whitelist
             from .whitelist import check_whitelist_batch
@@ -1059,7 +1675,7 @@ async def find_all_dlls(progress_callback=None):
     async def scan_ea():
         ea_games = await get_ea_games()
         if ea_games:
-            return await find_dlls(ea_games, "EA Launcher", dll_names)
+            return await find_dlls(ea_games, "EA Launcher", dll_names, dir_index, session.cancel_event)
         return []
 
     async def scan_ubisoft():
@@ -1067,199 +1683,81 @@ async def find_all_dlls(progress_callback=None):
         get_ubisoft_install_path()  # This will auto-add path if found in registry
         ubisoft_games = await get_ubisoft_games()
         if ubisoft_games:
-            return await find_dlls(ubisoft_games, "Ubisoft Launcher", dll_names)
+            return await find_dlls(ubisoft_games, "Ubisoft Launcher", dll_names, dir_index, session.cancel_event)
         return []
 
     async def scan_epic():
         epic_games = await get_epic_games()
         if epic_games:
-            return await find_dlls(epic_games, "Epic Games Launcher", dll_names)
+            return await find_dlls(epic_games, "Epic Games Launcher", dll_names, dir_index, session.cancel_event)
         return []
 
     async def scan_gog():
         gog_games = await get_gog_games()
         if gog_games:
-            return await find_dlls(gog_games, "GOG Launcher", dll_names)
+            return await find_dlls(gog_games, "GOG Launcher", dll_names, dir_index, session.cancel_event)
         return []
 
     async def scan_battlenet():
         battlenet_games = await get_battlenet_games()
         if battlenet_games:
-            return await find_dlls(battlenet_games, "Battle.net Launcher", dll_names)
+            return await find_dlls(battlenet_games, "Battle.net Launcher", dll_names, dir_index, session.cancel_event)
         return []
 
     async def scan_xbox():
         xbox_games = await get_xbox_games()
         if xbox_games:
-            return await find_dlls(xbox_games, "Xbox Launcher", dll_names)
+            return await find_dlls(xbox_games, "Xbox Launcher", dll_names, dir_index, session.cancel_event)
         return []
 
     async def scan_custom(folder_num):
         custom_folder = await get_custom_folder(folder_num)
         if custom_folder:
             return await find_dlls(
-                custom_folder, f"Custom Folder {folder_num}", dll_names
+                custom_folder, f"Custom Folder {folder_num}", dll_names, dir_index,
+                session.cancel_event,
             )
         return []
 
-    # Create tasks for all launchers and register them for shutdown tracking
-    # This ensures tasks are cancelled gracefully during application shutdown.
-    #
-    # Auto-detection (get_steam_install_path / get_ubisoft_install_path inside
-    # the scan_* tasks) can add_launcher_path once per detected launcher, each
-    # of which would otherwise rewrite config.toml. Wrap the whole concurrent
-    # scan in a single deferred_save() batch so the file is rewritten at most
-    # once when detection completes, regardless of how many paths were added.
-    with config_manager.deferred_save():
-        tasks = {
-            "Steam": register_task(asyncio.create_task(scan_steam()), "scan_steam"),
-            "EA Launcher": register_task(asyncio.create_task(scan_ea()), "scan_ea"),
-            "Ubisoft Launcher": register_task(asyncio.create_task(scan_ubisoft()), "scan_ubisoft"),
-            "Epic Games Launcher": register_task(asyncio.create_task(scan_epic()), "scan_epic"),
-            "GOG Launcher": register_task(asyncio.create_task(scan_gog()), "scan_gog"),
-            "Battle.net Launcher": register_task(asyncio.create_task(scan_battlenet()), "scan_battlenet"),
-            "Xbox Launcher": register_task(asyncio.create_task(scan_xbox()), "scan_xbox"),
-            "Custom Folder 1": register_task(asyncio.create_task(scan_custom(1)), "scan_custom_1"),
-            "Custom Folder 2": register_task(asyncio.create_task(scan_custom(2)), "scan_custom_2"),
-            "Custom Folder 3": register_task(asyncio.create_task(scan_custom(3)), "scan_custom_3"),
-            "Custom Folder 4": register_task(asyncio.create_task(scan_custom(4)), "scan_custom_4"),
-        }
-
-        # Wait for all tasks to complete and gather results with progress reporting
-        completed_count = 0
-        total_launchers = len(tasks)
-
-        for launcher_name, task in tasks.items():
-            try:
-                dlls = await task
-                all_dll_paths[launcher_name] = dlls
-                completed_count += 1
-
-                # Calculate progress (5% base + 65% for launchers = 5-70%)
-                progress_pct = int(5 + (completed_count / total_launchers) * 65)
-
-                await _safe_progress_callback(
-                    progress_callback,
-                    progress_pct,
-                    100,
-                    f"Scanned {launcher_name}: {len(dlls)} DLLs found"
-                )
-
-                if dlls:
-                    logger.info(f"Found {len(dlls)} DLLs in {launcher_name}")
-            except Exception as e:
-                logger.error(f"Error scanning {launcher_name}: {e}")
-                all_dll_paths[launcher_name] = []
-                completed_count += 1
-
-                # Report progress even on error
-                progress_pct = int(5 + (completed_count / total_launchers) * 65)
-                await _safe_progress_callback(
-                    progress_callback,
-                    progress_pct,
-                    100,
-                    f"Error scanning {launcher_name}"
-                )
+    async def scan_prefixes():
+        return await scan_prefix_games(dll_names, dir_index, session.cancel_event)
 
-    # Report whitelist filtering phase
-    await _safe_progress_callback(progress_callback, 70, 100, "Filtering whitelisted games...")
+    # Cancel handle and checkpoints of this run (see scan_session); launchers
+    # and games an interrupted earlier scan finished are taken from its
+    # checkpoint instead of being walked or resolved again.
+    session = await ScanSession.start(dll_names)
 
-    # Remove duplicates
-    unique_dlls = set()
-    for launcher in all_dll_paths:
-        all_dll_paths[launcher] = [
-            dll
-            for dll in all_dll_paths[launcher]
-            if str(dll) not in unique_dlls and not unique_dlls.add(str(dll))
-        ]
+    async def resumable(launcher_name: str, scan) -> list:
+        dlls = session.resumed_launchers.get(launcher_name)
+        if dlls is not None:
+            logger.info(f"Resumed {launcher_name} from checkpoint: {len(dlls)} DLLs")
+            return dlls
+        return await scan()
 
-    # Log summary
-    total_dlls = sum(len(dlls) for dlls in all_dll_paths.values())
-    logger.info(f"Scan complete. Found {total_dlls} total DLLs across all launchers")
+    tasks: dict[str, asyncio.Task] = {}
+    launchers_collected = False
 
-    # Record discovered games and DLLs in database using BATCH operations
+    # Record discovered games and DLLs in the database as a streaming pipeline:
+    #
+    #   launcher tasks --> grouping --> game workers --> DLL writer
+    #
+    # Each launcher's hits are grouped into games as soon as that launcher
+    # finishes (grouping and the overlapping-path merge only ever look within
+    # one launcher), each game is resolved, recorded and version-scanned on its
+    # own, and DLL rows are written in chunks as they arrive. Nothing waits for
+    # the slowest launcher or the slowest store search any more, and only the
+    # bounded queues' worth of records is held in memory at once.
     try:
         from dlss_updater.database import db_manager
         from dlss_updater.steam_integration import (
             find_steam_app_id_by_name,
             detect_steam_app_id_from_manifest,
             find_app_id_via_api,
-            find_app_id_via_store_search,
             get_steam_owned_games,
         )
-        from dlss_updater.utils import extract_game_name
+        from dlss_updater.reresolution import app_id_resolver, needs_network_resolution
         from dlss_updater.constants import DLL_TYPE_MAP
-
-        # Report database recording start
-        await _safe_progress_callback(progress_callback, 75, 100, "Preparing game data...")
-
-        logger.info("Recording scanned games in database (batch mode)...")
-
-        # Phase 1: Group DLLs by game directory
-        #
-        # Cache Path.resolve() results per unique game directory for the
-        # duration of this scan pass. Many DLLs live under the same game root
-        # (bin/, engine/, plugins/, ...), and resolve() hits the filesystem to
-        # canonicalise the path; keyed by the game_dir string, one resolve per
-        # unique directory instead of one per DLL. Local to the pass, so no
-        # cross-thread sharing / locking is required.
-        all_games_dict = {}
-        resolve_cache: dict[str, str] = {}
-        for launcher, dll_paths in all_dll_paths.items():
-            games_dict = {}
-            normalized_to_original = {}
-
-            for dll_path in dll_paths:
-                game_dir = find_game_root(Path(dll_path), launcher)
-                game_dir_key = str(game_dir)
-                game_dir_normalized = resolve_cache.get(game_dir_key)
-                if game_dir_normalized is None:
-                    game_dir_normalized = str(game_dir.resolve()).lower()
-                    resolve_cache[game_dir_key] = game_dir_normalized
-
-                if game_dir_normalized not in games_dict:
-                    games_dict[game_dir_normalized] = []
-                    normalized_to_original[game_dir_normalized] = str(game_dir)
-
-                games_dict[game_dir_normalized].append(dll_path)
-
-            games_dict_original = {
-                normalized_to_original[norm_path]: dlls
-                for norm_path, dlls in games_dict.items()
-            }
-
-            all_games_dict[launcher] = games_dict_original
-
-        # Phase 1b: Merge games with overlapping paths (handles custom folders)
-        # This catches cases where DLLs are in subdirectories that weren't detected by pattern matching
-        for launcher, games_dict in all_games_dict.items():
-            sorted_paths = sorted(games_dict.keys(), key=len)
-            paths_to_remove = set()
-
-            for i, path1 in enumerate(sorted_paths):
-                if path1 in paths_to_remove:
-                    continue
-                path1_lower = path1.lower()
-
-                for path2 in sorted_paths[i + 1:]:
-                    if path2 in paths_to_remove:
-                        continue
-                    path2_lower = path2.lower()
-
-                    # Check if path2 is under path1 (path1 is parent)
-                    if path2_lower.startswith(path1_lower + os.sep):
-                        games_dict[path1].extend(games_dict[path2])
-                        paths_to_remove.add(path2)
-                        logger.debug(f"Merged subdir {path2} into {path1}")
-
-            for path in paths_to_remove:
-                del games_dict[path]
-
-            if paths_to_remove:
-                logger.info(f"Merged {len(paths_to_remove)} duplicate game entries for {launcher}")
-
-        # Phase 2: Prepare game records with Steam app IDs (parallel lookup)
-        await _safe_progress_callback(progress_callback, 78, 100, "Looking up Steam app IDs...")
+        from .updater import get_dll_version
 
         # Pre-fetch owned games from Steam API if credentials are configured
         _has_api_credentials = config_manager.has_steam_api_credentials()
@@ -1274,13 +1772,7 @@ async def find_all_dlls(progress_callback=None):
                 logger.warning(f"Failed to fetch owned games from Steam API: {e}")
                 _has_api_credentials = False
 
-        # Store search rate limiter (shared across all prepare_game_data calls)
-        _store_search_semaphore = anyio.Semaphore(3)
-
-        games_to_insert = []
-        game_dll_mapping = {}  # Maps game path to list of DLL paths
-
-        async def prepare_game_data(launcher: str, game_dir_str: str, game_dlls: list):
+        async def prepare_game_data(launcher: str, game_dir_str: str):
             game_dir = Path(game_dir_str)
             game_name = game_dir.name
 
@@ -1299,13 +1791,8 @@ async def find_all_dlls(progress_callback=None):
                 if app_id:
                     resolution_source = 'api'
 
-            # Tier 3: Store search API (rate-limited, no auth required)
-            if app_id is None:
-                async with _store_search_semaphore:
-                    app_id = await find_app_id_via_store_search(game_name)
-                    if app_id:
-                        resolution_source = 'store_search'
-                        await anyio.sleep(1.5)  # Rate limit only on actual API hits
+            # Tier 3 (Store search API) needs the network: it runs afterwards
+            # in app_id_resolver, so it never holds up recording the game
 
             # Tier 4: FTS5 fuzzy match (last resort)
             if app_id is None:
@@ -1319,52 +1806,9 @@ async def find_all_dlls(progress_callback=None):
                 'launcher': launcher,
                 'steam_app_id': app_id,
                 'resolution_source': resolution_source,
-                'dlls': game_dlls,
             }
 
-        # Gather all game preparation specs
-        prepare_specs = []
-        for launcher, games_dict in all_games_dict.items():
-            for game_dir_str, game_dlls in games_dict.items():
-                prepare_specs.append((launcher, game_dir_str, game_dlls))
-
-        prepared_games: list = [None] * len(prepare_specs)
-        prepare_errors: list = [None] * len(prepare_specs)
-
-        async def _run_prepare(i, launcher, game_dir_str, game_dlls):
-            try:
-                prepared_games[i] = await prepare_game_data(launcher, game_dir_str, game_dlls)
-            except Exception as e:
-                prepare_errors[i] = e
-
-        # Execute all Steam ID lookups in parallel
-        async with anyio.create_task_group() as tg:
-            for i, (launcher, game_dir_str, game_dlls) in enumerate(prepare_specs):
-                tg.start_soon(_run_prepare, i, launcher, game_dir_str, game_dlls)
-
-        # Filter out exceptions and extract game data
-        for i, result in enumerate(prepared_games):
-            if prepare_errors[i] is not None:
-                logger.error(f"Error preparing game data: {prepare_errors[i]}")
-                continue
-            game_dll_mapping[result['path']] = result.pop('dlls')
-            games_to_insert.append(result)
-
-        await _safe_progress_callback(progress_callback, 82, 100, f"Batch inserting {len(games_to_insert)} games...")
-
-        # Phase 3: Batch upsert all games
-        games_result = await db_manager.batch_upsert_games(games_to_insert)
-        recorded_games = len(games_result)
-
-        await _safe_progress_callback(progress_callback, 88, 100, "Extracting DLL versions...")
-
-        # Phase 4: Prepare DLL records with version extraction (parallel)
-        from .updater import get_dll_version
-
-        dlls_to_insert = []
-        dlls_with_versions = 0
-
-        async def extract_dll_info(game_path: str, dll_path: str, game_id: int):
+        async def extract_dll_info(dll_path: str, game_id: int):
             dll_filename = Path(dll_path).name
             dll_type = DLL_TYPE_MAP.get(dll_filename.lower(), "Unknown")
 
@@ -1381,44 +1825,297 @@ async def find_all_dlls(progress_callback=None):
                 'current_version': dll_version,
             }
 
-        # Gather all DLL extraction specs
-        extract_specs = []
-        for game_path, game in games_result.items():
-            if game_path in game_dll_mapping:
-                for dll_path in game_dll_mapping[game_path]:
-                    extract_specs.append((game_path, dll_path, game.id))
-
-        dll_results: list = [None] * len(extract_specs)
-        dll_errors: list = [None] * len(extract_specs)
-
-        # Execute all DLL version extractions in parallel. The io_heavy gate
-        # (sized from Concurrency.IO_HEAVY) bounds how many extractions are in
-        # flight; each one dispatches the CPU-bound PE parse to a worker thread
-        # via the thread_cpu limiter inside extract_dll_info().
-        async def extract_with_limit(i, game_path, dll_path, game_id):
-            async with io_heavy:
-                try:
-                    dll_results[i] = await extract_dll_info(game_path, dll_path, game_id)
-                except Exception as e:
-                    dll_errors[i] = e
+        # Launchers earlier in `tasks` win a DLL that several of them found
+        # (previously: the first launcher in dict order kept it). As launchers
+        # now finish in any order, a later-finishing higher-priority launcher
+        # re-claims the DLL; rows carry the game they were built for and the
+        # writer drops any whose DLL has since been claimed by another game.
+        launcher_priority = {name: i for i, name in enumerate(all_dll_paths)}
+        # DLLs are claimed per file identity (see _file_identity), so one file
+        # reached through two spellings of its path is recorded once, under
+        # the path of the launcher that claimed it.
+        dll_claims: dict = {}                 # identity -> (launcher priority, dll path)
+        dll_owner: dict[str, str] = {}        # dll path -> owning game path
+        games_by_path: dict[str, Any] = {}    # game path -> recorded Game
+        written_dll_paths: set[str] = set()
+        launcher_failed = False
+        recorded_dlls = 0
+        dlls_with_versions = 0
 
-        async with anyio.create_task_group() as tg:
-            for i, (game_path, dll_path, game_id) in enumerate(extract_specs):
-                tg.start_soon(extract_with_limit, i, game_path, dll_path, game_id)
+        launcher_send, launcher_recv = anyio.create_memory_object_stream(len(all_dll_paths))
+        game_send, game_recv = anyio.create_memory_object_stream(_GAME_QUEUE_SIZE)
+        dll_send, dll_recv = anyio.create_memory_object_stream(_DLL_QUEUE_SIZE)
 
-        # Collect DLL data
-        for i, result in enumerate(dll_results):
-            if dll_errors[i] is not None:
-                logger.error(f"Error extracting DLL info: {dll_errors[i]}")
-                continue
-            dlls_to_insert.append(result)
-            if result.get('current_version'):
-                dlls_with_versions += 1
+        async def collect_launchers(tasks: dict[str, asyncio.Task]) -> None:
+            """Stage 1: forward each launcher's DLLs as soon as it finishes."""
+            nonlocal launcher_failed, launchers_collected
+            completed_count = 0
+            total_launchers = len(tasks)
 
-        await _safe_progress_callback(progress_callback, 95, 100, f"Batch inserting {len(dlls_to_insert)} DLLs...")
+            async def _await_launcher(launcher_name: str, task: asyncio.Task) -> None:
+                nonlocal completed_count, launcher_failed
+                try:
+                    dlls = await task
+                    all_dll_paths[launcher_name] = dlls
+                    completed_count += 1
+                    await session.checkpoint_launcher(launcher_name, dlls)
+
+                    # Calculate progress (5% base + 65% for launchers = 5-70%)
+                    progress_pct = int(5 + (completed_count / total_launchers) * 65)
+
+                    await _safe_progress_callback(
+                        progress_callback,
+                        progress_pct,
+                        100,
+                        f"Scanned {launcher_name}: {len(dlls)} DLLs found"
+                    )
+
+                    if dlls:
+                        logger.info(f"Found {len(dlls)} DLLs in {launcher_name}")
+                        await launcher_send.send((launcher_name, dlls))
+                except Exception as e:
+                    logger.error(f"Error scanning {launcher_name}: {e}")
+                    all_dll_paths[launcher_name] = []
+                    completed_count += 1
+                    launcher_failed = True
+                    if launcher_name == "Steam":
+                        steam_manifest_states.clear()
+
+                    # Report progress even on error
+                    progress_pct = int(5 + (completed_count / total_launchers) * 65)
+                    await _safe_progress_callback(
+                        progress_callback,
+                        progress_pct,
+                        100,
+                        f"Error scanning {launcher_name}"
+                    )
+
+            async with launcher_send:
+                async with anyio.create_task_group() as tg:
+                    for launcher_name, task in tasks.items():
+                        tg.start_soon(_await_launcher, launcher_name, task)
+
+            # Persist the directory index. Directories a failed launcher never
+            # reached are kept rather than pruned, so one flaky drive doesn't
+            # cost a full walk; so are those of launchers taken from a
+            # checkpoint, which were not walked this time.
+            launchers_collected = True
+            await dir_index.save(prune=not launcher_failed and not session.resumed_launchers)
+
+            total_dlls = sum(len(dlls) for dlls in all_dll_paths.values())
+            logger.info(f"Scan complete. Found {total_dlls} DLLs across all launchers (before de-duplication)")
+            await _safe_progress_callback(progress_callback, 75, 100, "Recording games in database...")
+
+        async def group_games() -> None:
+            """Stage 2: claim each launcher's DLLs and group them by game root."""
+            # Identity per unique game directory for the duration of this scan
+            # pass. Many DLLs live under the same game root (bin/, engine/,
+            # plugins/, ...); keyed by the game_dir string, one stat per unique
+            # directory instead of one per DLL. Only this stage touches it, so
+            # no locking is required.
+            game_dir_identities: dict[str, tuple[int, int] | str] = {}
+
+            async with launcher_recv, game_send:
+                async for launcher, dll_paths in launcher_recv:
+                    priority = launcher_priority[launcher]
+                    games_dict = {}
+                    normalized_to_original = {}
+
+                    identities = await anyio.to_thread.run_sync(
+                        lambda: [_file_identity(p) for p in dll_paths], limiter=thread_io
+                    )
+
+                    for dll_path, identity in zip(dll_paths, identities):
+                        dll_key = str(dll_path)
+                        dll_identities[dll_key] = identity
+                        claim = dll_claims.get(identity)
+                        if claim is not None and claim[0] <= priority:
+                            continue
+                        if claim is not None:
+                            # Re-claimed: rows built for the other spelling are dropped
+                            dll_owner.pop(claim[1], None)
+                        dll_claims[identity] = (priority, dll_key)
+
+                        game_dir = find_game_root(Path(dll_path), launcher)
+                        game_dir_key = str(game_dir)
+                        game_dir_normalized = game_dir_identities.get(game_dir_key)
+                        if game_dir_normalized is None:
+                            game_dir_normalized = _file_identity(game_dir)
+                            game_dir_identities[game_dir_key] = game_dir_normalized
+
+                        if game_dir_normalized not in games_dict:
+                            games_dict[game_dir_normalized] = []
+                            normalized_to_original[game_dir_normalized] = str(game_dir)
+
+                        games_dict[game_dir_normalized].append(dll_path)
+
+                    games_dict = {
+                        normalized_to_original[norm_path]: dlls
+                        for norm_path, dlls in games_dict.items()
+                    }
+
+                    # Merge games with overlapping paths (handles custom folders)
+                    merged = _merge_nested_game_dirs(games_dict)
+                    if merged:
+                        logger.info(f"Merged {merged} duplicate game entries for {launcher}")
+
+                    for game_dir_str, game_dlls in games_dict.items():
+                        for dll_path in game_dlls:
+                            dll_owner[str(dll_path)] = game_dir_str
+                        await game_send.send((launcher, game_dir_str, game_dlls))
+
+        async def record_games(game_recv, dll_send) -> None:
+            """Stage 3: resolve, record and version-scan one game at a time."""
+            async with game_recv, dll_send:
+                async for launcher, game_dir_str, game_dlls in game_recv:
+                    try:
+                        game_data = session.resumed_games.get(game_dir_str)
+                        resumed = game_data is not None and game_data.get('launcher') == launcher
+                        if not resumed:
+                            game_data = await prepare_game_data(launcher, game_dir_str)
+                        game = (await db_manager.batch_upsert_games([game_data])).get(game_dir_str)
+                    except Exception as e:
+                        logger.error(f"Error preparing game data: {e}")
+                        continue
+                    if game is None:
+                        continue
+                    games_by_path[game_dir_str] = game
+                    # Checkpointed games were queued by the interrupted scan
+                    # (a queue lost to a restart is refilled by the next scan)
+                    if not resumed and needs_network_resolution(game.steam_app_id, game.resolution_source):
+                        app_id_resolver.enqueue(game.id, game.name, game.steam_app_id)
+
+                    dll_results: list = [None] * len(game_dlls)
+                    dll_errors: list = [None] * len(game_dlls)
+
+                    # The io_heavy gate (sized from Concurrency.IO_HEAVY) bounds
+                    # how many extractions are in flight; each one dispatches
+                    # the CPU-bound PE parse to a worker thread via the
+                    # thread_cpu limiter inside extract_dll_info().
+                    async def extract_with_limit(i, dll_path, game_id):
+                        async with io_heavy:
+                            try:
+                                dll_results[i] = await extract_dll_info(dll_path, game_id)
+                            except Exception as e:
+                                dll_errors[i] = e
+
+                    async with anyio.create_task_group() as tg:
+                        for i, dll_path in enumerate(game_dlls):
+                            tg.start_soon(extract_with_limit, i, dll_path, game.id)
+
+                    for i, result in enumerate(dll_results):
+                        if dll_errors[i] is not None:
+                            logger.error(f"Error extracting DLL info: {dll_errors[i]}")
+                            continue
+                        await dll_send.send((game_dir_str, result))
+                    # Checkpoint marker: the writer checkpoints the game once
+                    # the rows sent before it are written
+                    await dll_send.send((None, game_data))
+
+        async def write_dlls() -> None:
+            """Stage 4: upsert DLL rows in chunks as they arrive."""
+            nonlocal recorded_dlls, dlls_with_versions
+            chunk = []
+
+            async def flush() -> None:
+                nonlocal recorded_dlls, dlls_with_versions
+                # Drop rows whose DLL was re-claimed by a higher-priority launcher
+                rows = [
+                    row for game_path, row in chunk
+                    if game_path is not None and dll_owner.get(row['dll_path']) == game_path
+                ]
+                finished_games = [game_data for game_path, game_data in chunk if game_path is None]
+                chunk.clear()
+                if rows:
+                    recorded_dlls += await db_manager.batch_upsert_dlls(rows)
+                    written_dll_paths.update(row['dll_path'] for row in rows)
+                    dlls_with_versions += sum(1 for row in rows if row.get('current_version'))
+                for game_data in finished_games:
+                    await session.checkpoint_game(game_data)
+
+            try:
+                async with dll_recv:
+                    async for item in dll_recv:
+                        chunk.append(item)
+                        # Full chunk, or a finished game with nothing queued
+                        # behind it: don't leave it uncheckpointed while the
+                        # producers are busy walking or resolving
+                        if len(chunk) >= _DLL_UPSERT_CHUNK or (
+                            item[0] is None and dll_recv.statistics().current_buffer_used == 0
+                        ):
+                            await flush()
+            finally:
+                # Also on cancel: rows already built are kept and checkpointed
+                with anyio.CancelScope(shield=True):
+                    await flush()
+
+        # Create tasks for all launchers and register them for shutdown tracking
+        # This ensures tasks are cancelled gracefully during application shutdown.
+        #
+        # Auto-detection (get_steam_install_path / get_ubisoft_install_path inside
+        # the scan_* tasks) can add_launcher_path once per detected launcher, each
+        # of which would otherwise rewrite config.toml. Wrap the whole concurrent
+        # scan in a single deferred_save() batch so the file is rewritten at most
+        # once when detection completes, regardless of how many paths were added.
+        with config_manager.deferred_save():
+            tasks.update({
+                "Steam": register_task(asyncio.create_task(resumable("Steam", scan_steam)), "scan_steam"),
+                "EA Launcher": register_task(asyncio.create_task(resumable("EA Launcher", scan_ea)), "scan_ea"),
+                "Ubisoft Launcher": register_task(asyncio.create_task(resumable("Ubisoft Launcher", scan_ubisoft)), "scan_ubisoft"),
+                "Epic Games Launcher": register_task(asyncio.create_task(resumable("Epic Games Launcher", scan_epic)), "scan_epic"),
+                "GOG Launcher": register_task(asyncio.create_task(resumable("GOG Launcher", scan_gog)), "scan_gog"),
+                "Battle.net Launcher": register_task(asyncio.create_task(resumable("Battle.net Launcher", scan_battlenet)), "scan_battlenet"),
+                "Xbox Launcher": register_task(asyncio.create_task(resumable("Xbox Launcher", scan_xbox)), "scan_xbox"),
+                "Custom Folder 1": register_task(asyncio.create_task(resumable("Custom Folder 1", lambda: scan_custom(1))), "scan_custom_1"),
+                "Custom Folder 2": register_task(asyncio.create_task(resumable("Custom Folder 2", lambda: scan_custom(2))), "scan_custom_2"),
+                "Custom Folder 3": register_task(asyncio.create_task(resumable("Custom Folder 3", lambda: scan_custom(3))), "scan_custom_3"),
+                "Custom Folder 4": register_task(asyncio.create_task(resumable("Custom Folder 4", lambda: scan_custom(4))), "scan_custom_4"),
+                PREFIX_LAUNCHER: register_task(asyncio.create_task(resumable(PREFIX_LAUNCHER, scan_prefixes)), "scan_prefixes"),
+            })
+
+            with session.cancel_scope:
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(collect_launchers, tasks)
+                    tg.start_soon(group_games)
+                    async with game_recv, dll_send:
+                        for _ in range(_GAME_WORKERS):
+                            tg.start_soon(record_games, game_recv.clone(), dll_send.clone())
+                    tg.start_soon(write_dlls)
+
+        if session.cancelled:
+            # Everything recorded so far stays (and is checkpointed); the steps
+            # below assume every launcher was seen, so none of them run.
+            raise ScanCancelledError()
+
+        # Rows written under a path spelling whose file a higher-priority
+        # launcher then claimed under another (see _file_identity)
+        stale_dll_paths = [path for path in written_dll_paths if path not in dll_owner]
+        if stale_dll_paths:
+            await db_manager.delete_dlls_by_paths(stale_dll_paths)
+            written_dll_paths.difference_update(stale_dll_paths)
+
+        # Games whose every DLL was re-claimed by a higher-priority launcher
+        # never existed under the old single-pass grouping; drop their rows.
+        owning_games = set(dll_owner.values())
+        orphaned_games = [path for path in games_by_path if path not in owning_games]
+        if orphaned_games:
+            await db_manager.delete_games_without_dlls(orphaned_games)
+            for path in orphaned_games:
+                del games_by_path[path]
+
+        recorded_games = len(games_by_path)
+
+        # Games found in directories an update could not write to (e.g. a
+        # system-wide library) are reported alongside the unreadable ones
+        if IS_LINUX and games_by_path:
+            await anyio.to_thread.run_sync(
+                _note_unwritable_games, list(games_by_path), limiter=thread_io
+            )
 
-        # Phase 5: Batch upsert all DLLs
-        recorded_dlls = await db_manager.batch_upsert_dlls(dlls_to_insert)
+        # Persist the exe candidates the walk collected, so exe_resolver can
+        # rank them from the DB instead of walking each game tree again.
+        exe_candidates = _group_exe_candidates(dir_index.exe_files, games_by_path)
+        await db_manager.replace_exe_candidates(exe_candidates)
 
         logger.info(f"Database recording complete: {recorded_games} games, {recorded_dlls} DLLs")
         logger.info(f"Version extraction: {dlls_with_versions}/{recorded_dlls} DLLs have valid versions")
@@ -1426,13 +2123,17 @@ async def find_all_dlls(progress_callback=None):
         if dlls_with_versions == 0 and recorded_dlls > 0:
             logger.warning("No DLL versions extracted! Check get_dll_version() function")
 
+        if steam_manifest_states:
+            await db_manager.save_steam_manifest_states(steam_manifest_states)
+        await save_game_root_probes()
+
         # Phase 6: Cleanup phantom games and orphan DLLs
         # This removes games that were uninstalled and DLLs that no longer exist
         await _safe_progress_callback(progress_callback, 97, 100, "Cleaning up stale data...")
 
         # Build sets of valid paths from the current scan
-        valid_game_paths = set(games_result.keys())
-        valid_dll_paths = {dll['dll_path'] for dll in dlls_to_insert}
+        valid_game_paths = set(games_by_path)
+        valid_dll_paths = written_dll_paths
 
         cleanup_results = await db_manager.perform_post_scan_cleanup(
             valid_game_paths,
@@ -1454,24 +2155,47 @@ async def find_all_dlls(progress_callback=None):
         gc.collect()
         logger.debug("Forced garbage collection after version extraction")
 
+        await session.complete()
+
         # Report completion
         await _safe_progress_callback(progress_callback, 100, 100, f"Scan complete: {recorded_games} games, {recorded_dlls} DLLs")
 
+    except ScanCancelledError:
+        for task in tasks.values():
+            task.cancel()
+        if not launchers_collected:
+            # Listings taken before the cancel are still valid
+            await dir_index.save(prune=False)
+        # Games recorded while their DLLs were still being read are dropped;
+        # the resumed scan records them again
+        await db_manager.delete_games_without_dlls(list(games_by_path))
+        logger.info("Scan cancelled; finished launchers and games are checkpointed")
+        await _safe_progress_callback(progress_callback, 100, 100, "Scan cancelled")
     except Exception as e:
         logger.error(f"Error recording games in database: {e}", exc_info=True)
         await _safe_progress_callback(progress_callback, 100, 100, "Scan complete (database recording failed)")
+    finally:
+        session.close()
 
-    # On Linux, collect any skipped paths due to permissions
-    if IS_LINUX:
-        try:
-            from dlss_updater.linux_paths import get_all_linux_game_paths
-            linux_paths_result = await get_all_linux_game_paths()
-            skipped = linux_paths_result.get('skipped_paths', [])
-            if skipped:
-                all_dll_paths['_skipped_paths'] = skipped
-                logger.info(f"Linux: {len(skipped)} paths skipped due to permissions")
-        except Exception as e:
-            logger.debug(f"Could not collect Linux skipped paths: {e}")
+    # Remove duplicates: a DLL found by several launchers is reported once,
+    # under the highest-priority one (the order the launchers were declared in)
+    unique_dlls = set()
+    for launcher in all_dll_paths:
+        if launcher == '_skipped_paths':
+            continue
+        unique = []
+        for dll in all_dll_paths[launcher]:
+            identity = dll_identities.get(str(dll)) or str(dll)
+            if identity not in unique_dlls:
+                unique_dlls.add(identity)
+                unique.append(dll)
+        all_dll_paths[launcher] = unique
+
+    # On Linux, report the paths the walk skipped due to permissions
+    skipped = _take_skipped_paths()
+    if IS_LINUX and skipped:
+        all_dll_paths['_skipped_paths'] = skipped
+        logger.info(f"Linux: {len(skipped)} paths skipped due to permissions")
 
     return all_dll_paths
 
@@ -1505,19 +2229,31 @@ def find_all_dlls_sync():
             "Custom Folder 2": [],
             "Custom Folder 3": [],
             "Custom Folder 4": [],
+            PREFIX_LAUNCHER: [],
         }
 
 
-def scan_directory_for_dlls(directory, dll_names):
+def scan_directory_for_dlls(
+    directory,
+    dll_names,
+    dir_index: DirectoryIndex | None = None,
+    max_workers: int = None,
+    cancel_event: threading.Event | None = None,
+):
     """Scan a single directory for DLLs using optimized os.scandir()"""
     # Pre-compute lowercase DLL names for O(1) lookup
     dll_names_lower = frozenset(d.lower() for d in dll_names) if not isinstance(dll_names, frozenset) else dll_names
 
     # Use parallel scandir for better performance (especially with GIL disabled)
-    return _parallel_scandir_walk(str(directory), dll_names_lower)
+    return _parallel_scandir_walk(str(directory), dll_names_lower, max_workers, dir_index, cancel_event)
 
 
-async def scan_steam_libraries_parallel(library_paths, dll_names):
+async def scan_steam_libraries_parallel(
+    library_paths,
+    dll_names,
+    dir_index: DirectoryIndex | None = None,
+    cancel_event: threading.Event | None = None,
+):
     """Scan multiple Steam libraries in parallel with maximum concurrency.
 
     Each library's synchronous directory scan is dispatched to a worker thread
@@ -1534,9 +2270,12 @@ async def scan_steam_libraries_parallel(library_paths, dll_names):
 
     async def _worker(i: int, lib_path) -> None:
         try:
-            dlls = await anyio.to_thread.run_sync(
-                scan_directory_for_dlls, lib_path, dll_names, limiter=thread_io
-            )
+            # Libraries on one disk share its slots (see find_dlls)
+            async with device_slot(lib_path, Concurrency.THREADPOOL_IO) as workers:
+                dlls = await anyio.to_thread.run_sync(
+                    scan_directory_for_dlls, lib_path, dll_names, dir_index, workers, cancel_event,
+                    limiter=thread_io,
+                )
             lib_results[i] = dlls
             logger.info(f"Found {len(dlls)} DLLs in {lib_path}")
         except Exception as e:
@@ -4,6 +4,7 @@ Universal image fetching for ALL games (not just Steam launcher) via name matchi
 """
 
 import threading
+import time
 import msgspec
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -11,8 +12,10 @@ import aiohttp
 import anyio
 
 from dlss_updater.logger import setup_logger
-from dlss_updater.concurrency_limiters import thread_io
+from dlss_updater.concurrency_limiters import thread_cpu, thread_io
 from dlss_updater.database import db_manager
+from dlss_updater.http_cache import conditional_headers, validators_from_headers
+from dlss_updater.models import HttpValidators, SteamAppListCache, SteamAppListEntry
 from dlss_updater.name_normalize import normalize_search_name
 
 logger = setup_logger()
@@ -20,6 +23,69 @@ logger = setup_logger()
 # msgspec decoder for better performance
 _json_decoder = msgspec.json.Decoder()
 
+# Store search results are cached per normalised name (store_search_cache).
+# "No match" answers expire sooner: a game may get a store page later.
+STORE_SEARCH_HIT_TTL_S = 30 * 24 * 60 * 60
+STORE_SEARCH_MISS_TTL_S = 7 * 24 * 60 * 60
+
+# App list ingestion: download chunk size, decoded batches buffered between
+# the downloads and the staging writer, and how much undecodable data one
+# file may accumulate before it is considered malformed
+_APP_LIST_CHUNK_SIZE = 256 * 1024
+_APP_LIST_QUEUE_SIZE = 8
+_APP_LIST_MAX_PENDING = 4 * 1024 * 1024
+
+_app_list_decoder = msgspec.json.Decoder(list[SteamAppListEntry])
+_app_list_cache_decoder = msgspec.json.Decoder(SteamAppListCache)
+
+
+def _decode_app_list_chunk(data: bytes) -> tuple[list[tuple[int, str, str, str]], bytes]:
+    """
+    Decode the complete entries at the front of a partial JSON app list.
+
+    ``data`` is the not yet decoded part of a top-level ``[{...}, {...}]``
+    array. Everything up to the last ``}`` that closes an entry is decoded in
+    one go as a JSON array; the remainder is returned to be prefixed to the
+    next chunk. A ``}`` inside a string never yields valid JSON (the string
+    would be unterminated), so the cut falls back to the previous ``}``.
+
+    Returns:
+        (rows (appid, name, name_normalized, name_search) for entries with a
+        name, undecoded remainder)
+    """
+    body = data.lstrip(b" \t\r\n[,")
+    end = len(body)
+    while True:
+        end = body.rfind(b"}", 0, end)
+        if end < 0:
+            return [], body
+        try:
+            apps = _app_list_decoder.decode(b"[" + body[:end + 1] + b"]")
+            break
+        except msgspec.DecodeError:
+            continue
+
+    rows = []
+    for app in apps:
+        if not app.name:
+            continue
+        # name_search keeps spaces (FTS word tokens); name_normalized is the
+        # space-less exact-match form
+        name_search = normalize_search_name(app.name)
+        rows.append((app.appid, app.name, name_search.replace(' ', ''), name_search))
+    return rows, body[end + 1:]
+
+
+# Steam's store endpoints allow ~200 requests / 5 min per client; the Web API
+# far more, so the store rate is the one every request is held to.
+STEAM_REQUESTS_PER_SECOND = 200 / 300
+STEAM_REQUEST_BURST = 3
+# A 429 pauses every request for at least this long, doubling per repeat
+_THROTTLE_BACKOFF_MIN_S = 5.0
+_THROTTLE_BACKOFF_MAX_S = 300.0
+# Attempts per request when Steam answers 429
+_THROTTLE_ATTEMPTS = 3
+
 # Thread-safe cache for normalize_game_name (replaces @lru_cache for free-threading)
 _normalize_cache_lock = threading.Lock()
 _normalize_cache: dict = {}
@@ -70,6 +136,93 @@ async def close_http_session() -> None:
         await session.close()
 
 
+class SteamRateLimiter:
+    """
+    Async token bucket shared by every Steam store / Web API request.
+
+    Tokens refill at ``rate`` per second up to ``burst``; each request takes
+    one, waiting for it if none is left, so any number of concurrent callers
+    together stay within the rate. Implemented as virtual scheduling (each
+    acquire reserves the next free slot), so waiters need no lock of their own
+    and are served in arrival order.
+
+    An HTTP 429 (``throttled()``) pauses all requests: for Retry-After when
+    Steam sends one, else for a backoff that starts at
+    ``_THROTTLE_BACKOFF_MIN_S`` and doubles on every further 429 until a
+    request succeeds (``succeeded()``).
+    """
+
+    def __init__(self, rate: float = STEAM_REQUESTS_PER_SECOND, burst: int = STEAM_REQUEST_BURST):
+        self._interval = 1.0 / rate
+        self._burst_tolerance = (burst - 1) * self._interval
+        self._next_slot = 0.0         # theoretical arrival time of the next request
+        self._paused_until = 0.0
+        self._backoff = 0.0
+        self._lock = threading.Lock()  # free-threading: callers on several loops
+
+    async def acquire(self) -> None:
+        """Wait for a request slot."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now, self._paused_until)
+            self._next_slot = slot + self._interval
+            wait = slot - self._burst_tolerance - now
+        if wait > 0:
+            await anyio.sleep(wait)
+        # A 429 seen while waiting pauses this request too
+        while (wait := self._paused_until - time.monotonic()) > 0:
+            await anyio.sleep(wait)
+
+    def throttled(self, retry_after: float | None = None) -> float:
+        """Record an HTTP 429; returns the pause applied to every request."""
+        with self._lock:
+            self._backoff = min(max(self._backoff * 2, _THROTTLE_BACKOFF_MIN_S), _THROTTLE_BACKOFF_MAX_S)
+            pause = max(retry_after or 0.0, self._backoff)
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._next_slot = max(self._next_slot, self._paused_until)
+        return pause
+
+    def succeeded(self) -> None:
+        """Record a request Steam answered: the backoff starts over."""
+        self._backoff = 0.0
+
+
+# Shared by every store-search, appdetails and Web API call
+steam_rate_limiter = SteamRateLimiter()
+
+
+def _retry_after(value: str | None) -> float | None:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None  # HTTP-date form: use our own backoff
+
+
+async def steam_api_get(url: str, timeout: float) -> tuple[int, bytes]:
+    """
+    GET a Steam store / Web API URL through the shared rate limiter.
+
+    Retries up to ``_THROTTLE_ATTEMPTS`` times while Steam answers 429,
+    waiting out the limiter's backoff in between.
+
+    Returns:
+        (HTTP status, body)
+
+    Raises:
+        aiohttp.ClientError / TimeoutError: As session.get
+    """
+    session = await get_http_session()
+    for attempt in range(_THROTTLE_ATTEMPTS):
+        await steam_rate_limiter.acquire()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            if resp.status != 429:
+                steam_rate_limiter.succeeded()
+                return resp.status, await resp.read()
+            pause = steam_rate_limiter.throttled(_retry_after(resp.headers.get("Retry-After")))
+        logger.warning(f"Steam rate limited the request (attempt {attempt + 1}), pausing {pause:.0f}s")
+    return 429, b""
+
+
 class SteamIntegration:
     """
     Steam integration for fetching game images and app list
@@ -88,8 +241,8 @@ class SteamIntegration:
     APP_LIST_CACHE_DAYS = 7  # Re-download app list after 7 days
     IMAGE_SEMAPHORE = 10  # Max concurrent image CDN downloads (cold-start fan-out).
     #                       Gates ONLY fetch_steam_header_image (CDN image pulls);
-    #                       the rate-limited storesearch/appdetails lookups have their
-    #                       own guards and are not throttled by this semaphore.
+    #                       the rate-limited storesearch/appdetails lookups go
+    #                       through steam_rate_limiter instead.
 
     def __init__(self):
         from dlss_updater.platform_utils import APP_CONFIG_DIR
@@ -195,79 +348,161 @@ class SteamIntegration:
         """
         Download full Steam app list and store in database with FTS5 indexing.
 
-        Downloads from GitHub repository, normalizes names, and bulk-inserts
-        into the steam_apps table with FTS5 triggers handling the search index.
+        The category files are downloaded concurrently and decoded as they
+        stream in (see _decode_app_list_chunk); each decoded batch is
+        normalised and loaded into a staging table right away, so no file is
+        ever held in memory whole. The staging table is swapped in - one FTS
+        rebuild, atomically - only when every file arrived, or when there is
+        no list yet at all; otherwise the previous list is kept.
+
+        The requests are conditional on the validators saved with the current
+        list. When no file changed the list is kept as is; when only some did,
+        the unchanged ones are downloaded again in full, since the swap
+        replaces the whole list.
         """
         try:
             logger.info("Downloading Steam app list from GitHub repository...")
-            all_apps = []
+            cache = await self._read_app_list_cache()
+            if not await db_manager.begin_steam_apps_staging():
+                return
 
-            session = await get_http_session()
-            # Download all category files
-            for url in self.STEAM_APP_LIST_URLS:
-                try:
-                    logger.info(f"Fetching {url.split('/')[-1]}...")
-                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                        if response.status != 200:
-                            logger.warning(f"Failed to download {url}: HTTP {response.status}")
-                            continue
-
-                        # Read raw bytes and decode with msgspec (GitHub returns text/plain MIME type)
-                        content = await response.read()
-                        apps = _json_decoder.decode(content)
-
-                        # GitHub repo format: array of {appid, name, last_modified, price_change_number}
-                        if isinstance(apps, list):
-                            all_apps.extend(apps)
-                            logger.info(f"Downloaded {len(apps)} apps from {url.split('/')[-1]}")
-                        else:
-                            logger.warning(f"Unexpected format from {url}")
-
-                except TimeoutError:
-                    logger.warning(f"Timeout downloading {url}")
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error downloading {url}: {e}")
-                    continue
+            urls = self.STEAM_APP_LIST_URLS
+            status: list[int | None] = [None] * len(urls)
+            validators: list[HttpValidators | None] = [cache.validators.get(url) for url in urls]
+            staged = 0
+
+            async def _fetch(i: int, send) -> None:
+                async with send:
+                    status[i], validators[i] = await self._stream_app_list(urls[i], send, validators[i])
+
+            async def _stage(receive) -> None:
+                nonlocal staged
+                async with receive:
+                    async for rows in receive:
+                        staged += await db_manager.stage_steam_apps(rows)
+
+            async def _fetch_all(indices: list[int]) -> None:
+                send, receive = anyio.create_memory_object_stream(_APP_LIST_QUEUE_SIZE)
+                async with anyio.create_task_group() as tg:
+                    async with send:
+                        for i in indices:
+                            tg.start_soon(_fetch, i, send.clone())
+                    tg.start_soon(_stage, receive)
+
+            await _fetch_all(list(range(len(urls))))
+
+            unchanged = [i for i, code in enumerate(status) if code == 304]
+            if len(unchanged) == len(urls):
+                logger.info("Steam app list unchanged, keeping the current list")
+                await db_manager.drop_steam_apps_staging()
+                await self._write_app_list_cache(cache)
+                self._db_populated = True
+                return
+            if unchanged and all(code is not None for code in status):
+                logger.info(f"Re-downloading {len(unchanged)} unchanged app list file(s) for the swap")
+                for i in unchanged:
+                    validators[i] = None
+                await _fetch_all(unchanged)
+
+            complete = [code == 200 for code in status]
+            if not staged or (not all(complete) and await db_manager.get_steam_apps_count() > 0):
+                logger.error(
+                    f"Steam app list download incomplete ({sum(complete)}/{len(complete)} files), "
+                    f"keeping the current list"
+                )
+                await db_manager.drop_steam_apps_staging()
+                return
 
-            if not all_apps:
-                logger.error("Failed to download any Steam app data")
+            logger.info(f"Staged {staged} Steam apps, swapping in with one FTS5 rebuild...")
+            count = await db_manager.swap_in_staged_steam_apps()
+            if not count:
                 return
 
-            logger.info(f"Total: {len(all_apps)} Steam apps, processing for database...")
+            await self._write_app_list_cache(SteamAppListCache(
+                app_count=count,
+                validators={url: v for url, v in zip(urls, validators) if v is not None},
+            ))
 
-            # Prepare data for database: (appid, name, name_normalized, name_search)
-            #   name_normalized - space-less form for exact-match lookup
-            #   name_search     - normalized WITH spaces for FTS word-token search
-            db_apps = []
-            for app in all_apps:
-                if not app.get('name'):
-                    continue
+            self._db_populated = True
+            logger.info(f"Steam app list saved to database ({count} apps with FTS5 index)")
 
-                appid = app['appid']
-                name = app['name']
-                # Compute once (cached); derive both forms from it.
-                name_search = self.normalize_game_name(name)  # keeps spaces
-                name_normalized = name_search.replace(' ', '')  # space-less
-                db_apps.append((appid, name, name_normalized, name_search))
+        except Exception as e:
+            logger.error(f"Error downloading Steam app list: {e}", exc_info=True)
 
-            logger.info(f"Inserting {len(db_apps)} apps into database with FTS5 indexing...")
+    async def _read_app_list_cache(self) -> SteamAppListCache:
+        """Cache file of the current list; empty when there is no list to revalidate."""
+        if await db_manager.get_steam_apps_count() == 0:
+            return SteamAppListCache()
+        try:
+            content = await anyio.to_thread.run_sync(
+                self.app_list_cache_file.read_bytes, limiter=thread_io
+            )
+            return _app_list_cache_decoder.decode(content)
+        except (OSError, msgspec.DecodeError):
+            return SteamAppListCache()
 
-            # Clear existing data and insert fresh
-            await db_manager.clear_steam_apps()
-            count = await db_manager.upsert_steam_apps(db_apps)
+    async def _write_app_list_cache(self, cache: SteamAppListCache) -> None:
+        """Save the cache file (its mtime marks when the list was last checked)."""
+        await anyio.to_thread.run_sync(
+            self.app_list_cache_file.write_bytes,
+            msgspec.json.encode(cache),
+            limiter=thread_io,
+        )
 
-            # Save to local cache file for timestamp tracking (smaller subset)
-            cache_data = msgspec.json.encode(all_apps)
-            await anyio.to_thread.run_sync(
-                self.app_list_cache_file.write_bytes, cache_data, limiter=thread_io
-            )
+    async def _stream_app_list(
+        self, url: str, send, validators: HttpValidators | None = None
+    ) -> tuple[int | None, HttpValidators | None]:
+        """
+        Download one category file, sending row batches as they decode.
 
-            self._db_populated = True
-            logger.info(f"Steam app list saved to database ({count} apps with FTS5 index)")
+        The request is conditional on ``validators``, if given.
+
+        Returns:
+            (200, new validators) if the whole file was downloaded and decoded,
+            (304, ``validators``) if it is unchanged, (None, None) on failure
+        """
+        file_name = url.split('/')[-1]
+        try:
+            logger.info(f"Fetching {file_name}...")
+            session = await get_http_session()
+            async with session.get(
+                url,
+                headers=conditional_headers(validators),
+                timeout=aiohttp.ClientTimeout(total=120),
+            ) as response:
+                if response.status == 304 and validators is not None:
+                    logger.info(f"{file_name} not modified")
+                    return 304, validators
+                if response.status != 200:
+                    logger.warning(f"Failed to download {url}: HTTP {response.status}")
+                    return None, None
+                fresh = validators_from_headers(response.headers)
+
+                pending = b""
+                apps = 0
+                async for chunk in response.content.iter_chunked(_APP_LIST_CHUNK_SIZE):
+                    rows, pending = await anyio.to_thread.run_sync(
+                        _decode_app_list_chunk, pending + chunk, limiter=thread_cpu
+                    )
+                    if len(pending) > _APP_LIST_MAX_PENDING:
+                        logger.warning(f"Unexpected format from {url}")
+                        return None, None
+                    if rows:
+                        apps += len(rows)
+                        await send.send(rows)
+
+            if pending.strip(b" \t\r\n,") != b"]":
+                logger.warning(f"Unexpected format from {url} (truncated list)")
+                return None, None
+            logger.info(f"Downloaded {apps} apps from {file_name}")
+            return 200, fresh
 
+        except TimeoutError:
+            logger.warning(f"Timeout downloading {url}")
+            return None, None
         except Exception as e:
-            logger.error(f"Error downloading Steam app list: {e}", exc_info=True)
+            logger.warning(f"Error downloading {url}: {e}")
+            return None, None
 
     @staticmethod
     def normalize_game_name(name: str) -> str:
@@ -516,19 +751,19 @@ class SteamIntegration:
                 # header-sized art (no hero variant), acceptable as last resort.
                 try:
                     api_url = f"https://store.steampowered.com/api/appdetails?appids={app_id}"
-                    async with session.get(api_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                        if response.status == 200:
-                            data = _json_decoder.decode(await response.read())
-                            app_data = data.get(str(app_id), {})
-                            if app_data.get("success"):
-                                header_url = app_data.get("data", {}).get("header_image")
-                                if header_url:
-                                    async with session.get(header_url, timeout=aiohttp.ClientTimeout(total=10)) as img_resp:
-                                        if img_resp.status == 200:
-                                            raw_data = await img_resp.read()
-                                            await _persist(raw_data)
-                                            logger.info(f"Fetched thumbnail for Steam app {app_id} via appdetails API")
-                                            return cache_file
+                    status, body = await steam_api_get(api_url, timeout=10)
+                    if status == 200:
+                        data = _json_decoder.decode(body)
+                        app_data = data.get(str(app_id), {})
+                        if app_data.get("success"):
+                            header_url = app_data.get("data", {}).get("header_image")
+                            if header_url:
+                                async with session.get(header_url, timeout=aiohttp.ClientTimeout(total=10)) as img_resp:
+                                    if img_resp.status == 200:
+                                        raw_data = await img_resp.read()
+                                        await _persist(raw_data)
+                                        logger.info(f"Fetched thumbnail for Steam app {app_id} via appdetails API")
+                                        return cache_file
                 except Exception as e:
                     logger.debug(f"appdetails fallback failed for app {app_id}: {e}")
 
@@ -574,14 +809,13 @@ class SteamIntegration:
         """
         url = f"https://api.steampowered.com/ISteamWebAPIUtil/GetSupportedAPIList/v1/?key={api_key}"
         try:
-            session = await get_http_session()
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                is_valid = resp.status == 200
-                if is_valid:
-                    logger.info("Steam API key validated successfully")
-                else:
-                    logger.warning(f"Steam API key validation failed: HTTP {resp.status}")
-                return is_valid
+            status, _body = await steam_api_get(url, timeout=10)
+            is_valid = status == 200
+            if is_valid:
+                logger.info("Steam API key validated successfully")
+            else:
+                logger.warning(f"Steam API key validation failed: HTTP {status}")
+            return is_valid
         except Exception as e:
             logger.error(f"Error validating Steam API key: {e}")
             return False
@@ -610,13 +844,12 @@ class SteamIntegration:
             f"&skip_unvetted_apps=0"
         )
 
-        session = await get_http_session()
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-            if resp.status == 401:
-                raise ValueError("Invalid API key")
-            if resp.status != 200:
-                raise ValueError(f"Steam API returned HTTP {resp.status}")
-            data = _json_decoder.decode(await resp.read())
+        status, body = await steam_api_get(url, timeout=30)
+        if status == 401:
+            raise ValueError("Invalid API key")
+        if status != 200:
+            raise ValueError(f"Steam API returned HTTP {status}")
+        data = _json_decoder.decode(body)
 
         response = data.get("response", {})
         games = response.get("games", [])
@@ -696,20 +929,23 @@ class SteamIntegration:
         Returns:
             List of (appid, name) tuples in Steam's relevance order (may be empty).
         """
+        return await self._fetch_store_search(game_name, limit) or []
+
+    async def _fetch_store_search(self, game_name: str, limit: int) -> list[tuple[int, str]] | None:
+        """Store search request; None when it failed (as opposed to found nothing)."""
         import urllib.parse
         encoded_name = urllib.parse.quote(game_name)
         url = f"https://store.steampowered.com/api/storesearch/?term={encoded_name}&l=english&cc=US"
 
         try:
-            session = await get_http_session()
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status == 429:
-                    logger.warning("Steam store search rate limited, skipping")
-                    return []
-                if resp.status != 200:
-                    logger.debug(f"Store search returned HTTP {resp.status} for '{game_name}'")
-                    return []
-                data = _json_decoder.decode(await resp.read())
+            status, body = await steam_api_get(url, timeout=10)
+            if status == 429:
+                logger.warning("Steam store search still rate limited, skipping")
+                return None
+            if status != 200:
+                logger.debug(f"Store search returned HTTP {status} for '{game_name}'")
+                return None
+            data = _json_decoder.decode(body)
 
             items = data.get("items", [])
             results: list[tuple[int, str]] = []
@@ -722,24 +958,42 @@ class SteamIntegration:
 
         except TimeoutError:
             logger.debug(f"Store search timed out for '{game_name}'")
-            return []
+            return None
         except Exception as e:
             logger.debug(f"Store search error for '{game_name}': {e}")
-            return []
+            return None
 
-    async def find_app_id_via_store_search(self, game_name: str) -> int | None:
+    async def find_app_id_via_store_search(self, game_name: str, use_cache: bool = True) -> int | None:
         """Search Steam Store API for a game by name, returning the best match.
 
-        Thin wrapper over search_store_apps for the automatic resolution
-        pipeline (scanner / reresolution), which only needs the top hit.
+        Used by the automatic resolution pipeline (scanner / reresolution),
+        which only needs the top hit. Answers - "no match" included - are
+        cached per normalised name in store_search_cache for
+        STORE_SEARCH_HIT_TTL_S / STORE_SEARCH_MISS_TTL_S, so a cached name
+        costs no request (nor a rate-limiter slot). Failed requests
+        (rate limit, HTTP errors, timeouts) are not cached.
 
         Args:
             game_name: Game name to search for
+            use_cache: Read the cache (the answer is written either way)
 
         Returns:
             Steam app ID of the best match, or None
         """
-        results = await self.search_store_apps(game_name, limit=1)
+        cache_key = self.normalize_game_name(game_name)
+        if use_cache and cache_key:
+            cached = await db_manager.get_store_search_result(
+                cache_key, STORE_SEARCH_HIT_TTL_S, STORE_SEARCH_MISS_TTL_S
+            )
+            if cached is not None:
+                logger.debug(f"Store search for '{game_name}' -> app_id {cached.steam_app_id} (cached)")
+                return cached.steam_app_id
+
+        results = await self._fetch_store_search(game_name, 1)
+        if results is None:
+            return None
+        if cache_key:
+            await db_manager.save_store_search_result(cache_key, results[0][0] if results else None)
         if not results:
             logger.debug(f"Store search found no results for '{game_name}'")
             return None
@@ -895,9 +1149,9 @@ async def find_app_id_via_api(game_name: str) -> int | None:
     return await steam_integration.find_app_id_via_api(game_name)
 
 
-async def find_app_id_via_store_search(game_name: str) -> int | None:
+async def find_app_id_via_store_search(game_name: str, use_cache: bool = True) -> int | None:
     """Search Steam Store for a game by name."""
-    return await steam_integration.find_app_id_via_store_search(game_name)
+    return await steam_integration.find_app_id_via_store_search(game_name, use_cache)
 
 
 async def detect_steam_id() -> str | None:
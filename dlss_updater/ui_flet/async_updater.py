@@ -12,6 +12,7 @@ import anyio
 
 from dlss_updater.concurrency_limiters import thread_io
 from dlss_updater.scanner import find_all_dlls
+from dlss_updater.scan_session import cancel_active_scan
 from dlss_updater.utils import update_dlss_versions, process_single_dll, extract_game_name, find_game_root
 from dlss_updater.config import config_manager, get_current_settings
 from dlss_updater.models import UpdateProgress, UpdateResult
@@ -75,9 +76,8 @@ class AsyncUpdateCoordinator:
             # find_all_dlls is already async and now accepts progress_callback
             dll_dict = await find_all_dlls(progress_callback=scanner_progress_wrapper)
 
-            # The scanner fans out through scanner.py, which we must not modify;
-            # its internal launcher/DB phases can't be interrupted from here, so a
-            # cancel requested mid-scan is honoured at this phase boundary — the
+            # cancel() stops the scan through its ScanSession (what finished is
+            # checkpointed for the next scan to resume from); the partial
             # results are discarded and callers skip any follow-on work.
             if self._cancel_requested:
                 self.was_cancelled = True
@@ -652,7 +652,7 @@ class AsyncUpdateCoordinator:
         succeeded for everything else.
         """
         try:
-            from dlss_updater.config import LATEST_DLL_PATHS, config_manager
+            from dlss_updater.config import LATEST_DLL_PATHS, config_manager, get_source_dll_path
             from dlss_updater.fsr4_installer import (
                 FSR4_ANCHOR_DLL,
                 apply_fsr4_upgrade,
@@ -677,7 +677,9 @@ class AsyncUpdateCoordinator:
                 return
 
             for game_dir in sorted(game_dirs):
-                plan = plan_fsr4_upgrade(game_dir, dict(LATEST_DLL_PATHS))
+                # Per-game pins apply to the FSR 4 DLLs too
+                source_paths = {name: get_source_dll_path(name, game_dir) for name in LATEST_DLL_PATHS}
+                plan = plan_fsr4_upgrade(game_dir, source_paths)
                 if not plan.is_actionable:
                     self.logger.info(f"FSR 4 skipped for {game_name}: {plan.skipped_reason}")
                     continue
@@ -707,3 +709,4 @@ class AsyncUpdateCoordinator:
         """Request cancellation of current operation"""
         self.logger.info("Update cancellation requested")
         self._cancel_requested = True
+        cancel_active_scan()
@@ -1182,6 +1182,7 @@ class GamesView(ThemeAwareMixin, ft.Column):
             "Custom Folder 2": ft.Icons.FOLDER_SPECIAL,
             "Custom Folder 3": ft.Icons.FOLDER_SPECIAL,
             "Custom Folder 4": ft.Icons.FOLDER_SPECIAL,
+            "Proton/Wine Prefixes": ft.Icons.WINE_BAR,
         }
 
         # ========== PHASE 1: Collect all game IDs across all launchers ==========
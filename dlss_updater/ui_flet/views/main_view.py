@@ -2085,6 +2085,27 @@ class MainView(ft.Column):
         # go DOWN, so it has to converge with the hub here too.
         await self.refresh_update_status_pill()
 
+    async def refresh_after_library_change(self) -> None:
+        """Re-read the inventory after it changed outside a scan.
+
+        Called from main.py: by the LibraryWatcher (only when watch_libraries
+        is on) and by app_id_resolver after it wrote resolved app IDs.
+        """
+        if self.hub_view:
+            try:
+                await self.hub_view.load_stats()
+            except Exception as e:
+                self.logger.debug(f"Post-library-change hub stats refresh failed: {e}")
+
+        await self.refresh_update_status_pill()
+
+        games_view = self.games_view
+        if games_view is not None and getattr(games_view, "_games_loaded", False):
+            try:
+                await games_view.load_games(force=True)
+            except Exception as e:
+                self.logger.debug(f"Post-library-change games refresh failed: {e}")
+
     async def refresh_after_dll_cache_ready(self) -> None:
         """Re-derive update state once the DLL cache has finished initialising.
 
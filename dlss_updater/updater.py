@@ -16,6 +16,7 @@ from .logger import setup_logger
 from .constants import DLL_TYPE_MAP, FSR4_DLL_RENAME_MAP
 from .config import config_manager
 from .dll_repository import is_known_bad_dll
+from .dll_store import is_pinned_source
 from .models import ProcessedDLLResult
 
 logger = setup_logger()
@@ -58,7 +59,7 @@ def get_dll_versions_parallel(dll_path1, dll_path2):
     Extract versions from two DLLs.
 
     Both extractions go through ``get_dll_version``, which caches results on
-    ``(path, mtime)`` behind a lock-guarded FIFO cache, so back-to-back calls
+    the file's identity behind a lock-guarded FIFO cache, so back-to-back calls
     are cheap (the second unique parse is the only real cost, and repeats are
     served from cache). This previously fanned out to a dedicated
     ThreadPoolExecutor, but that nested pool oversubscribed the anyio thread
@@ -72,9 +73,15 @@ def get_dll_versions_parallel(dll_path1, dll_path2):
     """
     return get_dll_version(dll_path1), get_dll_version(dll_path2)
 
-# Cache for DLL version extraction (key: (path, mtime) for cache invalidation)
+# Cache for DLL version extraction (key: (path, size, mtime_ns, inode) for cache
+# invalidation, value: (version, fingerprint)). Backed by the persistent
+# dll_version_cache table in games.db.
 _dll_version_cache: dict = {}
 
+# Content fingerprint -> version, so byte-identical copies of a DLL across
+# games share one parse. Backed by the dll_fingerprints table in games.db.
+_fingerprint_version_cache: dict = {}
+
 # Thread-safe cache for parse_version (replaces @lru_cache)
 _parse_version_cache: dict = {}
 
@@ -157,80 +164,176 @@ def parse_version(version_string):
     return result
 
 
-def get_dll_version(dll_path):
+def is_already_current(existing_version, latest_version, source_path) -> bool:
     """
-    Extract version from a DLL file using pefile.
+    Check whether a DLL at existing_version needs no update from source_path.
 
-    Uses fast_load=True and only parses the resource directory for better performance.
-    Results are cached based on file path and modification time.
+    Anything at or above the latest version is current - except for a source
+    pinned in the DLL store, which may be older on purpose (rolling games
+    back), so there only the same version counts.
+    """
+    if is_pinned_source(source_path):
+        return parse_version(existing_version) == parse_version(latest_version)
+    return parse_version(existing_version) >= parse_version(latest_version)
 
-    Thread-safe for free-threading (Python 3.14+).
+
+def _remember(cache: dict, key, value) -> None:
+    """Add an entry to one of the version caches (thread-safe, FIFO-bounded)."""
+    with _dll_version_cache_lock:
+        cache[key] = value
+
+        # Limit cache size to prevent memory bloat
+        if len(cache) > 256:
+            # Remove oldest entries (simple FIFO)
+            keys_to_remove = list(cache.keys())[:128]
+            for key in keys_to_remove:
+                del cache[key]
+
+
+def _read_file_version_pefile(dll_path) -> str | None:
+    """
+    Read the raw FileVersion string with pefile.
+
+    Fallback for binaries the lightweight reader in pe_version rejects.
+    Uses fast_load=True and only parses the resource directory.
     """
     import pefile  # Deferred import for faster startup
 
+    # CRITICAL: Use file path instead of data= to avoid loading entire DLL into memory
+    # pefile uses memory mapping when given a path, which is much more efficient
+    pe = None
     try:
-        # Get file modification time for cache invalidation
-        path_obj = Path(dll_path)
-        path_str = str(path_obj)
-        mtime = path_obj.stat().st_mtime
-        cache_key = (path_str, mtime)
+        # Pass file path directly - pefile will use mmap internally
+        # This avoids loading 20-50MB per DLL into Python's heap
+        pe = pefile.PE(dll_path, fast_load=True)
 
-        # Check cache first (thread-safe read)
-        with _dll_version_cache_lock:
-            if cache_key in _dll_version_cache:
-                return _dll_version_cache[cache_key]
+        # Only parse the resource directory (where version info lives)
+        pe.parse_data_directories(
+            directories=[pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE']]
+        )
 
-        # Not in cache, parse the DLL (outside lock to avoid blocking)
-        # CRITICAL: Use file path instead of data= to avoid loading entire DLL into memory
-        # pefile uses memory mapping when given a path, which is much more efficient
-        pe = None
+        raw_version = None
+        if hasattr(pe, 'FileInfo') and pe.FileInfo:
+            for fileinfo in pe.FileInfo:
+                for entry in fileinfo:
+                    if hasattr(entry, "StringTable"):
+                        for st in entry.StringTable:
+                            for key, value in st.entries.items():
+                                if key == b"FileVersion":
+                                    raw_version = value.decode("utf-8")
+                                    break
+        return raw_version
+
+    finally:
+        # CRITICAL: Close PE object to release mmap and file handle
+        if pe is not None:
+            pe.close()
+
+
+def _read_file_version(path_str: str) -> str | None:
+    """Parse the FileVersion of a DLL, normalized (no caching)."""
+    from .pe_version import PEVersionError, read_version_info
+
+    try:
+        raw_version = read_version_info(path_str).file_version
+    except PEVersionError as e:
+        logger.debug(f"Version reader rejected {path_str} ({e}), falling back to pefile")
+        raw_version = _read_file_version_pefile(path_str)
+
+    # Normalize version to dot-separated format
+    # PE files often use commas (310,4,0,0) but we want dots
+    return normalize_version_string(raw_version.strip()) if raw_version else None
+
+
+def _dll_record(dll_path) -> tuple[str | None, str | None]:
+    """
+    Return (version, content fingerprint) of a DLL, parsing as little as possible.
+
+    Lookup order: in-memory cache and persistent cache by file identity
+    (path, size, mtime_ns, inode); then the fingerprint -> version map, which
+    lets a new copy of a known build skip the parse; then a real parse.
+    The fingerprint is None for files pe_version cannot fingerprint.
+
+    Raises OSError if the file cannot be read.
+    """
+    from .database import db_manager
+    from .pe_version import PEVersionError, content_fingerprint
+
+    path_str = str(Path(dll_path))
+    st = os.stat(path_str)
+    cache_key = (path_str, st.st_size, st.st_mtime_ns, st.st_ino)
+
+    # Check cache first (thread-safe read)
+    with _dll_version_cache_lock:
+        if cache_key in _dll_version_cache:
+            return _dll_version_cache[cache_key]
+
+    # Then the persistent cache from earlier runs
+    hit, version_str, fingerprint = db_manager.get_cached_dll_version_sync(*cache_key)
+    if hit and fingerprint is not None:
+        _remember(_dll_version_cache, cache_key, (version_str, fingerprint))
+        return version_str, fingerprint
+
+    if fingerprint is None:
         try:
-            # Pass file path directly - pefile will use mmap internally
-            # This avoids loading 20-50MB per DLL into Python's heap
-            pe = pefile.PE(dll_path, fast_load=True)
+            fingerprint = content_fingerprint(path_str)
+        except PEVersionError as e:
+            logger.debug(f"Cannot fingerprint {path_str}: {e}")
 
-            # Only parse the resource directory (where version info lives)
-            pe.parse_data_directories(
-                directories=[pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE']]
-            )
+    if not hit and fingerprint is not None:
+        with _dll_version_cache_lock:
+            hit = fingerprint in _fingerprint_version_cache
+            version_str = _fingerprint_version_cache.get(fingerprint)
+        if not hit:
+            hit, version_str = db_manager.get_fingerprint_version_sync(fingerprint)
+
+    if not hit:
+        # Not in any cache, parse the DLL (outside lock to avoid blocking)
+        version_str = _read_file_version(path_str)
+
+    if fingerprint is not None:
+        _remember(_fingerprint_version_cache, fingerprint, version_str)
+    _remember(_dll_version_cache, cache_key, (version_str, fingerprint))
+    db_manager.store_dll_version_sync(*cache_key, version_str, fingerprint)
+    return version_str, fingerprint
+
+
+def get_dll_version(dll_path):
+    """
+    Extract the FileVersion of a DLL.
 
-            version_str = None
-            if hasattr(pe, 'FileInfo') and pe.FileInfo:
-                for fileinfo in pe.FileInfo:
-                    for entry in fileinfo:
-                        if hasattr(entry, "StringTable"):
-                            for st in entry.StringTable:
-                                for key, value in st.entries.items():
-                                    if key == b"FileVersion":
-                                        raw_version = value.decode("utf-8").strip()
-                                        # Normalize version to dot-separated format
-                                        # PE files often use commas (310,4,0,0) but we want dots
-                                        version_str = normalize_version_string(raw_version)
-                                        break
-
-            # Cache the result (thread-safe write)
-            with _dll_version_cache_lock:
-                _dll_version_cache[cache_key] = version_str
-
-                # Limit cache size to prevent memory bloat
-                if len(_dll_version_cache) > 256:
-                    # Remove oldest entries (simple FIFO)
-                    keys_to_remove = list(_dll_version_cache.keys())[:128]
-                    for key in keys_to_remove:
-                        del _dll_version_cache[key]
-
-            return version_str
-
-        finally:
-            # CRITICAL: Close PE object to release mmap and file handle
-            if pe is not None:
-                pe.close()
+    Reads the version resource with the lightweight reader in pe_version (a
+    few KB of reads) and falls back to pefile for binaries it rejects.
+    Results are cached on the file's identity (path, size, mtime_ns, inode), in
+    memory and persistently in games.db, so each DLL revision is parsed at
+    most once across runs; byte-identical copies in other games share the
+    parse through their content fingerprint.
 
+    Thread-safe for free-threading (Python 3.14+).
+    """
+    try:
+        return _dll_record(dll_path)[0]
     except Exception as e:
         logger.error(f"Error reading version from {dll_path}: {e}")
     return None
 
 
+def get_dll_fingerprint(dll_path) -> str | None:
+    """
+    Content fingerprint of a DLL (see pe_version.content_fingerprint).
+
+    Cached together with the version. Equal fingerprints mean the same size,
+    headers and resources - the same release build in practice, though not
+    proof of byte identity - without reading either file in full. Returns
+    None if the file cannot be fingerprinted.
+    """
+    try:
+        return _dll_record(dll_path)[1]
+    except Exception as e:
+        logger.debug(f"Error fingerprinting {dll_path}: {e}")
+    return None
+
+
 async def get_dll_version_async(dll_path):
     """
     Async wrapper for get_dll_version.
@@ -522,7 +625,7 @@ def update_dll(dll_path, latest_dll_path):
                 )
                 return ProcessedDLLResult(success=False, dll_type=dll_type)
 
-            if existing_parsed >= latest_parsed:
+            if is_already_current(existing_version, latest_version, latest_dll_path):
                 # Known-bad builds (e.g. watermarked dev variants) report the
                 # same version as the clean replacement, so replace them anyway
                 if is_known_bad_dll(dll_path.name, dll_path):
@@ -661,7 +764,7 @@ def update_dll_with_backup(dll_path, latest_dll_path, pre_created_backup_path=No
                 )
                 return ProcessedDLLResult(success=False, dll_type=dll_type)
 
-            if existing_parsed >= latest_parsed:
+            if is_already_current(existing_version, latest_version, latest_dll_path):
                 # Known-bad builds (e.g. watermarked dev variants) report the
                 # same version as the clean replacement, so replace them anyway
                 if is_known_bad_dll(dll_path.name, dll_path):
@@ -919,7 +1022,7 @@ def update_fsr4_dll_with_rename(source_dll_path, target_dll_path, latest_dll_pat
 
             logger.info(f"Existing version: {existing_version}, Latest version: {latest_version}")
 
-            if existing_parsed >= latest_parsed:
+            if is_already_current(existing_version, latest_version, latest_dll_path):
                 logger.info(f"{target_dll_path} is already up-to-date (version {existing_version}).")
                 return ProcessedDLLResult(success=False, dll_type=dll_type)
 
@@ -3,12 +3,14 @@ import anyio
 import concurrent.futures
 import threading
 import sys
+import time
 from pathlib import Path
 from dlss_updater.logger import setup_logger
 from dlss_updater.config import config_manager, Concurrency
 from dlss_updater.concurrency_limiters import io_heavy, thread_io
-from dlss_updater.models import ProcessedDLLResult
+from dlss_updater.models import GameRootProbe, ProcessedDLLResult
 from dlss_updater.platform_utils import IS_WINDOWS, IS_LINUX
+from dlss_updater.scan_index import _RACY_WINDOW_NS
 
 # Only import ctypes on Windows (not available/needed on Linux for our use case)
 if IS_WINDOWS:
@@ -20,14 +22,36 @@ logger = setup_logger()
 # Per-directory probe cache for find_game_root()'s generic fallback.
 #
 # The generic branch walks up to max_depth levels, and at each level probes the
-# directory with a glob("*.exe") plus several exists() calls. During a scan the
-# same directories are probed repeatedly (many DLLs share ancestor dirs), so the
-# indicator count is memoized per directory. Lock-guarded + FIFO-bounded to stay
-# correct and memory-stable on the free-threaded (GIL-disabled) build — the same
-# pattern used by the version caches (no functools.lru_cache on shared state).
-_game_root_probe_cache: dict = {}
+# directory with a glob("*.exe") plus several exists() calls. The same
+# directories are probed over and over (many DLLs share ancestor dirs, and every
+# scan, whitelist check and UI lookup resolves the same roots again), so the
+# indicator count is memoized per directory and validated with one stat() on
+# the directory's mtime_ns + inode (see models.GameRootProbe). Probes are
+# persisted across runs: load_game_root_probes() / save_game_root_probes()
+# bracket each scan. Lock-guarded + FIFO-bounded to stay correct and
+# memory-stable on the free-threaded (GIL-disabled) build — the same pattern
+# used by the version caches (no functools.lru_cache on shared state).
+_game_root_probe_cache: dict[str, GameRootProbe] = {}
+_game_root_probe_dirty: dict[str, GameRootProbe] = {}
+_game_root_probe_evicted: set[str] = set()
 _game_root_probe_cache_lock = threading.Lock()
-_GAME_ROOT_PROBE_CACHE_MAX = 512
+_game_root_probes_loaded = False
+_GAME_ROOT_PROBE_CACHE_MAX = 16384
+
+
+def _store_game_root_probe(probe: GameRootProbe, dirty: bool) -> None:
+    """Add a probe to the cache (caller holds _game_root_probe_cache_lock)."""
+    _game_root_probe_cache[probe.path] = probe
+    _game_root_probe_evicted.discard(probe.path)
+    if dirty:
+        _game_root_probe_dirty[probe.path] = probe
+    if len(_game_root_probe_cache) > _GAME_ROOT_PROBE_CACHE_MAX:
+        # Remove oldest entries (simple FIFO - remove first half)
+        keys_to_remove = list(_game_root_probe_cache.keys())[: _GAME_ROOT_PROBE_CACHE_MAX // 2]
+        for k in keys_to_remove:
+            del _game_root_probe_cache[k]
+            _game_root_probe_dirty.pop(k, None)
+        _game_root_probe_evicted.update(keys_to_remove)
 
 
 def _game_root_indicator_count(current: Path) -> int:
@@ -35,14 +59,19 @@ def _game_root_indicator_count(current: Path) -> int:
 
     Returns the number of "this looks like a game root" signals present in the
     directory: at least one .exe, a bin/Binaries dir, an engine/Engine dir, a
-    data/Data dir, or a Content dir. Results are cached per directory path for
-    the free-threaded build under a bounded, lock-guarded dict.
+    data/Data dir, or a Content dir. Results are cached per directory for as
+    long as its mtime and inode are unchanged.
     """
     key = str(current)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return 0  # Missing/unreadable: nothing to glob or find
+
     with _game_root_probe_cache_lock:
         cached = _game_root_probe_cache.get(key)
-    if cached is not None:
-        return cached
+    if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.inode == st.st_ino:
+        return cached.indicators
 
     has_exe = any(current.glob("*.exe"))
     has_bin = (current / "bin").exists() or (current / "Binaries").exists()
@@ -52,16 +81,51 @@ def _game_root_indicator_count(current: Path) -> int:
 
     count = sum([has_exe, has_bin, has_engine, has_data, has_content])
 
-    with _game_root_probe_cache_lock:
-        _game_root_probe_cache[key] = count
-        if len(_game_root_probe_cache) > _GAME_ROOT_PROBE_CACHE_MAX:
-            # Remove oldest entries (simple FIFO - remove first half)
-            keys_to_remove = list(_game_root_probe_cache.keys())[: _GAME_ROOT_PROBE_CACHE_MAX // 2]
-            for k in keys_to_remove:
-                del _game_root_probe_cache[k]
+    # A directory changed within the mtime granularity of our probe could
+    # change again unnoticed, so such probes are not kept (as scan_index)
+    if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+        probe = GameRootProbe(path=key, mtime_ns=st.st_mtime_ns, inode=st.st_ino, indicators=count)
+        with _game_root_probe_cache_lock:
+            _store_game_root_probe(probe, dirty=True)
     return count
 
 
+async def load_game_root_probes() -> None:
+    """Load the persisted find_game_root probes (once per process)."""
+    global _game_root_probes_loaded
+    if _game_root_probes_loaded:
+        return
+    from dlss_updater.database import db_manager
+
+    try:
+        probes = await db_manager.load_game_root_probes()
+    except Exception as e:
+        logger.warning(f"Could not load game root probes: {e}")
+        return
+    with _game_root_probe_cache_lock:
+        _game_root_probes_loaded = True
+        for path, probe in probes.items():
+            # Probes taken in this process are newer than the persisted ones
+            if path not in _game_root_probe_cache:
+                _store_game_root_probe(probe, dirty=False)
+    logger.debug(f"Loaded {len(probes)} game root probes")
+
+
+async def save_game_root_probes() -> None:
+    """Persist probes taken (and drop those evicted) since the last save."""
+    from dlss_updater.database import db_manager
+
+    with _game_root_probe_cache_lock:
+        upserts = list(_game_root_probe_dirty.values())
+        deletes = list(_game_root_probe_evicted)
+        _game_root_probe_dirty.clear()
+        _game_root_probe_evicted.clear()
+    try:
+        await db_manager.save_game_root_probes(upserts, deletes)
+    except Exception as e:
+        logger.warning(f"Could not save game root probes: {e}")
+
+
 def process_single_dll_thread_safe(dll_path, launcher, progress_tracker):
     """Thread-safe version of process_single_dll"""
     try:
@@ -96,7 +160,7 @@ async def process_single_dll_with_backup(dll_path, launcher, backup_path, progre
 
         # Update DLL with pre-created backup
         if dll_name in config.LATEST_DLL_PATHS:
-            latest_dll_path = config.LATEST_DLL_PATHS[dll_name]
+            latest_dll_path = config.get_source_dll_path(dll_name, str(dll_path))
             # Pass the backup path to update_dll
             from dlss_updater.updater import update_dll_with_backup
 
@@ -463,6 +527,19 @@ def find_game_root(dll_path: Path, launcher: str) -> Path:
         except (ValueError, IndexError):
             pass
 
+    # For Proton/Wine prefixes: never climb above the game's own folder in
+    # drive_c/<Program Files|Games|...>, or every game of the prefix would
+    # collapse into "Program Files"
+    prefix_game_dir = None
+    if launcher == "Proton/Wine Prefixes":
+        parts = current.parts
+        if "drive_c" in parts:
+            drive_c_idx = len(parts) - 1 - parts[::-1].index("drive_c")
+            # users/<user>/Desktop/<Game> sits two levels deeper
+            depth = 4 if parts[drive_c_idx + 1:drive_c_idx + 2] == ("users",) else 2
+            if drive_c_idx + depth < len(parts):
+                prefix_game_dir = Path(*parts[:drive_c_idx + depth + 1])
+
     # For other launchers: Walk up with stricter heuristics
     max_depth = 5  # Increased from 3 for better detection
     for _ in range(max_depth):
@@ -471,6 +548,9 @@ def find_game_root(dll_path: Path, launcher: str) -> Path:
         if _game_root_indicator_count(current) >= 2:
             return current
 
+        if current == prefix_game_dir:
+            return current
+
         # Move up one level
         if current.parent == current:  # Reached filesystem root
             break
@@ -768,7 +848,7 @@ async def process_single_dll(dll_path, launcher):
             return ProcessedDLLResult(success=False, dll_type=dll_type)
 
         if dll_name in config.LATEST_DLL_PATHS:
-            latest_dll_path = config.LATEST_DLL_PATHS[dll_name]
+            latest_dll_path = config.get_source_dll_path(dll_name, str(dll_path))
             logger.debug(f"Found {dll_name} in LATEST_DLL_PATHS, latest_dll_path: {latest_dll_path}")
             # Run file I/O in a bounded I/O worker thread to avoid blocking
             return await anyio.to_thread.run_sync(update_dll, str(dll_path), latest_dll_path, limiter=thread_io)
@@ -20,6 +20,14 @@ from dlss_updater.logger import setup_logger
 logger = setup_logger()
 
 
+def _int_field(value: str | None) -> int:
+    """Parse a numeric manifest field, treating missing/garbled values as 0."""
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        return 0
+
+
 class VDFParser:
     """
     Lightweight async VDF parser for Steam manifest files.
@@ -180,7 +188,9 @@ class VDFParser:
             acf_path: Path to appmanifest_*.acf file
 
         Returns:
-            Dict with appid, name, installdir, or None if parsing fails
+            Dict with appid, name, installdir plus the raw buildid,
+            LastUpdated, SizeOnDisk and StateFlags strings (empty if absent),
+            or None if parsing fails
         """
         try:
             data = await cls.parse_file(acf_path)
@@ -191,6 +201,10 @@ class VDFParser:
             #     "appid"    "123456"
             #     "name"     "Game Name"
             #     "installdir"    "GameFolder"
+            #     "StateFlags"    "4"
+            #     "LastUpdated"   "1718000000"
+            #     "SizeOnDisk"    "12345678"
+            #     "buildid"       "14530000"
             #     ...
             # }
 
@@ -205,7 +219,11 @@ class VDFParser:
                 return {
                     'appid': appid,
                     'name': name or f"App {appid}",
-                    'installdir': installdir
+                    'installdir': installdir,
+                    'buildid': app_state.get('buildid', ''),
+                    'LastUpdated': app_state.get('LastUpdated', ''),
+                    'SizeOnDisk': app_state.get('SizeOnDisk', ''),
+                    'StateFlags': app_state.get('StateFlags', ''),
                 }
 
             return None
@@ -228,7 +246,8 @@ class VDFParser:
             steam_path: Steam installation path (e.g., C:\\Program Files (x86)\\Steam)
 
         Returns:
-            List of game dicts with: app_id, name, path, steamapps_dir
+            List of game dicts with: app_id, name, path, steamapps_dir,
+            build_id, last_updated, size_on_disk, state_flags
         """
         games = []
 
@@ -292,7 +311,11 @@ class VDFParser:
                             'app_id': int(game_data['appid']) if game_data.get('appid') else None,
                             'name': game_data['name'],
                             'path': game_dir,
-                            'steamapps_dir': steamapps_dir
+                            'steamapps_dir': steamapps_dir,
+                            'build_id': _int_field(game_data.get('buildid')),
+                            'last_updated': _int_field(game_data.get('LastUpdated')),
+                            'size_on_disk': _int_field(game_data.get('SizeOnDisk')),
+                            'state_flags': _int_field(game_data.get('StateFlags')),
                         })
 
             return library_games
@@ -6,7 +6,8 @@ import aiohttp
 import anyio
 from dlss_updater.logger import setup_logger
 from dlss_updater.config import config_manager
-from dlss_updater.concurrency_limiters import io_extreme
+from dlss_updater.concurrency_limiters import io_extreme, thread_io
+from dlss_updater.http_cache import clear_validators, fetch_cached
 
 logger = setup_logger()
 
@@ -50,30 +51,52 @@ async def _get_lock() -> anyio.Lock:
     return _whitelist_lock
 
 
+def _get_whitelist_cache_path() -> Path:
+    """Local copy of the whitelist CSV (revalidated on every fetch)."""
+    from dlss_updater.platform_utils import APP_CONFIG_DIR
+    return APP_CONFIG_DIR / "whitelist.csv"
+
+
+def _parse_whitelist(content: bytes) -> set:
+    reader = csv.reader(StringIO(content.decode("utf-8", errors="replace")))
+    return set(row[0].strip() for row in reader if row and row[0].strip())
+
+
+async def _read_cached_whitelist(cache_path: Path) -> set:
+    """Last downloaded whitelist, for when the remote one can't be fetched."""
+    try:
+        content = await anyio.to_thread.run_sync(cache_path.read_bytes, limiter=thread_io)
+    except OSError:
+        return set()
+    logger.info("Using the last downloaded whitelist")
+    return _parse_whitelist(content)
+
+
 async def fetch_whitelist_async() -> set:
-    """Fetch whitelist from remote URL using aiohttp (non-blocking)"""
+    """Fetch whitelist from remote URL using aiohttp (non-blocking)
+
+    Uses the shared DLL repository session and a conditional request against
+    the local copy, so an unchanged whitelist is answered with a 304.
+    """
+    from dlss_updater.dll_repository import get_http_session
+
+    cache_path = _get_whitelist_cache_path()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                WHITELIST_URL,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to fetch whitelist: HTTP {response.status}")
-                    return set()
-
-                csv_data = StringIO(await response.text())
-                reader = csv.reader(csv_data)
-                return set(row[0].strip() for row in reader if row and row[0].strip())
+        session = await get_http_session()
+        content = await fetch_cached(session, WHITELIST_URL, cache_path, timeout=10)
+        if content is None:
+            return await _read_cached_whitelist(cache_path)
+        return _parse_whitelist(content)
 
     except TimeoutError:
         logger.error("Timeout fetching whitelist")
-        return set()
+        return await _read_cached_whitelist(cache_path)
     except aiohttp.ClientError as e:
         logger.error(f"Failed to fetch whitelist: {e}")
-        return set()
+        return await _read_cached_whitelist(cache_path)
     except csv.Error as e:
         logger.error(f"Failed to parse whitelist CSV: {e}")
+        await anyio.to_thread.run_sync(clear_validators, cache_path, limiter=thread_io)
         return set()
 
 
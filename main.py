@@ -505,6 +505,17 @@ async def main(page: ft.Page):
     register_task(asyncio.create_task(init_dll_cache()), "init_dll_cache")
     register_task(asyncio.create_task(update_steam_list()), "update_steam_list")
 
+    # Scans leave store-search app ID resolution to this background queue
+    from dlss_updater.reresolution import app_id_resolver
+    app_id_resolver.add_listener(main_view.refresh_after_library_change)
+
+    # Optional: keep the game inventory current between scans
+    if config_manager.get_watch_libraries():
+        from dlss_updater.library_watcher import LibraryWatcher
+
+        library_watcher = LibraryWatcher(on_change=main_view.refresh_after_library_change)
+        register_task(asyncio.create_task(library_watcher.run()), "library_watcher")
+
 
 def check_prerequisites():
     """Check dependencies and admin privileges before launching UI"""
@@ -0,0 +1,31 @@
+"""Shared fixtures for the test suite."""
+
+import threading
+
+import pytest
+
+from dlss_updater.database import db_manager
+
+
+@pytest.fixture()
+def temp_db(tmp_path):
+    """Repoint the db_manager singleton at a fresh temp DB, then restore it."""
+    db_path = tmp_path / "games.db"
+
+    orig_path = db_manager.db_path
+    orig_local = db_manager._thread_local
+
+    db_manager.db_path = db_path
+    db_manager._thread_local = threading.local()  # force reconnect to temp DB
+
+    db_manager._create_schema()
+
+    try:
+        yield db_path
+    finally:
+        try:
+            db_manager._close_thread_connection()
+        except Exception:
+            pass
+        db_manager.db_path = orig_path
+        db_manager._thread_local = orig_local
@@ -0,0 +1,91 @@
+"""
+Builds minimal PE32+ DLLs with a VS_VERSIONINFO resource for tests.
+
+Only what ``get_dll_version`` looks at is real: the headers, a single
+``.rsrc`` section and an RT_VERSION resource whose StringTable carries a
+``FileVersion`` string and whose VS_FIXEDFILEINFO carries the numeric version.
+"""
+
+import struct
+
+_FILE_ALIGNMENT = 0x200
+_SECTION_RVA = 0x1000
+
+
+def _align(data: bytes, boundary: int = 4) -> bytes:
+    return data + b"\0" * (-len(data) % boundary)
+
+
+def _block(key: str, value: bytes, value_length: int, wtype: int, children: list[bytes] = ()) -> bytes:
+    """One VS_VERSIONINFO-style node: header, key, value, then children."""
+    body = _align(struct.pack("<HHH", 0, value_length, wtype) + (key + "\0").encode("utf-16-le"))
+    body = _align(body + value) if value else body
+    for child in children:
+        body = _align(body) + child
+    return struct.pack("<H", len(body)) + body[2:]
+
+
+def version_info(file_version: str | None, fixed: tuple[int, int, int, int] = (1, 0, 0, 0)) -> bytes:
+    """A VS_VERSIONINFO blob; ``file_version=None`` omits the StringFileInfo."""
+    ms = (fixed[0] << 16) | fixed[1]
+    ls = (fixed[2] << 16) | fixed[3]
+    fixed_info = struct.pack(
+        "<13I", 0xFEEF04BD, 0x00010000, ms, ls, ms, ls, 0x3F, 0, 0x40004, 2, 0, 0, 0
+    )
+    children = []
+    if file_version is not None:
+        value = (file_version + "\0").encode("utf-16-le")
+        string = _block("FileVersion", value, len(file_version) + 1, 1)
+        table = _block("040904b0", b"", 0, 1, [string])
+        children.append(_block("StringFileInfo", b"", 0, 1, [table]))
+    translation = _block("Translation", struct.pack("<HH", 0x409, 1200), 4, 0)
+    children.append(_block("VarFileInfo", b"", 0, 1, [translation]))
+    return _block("VS_VERSION_INFO", fixed_info, len(fixed_info), 0, children)
+
+
+def _resource_section(blob: bytes) -> bytes:
+    """RT_VERSION (16) -> ID 1 -> language 0x409 -> data entry -> blob."""
+    def directory(entry_id: int, target: int) -> bytes:
+        return struct.pack("<IIHHHH", 0, 0, 0, 0, 0, 1) + struct.pack("<II", entry_id, target)
+
+    data_offset = 88
+    section = (
+        directory(16, 0x80000000 | 24)
+        + directory(1, 0x80000000 | 48)
+        + directory(0x409, 72)
+        + struct.pack("<IIII", _SECTION_RVA + data_offset, len(blob), 0, 0)
+    )
+    assert len(section) == data_offset
+    return section + blob
+
+
+def build_pe(file_version: str | None = "1.0.0.0", fixed: tuple[int, int, int, int] = (1, 0, 0, 0),
+             padding: int = 0) -> bytes:
+    """A minimal PE32+ DLL whose only section is ``.rsrc``.
+
+    ``padding`` appends zero bytes to the section to make a bigger file.
+    """
+    rsrc = _resource_section(version_info(file_version, fixed))
+    virtual_size = len(rsrc)
+    raw = rsrc + b"\0" * padding
+    raw += b"\0" * (-len(raw) % _FILE_ALIGNMENT)
+
+    dos = b"MZ" + b"\0" * 0x3A + struct.pack("<I", 0x40)
+    coff = struct.pack("<HHIIIHH", 0x8664, 1, 0, 0, 0, 240, 0x2022)
+    size_of_image = _SECTION_RVA + ((virtual_size + 0xFFF) & ~0xFFF)
+    optional = struct.pack(
+        "<HBBIIIIIQIIHHHHHHIIIIHHQQQQII",
+        0x20B, 14, 0, 0, len(raw), 0, 0, 0, 0x180000000,
+        0x1000, _FILE_ALIGNMENT, 6, 0, 0, 0, 6, 0, 0,
+        size_of_image, _FILE_ALIGNMENT, 0, 2, 0x160,
+        0x100000, 0x1000, 0x100000, 0x1000, 0, 16,
+    )
+    directories = [(0, 0)] * 16
+    directories[2] = (_SECTION_RVA, virtual_size)
+    optional += b"".join(struct.pack("<II", rva, size) for rva, size in directories)
+    section = struct.pack(
+        "<8sIIIIIIHHI", b".rsrc", virtual_size, _SECTION_RVA, len(raw), _FILE_ALIGNMENT,
+        0, 0, 0, 0, 0x40000040,
+    )
+    headers = dos + b"PE\0\0" + coff + optional + section
+    return headers + b"\0" * (_FILE_ALIGNMENT - len(headers)) + raw
@@ -0,0 +1,136 @@
+"""
+Tests for binary delta updates of cached DLLs.
+
+Verifies:
+  * make_delta / apply_delta round-trip insertions, deletions, scattered
+    byte changes and empty files, and the bytewise SWAR addition is exact
+  * malformed patches raise DeltaError
+  * a cached build with a delta in the manifest is patched without
+    downloading the full file
+  * without a delta for the cached digest, or with a broken delta, the
+    full file is downloaded instead
+"""
+
+import hashlib
+import random
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from dlss_updater import dll_repository
+from dlss_updater.binary_delta import DeltaError, _add_bytes, apply_delta, make_delta
+
+
+def _builds() -> tuple[bytes, bytes]:
+    """Two "builds": the second has inserted, removed and scattered changes."""
+    rng = random.Random(7)
+    old = bytearray(rng.randbytes(400_000))
+    new = bytearray(old)
+    new[5000:5000] = b"new code" * 64
+    for _ in range(2000):
+        new[rng.randrange(len(new))] = rng.randrange(256)
+    del new[200_000:210_000]
+    new += rng.randbytes(3000)
+    return bytes(old), bytes(new)
+
+
+OLD, NEW = _builds()
+
+
+def test_add_bytes_is_bytewise():
+    rng = random.Random(1)
+    a, b = rng.randbytes(5000), rng.randbytes(5000)
+    assert _add_bytes(a, b) == bytes((x + y) & 0xFF for x, y in zip(a, b))
+
+
+def test_round_trip():
+    patch = make_delta(OLD, NEW)
+    assert apply_delta(OLD, patch) == NEW
+    assert len(patch) < len(NEW) // 10
+
+    for old, new in [(b"", b""), (b"", b"abc"), (b"abc", b""), (b"x" * 300, b"x" * 300)]:
+        assert apply_delta(old, make_delta(old, new)) == new
+
+
+def test_malformed_patch():
+    patch = make_delta(OLD, NEW)
+    with pytest.raises(DeltaError):
+        apply_delta(OLD, b"not a patch")
+    with pytest.raises(DeltaError):
+        apply_delta(OLD, patch[:-10])
+    with pytest.raises(DeltaError):
+        apply_delta(OLD[:1000], patch)  # diff runs outside the old file
+
+
+@pytest.fixture()
+async def dll_server(temp_db, tmp_path, monkeypatch):
+    """Local server for full DLLs and deltas; ``files[path]`` is the body."""
+    files: dict[str, bytes] = {}
+    requests: list[str] = []
+
+    async def _handler(request):
+        requests.append(request.path)
+        return web.Response(body=files[request.path.lstrip("/")])
+
+    app = web.Application()
+    app.router.add_get("/{path:.+}", _handler)
+    server = TestServer(app)
+    await server.start_server()
+
+    cache_dir = tmp_path / "dll_cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(dll_repository, "_http_session", None)
+    monkeypatch.setattr(dll_repository, "GITHUB_RAW_BASE", str(server.make_url("")).rstrip("/"))
+    monkeypatch.setattr(dll_repository, "LOCAL_DLL_CACHE_DIR", str(cache_dir))
+    files["dlls/nvngx_dlss.dll"] = NEW
+    files["deltas/nvngx_dlss.dll/old-new.bsd"] = make_delta(OLD, NEW)
+    try:
+        yield files, requests, cache_dir
+    finally:
+        await dll_repository.close_http_session()
+        await server.close()
+
+
+def _manifest(source: str = hashlib.sha256(OLD).hexdigest()) -> dict:
+    return {"nvngx_dlss.dll": {
+        "version": "310.5.0.0",
+        "sha256": hashlib.sha256(NEW).hexdigest(),
+        "deltas": {source: "deltas/nvngx_dlss.dll/old-new.bsd"},
+    }}
+
+
+async def test_cached_build_is_patched(dll_server):
+    _files, requests, cache_dir = dll_server
+    cached = cache_dir / "nvngx_dlss.dll"
+    cached.write_bytes(OLD)
+
+    assert await dll_repository.download_latest_dll_async("nvngx_dlss.dll", _manifest())
+
+    assert cached.read_bytes() == NEW
+    assert requests == ["/deltas/nvngx_dlss.dll/old-new.bsd"]
+    assert dll_repository.get_dll_sha256(cached) == hashlib.sha256(NEW).hexdigest()
+
+
+async def test_unknown_source_downloads_full_file(dll_server):
+    _files, requests, cache_dir = dll_server
+    cached = cache_dir / "nvngx_dlss.dll"
+    cached.write_bytes(OLD)
+
+    assert await dll_repository.download_latest_dll_async("nvngx_dlss.dll", _manifest(source="0" * 64))
+
+    assert cached.read_bytes() == NEW
+    assert requests == ["/dlls/nvngx_dlss.dll"]
+
+
+async def test_broken_delta_downloads_full_file(dll_server):
+    files, requests, cache_dir = dll_server
+    cached = cache_dir / "nvngx_dlss.dll"
+    cached.write_bytes(OLD)
+    files["deltas/nvngx_dlss.dll/old-new.bsd"] = make_delta(OLD, NEW + b"!")
+
+    assert await dll_repository.download_latest_dll_async("nvngx_dlss.dll", _manifest())
+
+    assert cached.read_bytes() == NEW
+    assert requests == ["/deltas/nvngx_dlss.dll/old-new.bsd", "/dlls/nvngx_dlss.dll"]
+    assert not (cache_dir / "nvngx_dlss.dll.patched").exists()
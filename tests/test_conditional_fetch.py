@@ -0,0 +1,117 @@
+"""
+Tests for conditional downloads of the DLL manifest and the whitelist.
+
+Verifies:
+  * a download saves its ETag / Last-Modified next to the local copy, the
+    next fetch sends them back and a 304 is served from the copy
+  * a changed file is downloaded again and replaces the copy
+  * a 304 for a copy that has gone missing falls back to a full download
+  * the whitelist uses the shared session and falls back to its last
+    downloaded copy when the server fails
+"""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from dlss_updater import dll_repository, http_cache, whitelist
+
+LAST_MODIFIED = "Wed, 14 Oct 2026 10:00:00 GMT"
+
+
+class _Remote:
+    """One remote file: ``body`` (or an error ``status``), validated by ``etag``."""
+
+    def __init__(self):
+        self.body = b""
+        self.etag: str | None = None
+        self.status = 200
+        self.requests: list[dict[str, str]] = []
+
+    async def handle(self, request):
+        self.requests.append({
+            k: v for k, v in request.headers.items() if k in ("If-None-Match", "If-Modified-Since")
+        })
+        if self.status != 200:
+            return web.Response(status=self.status)
+        if self.etag is not None:
+            if request.headers.get("If-None-Match") == self.etag:
+                return web.Response(status=304, headers={"ETag": self.etag})
+            return web.Response(body=self.body, headers={"ETag": self.etag})
+        if request.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            return web.Response(status=304)
+        return web.Response(body=self.body, headers={"Last-Modified": LAST_MODIFIED})
+
+
+@pytest.fixture()
+async def remote(tmp_path, monkeypatch):
+    manifest, wl = _Remote(), _Remote()
+    app = web.Application()
+    app.router.add_get("/manifest.json", manifest.handle)
+    app.router.add_get("/whitelist.csv", wl.handle)
+    server = TestServer(app)
+    await server.start_server()
+
+    monkeypatch.setattr(dll_repository, "_http_session", None)
+    monkeypatch.setattr(dll_repository, "DLL_MANIFEST_URL", str(server.make_url("/manifest.json")))
+    monkeypatch.setattr(dll_repository, "LOCAL_DLL_CACHE_DIR", str(tmp_path / "dll_cache"))
+    monkeypatch.setattr(whitelist, "WHITELIST_URL", str(server.make_url("/whitelist.csv")))
+    monkeypatch.setattr(whitelist, "_get_whitelist_cache_path", lambda: tmp_path / "whitelist.csv")
+    try:
+        yield manifest, wl
+    finally:
+        await dll_repository.close_http_session()
+        await server.close()
+
+
+async def test_manifest_revalidates_with_etag(remote):
+    manifest, _wl = remote
+    manifest.body, manifest.etag = b'{"nvngx_dlss.dll": {"version": "310.1.0.0"}}', '"v1"'
+
+    assert (await dll_repository.get_remote_manifest_async())["nvngx_dlss.dll"]["version"] == "310.1.0.0"
+    assert (await dll_repository.get_cached_manifest_async()) is not None
+
+    second = await dll_repository.get_remote_manifest_async()
+    assert second["nvngx_dlss.dll"]["version"] == "310.1.0.0"
+    assert manifest.requests == [{}, {"If-None-Match": '"v1"'}]
+
+    manifest.body, manifest.etag = b'{"nvngx_dlss.dll": {"version": "310.2.0.0"}}', '"v2"'
+    assert (await dll_repository.get_remote_manifest_async())["nvngx_dlss.dll"]["version"] == "310.2.0.0"
+    assert (await dll_repository.get_cached_manifest_async())["nvngx_dlss.dll"]["version"] == "310.2.0.0"
+
+
+async def test_missing_copy_is_downloaded_again(remote, tmp_path, monkeypatch):
+    manifest, _wl = remote
+    manifest.body, manifest.etag = b'{"nvngx_dlss.dll": {"version": "310.1.0.0"}}', '"v1"'
+    await dll_repository.get_remote_manifest_async()
+
+    # Validators read, then the copy disappears before the 304 arrives
+    load_validators = http_cache.load_validators
+    copy = tmp_path / "dll_cache" / "manifest.json"
+
+    def _load_then_delete(path):
+        validators = load_validators(path)
+        path.unlink(missing_ok=True)
+        return validators
+
+    with monkeypatch.context() as m:
+        m.setattr(http_cache, "load_validators", _load_then_delete)
+        result = await dll_repository.get_remote_manifest_async()
+
+    assert result["nvngx_dlss.dll"]["version"] == "310.1.0.0"
+    assert manifest.requests[1:] == [{"If-None-Match": '"v1"'}, {}]
+    assert copy.exists()
+
+
+async def test_whitelist_last_modified_and_fallback(remote):
+    _manifest, wl = remote
+    wl.body = b"Game A\nGame B,comment\n\n"
+
+    assert await whitelist.fetch_whitelist_async() == {"Game A", "Game B"}
+    session = dll_repository._http_session
+    assert await whitelist.fetch_whitelist_async() == {"Game A", "Game B"}
+    assert wl.requests == [{}, {"If-Modified-Since": LAST_MODIFIED}]
+    assert dll_repository._http_session is session
+
+    wl.status = 503
+    assert await whitelist.fetch_whitelist_async() == {"Game A", "Game B"}
@@ -0,0 +1,125 @@
+"""
+Tests for the per-device I/O limiters in ``concurrency_limiters``.
+
+Verifies:
+  * paths on one device share a limiter, other devices get their own
+  * rotational devices get DEVICE_IO_ROTATIONAL, others DEVICE_IO_SSD
+  * a path that does not exist yet maps to its nearest existing ancestor
+  * the scan walk sizes its pool from the root device
+  * device_slot takes the free slots it asks for and waits for one when
+    the device is busy
+  * a library walk only runs as many threads as the slots it holds, so
+    walks on one disk share its limit
+"""
+
+import concurrent.futures
+import os
+
+import anyio
+import pytest
+
+from dlss_updater import concurrency_limiters, scanner
+from dlss_updater.config import Concurrency
+
+
+@pytest.fixture()
+def devices(monkeypatch):
+    """Fresh limiter caches; ``rotational`` holds the st_devs that spin."""
+    rotational: set[int] = set()
+    monkeypatch.setattr(concurrency_limiters, "_device_limiters", {})
+    monkeypatch.setattr(concurrency_limiters, "_device_capacities", {})
+    monkeypatch.setattr(concurrency_limiters, "_is_rotational", lambda dev: dev in rotational)
+    return rotational
+
+
+def test_same_device_shares_limiter(tmp_path, devices):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    limiter = concurrency_limiters.device_limiter(tmp_path / "a")
+    assert concurrency_limiters.device_limiter(tmp_path / "b") is limiter
+    assert limiter.total_tokens == Concurrency.DEVICE_IO_SSD
+
+
+def test_rotational_device_gets_small_limit(tmp_path, devices):
+    devices.add(os.stat(tmp_path).st_dev)
+    assert concurrency_limiters.device_capacity(tmp_path) == Concurrency.DEVICE_IO_ROTATIONAL
+    limiter = concurrency_limiters.device_limiter(tmp_path)
+    assert limiter.total_tokens == Concurrency.DEVICE_IO_ROTATIONAL
+
+
+def test_other_device_gets_own_limiter(tmp_path, devices, monkeypatch):
+    monkeypatch.setattr(
+        concurrency_limiters, "_device_of", lambda path: 2 if "hdd" in str(path) else 1
+    )
+    devices.add(2)
+    ssd = concurrency_limiters.device_limiter(tmp_path / "ssd")
+    hdd = concurrency_limiters.device_limiter(tmp_path / "hdd")
+    assert ssd is not hdd
+    assert (ssd.total_tokens, hdd.total_tokens) == (
+        Concurrency.DEVICE_IO_SSD, Concurrency.DEVICE_IO_ROTATIONAL
+    )
+
+
+def test_missing_path_uses_existing_ancestor(tmp_path):
+    missing = tmp_path / "not" / "yet" / "nvngx_dlss.dll"
+    assert concurrency_limiters._device_of(missing) == os.stat(tmp_path).st_dev
+
+
+@pytest.fixture()
+def pool_sizes(monkeypatch):
+    """Worker counts of the walk pools created, in order."""
+    sizes = []
+    real_executor = concurrent.futures.ThreadPoolExecutor
+
+    class _RecordingExecutor(real_executor):
+        def __init__(self, max_workers=None, *args, **kwargs):
+            sizes.append(max_workers)
+            super().__init__(max_workers, *args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", _RecordingExecutor)
+    return sizes
+
+
+def test_walk_pool_sized_from_device(tmp_path, devices, pool_sizes):
+    (tmp_path / "Game").mkdir()
+    devices.add(os.stat(tmp_path).st_dev)
+
+    scanner._parallel_scandir_walk(str(tmp_path), frozenset({"nvngx_dlss.dll"}))
+    assert pool_sizes == [Concurrency.DEVICE_IO_ROTATIONAL]
+
+
+async def test_device_slot_takes_free_slots(tmp_path, devices):
+    devices.add(os.stat(tmp_path).st_dev)
+    limiter = concurrency_limiters.device_limiter(tmp_path)
+
+    async with concurrency_limiters.device_slot(tmp_path, workers=8) as held:
+        assert held == Concurrency.DEVICE_IO_ROTATIONAL
+        assert limiter.available_tokens == 0
+
+        entered = anyio.Event()
+
+        async def _waiter():
+            async with concurrency_limiters.device_slot(tmp_path, workers=8) as waiting_held:
+                assert waiting_held == Concurrency.DEVICE_IO_ROTATIONAL
+                entered.set()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(_waiter)
+            await anyio.sleep(0.05)
+            assert not entered.is_set()
+            tg.cancel_scope.cancel()
+
+    assert limiter.available_tokens == Concurrency.DEVICE_IO_ROTATIONAL
+
+
+async def test_library_walk_shares_device_limit(tmp_path, devices, pool_sizes, monkeypatch):
+    library = tmp_path / "Library"
+    (library / "Game").mkdir(parents=True)
+    devices.add(os.stat(tmp_path).st_dev)
+    monkeypatch.setattr(scanner, "HAVE_SCANDIR_RS", False)
+
+    # Another walk on the same disk holds one of its slots
+    async with concurrency_limiters.device_slot(tmp_path):
+        await scanner.find_dlls([library], "Custom Folder 1", ["nvngx_dlss.dll"])
+
+    assert pool_sizes == [Concurrency.DEVICE_IO_ROTATIONAL - 1]
@@ -0,0 +1,104 @@
+"""
+Tests for content-fingerprint dedup of DLL version extraction.
+
+Byte-identical copies of a DLL (the same nvngx_dlss.dll build in dozens of
+games) share one version parse through their content fingerprint, and the
+update pre-filter skips targets that are already the bundled latest build.
+
+Verifies:
+  * identical copies at different paths are parsed once
+  * the fingerprint -> version map survives a restart
+  * different builds get different fingerprints
+  * _check_needs_update skips a target identical to LATEST_DLL_PATHS,
+    unless the target is a known-bad build
+"""
+
+import pytest
+
+from dlss_updater import config
+from dlss_updater import high_performance_updater as hpu
+from dlss_updater import pe_version, updater
+from dlss_updater.pe_version import content_fingerprint
+from tests.pe_builder import build_pe
+
+
+@pytest.fixture()
+def parses(monkeypatch):
+    """Count version-resource parses and start from empty in-memory caches."""
+    calls = []
+    real_read = pe_version.read_version_info
+
+    def _counting_read(path):
+        calls.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(pe_version, "read_version_info", _counting_read)
+    monkeypatch.setattr(updater, "_dll_version_cache", {})
+    monkeypatch.setattr(updater, "_fingerprint_version_cache", {})
+    return calls
+
+
+def _copies(tmp_path, count, data):
+    paths = []
+    for i in range(count):
+        dll = tmp_path / f"Game{i}" / "nvngx_dlss.dll"
+        dll.parent.mkdir()
+        dll.write_bytes(data)
+        paths.append(dll)
+    return paths
+
+
+def test_identical_copies_share_one_parse(temp_db, tmp_path, parses):
+    copies = _copies(tmp_path, 5, build_pe("310.4.0.0", padding=8192))
+
+    assert {updater.get_dll_version(p) for p in copies} == {"310.4.0.0"}
+    assert len(parses) == 1
+
+
+def test_fingerprint_map_survives_restart(temp_db, tmp_path, parses, monkeypatch):
+    first, second = _copies(tmp_path, 2, build_pe("310.4.0.0"))
+    assert updater.get_dll_version(first) == "310.4.0.0"
+
+    monkeypatch.setattr(updater, "_dll_version_cache", {})
+    monkeypatch.setattr(updater, "_fingerprint_version_cache", {})
+    assert updater.get_dll_version(second) == "310.4.0.0"
+    assert len(parses) == 1
+
+
+def test_different_builds_differ(tmp_path):
+    old, new = tmp_path / "old.dll", tmp_path / "new.dll"
+    old.write_bytes(build_pe("3.7.10.0"))
+    new.write_bytes(build_pe("3.7.20.0"))
+    assert content_fingerprint(old) != content_fingerprint(new)
+    assert content_fingerprint(old).startswith(f"{old.stat().st_size}:")
+
+
+def test_prefilter_skips_identical_target(temp_db, tmp_path, parses, monkeypatch):
+    source = tmp_path / "latest" / "nvngx_dlss.dll"
+    source.parent.mkdir()
+    source.write_bytes(build_pe("310.4.0.0"))
+    identical, older = _copies(tmp_path, 2, build_pe("310.4.0.0"))
+    older.write_bytes(build_pe("3.7.10.0"))
+    monkeypatch.setitem(config.LATEST_DLL_PATHS, "nvngx_dlss.dll", str(source))
+
+    manager = hpu.HighPerformanceUpdateManager()
+    needs, reason = manager._check_needs_update(hpu.DLLTask(str(identical), "nvngx_dlss.dll"))
+    assert not needs
+    assert "same build" in reason
+
+    needs, _reason = manager._check_needs_update(hpu.DLLTask(str(older), "nvngx_dlss.dll"))
+    assert needs
+
+
+def test_prefilter_replaces_known_bad_same_fingerprint(temp_db, tmp_path, parses, monkeypatch):
+    source = tmp_path / "latest" / "nvngx_dlss.dll"
+    source.parent.mkdir()
+    source.write_bytes(build_pe("310.4.0.0"))
+    [target] = _copies(tmp_path, 1, build_pe("310.4.0.0"))
+    monkeypatch.setitem(config.LATEST_DLL_PATHS, "nvngx_dlss.dll", str(source))
+    monkeypatch.setattr(hpu, "is_known_bad_dll", lambda name, path: str(path) == str(target))
+
+    manager = hpu.HighPerformanceUpdateManager()
+    needs, reason = manager._check_needs_update(hpu.DLLTask(str(target), "nvngx_dlss.dll"))
+    assert needs
+    assert "Known-bad" in reason
@@ -0,0 +1,118 @@
+"""
+Tests for DLL download verification and the integrity index.
+
+Verifies:
+  * a download matching the manifest digest is installed and its digest
+    recorded, so later lookups need no re-hash
+  * a download that does not match is discarded and the cached copy kept
+  * known-bad checks hash a file once per revision, then use the index
+  * a published digest decides whether the cached copy is up to date
+"""
+
+import hashlib
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from dlss_updater import dll_repository
+from tests.pe_builder import build_pe
+
+DLL = build_pe(file_version="310.2.0.0")
+
+
+@pytest.fixture()
+async def dll_server(temp_db, tmp_path, monkeypatch):
+    """Local server for ``/dlls/<name>``; ``files[name]`` is the body."""
+    files: dict[str, bytes] = {}
+
+    async def _handler(request):
+        return web.Response(body=files[request.match_info["name"]])
+
+    app = web.Application()
+    app.router.add_get("/dlls/{name}", _handler)
+    server = TestServer(app)
+    await server.start_server()
+
+    cache_dir = tmp_path / "dll_cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(dll_repository, "_http_session", None)
+    monkeypatch.setattr(dll_repository, "GITHUB_RAW_BASE", str(server.make_url("")).rstrip("/"))
+    monkeypatch.setattr(dll_repository, "LOCAL_DLL_CACHE_DIR", str(cache_dir))
+    try:
+        yield files, cache_dir
+    finally:
+        await dll_repository.close_http_session()
+        await server.close()
+
+
+def _no_rehash(monkeypatch):
+    def _file_digest(*_args, **_kwargs):
+        raise AssertionError("digest should come from the integrity index")
+
+    monkeypatch.setattr(dll_repository.hashlib, "file_digest", _file_digest)
+
+
+def _manifest(sha256: str) -> dict:
+    return {"nvngx_dlss.dll": {"version": "310.2.0.0", "sha256": f"sha256:{sha256}"}}
+
+
+async def test_verified_download_is_recorded(dll_server, monkeypatch):
+    files, cache_dir = dll_server
+    files["nvngx_dlss.dll"] = DLL
+
+    assert await dll_repository.download_latest_dll_async(
+        "nvngx_dlss.dll", _manifest(hashlib.sha256(DLL).hexdigest())
+    )
+
+    cached = cache_dir / "nvngx_dlss.dll"
+    assert cached.read_bytes() == DLL
+    assert not (cache_dir / "nvngx_dlss.dll.tmp").exists()
+    _no_rehash(monkeypatch)
+    assert dll_repository.get_dll_sha256(cached) == hashlib.sha256(DLL).hexdigest()
+
+
+async def test_mismatched_download_is_discarded(dll_server):
+    files, cache_dir = dll_server
+    cached = cache_dir / "nvngx_dlss.dll"
+    cached.write_bytes(b"previous copy")
+    files["nvngx_dlss.dll"] = DLL + b"tampered"
+
+    assert not await dll_repository.download_latest_dll_async(
+        "nvngx_dlss.dll", _manifest(hashlib.sha256(DLL).hexdigest())
+    )
+
+    assert cached.read_bytes() == b"previous copy"
+    assert not (cache_dir / "nvngx_dlss.dll.tmp").exists()
+
+
+def test_known_bad_check_uses_index(temp_db, tmp_path, monkeypatch):
+    bad = tmp_path / "nvngx_dlss.dll"
+    bad.write_bytes(b"watermarked build")
+    monkeypatch.setitem(dll_repository.KNOWN_BAD_DLL_BUILDS, "nvngx_dlss.dll", {
+        "size": bad.stat().st_size,
+        "sha256": hashlib.sha256(b"watermarked build").hexdigest(),
+    })
+
+    assert dll_repository.is_known_bad_dll("nvngx_dlss.dll", bad)
+    with monkeypatch.context() as m:
+        _no_rehash(m)
+        assert dll_repository.is_known_bad_dll("nvngx_dlss.dll", bad)
+
+    # A new revision of the file is hashed again
+    bad.write_bytes(b"clean rel build!!")
+    assert not dll_repository.is_known_bad_dll("nvngx_dlss.dll", bad)
+
+
+async def test_published_digest_decides_update(dll_server):
+    _files, cache_dir = dll_server
+    cached = cache_dir / "nvngx_dlss.dll"
+    cached.write_bytes(DLL)
+
+    assert not await dll_repository.check_for_dll_update_async(
+        "nvngx_dlss.dll", _manifest(hashlib.sha256(DLL).hexdigest())
+    )
+    # Same version, different build: the cached copy is replaced
+    assert await dll_repository.check_for_dll_update_async(
+        "nvngx_dlss.dll", _manifest(hashlib.sha256(b"other build").hexdigest())
+    )
@@ -0,0 +1,141 @@
+"""
+Tests for the multi-version DLL store and version pinning.
+
+Verifies:
+  * installed downloads are stored by digest and indexed by version, and
+    storing the same build again adds nothing
+  * pruning keeps the newest ``keep_versions`` versions plus pinned ones
+  * a global pin switches LATEST_DLL_PATHS to the stored build without
+    downloading anything
+  * a per-game pin applies only to targets inside that game's folder
+  * a pinned older build counts as an update (rollback), an unpinned one not
+  * resolving the DLL paths only reads the store, it never adds to it
+"""
+
+import hashlib
+
+import pytest
+
+from dlss_updater import config, dll_repository, dll_store
+from dlss_updater.config import config_manager
+from dlss_updater.models import DLLStoreConfig
+from dlss_updater.updater import is_already_current
+from tests.pe_builder import build_pe
+
+BUILDS = {version: build_pe(file_version=version) for version in ("310.1.0.0", "310.2.0.0", "310.3.0.0")}
+
+
+@pytest.fixture()
+def dll_cache(temp_db, tmp_path, monkeypatch):
+    """Empty DLL cache and store settings; config is never written to disk."""
+    cache_dir = tmp_path / "dll_cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(dll_repository, "LOCAL_DLL_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(config_manager._config, "dll_store", DLLStoreConfig())
+    monkeypatch.setattr(config_manager, "_save_unlocked", lambda: None)
+
+    def _no_download(*args, **kwargs):
+        raise AssertionError("the DLL store must not download")
+
+    monkeypatch.setattr(dll_repository, "download_latest_dll", _no_download)
+
+    latest_paths = dict(config.LATEST_DLL_PATHS)
+    game_paths = dict(config.GAME_DLL_PATHS)
+    latest_versions = dict(config.LATEST_DLL_VERSIONS)
+    try:
+        yield cache_dir
+    finally:
+        for current, saved in (
+            (config.LATEST_DLL_PATHS, latest_paths),
+            (config.GAME_DLL_PATHS, game_paths),
+            (config.LATEST_DLL_VERSIONS, latest_versions),
+        ):
+            current.clear()
+            current.update(saved)
+
+
+def _install(cache_dir, version: str):
+    """Install a build into the cache the way a finished download is."""
+    temp = cache_dir / "nvngx_dlss.dll.tmp"
+    temp.write_bytes(BUILDS[version])
+    dll_repository._install_download(
+        temp, cache_dir / "nvngx_dlss.dll", hashlib.sha256(BUILDS[version]).hexdigest()
+    )
+
+
+def test_downloads_are_stored_by_digest(dll_cache):
+    _install(dll_cache, "310.1.0.0")
+    _install(dll_cache, "310.2.0.0")
+    _install(dll_cache, "310.2.0.0")
+
+    versions = dll_store.stored_versions("nvngx_dlss.dll")
+    assert [v for v, _d in versions] == ["310.2.0.0", "310.1.0.0"]
+    for version, digest in versions:
+        assert digest == hashlib.sha256(BUILDS[version]).hexdigest()
+        stored = dll_cache / "store" / digest / "nvngx_dlss.dll"
+        assert dll_store.stored_dll_path("nvngx_dlss.dll", version) == str(stored)
+        assert stored.read_bytes() == BUILDS[version]
+
+
+def test_prune_keeps_recent_and_pinned(dll_cache):
+    config_manager.set_dll_store_keep_versions(1)
+    config_manager.set_dll_pin("nvngx_dlss.dll", "310.1.0.0")
+    for version in BUILDS:
+        _install(dll_cache, version)
+
+    assert [v for v, _d in dll_store.stored_versions("nvngx_dlss.dll")] == ["310.3.0.0", "310.1.0.0"]
+    assert dll_store.stored_dll_path("nvngx_dlss.dll", "310.2.0.0") is None
+    digest = hashlib.sha256(BUILDS["310.2.0.0"]).hexdigest()
+    assert not (dll_cache / "store" / digest).exists()
+
+
+def test_global_pin_switches_without_download(dll_cache):
+    _install(dll_cache, "310.1.0.0")
+    _install(dll_cache, "310.2.0.0")
+    config.refresh_dll_paths()
+    assert config.LATEST_DLL_PATHS["nvngx_dlss.dll"] == str(dll_cache / "nvngx_dlss.dll")
+
+    config_manager.set_dll_pin("nvngx_dlss.dll", "310.1.0.0")
+    config.refresh_dll_paths()
+
+    pinned = config.get_source_dll_path("nvngx_dlss.dll")
+    assert pinned == dll_store.stored_dll_path("nvngx_dlss.dll", "310.1.0.0")
+    assert config.LATEST_DLL_VERSIONS["nvngx_dlss.dll"] == "310.1.0.0"
+
+    config_manager.set_dll_pin("nvngx_dlss.dll", None)
+    config.refresh_dll_paths()
+    assert config.get_source_dll_path("nvngx_dlss.dll") == str(dll_cache / "nvngx_dlss.dll")
+
+
+def test_game_pin_applies_inside_game(dll_cache, tmp_path):
+    _install(dll_cache, "310.1.0.0")
+    _install(dll_cache, "310.2.0.0")
+    game = tmp_path / "Games" / "Pinned Game"
+    config_manager.set_dll_pin("nvngx_dlss.dll", "310.1.0.0", game_path=str(game))
+    config.refresh_dll_paths()
+
+    pinned = dll_store.stored_dll_path("nvngx_dlss.dll", "310.1.0.0")
+    target = game / "bin" / "nvngx_dlss.dll"
+    other = tmp_path / "Games" / "Other Game" / "nvngx_dlss.dll"
+    assert config.get_source_dll_path("nvngx_dlss.dll", str(target)) == pinned
+    assert config.get_source_dll_path("nvngx_dlss.dll", str(other)) == str(dll_cache / "nvngx_dlss.dll")
+
+
+def test_pinned_older_build_is_a_rollback(dll_cache):
+    _install(dll_cache, "310.1.0.0")
+    _install(dll_cache, "310.2.0.0")
+    pinned = dll_store.stored_dll_path("nvngx_dlss.dll", "310.1.0.0")
+    latest = str(dll_cache / "nvngx_dlss.dll")
+
+    assert is_already_current("310.2.0.0", "310.1.0.0", latest)
+    assert not is_already_current("310.2.0.0", "310.1.0.0", pinned)
+    assert is_already_current("310.1.0.0", "310.1.0.0", pinned)
+
+
+def test_resolving_paths_does_not_store(dll_cache):
+    (dll_cache / "nvngx_dlss.dll").write_bytes(BUILDS["310.1.0.0"])
+    config.refresh_dll_paths()
+
+    assert config.LATEST_DLL_PATHS["nvngx_dlss.dll"] == str(dll_cache / "nvngx_dlss.dll")
+    assert dll_store.stored_versions("nvngx_dlss.dll") == []
+    assert not (dll_cache / "store").exists()
@@ -0,0 +1,79 @@
+"""
+Tests for the persistent DLL version cache.
+
+``get_dll_version`` records each DLL's FileVersion in games.db keyed by the
+file's identity (path, size, mtime_ns, inode), so a DLL revision is parsed at
+most once across runs - the in-memory cache alone is lost on every restart.
+
+Verifies:
+  * a version read in an earlier "run" is served from the DB without a parse
+  * DLLs without a FileVersion are cached too (as a hit with None)
+  * replacing the file (new size/mtime) re-parses and updates the row
+"""
+
+import os
+
+import pytest
+
+from dlss_updater import pe_version, updater
+from tests.pe_builder import build_pe
+
+
+@pytest.fixture()
+def parses(monkeypatch):
+    """Count version-resource parses and start from an empty in-memory cache."""
+    calls = []
+    real_read = pe_version.read_version_info
+
+    def _counting_read(path):
+        calls.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(pe_version, "read_version_info", _counting_read)
+    monkeypatch.setattr(updater, "_dll_version_cache", {})
+    return calls
+
+
+def _new_run(monkeypatch):
+    """Simulate an app restart: the in-memory cache is gone, the DB is not."""
+    monkeypatch.setattr(updater, "_dll_version_cache", {})
+
+
+def test_version_survives_restart(temp_db, tmp_path, parses, monkeypatch):
+    dll = tmp_path / "nvngx_dlss.dll"
+    dll.write_bytes(build_pe("310,4,0,0"))
+
+    assert updater.get_dll_version(dll) == "310.4.0.0"
+    assert len(parses) == 1
+
+    _new_run(monkeypatch)
+    assert updater.get_dll_version(dll) == "310.4.0.0"
+    assert len(parses) == 1
+
+
+def test_missing_file_version_is_cached(temp_db, tmp_path, parses, monkeypatch):
+    dll = tmp_path / "sl.common.dll"
+    dll.write_bytes(build_pe(None))
+
+    assert updater.get_dll_version(dll) is None
+    _new_run(monkeypatch)
+    assert updater.get_dll_version(dll) is None
+    assert len(parses) == 1
+
+
+def test_replaced_file_is_reparsed(temp_db, tmp_path, parses, monkeypatch):
+    dll = tmp_path / "nvngx_dlss.dll"
+    dll.write_bytes(build_pe("3.7.10.0"))
+    assert updater.get_dll_version(dll) == "3.7.10.0"
+
+    dll.write_bytes(build_pe("310.4.0.0", padding=4096))
+    st = dll.stat()
+    os.utime(dll, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    _new_run(monkeypatch)
+    assert updater.get_dll_version(dll) == "310.4.0.0"
+    assert len(parses) == 2
+
+    _new_run(monkeypatch)
+    assert updater.get_dll_version(dll) == "310.4.0.0"
+    assert len(parses) == 2
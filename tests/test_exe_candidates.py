@@ -0,0 +1,118 @@
+"""
+Tests for exe candidates collected by the scan walk.
+
+The scan walk notes every ``.exe`` it passes so ``exe_resolver`` can rank a
+game's executables from the DB instead of walking the game tree a second time.
+
+Verifies:
+  * the walk collects exes both from fresh listings and from the directory index
+  * candidates are assigned to the nearest game folder, minus non-game helpers
+  * resolve_game_exe ranks recorded candidates without walking the folder
+  * vanished recorded candidates fall back to the folder walk
+"""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from dlss_updater import exe_resolver, scanner
+from dlss_updater.database import db_manager
+from dlss_updater.models import Game
+from dlss_updater.scan_index import DirectoryIndex
+
+DLL_NAMES = frozenset({"nvngx_dlss.dll"})
+HOUR_AGO_NS = time.time_ns() - 3600 * 1_000_000_000
+
+
+@pytest.fixture()
+def game_dir(tmp_path):
+    game = tmp_path / "Library" / "GameA"
+    (game / "bin").mkdir(parents=True)
+    (game / "bin" / "GameA.exe").write_bytes(b"M" * 4096)
+    (game / "bin" / "nvngx_dlss.dll").write_bytes(b"MZ")
+    (game / "Tool.exe").write_bytes(b"M" * 16)
+    (game / "UnityCrashHandler64.exe").write_bytes(b"M" * 8192)
+    for d in (game / "bin", game, game.parent):
+        os.utime(d, ns=(HOUR_AGO_NS, HOUR_AGO_NS))
+    return game
+
+
+def _game(game_dir, game_id=1) -> Game:
+    now = datetime.now()
+    return Game(
+        id=game_id, name="Game A", path=str(game_dir), launcher="Steam",
+        last_scanned=now, created_at=now,
+    )
+
+
+async def _walk(root) -> DirectoryIndex:
+    dir_index = await DirectoryIndex.load()
+    scanner._parallel_scandir_walk(str(root), DLL_NAMES, dir_index=dir_index)
+    await dir_index.save()
+    return dir_index
+
+
+async def test_walk_collects_exes_fresh_and_reused(temp_db, game_dir):
+    expected = {
+        (str(game_dir / "bin" / "GameA.exe"), 4096),
+        (str(game_dir / "Tool.exe"), 16),
+        (str(game_dir / "UnityCrashHandler64.exe"), 8192),
+    }
+    first = await _walk(game_dir.parent)
+    assert set(first.exe_files) == expected
+
+    second = await _walk(game_dir.parent)
+    assert second.listed == 0
+    assert set(second.exe_files) == expected
+
+
+async def test_grouping_filters_helpers(temp_db, game_dir):
+    dir_index = await _walk(game_dir.parent)
+    grouped = scanner._group_exe_candidates(
+        dir_index.exe_files, {str(game_dir): _game(game_dir, 7)}
+    )
+    assert sorted(grouped[7]) == [
+        (str(game_dir / "Tool.exe"), 16),
+        (str(game_dir / "bin" / "GameA.exe"), 4096),
+    ]
+
+
+async def _record(game_dir):
+    dir_index = await _walk(game_dir.parent)
+    games = await db_manager.batch_upsert_games(
+        [{"name": "Game A", "path": str(game_dir), "launcher": "Steam"}]
+    )
+    await db_manager.replace_exe_candidates(
+        scanner._group_exe_candidates(dir_index.exe_files, games)
+    )
+    return games[str(game_dir)]
+
+
+async def test_resolver_uses_recorded_candidates(temp_db, game_dir, monkeypatch):
+    game = await _record(game_dir)
+
+    def _no_walk(_path):
+        raise AssertionError("game folder should not be walked")
+
+    monkeypatch.setattr(exe_resolver, "_scan_candidate_exes", _no_walk)
+    monkeypatch.setattr(exe_resolver.nvapi_drs, "is_available", lambda: False)
+
+    resolution = await exe_resolver.resolve_game_exe(game, db_manager)
+    assert resolution.exe_path == str(game_dir / "bin" / "GameA.exe")
+    assert resolution.candidates == [
+        str(game_dir / "bin" / "GameA.exe"),
+        str(game_dir / "Tool.exe"),
+    ]
+
+
+async def test_vanished_candidates_fall_back_to_walk(temp_db, game_dir, monkeypatch):
+    game = await _record(game_dir)
+    (game_dir / "bin" / "GameA.exe").unlink()
+    (game_dir / "Tool.exe").unlink()
+    (game_dir / "Game.exe").write_bytes(b"M")
+    monkeypatch.setattr(exe_resolver.nvapi_drs, "is_available", lambda: False)
+
+    resolution = exe_resolver._resolve_game_exe_sync(game, db_manager)
+    assert resolution.exe_path == str(game_dir / "Game.exe")
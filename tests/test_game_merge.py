@@ -0,0 +1,49 @@
+"""
+Tests for ``_merge_nested_game_dirs``, the per-launcher merge of game folders
+found inside another game's folder.
+
+Verifies:
+  * nested folders (at any depth) merge into the outermost game, DLLs included
+  * siblings sharing a name prefix ("Game" / "Game 2") stay separate
+  * the comparison ignores case
+"""
+
+import os
+
+from dlss_updater.scanner import _merge_nested_game_dirs
+
+
+def _p(*parts: str) -> str:
+    return os.path.join(os.sep, "games", *parts)
+
+
+def test_nested_dirs_merge_into_outermost_game():
+    games = {
+        _p("Game", "bin", "x64"): ["c"],
+        _p("Game"): ["a"],
+        _p("Game", "bin"): ["b"],
+        _p("Other"): ["d"],
+    }
+
+    assert _merge_nested_game_dirs(games) == 2
+    assert sorted(games) == [_p("Game"), _p("Other")]
+    assert sorted(games[_p("Game")]) == ["a", "b", "c"]
+
+
+def test_name_prefix_siblings_stay_separate():
+    games = {
+        _p("Game"): ["a"],
+        _p("Game 2"): ["b"],
+        _p("Game 2", "sub"): ["c"],
+        _p("Game", "sub"): ["d"],
+    }
+
+    assert _merge_nested_game_dirs(games) == 2
+    assert games == {_p("Game"): ["a", "d"], _p("Game 2"): ["b", "c"]}
+
+
+def test_merge_ignores_case():
+    games = {_p("Game"): ["a"], _p("GAME", "Plugins"): ["b"]}
+
+    assert _merge_nested_game_dirs(games) == 1
+    assert games == {_p("Game"): ["a", "b"]}
@@ -0,0 +1,93 @@
+"""
+Tests for the persistent find_game_root probe cache.
+
+A directory's game-root indicator count is reused for as long as the
+directory's (mtime_ns, inode) are unchanged, within a run and across runs.
+
+Verifies:
+  * an unchanged directory is answered without globbing it again
+  * a changed directory is probed again
+  * probes survive a restart through save/load_game_root_probes
+  * probes of directories modified inside the racy window are not kept
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from dlss_updater import utils
+
+HOUR_AGO_NS = time.time_ns() - 3600 * 1_000_000_000
+
+
+def _age(path: Path, ns: int = HOUR_AGO_NS) -> None:
+    os.utime(path, ns=(ns, ns))
+
+
+@pytest.fixture()
+def probe_cache(monkeypatch):
+    """Empty, not-yet-loaded probe cache; counts glob() calls per directory."""
+    monkeypatch.setattr(utils, "_game_root_probe_cache", {})
+    monkeypatch.setattr(utils, "_game_root_probe_dirty", {})
+    monkeypatch.setattr(utils, "_game_root_probe_evicted", set())
+    monkeypatch.setattr(utils, "_game_root_probes_loaded", False)
+
+    globbed = []
+    real_glob = Path.glob
+
+    def _counting_glob(self, pattern, *args, **kwargs):
+        globbed.append(str(self))
+        return real_glob(self, pattern, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "glob", _counting_glob)
+    return globbed
+
+
+@pytest.fixture()
+def game(tmp_path):
+    root = tmp_path / "Game"
+    (root / "bin").mkdir(parents=True)
+    (root / "game.exe").write_bytes(b"MZ")
+    _age(root)
+    return root
+
+
+def test_unchanged_directory_is_not_probed_again(game, probe_cache):
+    assert utils._game_root_indicator_count(game) == 2
+    assert utils._game_root_indicator_count(game) == 2
+    assert probe_cache == [str(game)]
+
+
+def test_changed_directory_is_probed_again(game, probe_cache):
+    assert utils._game_root_indicator_count(game) == 2
+
+    (game / "Engine").mkdir()
+    _age(game, HOUR_AGO_NS + 1_000)
+
+    assert utils._game_root_indicator_count(game) == 3
+    assert probe_cache == [str(game), str(game)]
+
+
+async def test_probes_persist_across_runs(temp_db, game, probe_cache, monkeypatch):
+    await utils.load_game_root_probes()
+    assert utils._game_root_indicator_count(game) == 2
+    await utils.save_game_root_probes()
+
+    # Restart: empty in-memory cache, load again from the database
+    monkeypatch.setattr(utils, "_game_root_probe_cache", {})
+    monkeypatch.setattr(utils, "_game_root_probes_loaded", False)
+    await utils.load_game_root_probes()
+
+    assert utils._game_root_indicator_count(game) == 2
+    assert probe_cache == [str(game)]
+
+
+def test_racy_directory_is_not_kept(tmp_path, probe_cache):
+    fresh = tmp_path / "Fresh"
+    (fresh / "Data").mkdir(parents=True)
+
+    assert utils._game_root_indicator_count(fresh) == 1
+    assert utils._game_root_indicator_count(fresh) == 1
+    assert probe_cache == [str(fresh), str(fresh)]
@@ -0,0 +1,238 @@
+"""
+Tests for the background library watcher.
+
+Verifies:
+  * a new folder under a library root is recorded as a game with its DLLs
+  * the polling fallback notices a DLL added to or removed from a recorded
+    game and a new folder under a polled root, and the refresh records it
+  * with inotify, a burst of events in a game folder is debounced into one
+    targeted refresh, and a new game folder is picked up from the root watch
+  * games whose directories do not fit in the watch budget are polled
+  * the directory index is loaded once and kept between poll ticks, and a
+    sync with nothing changed places no new watches
+"""
+
+import os
+import time
+
+import anyio
+import pytest
+
+from dlss_updater import library_watcher, scanner
+from dlss_updater.scan_index import DirectoryIndex
+from dlss_updater.config import config_manager
+from dlss_updater.database import db_manager
+from dlss_updater.library_watcher import LibraryWatcher
+from tests.pe_builder import build_pe
+
+
+async def _not_whitelisted(dll_paths, _launcher):
+    return list(dll_paths)
+
+
+@pytest.fixture()
+def library(tmp_path, temp_db, monkeypatch):
+    """One custom-folder library root with whitelisting and app IDs stubbed."""
+    root = tmp_path / "lib"
+    root.mkdir()
+
+    async def _roots():
+        return {str(root): "Custom Folder 1"}
+
+    monkeypatch.setattr(library_watcher, "_library_roots", _roots)
+    monkeypatch.setattr(scanner, "_filter_whitelisted", _not_whitelisted)
+    monkeypatch.setattr(config_manager, "get_update_preference", lambda tech: tech == "DLSS")
+    return root
+
+
+def _dll(path, version="3.7.10.0"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(build_pe(file_version=version))
+    return str(path)
+
+
+async def _recorded() -> dict[str, list[str]]:
+    return {path: sorted(dlls) for path, (_launcher, dlls) in (await db_manager.get_game_dll_paths()).items()}
+
+
+async def _drain(watcher: LibraryWatcher) -> bool:
+    """Apply everything queued, ignoring the debounce."""
+    items = [(path, kind, launcher) for path, (_due, kind, launcher) in watcher._pending.items()]
+    watcher._pending.clear()
+    return await watcher.apply(items)
+
+
+async def test_new_folder_is_recorded(library):
+    dll = _dll(library / "Alpha" / "bin" / "nvngx_dlss.dll", "3.8.1.0")
+    watcher = LibraryWatcher()
+    watcher._dll_names_lower = frozenset({"nvngx_dlss.dll", "nvngx_dlssg.dll"})
+
+    assert await watcher.apply([(str(library / "Alpha"), 'new', "Custom Folder 1")])
+
+    recorded = await _recorded()
+    assert [dll] in recorded.values()
+    assert (await db_manager.get_game_dll_by_path(dll)).current_version == "3.8.1.0"
+
+
+async def test_poll_fallback_tracks_dll_changes(library):
+    dlss = _dll(library / "Alpha" / "nvngx_dlss.dll")
+    watcher = LibraryWatcher(use_inotify=False)
+    watcher._dll_names_lower = frozenset({"nvngx_dlss.dll", "nvngx_dlssg.dll"})
+    await watcher.apply([(str(library / "Alpha"), 'new', "Custom Folder 1")])
+
+    await watcher.sync()
+    assert watcher.polled_games == {str(library / "Alpha")}
+    await watcher.poll()
+    assert not watcher._pending  # baseline matches what is recorded
+
+    frame_gen = _dll(library / "Alpha" / "nvngx_dlssg.dll")
+    await watcher.poll()
+    assert list(watcher._pending) == [str(library / "Alpha")]
+    assert await _drain(watcher)
+    assert await _recorded() == {str(library / "Alpha"): sorted([dlss, frame_gen])}
+
+    (library / "Alpha" / "nvngx_dlss.dll").unlink()
+    await watcher.poll()
+    assert await _drain(watcher)
+    assert await _recorded() == {str(library / "Alpha"): [frame_gen]}
+
+    beta = _dll(library / "Beta" / "nvngx_dlss.dll")
+    await watcher.poll()
+    assert watcher._pending[str(library / "Beta")][1] == 'new'
+    await _drain(watcher)
+    assert (await _recorded())[str(library / "Beta")] == [beta]
+
+
+async def test_inotify_events_are_debounced(library, monkeypatch):
+    if library_watcher._Inotify.open() is None:
+        pytest.skip("inotify unavailable")
+
+    _dll(library / "Alpha" / "nvngx_dlss.dll")
+    changed = anyio.Event()
+    applied = []
+
+    async def _on_change():
+        changed.set()
+
+    watcher = LibraryWatcher(_on_change, debounce=0.3, poll_interval=3600)
+    watcher._dll_names_lower = frozenset({"nvngx_dlss.dll", "nvngx_dlssg.dll"})
+    await watcher.apply([(str(library / "Alpha"), 'new', "Custom Folder 1")])
+
+    apply = watcher.apply
+
+    async def _apply(items):
+        applied.append(sorted(path for path, _kind, _launcher in items))
+        return await apply(items)
+
+    monkeypatch.setattr(watcher, "apply", _apply)
+
+    with anyio.fail_after(10):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(watcher.run)
+            while watcher.watch_count < 2:  # the root and Alpha
+                await anyio.sleep(0.01)
+
+            frame_gen = _dll(library / "Alpha" / "nvngx_dlssg.dll")
+            _dll(library / "Alpha" / "nvngx_dlssg.dll", "3.8.1.0")  # rewritten in the burst
+            await changed.wait()
+            assert applied == [[str(library / "Alpha")]]
+            assert (await db_manager.get_game_dll_by_path(frame_gen)).current_version == "3.8.1.0"
+
+            changed = anyio.Event()
+            beta = _dll(library / "Beta" / "nvngx_dlss.dll")
+            await changed.wait()
+            tg.cancel_scope.cancel()
+
+    assert (await _recorded())[str(library / "Beta")] == [beta]
+    assert watcher.watch_count == 0
+
+
+async def test_games_over_budget_are_polled(library):
+    inotify = library_watcher._Inotify.open()
+    if inotify is None:
+        pytest.skip("inotify unavailable")
+
+    _dll(library / "Alpha" / "nvngx_dlss.dll")
+    _dll(library / "Beta" / "nvngx_dlss.dll")
+    watcher = LibraryWatcher(watch_budget=2)
+    watcher._dll_names_lower = frozenset({"nvngx_dlss.dll"})
+    await watcher.apply([
+        (str(library / "Alpha"), 'new', "Custom Folder 1"),
+        (str(library / "Beta"), 'new', "Custom Folder 1"),
+    ])
+
+    watcher._inotify = inotify
+    try:
+        await watcher.sync()
+    finally:
+        inotify.close()
+
+    # The root takes one watch, Alpha the other; Beta falls back to polling
+    assert watcher.watch_count == 2
+    assert watcher.polled_games == {str(library / "Beta")}
+
+
+async def test_poll_keeps_directory_index(library, monkeypatch):
+    _dll(library / "Alpha" / "nvngx_dlss.dll")
+    os.utime(library / "Alpha", (time.time() - 60,) * 2)  # outside the racy-mtime window
+    watcher = LibraryWatcher(use_inotify=False)
+    watcher._dll_names_lower = frozenset({"nvngx_dlss.dll"})
+    await watcher.apply([(str(library / "Alpha"), 'new', "Custom Folder 1")])
+    await watcher.sync()
+
+    loads = []
+    load = DirectoryIndex.load
+
+    async def _load():
+        loads.append(1)
+        return await load()
+
+    monkeypatch.setattr(DirectoryIndex, "load", _load)
+    await watcher.poll()
+    listed = []
+    record = DirectoryIndex.record
+
+    def _record(self, path, *args, **kwargs):
+        listed.append(path)
+        return record(self, path, *args, **kwargs)
+
+    monkeypatch.setattr(DirectoryIndex, "record", _record)
+    await watcher.poll()
+    assert len(loads) == 1
+    assert listed == []  # the second tick reused what the first one listed
+
+
+async def test_sync_keeps_placed_watches(library):
+    inotify = library_watcher._Inotify.open()
+    if inotify is None:
+        pytest.skip("inotify unavailable")
+
+    _dll(library / "Alpha" / "nvngx_dlss.dll")
+    watcher = LibraryWatcher()
+    watcher._dll_names_lower = frozenset({"nvngx_dlss.dll"})
+    await watcher.apply([(str(library / "Alpha"), 'new', "Custom Folder 1")])
+
+    added = []
+    add_watch = inotify.add_watch
+
+    def _add_watch(path, mask):
+        added.append(path)
+        return add_watch(path, mask)
+
+    inotify.add_watch = _add_watch
+    watcher._inotify = inotify
+    try:
+        await watcher.sync()
+        assert sorted(added) == sorted([str(library), str(library / "Alpha")])
+
+        added.clear()
+        await watcher.sync()
+        assert added == []
+
+        _dll(library / "Beta" / "nvngx_dlss.dll")
+        await watcher.apply([(str(library / "Beta"), 'new', "Custom Folder 1")])
+        await watcher.sync()
+        assert added == [str(library / "Beta")]
+        assert watcher.watch_count == 3
+    finally:
+        inotify.close()
@@ -0,0 +1,98 @@
+"""
+Tests for the work-sharing directory walk in ``_parallel_scandir_walk``.
+
+Verifies:
+  * every DLL of a deep, skewed tree is found exactly once, whatever the
+    worker count
+  * a directory that fails to list is skipped without stalling the walk
+  * a directory denied by permissions is noted for the scan's skipped paths
+  * once the scan's cancel event is set, no further directory is listed
+"""
+
+import threading
+
+import pytest
+
+from dlss_updater import scanner
+
+DLL_NAMES = frozenset({"nvngx_dlss.dll"})
+
+
+@pytest.fixture()
+def skewed_tree(tmp_path):
+    expected = []
+    for i in range(6):
+        for j in range(6):
+            leaf = tmp_path / "Huge" / f"d{i}" / f"e{j}" / "bin"
+            leaf.mkdir(parents=True)
+            (leaf / "nvngx_dlss.dll").touch()
+            expected.append(str(leaf / "nvngx_dlss.dll"))
+    small = tmp_path / "Small"
+    small.mkdir()
+    (small / "nvngx_dlss.dll").touch()
+    expected.append(str(small / "nvngx_dlss.dll"))
+    return tmp_path, sorted(expected)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 8])
+def test_finds_every_dll_once(skewed_tree, workers):
+    root, expected = skewed_tree
+    found = scanner._parallel_scandir_walk(str(root), DLL_NAMES, max_workers=workers)
+    assert sorted(found) == expected
+
+
+def test_failed_listing_is_skipped(skewed_tree, monkeypatch):
+    root, expected = skewed_tree
+    broken = str(root / "Huge" / "d0")
+    list_directory = scanner._list_directory
+
+    def _list_directory(directory, *args, **kwargs):
+        if directory == broken:
+            raise RuntimeError("boom")
+        return list_directory(directory, *args, **kwargs)
+
+    monkeypatch.setattr(scanner, "_list_directory", _list_directory)
+    found = scanner._parallel_scandir_walk(str(root), DLL_NAMES, max_workers=4)
+    assert sorted(found) == [path for path in expected if not path.startswith(broken)]
+
+
+def test_permission_denied_is_noted(skewed_tree, monkeypatch):
+    root, expected = skewed_tree
+    denied = str(root / "Huge" / "d1")
+    list_directory = scanner._list_directory
+
+    def _list_directory(directory, *args, **kwargs):
+        if directory == denied:
+            raise PermissionError(13, "Permission denied", directory)
+        return list_directory(directory, *args, **kwargs)
+
+    monkeypatch.setattr(scanner, "_list_directory", _list_directory)
+    scanner._take_skipped_paths()
+    found = scanner._parallel_scandir_walk(str(root), DLL_NAMES, max_workers=4)
+
+    assert sorted(found) == [path for path in expected if not path.startswith(denied)]
+    assert scanner._take_skipped_paths() == [{'path': denied, 'reason': "Permission denied"}]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_cancel_stops_listing(skewed_tree, monkeypatch, workers):
+    root, _expected = skewed_tree
+    cancel_event = threading.Event()
+    listed = []
+    list_directory = scanner._list_directory
+
+    def _list_directory(directory, *args, **kwargs):
+        listed.append(directory)
+        if len(listed) == 3:
+            cancel_event.set()
+        return list_directory(directory, *args, **kwargs)
+
+    monkeypatch.setattr(scanner, "_list_directory", _list_directory)
+    scanner._parallel_scandir_walk(str(root), DLL_NAMES, workers, cancel_event=cancel_event)
+
+    # Workers already listing when the event was set finish that directory
+    assert 3 <= len(listed) < 3 + workers
+
+    listed.clear()
+    assert scanner._parallel_scandir_walk(str(root), DLL_NAMES, workers, cancel_event=cancel_event) == []
+    assert listed == []
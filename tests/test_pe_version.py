@@ -0,0 +1,77 @@
+"""
+Tests for the lightweight VS_VERSIONINFO reader (dlss_updater.pe_version).
+
+The reader must return exactly the FileVersion string pefile finds, reject
+anything malformed with PEVersionError (so get_dll_version can fall back to
+pefile), and treat a PE without a version resource as "no version".
+"""
+
+import struct
+
+import pytest
+
+from dlss_updater import pe_version, updater
+from dlss_updater.pe_version import PEVersionError, read_version_info
+from tests.pe_builder import build_pe
+
+
+@pytest.mark.parametrize("file_version", ["310.4.0.0", "3, 7, 10, 0", "1.0.0.0 (release)", ""])
+def test_matches_pefile(tmp_path, file_version):
+    dll = tmp_path / "nvngx_dlss.dll"
+    dll.write_bytes(build_pe(file_version, fixed=(310, 4, 0, 0)))
+
+    info = read_version_info(dll)
+    assert info.file_version == file_version
+    assert info.file_version == updater._read_file_version_pefile(str(dll))
+    assert info.fixed_file_version == (310, 4, 0, 0)
+
+
+def test_missing_string_table(tmp_path):
+    dll = tmp_path / "sl.common.dll"
+    dll.write_bytes(build_pe(None, fixed=(2, 7, 1, 0)))
+
+    info = read_version_info(dll)
+    assert info.file_version is None
+    assert info.fixed_file_version == (2, 7, 1, 0)
+
+
+def test_no_resource_directory(tmp_path):
+    data = bytearray(build_pe("1.0.0.0"))
+    pe_offset = struct.unpack_from("<I", data, 0x3C)[0]
+    rsrc_entry = pe_offset + 24 + 112 + 2 * 8
+    struct.pack_into("<II", data, rsrc_entry, 0, 0)
+    dll = tmp_path / "plain.dll"
+    dll.write_bytes(bytes(data))
+
+    assert read_version_info(dll) == pe_version.PEVersionInfo()
+
+
+@pytest.mark.parametrize("corrupt", ["not_pe", "bad_signature", "rva_outside", "truncated"])
+def test_malformed_raises(tmp_path, corrupt):
+    data = bytearray(build_pe("1.0.0.0"))
+    pe_offset = struct.unpack_from("<I", data, 0x3C)[0]
+    if corrupt == "not_pe":
+        data = bytearray(b"just some bytes")
+    elif corrupt == "bad_signature":
+        data[pe_offset:pe_offset + 4] = b"NE\0\0"
+    elif corrupt == "rva_outside":
+        struct.pack_into("<I", data, pe_offset + 24 + 112 + 2 * 8, 0x900000)
+    else:
+        data = data[:0x200 + 40]
+    dll = tmp_path / "broken.dll"
+    dll.write_bytes(bytes(data))
+
+    with pytest.raises(PEVersionError):
+        read_version_info(dll)
+
+
+def test_get_dll_version_falls_back_to_pefile(temp_db, tmp_path, monkeypatch):
+    dll = tmp_path / "nvngx_dlss.dll"
+    dll.write_bytes(build_pe("310,4,0,0"))
+
+    def _reject(_path):
+        raise PEVersionError("forced")
+
+    monkeypatch.setattr(pe_version, "read_version_info", _reject)
+    monkeypatch.setattr(updater, "_dll_version_cache", {})
+    assert updater.get_dll_version(dll) == "310.4.0.0"
@@ -0,0 +1,103 @@
+"""
+Tests for scanning games inside Proton and Wine prefixes.
+
+Verifies:
+  * get_proton_prefixes reuses its recorded list while compatdata is unchanged
+    and lists again once an app directory is added
+  * prefix game directories that resolve into a native Steam library, or
+    repeat another one through a symlink, are dropped
+  * scan_prefix_games walks the remaining directories for DLLs
+  * find_game_root stops at the game's folder inside drive_c
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from dlss_updater import linux_paths, scanner, whitelist
+from dlss_updater.utils import find_game_root
+
+HOUR_AGO_NS = time.time_ns() - 3600 * 1_000_000_000
+
+
+def _prefix(compatdata: Path, app_id: str) -> Path:
+    drive_c = compatdata / app_id / "pfx" / "drive_c"
+    drive_c.mkdir(parents=True)
+    return drive_c
+
+
+def _age(path: Path, ns: int = HOUR_AGO_NS) -> None:
+    os.utime(path, ns=(ns, ns))
+
+
+async def test_prefix_list_cached_per_compatdata_mtime(tmp_path, temp_db):
+    compatdata = tmp_path / "steamapps" / "compatdata"
+    first = _prefix(compatdata, "100")
+    (compatdata / "200").mkdir()  # no prefix yet
+    _age(compatdata)
+
+    assert await linux_paths.get_proton_prefixes(tmp_path) == [first]
+
+    # A prefix created inside an existing app dir leaves compatdata's mtime
+    # alone, so the recorded list is served
+    _prefix(compatdata, "200")
+    assert await linux_paths.get_proton_prefixes(tmp_path) == [first]
+
+    # A new app dir changes compatdata's mtime: listed again
+    third = _prefix(compatdata, "300")
+    _age(compatdata, HOUR_AGO_NS + 1_000_000_000)
+    prefixes = await linux_paths.get_proton_prefixes(tmp_path)
+    assert sorted(prefixes) == sorted([first, compatdata / "200" / "pfx" / "drive_c", third])
+
+
+@pytest.fixture()
+def prefixes(tmp_path, temp_db, monkeypatch):
+    steam = tmp_path / "Steam"
+    library = steam / "steamapps" / "common"
+    (library / "NativeGame").mkdir(parents=True)
+    (library / "NativeGame" / "nvngx_dlss.dll").touch()
+
+    program_files = _prefix(steam / "steamapps" / "compatdata", "100") / "Program Files"
+    (program_files / "PrefixGame" / "bin").mkdir(parents=True)
+    (program_files / "PrefixGame" / "bin" / "nvngx_dlss.dll").touch()
+    (program_files / "SteamLink").symlink_to(library / "NativeGame")
+    (program_files / "PrefixGameAgain").symlink_to(program_files / "PrefixGame")
+
+    async def _steam_path():
+        return steam
+
+    async def _libraries(_steam_path):
+        return [library]
+
+    async def _no_wine_prefixes():
+        return []
+
+    async def _nothing_whitelisted(dll_paths):
+        return {path: False for path in dll_paths}
+
+    monkeypatch.setattr(scanner, "IS_LINUX", True)
+    monkeypatch.setattr(linux_paths, "get_linux_steam_path", _steam_path)
+    monkeypatch.setattr(linux_paths, "get_linux_steam_libraries", _libraries)
+    monkeypatch.setattr(linux_paths, "get_wine_prefixes", _no_wine_prefixes)
+    monkeypatch.setattr(whitelist, "check_whitelist_batch", _nothing_whitelisted)
+    return program_files
+
+
+async def test_prefix_games_deduplicated(prefixes):
+    assert await scanner.get_prefix_game_dirs() == [str(prefixes / "PrefixGame")]
+
+
+async def test_prefix_games_scanned(prefixes):
+    found = await scanner.scan_prefix_games(["nvngx_dlss.dll"])
+    assert found == [str(prefixes / "PrefixGame" / "bin" / "nvngx_dlss.dll")]
+
+
+def test_game_root_stays_inside_prefix():
+    drive_c = Path("/home/u/compatdata/100/pfx/drive_c")
+    dll = drive_c / "Program Files" / "Publisher" / "Game" / "nvngx_dlss.dll"
+    assert find_game_root(dll, scanner.PREFIX_LAUNCHER) == drive_c / "Program Files" / "Publisher"
+
+    dll = drive_c / "users" / "steamuser" / "Desktop" / "Game" / "bin" / "nvngx_dlss.dll"
+    assert find_game_root(dll, scanner.PREFIX_LAUNCHER) == drive_c / "users" / "steamuser" / "Desktop" / "Game"
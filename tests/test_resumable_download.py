@@ -0,0 +1,127 @@
+"""
+Tests for resuming interrupted DLL downloads.
+
+Verifies:
+  * a dropped connection keeps the partial file, and the next attempt asks
+    for the rest with Range + If-Range and verifies the whole file
+  * a server that ignores ranges (or whose file changed) answers with the
+    whole file, which replaces the partial
+  * an unsatisfiable range starts the download over
+"""
+
+import hashlib
+
+import anyio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from dlss_updater import dll_repository
+
+BODY = bytes(range(256)) * 4096  # 1 MiB
+ETAG = '"abc123"'
+
+
+class _Remote:
+    """Serves BODY with ETAG; ``drop_after`` cuts the next answer short."""
+
+    def __init__(self):
+        self.drop_after: int | None = None
+        self.ranges = True
+        self.status: int | None = None
+        self.requests: list[tuple[str | None, str | None]] = []
+
+    async def handle(self, request):
+        self.requests.append((request.headers.get("Range"), request.headers.get("If-Range")))
+        if self.status is not None:
+            status, self.status = self.status, None
+            return web.Response(status=status)
+
+        start, status = 0, 200
+        range_header = request.headers.get("Range")
+        if self.ranges and range_header and request.headers.get("If-Range") == ETAG:
+            start, status = int(range_header.removeprefix("bytes=").rstrip("-")), 206
+        headers = {"ETag": ETAG, "Content-Length": str(len(BODY) - start)}
+        if status == 206:
+            headers["Content-Range"] = f"bytes {start}-{len(BODY) - 1}/{len(BODY)}"
+
+        response = web.StreamResponse(status=status, headers=headers)
+        await response.prepare(request)
+        if self.drop_after is not None:
+            # Paced like a real link, so the client consumes what arrived
+            # before the connection drops
+            end = start + self.drop_after
+            for offset in range(start, end, 65536):
+                await response.write(BODY[offset:min(offset + 65536, end)])
+                await anyio.sleep(0.01)
+            self.drop_after = None
+            request.transport.close()
+            return response
+        await response.write(BODY[start:])
+        await response.write_eof()
+        return response
+
+
+@pytest.fixture()
+async def remote(temp_db, tmp_path, monkeypatch):
+    remote = _Remote()
+    app = web.Application()
+    app.router.add_get("/dlls/{name}", remote.handle)
+    server = TestServer(app)
+    await server.start_server()
+
+    cache_dir = tmp_path / "dll_cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(dll_repository, "_http_session", None)
+    monkeypatch.setattr(dll_repository, "GITHUB_RAW_BASE", str(server.make_url("")).rstrip("/"))
+    monkeypatch.setattr(dll_repository, "LOCAL_DLL_CACHE_DIR", str(cache_dir))
+    try:
+        yield remote, cache_dir
+    finally:
+        await dll_repository.close_http_session()
+        await server.close()
+
+
+MANIFEST = {"libxess.dll": {"version": "2.0.1.41", "sha256": hashlib.sha256(BODY).hexdigest()}}
+
+
+async def _download() -> bool:
+    return await dll_repository.download_latest_dll_async("libxess.dll", MANIFEST)
+
+
+async def test_dropped_download_resumes(remote):
+    server, cache_dir = remote
+    server.drop_after = 300_000
+
+    assert not await _download()
+    partial = cache_dir / "libxess.dll.tmp"
+    kept = partial.stat().st_size
+    assert 0 < kept <= 300_000
+
+    assert await _download()
+    assert server.requests == [(None, None), (f"bytes={kept}-", ETAG)]
+    assert (cache_dir / "libxess.dll").read_bytes() == BODY
+    assert not partial.exists()
+    assert not list(cache_dir.glob("*.validators.json"))
+
+
+async def test_ignored_range_falls_back_to_full_download(remote):
+    server, cache_dir = remote
+    server.drop_after = 300_000
+    await _download()
+
+    server.ranges = False
+    assert await _download()
+    assert server.requests[1][0] is not None
+    assert (cache_dir / "libxess.dll").read_bytes() == BODY
+
+
+async def test_unsatisfiable_range_starts_over(remote):
+    server, cache_dir = remote
+    server.drop_after = 300_000
+    await _download()
+
+    server.status = 416
+    assert await _download()
+    assert server.requests[2] == (None, None)
+    assert (cache_dir / "libxess.dll").read_bytes() == BODY
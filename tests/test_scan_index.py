@@ -0,0 +1,129 @@
+"""
+Tests for the persistent directory index used by incremental rescans.
+
+A directory whose (mtime_ns, inode) still match the recorded listing must be
+answered from the index without an os.scandir() call, while any directory that
+changed - a DLL dropped in, a subdirectory removed - must be re-listed so the
+scan never misses or invents a hit.
+
+Verifies:
+  * a second walk over an unchanged tree performs no os.scandir() calls
+  * adding a DLL re-lists only the directory it was added to, and is found
+  * removed directories are pruned from the index on save
+  * prune=False keeps directories the scan did not reach
+  * listings taken inside the racy window are not recorded
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from dlss_updater import scanner
+from dlss_updater.database import db_manager
+from dlss_updater.scan_index import DirectoryIndex
+
+DLL_NAMES = frozenset({"nvngx_dlss.dll", "nvngx_dlssg.dll"})
+HOUR_AGO_NS = time.time_ns() - 3600 * 1_000_000_000
+
+
+def _age(path: Path, ns: int = HOUR_AGO_NS) -> None:
+    """Backdate a directory's mtime so its listing is outside the racy window."""
+    os.utime(path, ns=(ns, ns))
+
+
+def _age_tree(root: Path) -> None:
+    _age(root)
+    for dirpath, dirnames, _ in os.walk(root):
+        for d in dirnames:
+            _age(Path(dirpath) / d)
+
+
+@pytest.fixture()
+def game_tree(tmp_path):
+    root = tmp_path / "Library"
+    (root / "GameA" / "bin").mkdir(parents=True)
+    (root / "GameA" / "bin" / "nvngx_dlss.dll").write_bytes(b"MZ")
+    (root / "GameB" / "data" / "levels").mkdir(parents=True)
+    (root / "GameB" / "data" / "readme.txt").write_text("x")
+    _age_tree(root)
+    return root
+
+
+@pytest.fixture()
+def count_scandir(monkeypatch):
+    calls = []
+    real_scandir = os.scandir
+
+    def _counting_scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(scanner.os, "scandir", _counting_scandir)
+    return calls
+
+
+async def _walk(root: Path, prune: bool = True) -> tuple[list[str], DirectoryIndex]:
+    dir_index = await DirectoryIndex.load()
+    found = scanner._parallel_scandir_walk(str(root), DLL_NAMES, dir_index=dir_index)
+    await dir_index.save(prune=prune)
+    return sorted(found), dir_index
+
+
+async def test_unchanged_tree_is_not_relisted(temp_db, game_tree, count_scandir):
+    first, index1 = await _walk(game_tree)
+    assert first == [str(game_tree / "GameA" / "bin" / "nvngx_dlss.dll")]
+    assert index1.reused == 0
+    listed = len(count_scandir)
+    assert listed == index1.listed > 0
+
+    count_scandir.clear()
+    second, index2 = await _walk(game_tree)
+    assert second == first
+    assert count_scandir == []
+    assert index2.reused == listed
+
+
+async def test_new_dll_relists_only_its_directory(temp_db, game_tree, count_scandir):
+    await _walk(game_tree)
+
+    levels = game_tree / "GameB" / "data" / "levels"
+    (levels / "nvngx_dlssg.dll").write_bytes(b"MZ")
+    _age(levels, HOUR_AGO_NS + 1_000_000_000)
+
+    count_scandir.clear()
+    found, _ = await _walk(game_tree)
+    assert str(levels / "nvngx_dlssg.dll") in found
+    assert count_scandir == [str(levels)]
+
+
+async def test_removed_directory_is_pruned(temp_db, game_tree):
+    await _walk(game_tree)
+    bin_dir = str(game_tree / "GameA" / "bin")
+    assert bin_dir in await db_manager.load_scan_dir_index()
+
+    (game_tree / "GameA" / "bin" / "nvngx_dlss.dll").unlink()
+    (game_tree / "GameA" / "bin").rmdir()
+    _age(game_tree / "GameA", HOUR_AGO_NS + 1_000_000_000)
+
+    found, _ = await _walk(game_tree)
+    assert found == []
+    assert bin_dir not in await db_manager.load_scan_dir_index()
+
+
+async def test_partial_scan_does_not_prune(temp_db, game_tree):
+    await _walk(game_tree)
+    await _walk(game_tree / "GameA", prune=False)
+    assert str(game_tree / "GameB" / "data") in await db_manager.load_scan_dir_index()
+
+
+async def test_racy_listing_is_not_recorded(temp_db, game_tree):
+    fresh = game_tree / "GameC"
+    fresh.mkdir()
+    _age(game_tree)
+
+    await _walk(game_tree)
+    recorded = await db_manager.load_scan_dir_index()
+    assert str(game_tree) in recorded
+    assert str(fresh) not in recorded
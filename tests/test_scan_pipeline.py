@@ -0,0 +1,255 @@
+"""
+Tests for the streaming record pipeline in ``find_all_dlls``.
+
+Launcher results are grouped, resolved, version-scanned and written to the
+database as each launcher finishes instead of after all of them.
+
+Verifies:
+  * every game and DLL a launcher reports is recorded, with its version
+  * a DLL reported by two launchers belongs to the higher-priority one, even
+    when the lower-priority launcher finishes (and is recorded) first
+  * a game left without DLLs by that re-claim is removed again
+  * the returned per-launcher lists are de-duplicated in priority order
+  * a DLL reached through a symlinked folder by a second launcher is one
+    file: recorded and returned once, under the higher-priority launcher
+  * paths the walk skipped are returned as '_skipped_paths' on Linux without
+    enumerating the Linux libraries again
+  * a cancelled scan stops promptly and keeps what finished checkpointed
+  * the next scan resumes: checkpointed launchers are not walked again and
+    checkpointed games skip app ID resolution; completing clears the checkpoint
+  * games are recorded without waiting for the store search, which runs in
+    the background resolver and then replaces the FTS5 guess
+"""
+
+import anyio
+import pytest
+
+from dlss_updater import linux_paths, reresolution, scan_session, scanner, steam_integration
+from dlss_updater.config import config_manager
+from dlss_updater.database import db_manager
+from tests.pe_builder import build_pe
+
+
+async def _none(*_args, **_kwargs):
+    return None
+
+
+async def _empty(*_args, **_kwargs):
+    return []
+
+
+@pytest.fixture()
+def launchers(temp_db, monkeypatch):
+    """Stub every launcher; ``reports[name] = (delay, dlls)`` feeds find_dlls."""
+    reports: dict[str, tuple[float, list[str]]] = {}
+
+    for getter in ("get_ea_games", "get_ubisoft_games", "get_epic_games",
+                   "get_gog_games", "get_battlenet_games", "get_xbox_games"):
+        monkeypatch.setattr(scanner, getter, _empty)
+    monkeypatch.setattr(scanner, "scan_prefix_games", _empty)
+    monkeypatch.setattr(scanner, "get_steam_install_path", lambda: None)
+    monkeypatch.setattr(scanner, "get_ubisoft_install_path", lambda: None)
+
+    async def _custom_folder(folder_num):
+        return [f"folder{folder_num}"] if f"Custom Folder {folder_num}" in reports else []
+
+    async def _find_dlls(_paths, launcher_name, _dll_names, _dir_index=None, _cancel_event=None):
+        delay, dlls = reports[launcher_name]
+        await anyio.sleep(delay)
+        return list(dlls)
+
+    monkeypatch.setattr(scanner, "get_custom_folder", _custom_folder)
+    monkeypatch.setattr(scanner, "find_dlls", _find_dlls)
+
+    monkeypatch.setattr(config_manager, "get_update_preference", lambda tech: tech == "DLSS")
+    monkeypatch.setattr(config_manager, "has_steam_api_credentials", lambda: False)
+    monkeypatch.setattr(steam_integration, "find_app_id_via_store_search", _none)
+    monkeypatch.setattr(steam_integration, "find_steam_app_id_by_name", _none)
+    monkeypatch.setattr(reresolution, "app_id_resolver", reresolution.AppIdResolver())
+    return reports
+
+
+def _dll(path, version="3.7.10.0"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(build_pe(file_version=version))
+    return str(path)
+
+
+async def _recorded() -> dict[str, list[str]]:
+    """game path -> sorted DLL paths recorded for it"""
+    games = await db_manager.get_all_games_by_launcher()
+    recorded = {}
+    for launcher_games in games.values():
+        for game in launcher_games:
+            dlls = await db_manager.get_dlls_for_game(game.id)
+            recorded[game.path] = sorted(dll.dll_path for dll in dlls)
+    return recorded
+
+
+async def test_records_games_and_versions(tmp_path, launchers):
+    alpha = _dll(tmp_path / "Alpha" / "nvngx_dlss.dll", "3.7.10.0")
+    beta = _dll(tmp_path / "Beta" / "nvngx_dlss.dll", "3.8.1.0")
+    launchers["Custom Folder 1"] = (0, [alpha, beta])
+
+    result = await scanner.find_all_dlls()
+
+    assert result["Custom Folder 1"] == [alpha, beta]
+    assert await _recorded() == {
+        str(tmp_path / "Alpha"): [alpha],
+        str(tmp_path / "Beta"): [beta],
+    }
+    dll = await db_manager.get_game_dll_by_path(beta)
+    assert dll.current_version == "3.8.1.0"
+
+
+async def test_higher_priority_launcher_reclaims_dll(tmp_path, launchers):
+    top = _dll(tmp_path / "Alpha" / "nvngx_dlss.dll")
+    nested = _dll(tmp_path / "Alpha" / "sub" / "nvngx_dlss.dll")
+    # Custom Folder 2 finishes first and records "Alpha/sub" as its own game;
+    # Custom Folder 1 then merges the nested DLL into "Alpha".
+    launchers["Custom Folder 1"] = (0.2, [top, nested])
+    launchers["Custom Folder 2"] = (0, [nested])
+
+    result = await scanner.find_all_dlls()
+
+    assert result["Custom Folder 1"] == [top, nested]
+    assert result["Custom Folder 2"] == []
+    assert await _recorded() == {str(tmp_path / "Alpha"): sorted([top, nested])}
+
+
+async def test_symlinked_path_is_the_same_dll(tmp_path, launchers):
+    real = _dll(tmp_path / "Library" / "Alpha" / "nvngx_dlss.dll")
+    (tmp_path / "Link").symlink_to(tmp_path / "Library", target_is_directory=True)
+    linked = str(tmp_path / "Link" / "Alpha" / "nvngx_dlss.dll")
+    # The lower-priority launcher sees the symlinked spelling and finishes first
+    launchers["Custom Folder 1"] = (0.2, [real])
+    launchers["Custom Folder 2"] = (0, [linked])
+
+    result = await scanner.find_all_dlls()
+
+    assert result["Custom Folder 1"] == [real]
+    assert result["Custom Folder 2"] == []
+    assert await _recorded() == {str(tmp_path / "Library" / "Alpha"): [real]}
+
+
+async def test_reports_paths_skipped_by_walk(tmp_path, launchers, monkeypatch):
+    alpha = _dll(tmp_path / "Alpha" / "nvngx_dlss.dll")
+    denied = str(tmp_path / "Locked")
+    launchers["Custom Folder 1"] = (0, [alpha])
+
+    find_dlls = scanner.find_dlls
+
+    async def _find_dlls_with_skip(*args, **kwargs):
+        scanner._note_skipped_path(denied)
+        return await find_dlls(*args, **kwargs)
+
+    async def _no_enumeration():
+        raise AssertionError("Linux game paths enumerated again")
+
+    monkeypatch.setattr(scanner, "find_dlls", _find_dlls_with_skip)
+    monkeypatch.setattr(scanner, "IS_LINUX", True)
+    monkeypatch.setattr(linux_paths, "get_all_linux_game_paths", _no_enumeration)
+
+    result = await scanner.find_all_dlls()
+
+    assert result["_skipped_paths"] == [{'path': denied, 'reason': "Permission denied"}]
+    assert scanner._take_skipped_paths() == []
+
+
+async def _cancel_once_recorded(game_path: str) -> None:
+    """Cancel the running scan as soon as ``game_path`` is checkpointed."""
+    while True:
+        await anyio.sleep(0.01)
+        session = scan_session.get_active_scan_session()
+        if session is None:
+            continue
+        checkpoint = await db_manager.load_scan_checkpoint(session.dll_names_key, 60)
+        if game_path in checkpoint.games:
+            assert scan_session.cancel_active_scan()
+            return
+
+
+async def test_cancelled_scan_resumes_from_checkpoint(tmp_path, launchers, monkeypatch):
+    alpha = _dll(tmp_path / "Alpha" / "nvngx_dlss.dll")
+    beta = _dll(tmp_path / "Beta" / "nvngx_dlss.dll")
+    launchers["Custom Folder 1"] = (0, [alpha])
+    launchers["Custom Folder 2"] = (30, [beta])  # still walking when cancelled
+
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(_cancel_once_recorded, str(tmp_path / "Alpha"))
+            await scanner.find_all_dlls()
+
+    assert scan_session.get_active_scan_session() is None
+    assert await _recorded() == {str(tmp_path / "Alpha"): [alpha]}
+
+    # Restart: Custom Folder 1 and the Alpha record come from the checkpoint
+    walked, resolved = [], []
+    find_dlls = scanner.find_dlls
+
+    async def _find_dlls(paths, launcher_name, *args):
+        walked.append(launcher_name)
+        return await find_dlls(paths, launcher_name, *args)
+
+    async def _store_search(name):
+        resolved.append(name)
+
+    monkeypatch.setattr(scanner, "find_dlls", _find_dlls)
+    monkeypatch.setattr(steam_integration, "find_app_id_via_store_search", _store_search)
+    launchers["Custom Folder 2"] = (0, [beta])
+
+    # Launchers taken from the checkpoint are not walked, so their recorded
+    # directories must survive the directory index save
+    prunes = []
+    save = scanner.DirectoryIndex.save
+
+    async def _save(self, prune=True):
+        prunes.append(prune)
+        await save(self, prune=False)
+
+    monkeypatch.setattr(scanner.DirectoryIndex, "save", _save)
+
+    result = await scanner.find_all_dlls()
+    await reresolution.app_id_resolver.drain()
+
+    assert walked == ["Custom Folder 2"]
+    assert resolved == ["Beta"]
+    assert prunes == [False]
+    assert result["Custom Folder 1"] == [alpha]
+    assert await _recorded() == {
+        str(tmp_path / "Alpha"): [alpha],
+        str(tmp_path / "Beta"): [beta],
+    }
+    assert await db_manager.load_scan_checkpoint("nvngx_dlss.dll", 60) == scan_session.ScanCheckpoint()
+
+
+async def test_store_search_runs_in_background(tmp_path, launchers, monkeypatch):
+    alpha = _dll(tmp_path / "Alpha" / "nvngx_dlss.dll")
+    launchers["Custom Folder 1"] = (0, [alpha])
+    searching = anyio.Event()
+    release = anyio.Event()
+
+    async def _fts5(name):
+        return 100
+
+    async def _store_search(name):
+        searching.set()
+        await release.wait()
+        return 200
+
+    monkeypatch.setattr(steam_integration, "find_steam_app_id_by_name", _fts5)
+    monkeypatch.setattr(steam_integration, "find_app_id_via_store_search", _store_search)
+
+    with anyio.fail_after(5):
+        await scanner.find_all_dlls()
+        await searching.wait()
+
+    [game] = (await db_manager.get_all_games_by_launcher())["Custom Folder 1"]
+    assert (game.steam_app_id, game.resolution_source) == (100, 'fts5')
+
+    release.set()
+    with anyio.fail_after(5):
+        await reresolution.app_id_resolver.drain()
+
+    [game] = (await db_manager.get_all_games_by_launcher())["Custom Folder 1"]
+    assert (game.steam_app_id, game.resolution_source) == (200, 'store_search')
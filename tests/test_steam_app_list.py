@@ -0,0 +1,163 @@
+"""
+Tests for streaming Steam app list ingestion.
+
+Verifies:
+  * the incremental decoder yields every entry whatever the chunk
+    boundaries, including names containing braces and escaped quotes
+  * a download of every category file replaces the list atomically and the
+    FTS index (rebuilt once) finds the new names, not the old ones, and the
+    normalized-name index is recreated on the new table
+  * when a category file fails, the existing list is kept untouched
+  * refreshes are conditional: when no file changed (all 304) the list is
+    kept without staging; when one changed, the unchanged ones are fetched
+    again in full so the swapped-in list is complete
+"""
+
+import hashlib
+import sqlite3
+
+import msgspec
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from dlss_updater import steam_integration as steam_module
+from dlss_updater.database import db_manager
+from dlss_updater.steam_integration import _decode_app_list_chunk, steam_integration
+
+GAMES = [
+    {"appid": 10, "name": "Counter-Strike", "last_modified": 1, "price_change_number": 2},
+    {"appid": 20, "name": "Brace } Yourself {", "last_modified": 1, "price_change_number": 2},
+    {"appid": 30, "name": 'Quote \\" } Game', "last_modified": 1, "price_change_number": 2},
+    {"appid": 40, "name": "", "last_modified": 1, "price_change_number": 2},
+]
+DLC = [{"appid": 50, "name": "Stalker 2 Heart of Chornobyl Soundtrack"}]
+
+
+def test_decoder_handles_any_chunking():
+    data = msgspec.json.encode(GAMES)
+    for size in (1, 7, 64, len(data)):
+        rows, pending = [], b""
+        for i in range(0, len(data), size):
+            decoded, pending = _decode_app_list_chunk(pending + data[i:i + size])
+            rows.extend(decoded)
+        assert pending.strip() == b"]"
+        assert [(appid, name) for appid, name, _normalized, _search in rows] == [
+            (10, "Counter-Strike"), (20, "Brace } Yourself {"), (30, 'Quote \\" } Game'),
+        ]
+
+
+class _Files(dict):
+    def __init__(self):
+        super().__init__()
+        self.requests: list[tuple[str, str | None]] = []
+
+
+@pytest.fixture()
+async def app_list_server(temp_db, tmp_path, monkeypatch):
+    """Local server for the category files; ``files[name]`` is a body or a status.
+
+    Bodies are served with an ETag; ``files.requests`` records each request
+    as (name, If-None-Match) and ``files.statuses`` the answers.
+    """
+    files = _Files()
+
+    async def _handler(request):
+        name = request.match_info["name"]
+        files.requests.append((name, request.headers.get("If-None-Match")))
+        body = files[name]
+        if isinstance(body, int):
+            return web.Response(status=body)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="text/plain", headers={"ETag": etag})
+
+    app = web.Application()
+    app.router.add_get("/{name}", _handler)
+    server = TestServer(app)
+    await server.start_server()
+
+    monkeypatch.setattr(steam_module, "_http_session", None)
+    monkeypatch.setattr(steam_module, "_APP_LIST_CHUNK_SIZE", 16)
+    monkeypatch.setattr(steam_integration, "app_list_cache_file", tmp_path / "steam_app_list.json")
+    monkeypatch.setattr(steam_integration, "STEAM_APP_LIST_URLS", [
+        str(server.make_url("/games_appid.json")),
+        str(server.make_url("/dlc_appid.json")),
+    ])
+    try:
+        yield files
+    finally:
+        await steam_module.close_http_session()
+        await server.close()
+
+
+async def test_download_swaps_in_new_list(app_list_server):
+    files = app_list_server
+    await db_manager.upsert_steam_apps([(99, "Old Game", "oldgame", "old game")])
+    files["games_appid.json"] = msgspec.json.encode(GAMES)
+    files["dlc_appid.json"] = msgspec.json.encode(DLC)
+
+    await steam_integration.download_steam_app_list()
+
+    assert await db_manager.get_steam_apps_count() == 4
+    assert await db_manager.search_steam_app("old game") == []
+    assert [appid for appid, _name in await db_manager.search_steam_app("chornobyl")] == [50]
+    assert await db_manager.get_steam_app_by_name("counterstrike") == 10
+    with sqlite3.connect(db_manager.db_path) as conn:
+        index = conn.execute(
+            "SELECT tbl_name FROM sqlite_master WHERE type = 'index' AND name = 'idx_steam_apps_normalized'"
+        ).fetchone()
+    assert index == ("steam_apps",)
+    # The triggers are back: later single-row writes keep the index current
+    await db_manager.upsert_steam_apps([(60, "Later Game", "latergame", "later game")])
+    assert [appid for appid, _name in await db_manager.search_steam_app("later")] == [60]
+
+
+async def test_failed_file_keeps_current_list(app_list_server):
+    files = app_list_server
+    await db_manager.upsert_steam_apps([(99, "Old Game", "oldgame", "old game")])
+    files["games_appid.json"] = msgspec.json.encode(GAMES)
+    files["dlc_appid.json"] = 503
+
+    await steam_integration.download_steam_app_list()
+
+    assert await db_manager.get_steam_apps_count() == 1
+    assert [appid for appid, _name in await db_manager.search_steam_app("old game")] == [99]
+
+
+async def test_unchanged_files_keep_list(app_list_server, monkeypatch):
+    files = app_list_server
+    files["games_appid.json"] = msgspec.json.encode(GAMES)
+    files["dlc_appid.json"] = msgspec.json.encode(DLC)
+    await steam_integration.download_steam_app_list()
+    files.requests.clear()
+
+    async def _no_staging():
+        raise AssertionError("an unchanged list must not be staged")
+
+    with monkeypatch.context() as m:
+        m.setattr(db_manager, "begin_steam_apps_staging", _no_staging)
+        await steam_integration.download_steam_app_list()
+
+    assert all(etag is not None for _name, etag in files.requests)
+    assert await db_manager.get_steam_apps_count() == 4
+
+
+async def test_one_changed_file_refetches_the_others(app_list_server):
+    files = app_list_server
+    files["games_appid.json"] = msgspec.json.encode(GAMES)
+    files["dlc_appid.json"] = msgspec.json.encode(DLC)
+    await steam_integration.download_steam_app_list()
+    files.requests.clear()
+
+    files["dlc_appid.json"] = msgspec.json.encode(DLC + [{"appid": 70, "name": "New DLC"}])
+    await steam_integration.download_steam_app_list()
+
+    # games_appid.json was unchanged (304), then fetched again unconditionally
+    conditional = [(name, etag is not None) for name, etag in files.requests]
+    assert sorted(conditional) == [
+        ("dlc_appid.json", True), ("games_appid.json", False), ("games_appid.json", True),
+    ]
+    assert await db_manager.get_steam_apps_count() == 5
+    assert await db_manager.get_steam_app_by_name("counterstrike") == 10
@@ -0,0 +1,134 @@
+"""
+Tests for skipping the DLL walk of Steam games Steam has not touched.
+
+``scan_steam_fast`` records each game's appmanifest state (buildid,
+LastUpdated, SizeOnDisk, StateFlags). On the next scan a fully installed game
+whose state is unchanged reuses its ``game_dlls`` rows instead of having its
+install dir walked again.
+
+Verifies:
+  * unchanged game -> not walked, DLLs come from game_dlls
+  * bumped buildid -> walked again
+  * update pending (StateFlags != 4) -> walked again
+  * a recorded DLL that vanished from disk -> walked again
+  * a different DLL name set -> walked again
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from dlss_updater import scanner
+from dlss_updater.database import db_manager
+
+DLL_NAMES = ["nvngx_dlss.dll"]
+
+
+def _write_manifest(steamapps, buildid="10", state_flags="4"):
+    (steamapps / "appmanifest_100.acf").write_text(
+        '"AppState"\n{\n'
+        '\t"appid"\t\t"100"\n'
+        '\t"name"\t\t"Game A"\n'
+        '\t"installdir"\t\t"GameA"\n'
+        f'\t"StateFlags"\t\t"{state_flags}"\n'
+        '\t"LastUpdated"\t\t"1700000000"\n'
+        '\t"SizeOnDisk"\t\t"4096"\n'
+        f'\t"buildid"\t\t"{buildid}"\n'
+        '}\n'
+    )
+
+
+@pytest.fixture()
+def steam(tmp_path, temp_db, monkeypatch):
+    steamapps = tmp_path / "Steam" / "steamapps"
+    dll = steamapps / "common" / "GameA" / "bin" / "nvngx_dlss.dll"
+    dll.parent.mkdir(parents=True)
+    dll.write_bytes(b"MZ")
+    _write_manifest(steamapps)
+
+    monkeypatch.setattr(scanner, "get_steam_manual_paths", lambda: [])
+    monkeypatch.setattr(scanner, "get_steam_libraries", lambda _path: [])
+
+    walked = []
+    real_scan = scanner.scan_game_for_dlls
+
+    async def _counting_scan(game_path, dll_names_lower, dir_index=None, cancel_event=None):
+        walked.append(str(game_path))
+        return await real_scan(game_path, dll_names_lower, dir_index, cancel_event)
+
+    monkeypatch.setattr(scanner, "scan_game_for_dlls", _counting_scan)
+    return tmp_path / "Steam", steamapps, dll, walked
+
+
+async def _scan(steam_root, names=DLL_NAMES) -> list[str]:
+    """One scan: walk/reuse, record the DLL rows, then persist the states."""
+    states = []
+    found = await scanner.scan_steam_fast(str(steam_root), names, manifest_states=states)
+
+    conn = sqlite3.connect(str(db_manager.db_path))
+    try:
+        conn.execute("DELETE FROM game_dlls")
+        conn.execute(
+            "INSERT OR IGNORE INTO games (id, name, path, launcher) VALUES (1, 'Game A', ?, 'Steam')",
+            (states[0].install_path,),
+        )
+        conn.executemany(
+            "INSERT INTO game_dlls (game_id, dll_type, dll_filename, dll_path) VALUES (1, 'DLSS DLL', ?, ?)",
+            [(os.path.basename(path), path) for path in found],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    await db_manager.save_steam_manifest_states(states)
+    return found
+
+
+async def test_unchanged_game_is_not_walked(steam):
+    steam_root, _steamapps, dll, walked = steam
+    assert await _scan(steam_root) == [str(dll)]
+    assert len(walked) == 1
+
+    walked.clear()
+    assert await _scan(steam_root) == [str(dll)]
+    assert walked == []
+
+
+async def test_new_build_is_walked(steam):
+    steam_root, steamapps, dll, walked = steam
+    await _scan(steam_root)
+
+    _write_manifest(steamapps, buildid="11")
+    walked.clear()
+    assert await _scan(steam_root) == [str(dll)]
+    assert len(walked) == 1
+
+
+async def test_pending_update_is_walked(steam):
+    steam_root, steamapps, _dll, walked = steam
+    await _scan(steam_root)
+
+    _write_manifest(steamapps, state_flags="6")
+    walked.clear()
+    await _scan(steam_root)
+    assert len(walked) == 1
+
+
+async def test_vanished_dll_is_walked(steam):
+    steam_root, _steamapps, dll, walked = steam
+    await _scan(steam_root)
+
+    dll.unlink()
+    walked.clear()
+    assert await _scan(steam_root) == []
+    assert len(walked) == 1
+
+
+async def test_different_dll_names_are_walked(steam):
+    steam_root, _steamapps, _dll, walked = steam
+    await _scan(steam_root)
+
+    walked.clear()
+    await _scan(steam_root, DLL_NAMES + ["nvngx_dlssg.dll"])
+    assert len(walked) == 1
@@ -0,0 +1,90 @@
+"""
+Tests for the shared Steam request rate limiter.
+
+Verifies:
+  * a burst is let through at once, further requests are paced at the rate
+  * concurrent callers together stay within the rate
+  * a 429 pauses every request, the backoff doubles per repeated 429 and
+    starts over after a success; Retry-After wins when longer
+  * steam_api_get retries a 429 answer through the limiter
+"""
+
+import time
+
+import anyio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from dlss_updater import steam_integration as steam_module
+from dlss_updater.steam_integration import SteamRateLimiter
+
+
+async def test_burst_then_paced():
+    limiter = SteamRateLimiter(rate=20, burst=2)
+    times = []
+
+    async def _request():
+        await limiter.acquire()
+        times.append(time.monotonic())
+
+    start = time.monotonic()
+    async with anyio.create_task_group() as tg:
+        for _ in range(6):
+            tg.start_soon(_request)
+
+    offsets = sorted(t - start for t in times)
+    assert offsets[1] < 0.04  # the burst goes through at once
+    assert offsets[-1] >= 0.19  # the other 4 at 20/s
+    assert offsets[-1] < 1.0
+
+
+async def test_throttle_backoff(monkeypatch):
+    monkeypatch.setattr(steam_module, "_THROTTLE_BACKOFF_MIN_S", 0.1)
+    limiter = SteamRateLimiter(rate=1000, burst=10)
+
+    assert limiter.throttled() == pytest.approx(0.1)
+    assert limiter.throttled() == pytest.approx(0.2)
+    start = time.monotonic()
+    await limiter.acquire()
+    assert time.monotonic() - start >= 0.15  # paused, although tokens were left
+
+    limiter.succeeded()
+    assert limiter.throttled() == pytest.approx(0.1)
+    assert limiter.throttled(retry_after=0.5) == pytest.approx(0.5)
+
+
+@pytest.fixture()
+async def steam_server(monkeypatch):
+    """Local HTTP server answering 429 once, then 200."""
+    hits = []
+
+    async def _handler(request):
+        hits.append(request.path)
+        if len(hits) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"items": [{"id": 10, "name": "Alpha"}]})
+
+    app = web.Application()
+    app.router.add_get("/api/storesearch/", _handler)
+    server = TestServer(app)
+    await server.start_server()
+
+    monkeypatch.setattr(steam_module, "_http_session", None)
+    monkeypatch.setattr(steam_module, "_THROTTLE_BACKOFF_MIN_S", 0.05)
+    monkeypatch.setattr(steam_module, "steam_rate_limiter", SteamRateLimiter(rate=1000, burst=10))
+    try:
+        yield server, hits
+    finally:
+        await steam_module.close_http_session()
+        await server.close()
+
+
+async def test_api_get_retries_after_429(steam_server):
+    server, hits = steam_server
+
+    status, body = await steam_module.steam_api_get(str(server.make_url("/api/storesearch/")), timeout=5)
+
+    assert status == 200
+    assert b'"Alpha"' in body
+    assert hits == ["/api/storesearch/", "/api/storesearch/"]
@@ -0,0 +1,104 @@
+"""
+Tests for the persistent Steam Store search cache.
+
+Verifies:
+  * a found app ID is cached per normalised name and reused without a request
+  * "no match" answers are cached too (negative caching)
+  * failed requests (rate limit, HTTP errors) are not cached
+  * expired entries and use_cache=False ask Steam again
+  * a forced re-resolution answers cached names, hits and "no match",
+    without a Steam request
+"""
+
+import pytest
+
+from dlss_updater import steam_integration as steam_module
+from dlss_updater.config import config_manager
+from dlss_updater.database import db_manager
+from dlss_updater.reresolution import run_reresolution
+from dlss_updater.steam_integration import steam_integration
+
+
+@pytest.fixture()
+def store(temp_db, monkeypatch):
+    """Stub the Store request; ``answers`` feeds it, ``requests`` records it."""
+    answers: dict[str, list | None] = {}
+    requests: list[str] = []
+
+    async def _fetch(game_name, limit):
+        requests.append(game_name)
+        return answers.get(game_name)
+
+    monkeypatch.setattr(steam_integration, "_fetch_store_search", _fetch)
+    return answers, requests
+
+
+async def test_hit_is_cached(store):
+    answers, requests = store
+    answers["The Witcher 3"] = [(292030, "The Witcher 3: Wild Hunt")]
+
+    assert await steam_module.find_app_id_via_store_search("The Witcher 3") == 292030
+    # Same normalised name, different spelling: served from the cache
+    assert await steam_module.find_app_id_via_store_search("Witcher 3") == 292030
+    assert requests == ["The Witcher 3"]
+
+
+async def test_miss_is_cached(store):
+    answers, requests = store
+    answers["Homebrew Thing"] = []
+
+    assert await steam_module.find_app_id_via_store_search("Homebrew Thing") is None
+    assert await steam_module.find_app_id_via_store_search("Homebrew Thing") is None
+    assert requests == ["Homebrew Thing"]
+
+
+async def test_failed_request_is_not_cached(store):
+    answers, requests = store  # no answer: the request fails
+
+    assert await steam_module.find_app_id_via_store_search("Alpha") is None
+    assert await db_manager.get_store_search_result(
+        steam_integration.normalize_game_name("Alpha"), 3600, 3600
+    ) is None
+    assert await steam_module.find_app_id_via_store_search("Alpha") is None
+    assert requests == ["Alpha", "Alpha"]
+
+
+async def test_expired_or_bypassed_cache_asks_again(store, monkeypatch):
+    answers, requests = store
+    answers["Alpha"] = []
+
+    await steam_module.find_app_id_via_store_search("Alpha")
+    answers["Alpha"] = [(10, "Alpha")]
+    assert await steam_module.find_app_id_via_store_search("Alpha", use_cache=False) == 10
+
+    monkeypatch.setattr(steam_module, "STORE_SEARCH_HIT_TTL_S", -1)
+    assert await steam_module.find_app_id_via_store_search("Alpha") == 10
+    assert requests == ["Alpha", "Alpha", "Alpha"]
+
+
+async def test_forced_reresolution_uses_cache(temp_db, monkeypatch):
+    async def _no_request(url, timeout):
+        raise AssertionError(f"unexpected Steam request: {url}")
+
+    async def _owned_games(api_key, steam_id):
+        return {}
+
+    monkeypatch.setattr(steam_module, "steam_api_get", _no_request)
+    monkeypatch.setattr(steam_integration, "get_owned_games", _owned_games)
+    monkeypatch.setattr(config_manager, "get_steam_api_key", lambda: "key")
+    monkeypatch.setattr(config_manager, "get_steam_id", lambda: "76561198000000000")
+
+    await db_manager.upsert_game({"name": "Alpha", "path": "/games/Alpha", "launcher": "Steam",
+                                  "steam_app_id": 10, "resolution_source": "manifest"})
+    await db_manager.upsert_game({"name": "Homebrew Thing", "path": "/games/Homebrew Thing",
+                                  "launcher": "Custom Folder 1"})
+    await db_manager.save_store_search_result(steam_integration.normalize_game_name("Alpha"), 20)
+    await db_manager.save_store_search_result(steam_integration.normalize_game_name("Homebrew Thing"), None)
+
+    result = await run_reresolution(force=True)
+
+    assert result == {"resolved": 1, "unchanged": 1, "failed": 0, "total": 2}
+    games = {game.name: game for game in await db_manager.get_all_games_for_reresolution()}
+    assert games["Alpha"].steam_app_id == 20
+    assert games["Alpha"].resolution_source == "store_search"
+    assert games["Homebrew Thing"].steam_app_id is None
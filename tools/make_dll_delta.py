@@ -0,0 +1,57 @@
+"""
+Make a binary delta between two builds of a DLL for the DLL repository.
+
+Writes ``deltas/<dll name>/<source digest>-<target digest>.bsd`` under the
+output directory (the repository checkout), checks that it applies, and
+prints the ``deltas`` entry to merge into the DLL's manifest.json entry:
+
+    python tools/make_dll_delta.py old/nvngx_dlss.dll new/nvngx_dlss.dll --out ../DLSS-Updater-DLLs
+
+The manifest entry must also carry the new build's ``sha256`` - clients
+only use deltas they can verify.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+# Ensure the repo root is importable when run directly.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dlss_updater.binary_delta import apply_delta, make_delta  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("old", type=Path, help="the build clients have cached")
+    parser.add_argument("new", type=Path, help="the build being published")
+    parser.add_argument("--out", type=Path, default=Path("."), help="DLL repository checkout")
+    args = parser.parse_args()
+
+    old = args.old.read_bytes()
+    new = args.new.read_bytes()
+    source = hashlib.sha256(old).hexdigest()
+    target = hashlib.sha256(new).hexdigest()
+
+    patch = make_delta(old, new)
+    if apply_delta(old, patch) != new:
+        print("Delta does not reproduce the new build", file=sys.stderr)
+        return 1
+
+    rel_path = f"deltas/{args.new.name}/{source}-{target}.bsd"
+    out_path = args.out / rel_path
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_bytes(patch)
+
+    print(f"{rel_path}: {len(patch)} bytes ({len(patch) / max(len(new), 1):.1%} of the full file)")
+    print(json.dumps({"sha256": target, "deltas": {source: rel_path}}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())